@@ -862,6 +862,30 @@ app.get('/api/v1/admin/users/:id/activity', authenticateToken, (req, res) => {
   });
 });
 
+app.get('/api/v1/admin/users/:id', authenticateToken, (req, res) => {
+  res.json({
+    success: true,
+    data: {
+      id: req.params.id,
+      firstName: 'User',
+      lastName: 'Detail',
+      email: 'user.detail@example.com',
+      status: 'active',
+      createdAt: new Date().toISOString()
+    }
+  });
+});
+
+// ===== PARTNER SELF-SERVICE ENDPOINTS =====
+app.get('/api/v1/partner/me', authenticateToken, (req, res) => {
+  const partner = mockPartners[0];
+  res.json({
+    ...partner,
+    email: req.user.email,
+    name: partner.businessName || partner.name
+  });
+});
+
 // ===== BOOKING MANAGEMENT ENDPOINTS =====
 app.get('/api/v1/admin/bookings', authenticateToken, (req, res) => {
   const mockBookings = Array.from({ length: 15 }, (_, i) => ({
@@ -0,0 +1,153 @@
+import {
+  PartnerWalletEntity,
+  PayoutEntity,
+} from '@/api/payout/entities/payout.entity';
+import { SpacePackageEntity } from '@/api/space/entities/space-inventory.entity';
+import { BookingEntity } from '@/database/entities/booking.entity';
+import { PaymentEntity } from '@/database/entities/payment.entity';
+import { Test, TestingModule } from '@nestjs/testing';
+import { getRepositoryToken } from '@nestjs/typeorm';
+import { AdminListEnrichmentService } from './admin-list-enrichment.service';
+
+describe('AdminListEnrichmentService', () => {
+  let service: AdminListEnrichmentService;
+
+  const createQueryBuilderMock = (rows: any[]) => {
+    const qb: any = {
+      select: jest.fn().mockReturnThis(),
+      addSelect: jest.fn().mockReturnThis(),
+      innerJoin: jest.fn().mockReturnThis(),
+      where: jest.fn().mockReturnThis(),
+      andWhere: jest.fn().mockReturnThis(),
+      groupBy: jest.fn().mockReturnThis(),
+      getRawMany: jest.fn().mockResolvedValue(rows),
+    };
+    return qb;
+  };
+
+  const bookingRepository = { createQueryBuilder: jest.fn() };
+  const paymentRepository = { createQueryBuilder: jest.fn() };
+  const partnerWalletRepository = { createQueryBuilder: jest.fn() };
+  const payoutRepository = { createQueryBuilder: jest.fn() };
+  const spacePackageRepository = { createQueryBuilder: jest.fn() };
+
+  beforeEach(async () => {
+    const module: TestingModule = await Test.createTestingModule({
+      providers: [
+        AdminListEnrichmentService,
+        {
+          provide: getRepositoryToken(BookingEntity),
+          useValue: bookingRepository,
+        },
+        {
+          provide: getRepositoryToken(PaymentEntity),
+          useValue: paymentRepository,
+        },
+        {
+          provide: getRepositoryToken(PartnerWalletEntity),
+          useValue: partnerWalletRepository,
+        },
+        {
+          provide: getRepositoryToken(PayoutEntity),
+          useValue: payoutRepository,
+        },
+        {
+          provide: getRepositoryToken(SpacePackageEntity),
+          useValue: spacePackageRepository,
+        },
+      ],
+    }).compile();
+
+    service = module.get<AdminListEnrichmentService>(
+      AdminListEnrichmentService,
+    );
+  });
+
+  describe('getUserSpendTotals', () => {
+    it('should issue one grouped query per table regardless of page size', async () => {
+      const userIds = Array.from({ length: 100 }, (_, i) => `CUS-${i}`);
+      bookingRepository.createQueryBuilder.mockReturnValue(
+        createQueryBuilderMock([{ userId: 'CUS-1', total: '250.50' }]),
+      );
+      paymentRepository.createQueryBuilder.mockReturnValue(
+        createQueryBuilderMock([{ userId: 'CUS-1', total: '300.00' }]),
+      );
+
+      const totals = await service.getUserSpendTotals(userIds);
+
+      expect(bookingRepository.createQueryBuilder).toHaveBeenCalledTimes(1);
+      expect(paymentRepository.createQueryBuilder).toHaveBeenCalledTimes(1);
+      expect(totals.size).toBe(100);
+      expect(totals.get('CUS-1')).toEqual({
+        totalSpent: 250.5,
+        totalTopups: 300,
+      });
+      expect(totals.get('CUS-2')).toEqual({ totalSpent: 0, totalTopups: 0 });
+    });
+
+    it('should not query when the page is empty', async () => {
+      const totals = await service.getUserSpendTotals([]);
+
+      expect(totals.size).toBe(0);
+      expect(bookingRepository.createQueryBuilder).not.toHaveBeenCalled();
+      expect(paymentRepository.createQueryBuilder).not.toHaveBeenCalled();
+    });
+  });
+
+  describe('getBookingCounts', () => {
+    it('should count bookings per user in one grouped query', async () => {
+      const qb = createQueryBuilderMock([{ userId: 'CUS-1', count: '4' }]);
+      bookingRepository.createQueryBuilder.mockReturnValue(qb);
+
+      const counts = await service.getBookingCounts(['CUS-1', 'CUS-2']);
+
+      expect(qb.groupBy).toHaveBeenCalledWith('booking.userId');
+      expect(counts.get('CUS-1')).toBe(4);
+      expect(counts.has('CUS-2')).toBe(false);
+    });
+  });
+
+  describe('getPartnerWalletBalances', () => {
+    it('should deduplicate partner ids and map balances', async () => {
+      const qb = createQueryBuilderMock([
+        { partnerId: 'CPT-1', balance: '1200.00' },
+      ]);
+      partnerWalletRepository.createQueryBuilder.mockReturnValue(qb);
+
+      const balances = await service.getPartnerWalletBalances([
+        'CPT-1',
+        'CPT-1',
+        'CPT-2',
+      ]);
+
+      expect(qb.where).toHaveBeenCalledWith('wallet.partnerId IN (:...ids)', {
+        ids: ['CPT-1', 'CPT-2'],
+      });
+      expect(balances.get('CPT-1')).toBe(1200);
+      expect(balances.has('CPT-2')).toBe(false);
+    });
+  });
+
+  describe('getSpacePriceSummaries', () => {
+    it('should return the cheapest active package price per space', async () => {
+      spacePackageRepository.createQueryBuilder.mockReturnValue(
+        createQueryBuilderMock([
+          {
+            spaceId: 'CSP-1',
+            minPrice: '499.00',
+            maxPrice: '2999.00',
+            packageCount: '3',
+          },
+        ]),
+      );
+
+      const summaries = await service.getSpacePriceSummaries(['CSP-1']);
+
+      expect(summaries.get('CSP-1')).toEqual({
+        basePrice: 499,
+        maxPrice: 2999,
+        packageCount: 3,
+      });
+    });
+  });
+});
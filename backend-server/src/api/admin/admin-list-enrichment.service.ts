@@ -0,0 +1,198 @@
+import {
+  PartnerWalletEntity,
+  PayoutEntity,
+} from '@/api/payout/entities/payout.entity';
+import { SpacePackageEntity } from '@/api/space/entities/space-inventory.entity';
+import { BookingStatus, PaymentStatus } from '@/common/enums/booking.enum';
+import { BookingEntity } from '@/database/entities/booking.entity';
+import { PaymentEntity } from '@/database/entities/payment.entity';
+import { Injectable } from '@nestjs/common';
+import { InjectRepository } from '@nestjs/typeorm';
+import { Repository } from 'typeorm';
+import { PayoutStatus } from '../payout/dto/payout.dto';
+
+export interface UserSpendTotals {
+  totalSpent: number;
+  totalTopups: number;
+}
+
+export interface SpacePriceSummary {
+  basePrice: number;
+  maxPrice: number;
+  packageCount: number;
+}
+
+/**
+ * Page-level enrichment for admin list endpoints.
+ *
+ * Every method takes the keys of one result page and answers with a single
+ * grouped query, so the number of round trips per page is constant no matter
+ * how many rows the page holds. Missing keys are simply absent from the
+ * returned map; callers fall back to their defaults.
+ */
+@Injectable()
+export class AdminListEnrichmentService {
+  constructor(
+    @InjectRepository(BookingEntity)
+    private readonly bookingRepository: Repository<BookingEntity>,
+    @InjectRepository(PaymentEntity)
+    private readonly paymentRepository: Repository<PaymentEntity>,
+    @InjectRepository(PartnerWalletEntity)
+    private readonly partnerWalletRepository: Repository<PartnerWalletEntity>,
+    @InjectRepository(PayoutEntity)
+    private readonly payoutRepository: Repository<PayoutEntity>,
+    @InjectRepository(SpacePackageEntity)
+    private readonly spacePackageRepository: Repository<SpacePackageEntity>,
+  ) {}
+
+  /**
+   * Completed booking spend and completed payment totals per user.
+   */
+  async getUserSpendTotals(
+    userIds: string[],
+  ): Promise<Map<string, UserSpendTotals>> {
+    const ids = this.unique(userIds);
+    const totals = new Map<string, UserSpendTotals>();
+    if (ids.length === 0) return totals;
+
+    const [bookingRows, paymentRows] = await Promise.all([
+      this.bookingRepository
+        .createQueryBuilder('booking')
+        .select('booking.userId', 'userId')
+        .addSelect('COALESCE(SUM(booking.totalAmount), 0)', 'total')
+        .where('booking.userId IN (:...ids)', { ids })
+        .andWhere('booking.status = :status', {
+          status: BookingStatus.COMPLETED,
+        })
+        .groupBy('booking.userId')
+        .getRawMany<{ userId: string; total: string }>(),
+      this.paymentRepository
+        .createQueryBuilder('payment')
+        .select('payment.userId', 'userId')
+        .addSelect('COALESCE(SUM(payment.amount), 0)', 'total')
+        .where('payment.userId IN (:...ids)', { ids })
+        .andWhere('payment.status = :status', {
+          status: PaymentStatus.COMPLETED,
+        })
+        .groupBy('payment.userId')
+        .getRawMany<{ userId: string; total: string }>(),
+    ]);
+
+    for (const id of ids) {
+      totals.set(id, { totalSpent: 0, totalTopups: 0 });
+    }
+    for (const row of bookingRows) {
+      totals.get(row.userId).totalSpent = parseFloat(row.total) || 0;
+    }
+    for (const row of paymentRows) {
+      totals.get(row.userId).totalTopups = parseFloat(row.total) || 0;
+    }
+    return totals;
+  }
+
+  /**
+   * Number of bookings per user, whatever their status.
+   */
+  async getBookingCounts(userIds: string[]): Promise<Map<string, number>> {
+    const ids = this.unique(userIds);
+    if (ids.length === 0) return new Map();
+
+    const rows = await this.bookingRepository
+      .createQueryBuilder('booking')
+      .select('booking.userId', 'userId')
+      .addSelect('COUNT(booking.id)', 'count')
+      .where('booking.userId IN (:...ids)', { ids })
+      .groupBy('booking.userId')
+      .getRawMany<{ userId: string; count: string }>();
+
+    return new Map(
+      rows.map((row) => [row.userId, parseInt(row.count, 10) || 0]),
+    );
+  }
+
+  /**
+   * Available wallet balance per partner.
+   */
+  async getPartnerWalletBalances(
+    partnerIds: string[],
+  ): Promise<Map<string, number>> {
+    const ids = this.unique(partnerIds);
+    if (ids.length === 0) return new Map();
+
+    const rows = await this.partnerWalletRepository
+      .createQueryBuilder('wallet')
+      .select('wallet.partnerId', 'partnerId')
+      .addSelect('wallet.availableBalance', 'balance')
+      .where('wallet.partnerId IN (:...ids)', { ids })
+      .getRawMany<{ partnerId: string; balance: string }>();
+
+    return new Map(
+      rows.map((row) => [row.partnerId, parseFloat(row.balance) || 0]),
+    );
+  }
+
+  /**
+   * Date of the most recent completed payout per partner.
+   */
+  async getLastPayoutDates(partnerIds: string[]): Promise<Map<string, Date>> {
+    const ids = this.unique(partnerIds);
+    if (ids.length === 0) return new Map();
+
+    const rows = await this.payoutRepository
+      .createQueryBuilder('payout')
+      .select('payout.partnerId', 'partnerId')
+      .addSelect('MAX(payout.processedDate)', 'lastPayoutDate')
+      .where('payout.partnerId IN (:...ids)', { ids })
+      .andWhere('payout.status = :status', { status: PayoutStatus.COMPLETED })
+      .groupBy('payout.partnerId')
+      .getRawMany<{ partnerId: string; lastPayoutDate: Date | null }>();
+
+    return new Map(
+      rows
+        .filter((row) => row.lastPayoutDate)
+        .map((row) => [row.partnerId, new Date(row.lastPayoutDate)]),
+    );
+  }
+
+  /**
+   * Cheapest and most expensive active package price per space.
+   */
+  async getSpacePriceSummaries(
+    spaceIds: string[],
+  ): Promise<Map<string, SpacePriceSummary>> {
+    const ids = this.unique(spaceIds);
+    if (ids.length === 0) return new Map();
+
+    const rows = await this.spacePackageRepository
+      .createQueryBuilder('package')
+      .innerJoin('package.spaceOption', 'spaceOption')
+      .select('spaceOption.spaceId', 'spaceId')
+      .addSelect('MIN(package.basePrice)', 'minPrice')
+      .addSelect('MAX(package.basePrice)', 'maxPrice')
+      .addSelect('COUNT(package.id)', 'packageCount')
+      .where('spaceOption.spaceId IN (:...ids)', { ids })
+      .andWhere('package.isActive = :isActive', { isActive: true })
+      .groupBy('spaceOption.spaceId')
+      .getRawMany<{
+        spaceId: string;
+        minPrice: string;
+        maxPrice: string;
+        packageCount: string;
+      }>();
+
+    return new Map(
+      rows.map((row) => [
+        row.spaceId,
+        {
+          basePrice: parseFloat(row.minPrice) || 0,
+          maxPrice: parseFloat(row.maxPrice) || 0,
+          packageCount: parseInt(row.packageCount, 10) || 0,
+        },
+      ]),
+    );
+  }
+
+  private unique(ids: string[]): string[] {
+    return Array.from(new Set(ids.filter(Boolean)));
+  }
+}
@@ -7,6 +7,8 @@ import { BookingEntity } from '@/database/entities/booking.entity';
 import { PartnerListingEntity } from '@/database/entities/partner-listing.entity';
 import { PartnerEntity } from '@/database/entities/partner.entity';
 import { SpaceEntity } from '@/database/entities/space.entity';
+import { CacheService } from '@/shared/cache/cache.service';
+import { keysetPaginate } from '@/utils/pagination/keyset-pagination';
 import { paginate } from '@/utils/pagination/offset-pagination';
 import { Injectable, Logger } from '@nestjs/common';
 import { InjectRepository } from '@nestjs/typeorm';
@@ -20,8 +22,10 @@ import {
   PartnerListResponseDto,
   PartnerQueryDto,
   PartnerRevenueAnalyticsDto,
+  PartnerSortBy,
   PartnerSpaceDto,
   PartnerStatsDto,
+  SortOrder,
   UpdatePartnerDto,
   UpdatePartnerStatusDto,
 } from './dto/partner-management.dto';
@@ -41,51 +45,105 @@ export class AdminPartnerService {
     private readonly partnerListingRepository: Repository<PartnerListingEntity>,
     @InjectRepository(BookingEntity)
     private readonly bookingRepository: Repository<BookingEntity>,
+    private readonly cacheService: CacheService,
   ) {}
 
   async findAllPartners(
     query: PartnerQueryDto,
   ): Promise<PartnerListResponseDto> {
-    try {
-      this.logger.log('Starting findAllPartners - simplified version');
+    const {
+      search,
+      status,
+      verificationStatus,
+      registrationDateFrom,
+      registrationDateTo,
+      sortBy,
+      sortOrder = SortOrder.DESC,
+      page = 1,
+      limit = 10,
+    } = query;
+
+    const queryBuilder = this.partnerRepository
+      .createQueryBuilder('partner')
+      .leftJoinAndSelect('partner.user', 'user');
 
-      // Simple query without any filters for testing
-      const partners = await this.partnerRepository.find({
-        take: 10,
-        order: { createdAt: 'DESC' },
-      });
+    if (search) {
+      queryBuilder.andWhere(
+        '(partner.businessName ILIKE :search OR user.email ILIKE :search)',
+        { search: `%${search}%` },
+      );
+    }
 
-      this.logger.log(`Found ${partners.length} partners`);
-
-      const response = {
-        data: partners.map((partner) => ({
-          id: partner.id,
-          name: partner.businessName,
-          email: '',
-          companyName: partner.businessName,
-          phone: '',
-          status: partner.status,
-          verificationStatus: partner.verificationStatus,
-          city: '',
-          area: '',
-          spacesCount: 0,
-          totalRevenue: 0,
-          createdAt: partner.createdAt,
-          lastActive: partner.updatedAt,
-        })),
-        total: partners.length,
-        page: 1,
-        limit: 10,
-        totalPages: 1,
-        hasNextPage: false,
-        hasPreviousPage: false,
-      };
+    if (status) {
+      queryBuilder.andWhere('partner.status = :status', { status });
+    }
 
-      return response;
-    } catch (error) {
-      this.logger.error('Error in findAllPartners:', error);
-      throw error;
+    if (verificationStatus) {
+      queryBuilder.andWhere(
+        'partner.verificationStatus = :verificationStatus',
+        { verificationStatus },
+      );
+    }
+
+    if (registrationDateFrom) {
+      queryBuilder.andWhere('partner.createdAt >= :registrationDateFrom', {
+        registrationDateFrom,
+      });
     }
+
+    if (registrationDateTo) {
+      queryBuilder.andWhere('partner.createdAt <= :registrationDateTo', {
+        registrationDateTo,
+      });
+    }
+
+    // Revenue and spaces count aren't columns, so those sorts fall back to
+    // the creation date
+    const sortColumns: Record<string, string> = {
+      name: 'partner.businessName',
+      createdAt: 'partner.createdAt',
+      lastActive: 'partner.updatedAt',
+    };
+    const sortKey = sortColumns[sortBy] ? sortBy : PartnerSortBy.CREATED_AT;
+
+    const result = await keysetPaginate(queryBuilder, {
+      sortKey,
+      sortColumn: sortColumns[sortKey],
+      sortOrder: sortOrder.toUpperCase() as 'ASC' | 'DESC',
+      limit,
+      page,
+      afterCursor: query.afterCursor,
+      beforeCursor: query.beforeCursor,
+      exactCount: query.exactCount,
+      cacheService: this.cacheService,
+    });
+
+    return {
+      data: result.items.map((partner) => ({
+        id: partner.id,
+        name: partner.businessName,
+        email: partner.user?.email || '',
+        companyName: partner.businessName,
+        phone: partner.contactInfo?.phone || '',
+        status: partner.status,
+        verificationStatus: partner.verificationStatus,
+        city: '',
+        area: '',
+        spacesCount: 0,
+        totalRevenue: 0,
+        createdAt: partner.createdAt,
+        lastActive: partner.updatedAt,
+      })),
+      total: result.totalRecords,
+      page,
+      limit,
+      totalPages: Math.ceil(result.totalRecords / limit),
+      hasNextPage: result.hasNextPage,
+      hasPreviousPage: result.hasPreviousPage,
+      nextCursor: result.nextCursor,
+      previousCursor: result.previousCursor,
+      totalIsEstimate: result.totalIsEstimate,
+    };
   }
 
   async findPartnerById(id: string): Promise<PartnerDetailsDto> {
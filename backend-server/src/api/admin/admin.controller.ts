@@ -17,11 +17,13 @@ import {
   Get,
   HttpStatus,
   Param,
+  ParseUUIDPipe,
   Patch,
   Post,
   Put,
   Query,
   Request,
+  StreamableFile,
   UseGuards,
   UsePipes,
   ValidationPipe,
@@ -2003,6 +2005,46 @@ export class AdminController {
     return this.adminService.exportData(exportDto);
   }
 
+  @Get('exports/:exportId')
+  @ApiOperation({ summary: 'Get export job status' })
+  @ApiParam({ name: 'exportId', description: 'Export ID' })
+  @ApiResponse({
+    status: HttpStatus.OK,
+    description: 'Export status retrieved successfully',
+  })
+  async getExportStatus(@Param('exportId', ParseUUIDPipe) exportId: string) {
+    return this.adminService.getExportStatus(exportId);
+  }
+
+  @Get('exports/:exportId/download')
+  @ApiOperation({ summary: 'Download a completed export' })
+  @ApiParam({ name: 'exportId', description: 'Export ID' })
+  @ApiResponse({
+    status: HttpStatus.OK,
+    description: 'Export file streamed successfully',
+  })
+  async downloadExport(
+    @Param('exportId', ParseUUIDPipe) exportId: string,
+  ): Promise<StreamableFile> {
+    const download = await this.adminService.openExportDownload(exportId);
+    return new StreamableFile(download.stream, {
+      type: download.contentType,
+      disposition: `attachment; filename="${download.fileName}"`,
+      length: download.fileSize,
+    });
+  }
+
+  @Delete('exports/:exportId')
+  @ApiOperation({ summary: 'Cancel a pending or running export' })
+  @ApiParam({ name: 'exportId', description: 'Export ID' })
+  @ApiResponse({
+    status: HttpStatus.OK,
+    description: 'Export cancelled successfully',
+  })
+  async cancelExport(@Param('exportId', ParseUUIDPipe) exportId: string) {
+    return this.adminService.cancelExport(exportId);
+  }
+
   @Post('imports/data')
   @ApiOperation({ summary: 'Import data from external sources' })
   @ApiResponse({
@@ -19,8 +19,8 @@ import {
   FinancialConfigurationVersionEntity,
 } from '@/common/entities/financial-configuration.entity';
 import { FinancialServicesModule } from '@/common/modules/financial-services.module';
-import { DynamicFinancialConfigService } from '@/common/services/dynamic-financial-config.service';
 import { BookingEntity } from '@/database/entities/booking.entity';
+import { DashboardDailyAggregateEntity } from '@/database/entities/dashboard-daily-aggregate.entity';
 import { InvoiceEntity } from '@/database/entities/invoice.entity';
 import { KycVerificationEntity } from '@/database/entities/kyc-verification.entity';
 import { PartnerCategoryEntity } from '@/database/entities/partner-category.entity';
@@ -36,6 +36,7 @@ import { SpaceEntity } from '@/database/entities/space.entity';
 import { WalletBalanceEntity } from '@/database/entities/wallet-balance.entity';
 import { CacheModule } from '@/shared/cache/cache.module';
 import { IdGeneratorService } from '@/utils/id-generator.service';
+import { ExportJobModule } from '@/worker/queues/export/export-job.module';
 import { CacheModule as NestCacheModule } from '@nestjs/cache-manager';
 import { Module } from '@nestjs/common';
 import { TypeOrmModule } from '@nestjs/typeorm';
@@ -44,6 +45,7 @@ import { AdminBookingController } from './admin-booking.controller';
 import { AdminAnalyticsController } from './admin-analytics.controller';
 import { AdminCategoriesController } from './admin-categories.controller';
 import { AdminKycController } from './admin-kyc.controller';
+import { AdminListEnrichmentService } from './admin-list-enrichment.service';
 import { AdminPartnerCategoryController } from './admin-partner-category.controller';
 import { AdminPartnerCategoryService } from './admin-partner-category.service';
 import { AdminPartnerSimpleService } from './admin-partner-simple.service';
@@ -60,6 +62,7 @@ import { AdminSystemController } from './admin-system.controller';
 import { AdminController } from './admin.controller';
 import { AdminService } from './admin.service';
 import { AuditService } from './audit.service';
+import { DashboardAggregateService } from './dashboard-aggregate.service';
 
 import { FinancialConfigController } from './financial-config.controller';
 import { TestAdminController } from './test-admin.controller';
@@ -89,6 +92,7 @@ import { TestAdminController } from './test-admin.controller';
       PayoutEntity,
       WalletBalanceEntity,
       InvoiceEntity,
+      DashboardDailyAggregateEntity,
       FinancialConfigurationEntity,
       FinancialConfigurationVersionEntity,
       FinancialConfigurationChangeEntity,
@@ -104,6 +108,7 @@ import { TestAdminController } from './test-admin.controller';
     CacheModule,
     NotificationModule,
     FinancialServicesModule,
+    ExportJobModule,
   ],
   controllers: [
     AdminController,
@@ -123,6 +128,7 @@ import { TestAdminController } from './test-admin.controller';
   ],
   providers: [
     AdminService,
+    AdminListEnrichmentService,
     AdminSpaceService,
     AdminPartnerService,
     AdminPartnerSimpleService,
@@ -130,9 +136,9 @@ import { TestAdminController } from './test-admin.controller';
     AdminPartnerCategoryService,
     AdminPartnerSubcategoryService,
     AuditService,
+    DashboardAggregateService,
     IdGeneratorService,
-    DynamicFinancialConfigService,
   ],
-  exports: [AdminService],
+  exports: [AdminService, DashboardAggregateService],
 })
 export class AdminModule {}
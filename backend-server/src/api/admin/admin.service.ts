@@ -3,6 +3,7 @@ import {
   TransactionType,
 } from '@/api/transaction/dto/financial-transaction.dto';
 import { Role as UserRole, UserStatus } from '@/api/user/user.enum';
+import { AuthService } from '@/auth/auth.service';
 import { UserEntity } from '@/auth/entities/user.entity';
 import { OffsetPaginationDto } from '@/common/dto/offset-pagination/offset-pagination.dto';
 import { PageOptionsDto } from '@/common/dto/offset-pagination/page-options.dto';
@@ -16,6 +17,7 @@ import {
   ErrorResponseUtil,
 } from '@/common/utils/error-response.util';
 import { CacheKey } from '@/constants/cache.constant';
+import { Job } from '@/constants/job.constant';
 import { BookingEntity } from '@/database/entities/booking.entity';
 import {
   InvoiceEntity,
@@ -36,12 +38,23 @@ import { WalletBalanceEntity } from '@/database/entities/wallet-balance.entity';
 import { CacheService } from '@/shared/cache/cache.service';
 import { EntityType } from '@/utils/id-generator.service';
 import {
+  KeysetSortColumn,
+  keysetPaginate,
+} from '@/utils/pagination/keyset-pagination';
+import {
+  ExportDownload,
+  ExportJobService,
+  ExportJobStatus,
+} from '@/worker/queues/export/export-job.service';
+import {
+  BadRequestException,
   ForbiddenException,
   Injectable,
   Logger,
   NotFoundException,
 } from '@nestjs/common';
 import { InjectRepository } from '@nestjs/typeorm';
+import { randomUUID } from 'crypto';
 import {
   Between,
   In,
@@ -63,7 +76,9 @@ import { FinancialTransactionService } from '../transaction/financial-transactio
 import { KycVerificationService } from '../user/kyc-verification.service';
 import { WalletTransactionType } from '../wallet/dto/wallet.dto';
 import { WalletService } from '../wallet/wallet.service';
+import { AdminListEnrichmentService } from './admin-list-enrichment.service';
 import { AuditAction, AuditService } from './audit.service';
+import { DashboardAggregateService } from './dashboard-aggregate.service';
 import {
   AdminAnalyticsQueryDto,
   AnalyticsGranularity,
@@ -159,6 +174,8 @@ import {
   UserStatsDto,
 } from './dto/user-management.dto';
 
+const ExportJob = Job.Export;
+
 @Injectable()
 export class AdminService {
   private readonly logger = new Logger(AdminService.name);
@@ -197,6 +214,10 @@ export class AdminService {
     private readonly emailService: EmailService,
     private readonly reviewService: ReviewService,
     private readonly financialTransactionService: FinancialTransactionService,
+    private readonly dashboardAggregateService: DashboardAggregateService,
+    private readonly adminListEnrichmentService: AdminListEnrichmentService,
+    private readonly exportJobService: ExportJobService,
+    private readonly authService: AuthService,
   ) {
     console.log('AdminService constructor called');
     console.log('InvoiceRepository injected:', !!this.invoiceRepository);
@@ -252,19 +273,6 @@ export class AdminService {
   async findAllUsers(
     queryDto: AdminUserQueryDto,
   ): Promise<UserListResponseDto> {
-    console.log('=== ENTERING findAllUsers ===');
-    console.log('Query DTO:', JSON.stringify(queryDto, null, 2));
-    console.log('UserRepository:', !!this.userRepository);
-
-    // Test basic repository access
-    try {
-      const testCount = await this.userRepository.count();
-      console.log('User count test successful:', testCount);
-    } catch (testError) {
-      console.error('User count test failed:', testError);
-      throw testError;
-    }
-
     const {
       query,
       status,
@@ -279,134 +287,113 @@ export class AdminService {
       limit,
     } = queryDto;
 
-    // Declare variables outside try block for catch block access
-    let orderByField = sortBy || 'createdAt';
-    const finalSortOrder = sortOrder || 'DESC';
-    const finalPage = page || 1;
     const finalLimit = limit || 20;
+    const queryBuilder = this.userRepository
+      .createQueryBuilder('user')
+      .leftJoinAndSelect('user.partner', 'partner');
 
-    try {
-      const queryBuilder = this.userRepository
-        .createQueryBuilder('user')
-        .leftJoinAndSelect('user.partner', 'partner')
-        .leftJoinAndSelect('user.bookings', 'bookings');
-
-      if (query) {
-        queryBuilder.andWhere(
-          '(user.firstName ILIKE :query OR user.lastName ILIKE :query OR user.email ILIKE :query OR user.username ILIKE :query)',
-          { query: `%${query}%` },
-        );
-      }
-
-      if (status) {
-        queryBuilder.andWhere('user.status = :status', { status });
-      }
+    if (query) {
+      queryBuilder.andWhere(
+        '(user.firstName ILIKE :query OR user.lastName ILIKE :query OR user.email ILIKE :query OR user.username ILIKE :query)',
+        { query: `%${query}%` },
+      );
+    }
 
-      if (role) {
-        queryBuilder.andWhere('user.role = :role', { role });
-      }
+    if (status) {
+      queryBuilder.andWhere('user.status = :status', { status });
+    }
 
-      if (emailVerified !== undefined) {
-        queryBuilder.andWhere('user.isEmailVerified = :emailVerified', {
-          emailVerified,
-        });
-      }
+    if (role) {
+      queryBuilder.andWhere('user.role = :role', { role });
+    }
 
-      if (createdAfter) {
-        queryBuilder.andWhere('user.createdAt >= :createdAfter', {
-          createdAfter,
-        });
-      }
+    if (emailVerified !== undefined) {
+      queryBuilder.andWhere('user.isEmailVerified = :emailVerified', {
+        emailVerified,
+      });
+    }
 
-      if (createdBefore) {
-        queryBuilder.andWhere('user.createdAt <= :createdBefore', {
-          createdBefore,
-        });
-      }
+    if (createdAfter) {
+      queryBuilder.andWhere('user.createdAt >= :createdAfter', {
+        createdAfter,
+      });
+    }
 
-      if (lastLoginAfter) {
-        queryBuilder.andWhere('user.lastLoginAt >= :lastLoginAfter', {
-          lastLoginAfter,
-        });
-      }
+    if (createdBefore) {
+      queryBuilder.andWhere('user.createdAt <= :createdBefore', {
+        createdBefore,
+      });
+    }
 
-      // Handle sortBy field mapping and validation
-      const sortOrder = (finalSortOrder || 'DESC').toUpperCase() as 'ASC' | 'DESC';
-
-      const sortMap: Record<string, string | string[]> = {
-        name: ['user.firstName', 'user.lastName', 'user.username'],
-        displayName: ['user.firstName', 'user.lastName', 'user.username'],
-        email: 'user.email',
-        username: 'user.username',
-        createdAt: 'user.createdAt',
-        updatedAt: 'user.updatedAt',
-        lastLoginAt: 'user.lastLoginAt',
-        role: 'user.role',
-        status: 'user.status',
-        emailVerified: 'user.isEmailVerified',
-        isEmailVerified: 'user.isEmailVerified',
-        firstName: 'user.firstName',
-        lastName: 'user.lastName',
-      };
+    if (lastLoginAfter) {
+      queryBuilder.andWhere('user.lastLoginAt >= :lastLoginAfter', {
+        lastLoginAfter,
+      });
+    }
 
-      const mapped = sortMap[orderByField];
+    // Keyset pagination sorts on a single column, with the id as tie-breaker
+    const sortMap: Record<string, KeysetSortColumn> = {
+      name: { column: 'user.firstName', nullable: true },
+      displayName: { column: 'user.firstName', nullable: true },
+      email: { column: 'user.email' },
+      username: { column: 'user.username' },
+      createdAt: { column: 'user.createdAt' },
+      updatedAt: { column: 'user.updatedAt' },
+      lastLoginAt: { column: 'user.lastLoginAt', nullable: true },
+      role: { column: 'user.role' },
+      status: { column: 'user.status' },
+      emailVerified: { column: 'user.isEmailVerified' },
+      isEmailVerified: { column: 'user.isEmailVerified' },
+      firstName: { column: 'user.firstName', nullable: true },
+      lastName: { column: 'user.lastName', nullable: true },
+    };
+    const sortKey = sortMap[sortBy] ? sortBy : 'createdAt';
+    const sort = sortMap[sortKey];
+
+    const result = await keysetPaginate(queryBuilder, {
+      sortKey,
+      sortColumn: sort.column,
+      sortOrder: (sortOrder || 'DESC').toUpperCase() as 'ASC' | 'DESC',
+      nullable: sort.nullable,
+      limit: finalLimit,
+      page,
+      afterCursor: queryDto.afterCursor,
+      beforeCursor: queryDto.beforeCursor,
+      exactCount: queryDto.exactCount,
+      cacheService: this.cacheService,
+    });
 
-      if (Array.isArray(mapped)) {
-        queryBuilder.orderBy(mapped[0], sortOrder);
-        for (let i = 1; i < mapped.length; i++) {
-          queryBuilder.addOrderBy(mapped[i], sortOrder);
-        }
-      } else if (typeof mapped === 'string') {
-        queryBuilder.orderBy(mapped, sortOrder);
-      } else {
-        // Fallback to createdAt if unknown sort field requested
-        queryBuilder.orderBy('user.createdAt', sortOrder);
-      }
+    const bookingCounts =
+      await this.adminListEnrichmentService.getBookingCounts(
+        result.items.map((user) => user.id),
+      );
 
-      const offset = (finalPage - 1) * finalLimit;
-      queryBuilder.skip(offset).take(finalLimit);
-
-      console.log('DEBUG findAllUsers SQL:', queryBuilder.getSql());
-      console.log('DEBUG findAllUsers params:', queryBuilder.getParameters());
-
-      const [items, total] = await queryBuilder.getManyAndCount();
-
-      // Transform to UserListItemDto
-      const data = items.map((user) => ({
-        id: user.id,
-        username: user.username,
-        email: user.email,
-        displayName:
-          `${user.firstName || ''} ${user.lastName || ''}`.trim() ||
-          user.username,
-        role: user.role,
-        status: user.status,
-        isEmailVerified: user.isEmailVerified,
-        createdAt: user.createdAt,
-        lastLoginAt: user.lastLoginAt,
-        totalBookings: user.bookings?.length || 0,
-      }));
+    // Transform to UserListItemDto
+    const data = result.items.map((user) => ({
+      id: user.id,
+      username: user.username,
+      email: user.email,
+      displayName:
+        `${user.firstName || ''} ${user.lastName || ''}`.trim() ||
+        user.username,
+      role: user.role,
+      status: user.status,
+      isEmailVerified: user.isEmailVerified,
+      createdAt: user.createdAt,
+      lastLoginAt: user.lastLoginAt,
+      totalBookings: bookingCounts.get(user.id) ?? 0,
+    }));
 
-      const pageOptions = new PageOptionsDto();
-      Object.assign(pageOptions, { page: finalPage, limit: finalLimit });
+    const pageOptions = new PageOptionsDto();
+    Object.assign(pageOptions, { page: page || 1, limit: finalLimit });
 
-      return {
-        data,
-        pagination: new OffsetPaginationDto(total, pageOptions),
-      };
-    } catch (error) {
-      console.error('=== ERROR IN findAllUsers ===');
-      console.error('Error message:', error.message);
-      console.error('Error name:', error.name);
-      console.error('Error stack:', error.stack);
-      console.error('Query DTO:', JSON.stringify(queryDto, null, 2));
-      console.error('Final page:', finalPage);
-      console.error('Final limit:', finalLimit);
-      console.error('Order by field:', orderByField);
-      console.error('Final sort order:', finalSortOrder);
-      console.error('=== END ERROR ===');
-      throw error;
-    }
+    return {
+      data,
+      pagination: new OffsetPaginationDto(result.totalRecords, pageOptions),
+      nextCursor: result.nextCursor,
+      previousCursor: result.previousCursor,
+      totalIsEstimate: result.totalIsEstimate,
+    };
   }
 
   async findUserById(id: string): Promise<UserDetailsDto> {
@@ -476,6 +463,16 @@ export class AdminService {
     return user;
   }
 
+  /**
+   * Save an admin change to a user and drop their cached principal, so a
+   * new status or role applies to tokens already in use
+   */
+  private async saveUser(user: UserEntity): Promise<UserEntity> {
+    const saved = await this.userRepository.save(user);
+    await this.authService.invalidatePrincipal(user.id, user.email);
+    return saved;
+  }
+
   async updateUser(
     id: string,
     updateDto: AdminUserUpdateDto,
@@ -487,7 +484,7 @@ export class AdminService {
     Object.assign(user, updateDto);
     user.updatedAt = new Date();
 
-    const updatedUser = await this.userRepository.save(user);
+    const updatedUser = await this.saveUser(user);
 
     // Log audit action
     if (adminId) {
@@ -519,7 +516,7 @@ export class AdminService {
     user.role = role as any;
     user.updatedAt = new Date();
 
-    return this.userRepository.save(user);
+    return this.saveUser(user);
   }
 
   async banUser(id: string, banDto: AdminUserBanDto): Promise<UserEntity> {
@@ -542,7 +539,7 @@ export class AdminService {
     }
     user.updatedAt = new Date();
 
-    return this.userRepository.save(user);
+    return this.saveUser(user);
   }
 
   async suspendUser(
@@ -568,7 +565,7 @@ export class AdminService {
     }
     user.updatedAt = new Date();
 
-    return this.userRepository.save(user);
+    return this.saveUser(user);
   }
 
   async reactivateUser(id: string): Promise<UserEntity> {
@@ -581,7 +578,7 @@ export class AdminService {
     user.suspensionExpiresAt = null;
     user.updatedAt = new Date();
 
-    return this.userRepository.save(user);
+    return this.saveUser(user);
   }
 
   async deleteUser(
@@ -601,7 +598,7 @@ export class AdminService {
     user.deletedAt = new Date();
     user.updatedAt = new Date();
 
-    await this.userRepository.save(user);
+    await this.saveUser(user);
 
     // Log audit action
     if (adminId) {
@@ -647,7 +644,7 @@ export class AdminService {
       user.banExpiresAt = null;
     }
 
-    const updatedUser = await this.userRepository.save(user);
+    const updatedUser = await this.saveUser(user);
 
     // Log audit action
     if (adminId) {
@@ -667,80 +664,37 @@ export class AdminService {
 
   // Analytics
   async getPlatformStats(): Promise<PlatformStatsDto> {
-    console.log('=== getPlatformStats called ===');
     try {
       const now = new Date();
       const startOfMonth = new Date(now.getFullYear(), now.getMonth(), 1);
       const thirtyDaysAgo = new Date(now.getTime() - 30 * 24 * 60 * 60 * 1000);
-      console.log('Date ranges:', { now, startOfMonth, thirtyDaysAgo });
-
-      const [totalUsers, totalPartners, totalSpaces, totalBookings] =
-        await Promise.all([
-          this.userRepository.count(),
-          this.partnerRepository.count(),
-          this.spaceRepository.count(),
-          this.bookingRepository.count(),
-        ]);
 
-      const [
-        activeUsers,
-        newUsersThisMonth,
-        newPartnersThisMonth,
-        bookingsThisMonth,
-      ] = await Promise.all([
+      // Totals and month-to-date figures come from the materialized daily
+      // aggregates; only the login-based activity count is computed live.
+      const [[totals, thisMonth], activeUsers] = await Promise.all([
+        this.dashboardAggregateService.sumMany([{}, { from: startOfMonth }]),
         this.userRepository.count({
           where: { lastLoginAt: MoreThan(thirtyDaysAgo) },
         }),
-        this.userRepository.count({
-          where: { createdAt: MoreThan(startOfMonth) },
-        }),
-        this.partnerRepository.count({
-          where: { createdAt: MoreThan(startOfMonth) },
-        }),
-        this.bookingRepository.count({
-          where: { createdAt: MoreThan(startOfMonth) },
-        }),
       ]);
 
-      const revenueResult = await this.paymentRepository
-        .createQueryBuilder('payment')
-        .select('SUM(payment.amount)', 'totalRevenue')
-        .where('payment.status = :status', { status: PaymentStatus.COMPLETED })
-        .getRawOne();
-
-      const revenueThisMonthResult = await this.paymentRepository
-        .createQueryBuilder('payment')
-        .select('SUM(payment.amount)', 'revenueThisMonth')
-        .where('payment.status = :status', { status: PaymentStatus.COMPLETED })
-        .andWhere('payment.createdAt >= :startOfMonth', { startOfMonth })
-        .getRawOne();
-
-      const avgBookingResult = await this.paymentRepository
-        .createQueryBuilder('payment')
-        .select('AVG(payment.amount)', 'averageValue')
-        .where('payment.status = :status', { status: PaymentStatus.COMPLETED })
-        .getRawOne();
-
-      const totalRevenue = parseFloat(revenueResult?.totalRevenue || '0');
-      const revenueThisMonth = parseFloat(
-        revenueThisMonthResult?.revenueThisMonth || '0',
-      );
-      const averageBookingValue = parseFloat(
-        avgBookingResult?.averageValue || '0',
-      );
+      const totalRevenue = totals.completedRevenue;
+      const averageBookingValue = totals.completedPayments
+        ? totalRevenue / totals.completedPayments
+        : 0;
       const platformCommission = totalRevenue * 0.1; // Assuming 10% commission
 
       return {
-        totalUsers,
-        totalPartners,
-        totalSpaces,
-        totalBookings,
+        totalUsers: totals.newUsers,
+        totalPartners: totals.newPartners,
+        totalSpaces: totals.newSpaces,
+        totalBookings: totals.newBookings,
         totalRevenue,
         activeUsers,
-        newUsersThisMonth,
-        newPartnersThisMonth,
-        bookingsThisMonth,
-        revenueThisMonth,
+        newUsersThisMonth: thisMonth.newUsers,
+        newPartnersThisMonth: thisMonth.newPartners,
+        bookingsThisMonth: thisMonth.newBookings,
+        revenueThisMonth: thisMonth.completedRevenue,
         averageBookingValue,
         platformCommission,
       };
@@ -1191,20 +1145,55 @@ export class AdminService {
   }
 
   // Data Export
-  async exportUsers(queryDto: any) {
-    const users = await this.findAllUsers(queryDto);
+  async exportUsers(queryDto: AdminUserQueryDto) {
+    const exportId = randomUUID();
+    await this.exportJobService.enqueue(ExportJob.AdminUsers, {
+      exportId,
+      format: 'csv',
+      filters: {
+        query: queryDto.query,
+        status: queryDto.status,
+        role: queryDto.role,
+        emailVerified: queryDto.emailVerified,
+        createdAfter: queryDto.createdAfter,
+        createdBefore: queryDto.createdBefore,
+        lastLoginAfter: queryDto.lastLoginAfter,
+      },
+    });
 
     return {
       success: true,
       message: 'Export initiated',
-      exportId: `export_${Date.now()}`,
+      exportId,
       format: 'csv',
-      recordCount: users.data.length,
-      downloadUrl: `https://api.example.com/exports/users_${Date.now()}.csv`,
-      expiresAt: new Date(Date.now() + 24 * 60 * 60 * 1000), // 24 hours
+      status: 'waiting',
+      downloadUrl: `/api/v1/admin/exports/${exportId}/download`,
     };
   }
 
+  async getExportStatus(exportId: string): Promise<ExportJobStatus> {
+    const status = await this.exportJobService.getStatus(exportId);
+    if (!status) {
+      throw new NotFoundException('Export not found');
+    }
+    return status;
+  }
+
+  async openExportDownload(exportId: string): Promise<ExportDownload> {
+    const download = await this.exportJobService.openDownload(exportId);
+    if (!download) {
+      throw new NotFoundException('Export is not available for download');
+    }
+    return download;
+  }
+
+  async cancelExport(exportId: string): Promise<ExportJobStatus> {
+    if (!(await this.exportJobService.cancel(exportId))) {
+      throw new NotFoundException('No running export found');
+    }
+    return this.getExportStatus(exportId);
+  }
+
   // User Documents
   async getUserDocuments(userId: string) {
     const user = await this.findUserById(userId);
@@ -2308,16 +2297,37 @@ export class AdminService {
       adminUser.createdAt = new Date();
       adminUser.updatedAt = new Date();
 
-      // Get transactions using FinancialTransactionService
-      const result = await this.financialTransactionService.getTransactions(
-        dto,
-        adminUser,
+      // Filter with FinancialTransactionService, paginate by keyset here
+      const sortColumns: Record<string, string> = {
+        createdAt: 'transaction.createdAt',
+        amount: 'transaction.amount',
+        status: 'transaction.status',
+        type: 'transaction.type',
+      };
+      const sortKey = sortColumns[dto.sortBy] ? dto.sortBy : 'createdAt';
+
+      const result = await keysetPaginate(
+        this.financialTransactionService.createTransactionsQuery(
+          dto,
+          adminUser,
+        ),
+        {
+          sortKey,
+          sortColumn: sortColumns[sortKey],
+          sortOrder: dto.sortOrder,
+          limit,
+          page,
+          afterCursor: queryDto.afterCursor,
+          beforeCursor: queryDto.beforeCursor,
+          exactCount: queryDto.exactCount,
+          cacheService: this.cacheService,
+        },
       );
 
-      const totalPages = Math.ceil(result.total / limit);
+      const totalPages = Math.ceil(result.totalRecords / limit);
 
-      // Map TransactionResponseDto[] to AdminTransactionResponseDto[]
-      const mappedTransactions = result.transactions.map((transaction) => ({
+      // Map FinancialTransactionEntity[] to AdminTransactionResponseDto[]
+      const mappedTransactions = result.items.map((transaction) => ({
         id: transaction.id,
         userId: transaction.user?.id || '',
         type: transaction.type,
@@ -2326,24 +2336,28 @@ export class AdminService {
         status: transaction.status,
         description: transaction.description,
         reference: transaction.externalTransactionId,
-        bookingId: transaction.booking?.id,
+        bookingId: transaction.bookingId,
         createdAt:
           transaction.createdAt?.toString() || new Date().toISOString(),
         updatedAt:
           transaction.updatedAt?.toString() || new Date().toISOString(),
-        processedAt: undefined, // Not available in TransactionResponseDto
+        processedAt: undefined, // Not tracked on financial transactions
       }));
 
       return {
         data: mappedTransactions,
-        totalRecords: result.total,
+        totalRecords: result.totalRecords,
         currentPage: page,
         totalPages,
         limit,
-        hasNextPage: page < totalPages,
-        hasPreviousPage: page > 1,
+        hasNextPage: result.hasNextPage,
+        hasPreviousPage: result.hasPreviousPage,
+        nextCursor: result.nextCursor,
+        previousCursor: result.previousCursor,
+        totalIsEstimate: result.totalIsEstimate,
       };
     } catch (error) {
+      if (error instanceof BadRequestException) throw error;
       this.logger.error('Failed to get all transactions:', error);
       // Return empty result if service fails
       return {
@@ -2478,133 +2492,29 @@ export class AdminService {
   async exportTransactions(
     exportDto: TransactionExportDto,
   ): Promise<TransactionExportResponseDto> {
-    try {
-      // Build query for transactions to export
-      const queryBuilder = this.paymentRepository
-        .createQueryBuilder('payment')
-        .leftJoinAndSelect('payment.booking', 'booking')
-        .leftJoinAndSelect('booking.user', 'user')
-        .leftJoinAndSelect('booking.space', 'space');
-
-      // Apply filters
-      if (exportDto.status) {
-        queryBuilder.where('payment.status = :status', {
-          status: exportDto.status,
-        });
-      }
-
-      if (exportDto.startDate) {
-        queryBuilder.andWhere('payment.createdAt >= :startDate', {
-          startDate: exportDto.startDate,
-        });
-      }
-
-      if (exportDto.endDate) {
-        queryBuilder.andWhere('payment.createdAt <= :endDate', {
-          endDate: exportDto.endDate,
-        });
-      }
-
-      if (exportDto.userId) {
-        queryBuilder.andWhere('user.id = :userId', {
-          userId: exportDto.userId,
-        });
-      }
-
-      if (exportDto.minAmount) {
-        queryBuilder.andWhere('payment.amount >= :minAmount', {
-          minAmount: exportDto.minAmount,
-        });
-      }
-
-      if (exportDto.maxAmount) {
-        queryBuilder.andWhere('payment.amount <= :maxAmount', {
-          maxAmount: exportDto.maxAmount,
-        });
-      }
-
-      // Apply sorting
-      queryBuilder.orderBy('payment.createdAt', 'DESC');
-
-      // Get all matching transactions
-      const transactions = await queryBuilder.getMany();
-
-      // Generate export data based on format
-      let exportData: string;
-      let mimeType: string;
-      let fileExtension: string;
-
-      if (exportDto.format === 'csv') {
-        // Generate CSV
-        const headers = [
-          'Transaction ID',
-          'User ID',
-          'User Name',
-          'User Email',
-          'Booking ID',
-          'Space Name',
-          'Amount',
-          'Currency',
-          'Status',
-          'Payment Method',
-          'Description',
-          'Created At',
-          'Updated At',
-        ];
-
-        const csvRows = [
-          headers.join(','),
-          ...transactions.map((payment) =>
-            [
-              payment.gatewayPaymentId || payment.id,
-              payment.booking?.user?.id || '',
-              payment.booking?.user?.username || '',
-              payment.booking?.user?.email || '',
-              payment.booking?.id || '',
-              payment.booking?.spaceOption?.name || '',
-              payment.amount,
-              payment.currency || 'USD',
-              payment.status,
-              payment.method || '',
-              `"${payment.failureReason || ''}"`,
-              payment.createdAt?.toISOString() || '',
-              payment.updatedAt?.toISOString() || '',
-            ].join(','),
-          ),
-        ];
-
-        exportData = csvRows.join('\n');
-        mimeType = 'text/csv';
-        fileExtension = 'csv';
-      } else {
-        // Generate Excel (simplified as CSV for now)
-        exportData = 'Excel export not implemented yet';
-        mimeType =
-          'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet';
-        fileExtension = 'xlsx';
-      }
-
-      // Generate filename
-      const timestamp = new Date().toISOString().split('T')[0];
-      const filename = `transactions_export_${timestamp}.${fileExtension}`;
-
-      // In a real implementation, you would save this to a file storage service
-      // and return the download URL. For now, we'll return the data directly.
-      const downloadUrl = `/api/v1/admin/downloads/${filename}`;
+    const exportId = randomUUID();
+    const format = exportDto.format || 'csv';
+
+    await this.exportJobService.enqueue(ExportJob.AdminTransactions, {
+      exportId,
+      format: format === 'excel' ? 'xlsx' : 'csv',
+      filters: {
+        status: exportDto.status,
+        startDate: exportDto.startDate,
+        endDate: exportDto.endDate,
+        userId: exportDto.userId,
+        minAmount: exportDto.minAmount,
+        maxAmount: exportDto.maxAmount,
+      },
+    });
 
-      return {
-        fileName: filename,
-        fileUrl: downloadUrl,
-        format: exportDto.format,
-        recordCount: transactions.length,
-        createdAt: new Date().toISOString(),
-        fileSize: Buffer.byteLength(exportData, 'utf8'),
-        expiresAt: new Date(Date.now() + 24 * 60 * 60 * 1000).toISOString(), // 24 hours
-      };
-    } catch (error) {
-      this.logger.error('Failed to export transactions:', error);
-      throw new Error('Failed to export transactions');
-    }
+    return {
+      exportId,
+      status: 'waiting',
+      fileUrl: `/api/v1/admin/exports/${exportId}/download`,
+      format,
+      createdAt: new Date().toISOString(),
+    };
   }
 
   // Bulk Operations
@@ -2621,6 +2531,7 @@ export class AdminService {
         updatedAt: new Date(),
       },
     );
+    await this.authService.invalidatePrincipal(...userIds);
 
     return {
       success: true,
@@ -3082,51 +2993,25 @@ export class AdminService {
       const thirtyDaysAgo = new Date(now.getTime() - 30 * 24 * 60 * 60 * 1000);
       const sixtyDaysAgo = new Date(now.getTime() - 60 * 24 * 60 * 60 * 1000);
 
-      // Current metrics
-      const totalUsers = await this.userRepository.count();
-      const totalBookings = await this.bookingRepository.count();
-      const activeSpaces = await this.spaceRepository.count({
-        where: { status: SpaceStatus.ACTIVE },
-      });
-
-      const totalRevenueResult = await this.paymentRepository
-        .createQueryBuilder('payment')
-        .select('SUM(payment.amount)', 'total')
-        .where('payment.status = :status', { status: PaymentStatus.COMPLETED })
-        .getRawOne();
-      const totalRevenue = parseFloat(totalRevenueResult?.total) || 0;
-
-      // Previous period metrics for growth calculation (30-60 days ago)
-      const usersLastMonth = await this.userRepository.count({
-        where: {
-          createdAt: Between(sixtyDaysAgo, thirtyDaysAgo),
-          role: Not(In(['Admin', 'SuperAdmin'])),
-        },
-      });
-
-      const bookingsLastMonth = await this.bookingRepository.count({
-        where: {
-          createdAt: Between(sixtyDaysAgo, thirtyDaysAgo),
-        },
-      });
-
-      const spacesLastMonth = await this.spaceRepository.count({
-        where: {
-          createdAt: Between(sixtyDaysAgo, thirtyDaysAgo),
-          status: SpaceStatus.ACTIVE,
-        },
-      });
+      // Current totals and the previous period (30-60 days ago) are read
+      // from the materialized daily aggregates in a single statement.
+      const [[totals, lastMonth], activeSpaces] = await Promise.all([
+        this.dashboardAggregateService.sumMany([
+          {},
+          { from: sixtyDaysAgo, to: thirtyDaysAgo },
+        ]),
+        this.spaceRepository.count({
+          where: { status: SpaceStatus.ACTIVE },
+        }),
+      ]);
 
-      const revenueLastMonthResult = await this.paymentRepository
-        .createQueryBuilder('payment')
-        .select('SUM(payment.amount)', 'total')
-        .where('payment.status = :status', { status: PaymentStatus.COMPLETED })
-        .andWhere('payment.createdAt BETWEEN :start AND :end', {
-          start: sixtyDaysAgo,
-          end: thirtyDaysAgo,
-        })
-        .getRawOne();
-      const revenueLastMonth = parseFloat(revenueLastMonthResult?.total) || 0;
+      const totalUsers = totals.newUsers;
+      const totalBookings = totals.newBookings;
+      const totalRevenue = totals.completedRevenue;
+      const usersLastMonth = lastMonth.newNonAdminUsers;
+      const bookingsLastMonth = lastMonth.newBookings;
+      const spacesLastMonth = lastMonth.newActiveSpaces;
+      const revenueLastMonth = lastMonth.completedRevenue;
 
       // Calculate growth percentages
       const calculateGrowth = (current: number, previous: number): number => {
@@ -3362,7 +3247,7 @@ export class AdminService {
 
     if (search) {
       queryBuilder.andWhere(
-        "(CONCAT(user.firstName, ' ', user.lastName) ILIKE :search OR user.email ILIKE :search OR partner.id::text ILIKE :search)",
+        "(CONCAT(partner.firstName, ' ', partner.lastName) ILIKE :search OR partner.email ILIKE :search OR partner.id::text ILIKE :search)",
         { search: `%${search}%` },
       );
     }
@@ -3372,52 +3257,63 @@ export class AdminService {
     }
 
     if (balanceMin !== undefined) {
-      queryBuilder.andWhere('wallet.balance >= :balanceMin', { balanceMin });
+      queryBuilder.andWhere('wallet.availableBalance >= :balanceMin', {
+        balanceMin,
+      });
     }
 
     if (balanceMax !== undefined) {
-      queryBuilder.andWhere('wallet.balance <= :balanceMax', { balanceMax });
-    }
-
-    // Handle sorting
-    let orderField = 'wallet.createdAt';
-    switch (sortBy) {
-      case 'partnerName':
-        orderField = "CONCAT(user.firstName, ' ', user.lastName)";
-        break;
-      case 'currentBalance':
-        orderField = 'wallet.balance';
-        break;
-      case 'pendingEarnings':
-        orderField = 'wallet.pendingEarnings';
-        break;
-      case 'lastPayoutDate':
-        orderField = 'wallet.lastPayoutDate';
-        break;
-      case 'status':
-        orderField = 'wallet.status';
-        break;
-      default:
-        orderField = 'wallet.createdAt';
+      queryBuilder.andWhere('wallet.availableBalance <= :balanceMax', {
+        balanceMax,
+      });
     }
 
-    queryBuilder.orderBy(orderField, sortOrder.toUpperCase() as 'ASC' | 'DESC');
+    // Sort columns, with the id as keyset tie-breaker
+    const sortColumns: Record<string, KeysetSortColumn> = {
+      partnerName: { column: 'partner.firstName', nullable: true },
+      currentBalance: { column: 'wallet.availableBalance' },
+      pendingEarnings: { column: 'wallet.pendingBalance' },
+      lastPayoutDate: { column: 'wallet.lastTransactionDate', nullable: true },
+      status: { column: 'wallet.status' },
+      createdAt: { column: 'wallet.createdAt' },
+    };
+    const sortKey = sortColumns[sortBy] ? sortBy : 'createdAt';
 
-    const offset = (page - 1) * limit;
-    queryBuilder.skip(offset).take(limit);
+    const result = await keysetPaginate(queryBuilder, {
+      sortKey,
+      sortColumn: sortColumns[sortKey].column,
+      sortOrder: sortOrder.toUpperCase() as 'ASC' | 'DESC',
+      nullable: sortColumns[sortKey].nullable,
+      limit,
+      page,
+      afterCursor: queryDto.afterCursor,
+      beforeCursor: queryDto.beforeCursor,
+      exactCount: queryDto.exactCount,
+      cacheService: this.cacheService,
+    });
+    const wallets = result.items;
 
-    const [wallets, total] = await queryBuilder.getManyAndCount();
+    const lastPayoutDates =
+      await this.adminListEnrichmentService.getLastPayoutDates(
+        wallets.map((wallet) => wallet.partnerId),
+      );
 
     const data = wallets.map((wallet) =>
-      this.mapToAdminPartnerWalletDto(wallet),
+      this.mapToAdminPartnerWalletDto(
+        wallet,
+        lastPayoutDates.get(wallet.partnerId),
+      ),
     );
 
     return {
       data,
-      total,
+      total: result.totalRecords,
       page,
       limit,
-      totalPages: Math.ceil(total / limit),
+      totalPages: Math.ceil(result.totalRecords / limit),
+      nextCursor: result.nextCursor,
+      previousCursor: result.previousCursor,
+      totalIsEstimate: result.totalIsEstimate,
     };
   }
 
@@ -3472,7 +3368,6 @@ export class AdminService {
         sortBy = 'createdAt',
         sortOrder = 'desc',
       } = queryDto;
-      const skip = (page - 1) * limit;
 
       const queryBuilder = this.userWalletRepository
         .createQueryBuilder('wallet')
@@ -3503,104 +3398,83 @@ export class AdminService {
         queryBuilder.andWhere('wallet.balance <= :balanceMax', { balanceMax });
       }
 
-      // Apply sorting
-      let sortField = 'wallet.createdAt';
-      switch (sortBy) {
-        case 'userName':
-          sortField = 'user.firstName';
-          break;
-        case 'userEmail':
-          sortField = 'user.email';
-          break;
-        case 'balance':
-          sortField = 'wallet.balance';
-          break;
-        case 'lastActivity':
-          sortField = 'wallet.lastTransactionAt';
-          break;
-        default:
-          sortField = 'wallet.createdAt';
-      }
-
-      queryBuilder.orderBy(
-        sortField,
-        sortOrder.toUpperCase() as 'ASC' | 'DESC',
-      );
-
-      // Apply pagination
-      queryBuilder.skip(skip).take(limit);
-
-      const [wallets, total] = await queryBuilder.getManyAndCount();
-
-      const data = await Promise.all(
-        wallets.map(async (wallet) => {
-          const user = wallet.user;
-
-          // Get completed bookings for this user to calculate total spent
-          const completedBookings = await this.bookingRepository.find({
-            where: {
-              userId: user.id,
-              status: BookingStatus.COMPLETED,
-            },
-            select: ['totalAmount'],
-          });
+      // Sort columns, with the id as keyset tie-breaker
+      const sortColumns: Record<string, KeysetSortColumn> = {
+        userName: { column: 'user.firstName', nullable: true },
+        userEmail: { column: 'user.email' },
+        balance: { column: 'wallet.balance' },
+        lastActivity: { column: 'wallet.lastTransactionAt', nullable: true },
+        createdAt: { column: 'wallet.createdAt' },
+      };
+      const sortKey = sortColumns[sortBy] ? sortBy : 'createdAt';
 
-          const totalSpent = completedBookings.reduce(
-            (sum, booking) => sum + (booking.totalAmount || 0),
-            0,
-          );
+      const result = await keysetPaginate(queryBuilder, {
+        sortKey,
+        sortColumn: sortColumns[sortKey].column,
+        sortOrder: sortOrder.toUpperCase() as 'ASC' | 'DESC',
+        nullable: sortColumns[sortKey].nullable,
+        limit,
+        page,
+        afterCursor: queryDto.afterCursor,
+        beforeCursor: queryDto.beforeCursor,
+        exactCount: queryDto.exactCount,
+        cacheService: this.cacheService,
+      });
+      const wallets = result.items;
 
-          // Get completed payments for this user to calculate total topups
-          // Note: We'll use a simple calculation for now since payment type might not be available
-          const completedPayments = await this.paymentRepository.find({
-            where: {
-              userId: user.id,
-              status: PaymentStatus.COMPLETED,
-            },
-            select: ['amount'],
-          });
+      // One grouped query per page for spend/top-up totals instead of two
+      // per wallet
+      const spendTotals =
+        await this.adminListEnrichmentService.getUserSpendTotals(
+          wallets.map((wallet) => wallet.userId),
+        );
 
-          const totalTopups = completedPayments.reduce(
-            (sum, payment) => sum + (payment.amount || 0),
-            0,
-          );
+      const data = wallets.map((wallet) => {
+        const user = wallet.user;
+        const { totalSpent, totalTopups } = spendTotals.get(wallet.userId) ?? {
+          totalSpent: 0,
+          totalTopups: 0,
+        };
 
-          // Get last activity from wallet or user's last update
-          const lastActivity =
-            wallet.lastTransactionAt || wallet.updatedAt || wallet.createdAt;
+        // Get last activity from wallet or user's last update
+        const lastActivity =
+          wallet.lastTransactionAt || wallet.updatedAt || wallet.createdAt;
 
-          return {
-            id: wallet.id,
-            userId: wallet.userId,
-            userName:
-              `${user.firstName || ''} ${user.lastName || ''}`.trim() ||
-              'Unknown User',
-            userEmail: user.email,
-            balance: Number(wallet.balance) || 0,
-            lockedBalance: Number(wallet.lockedBalance) || 0,
-            currency: wallet.currency || 'INR',
-            balanceType: wallet.balanceType,
-            totalSpent,
-            totalTopups,
-            lastActivity: lastActivity ? lastActivity.toISOString() : null,
-            createdAt: wallet.createdAt
-              ? wallet.createdAt.toISOString()
-              : new Date().toISOString(),
-            updatedAt: wallet.updatedAt
-              ? wallet.updatedAt.toISOString()
-              : new Date().toISOString(),
-          };
-        }),
-      );
+        return {
+          id: wallet.id,
+          userId: wallet.userId,
+          userName:
+            `${user.firstName || ''} ${user.lastName || ''}`.trim() ||
+            'Unknown User',
+          userEmail: user.email,
+          balance: Number(wallet.balance) || 0,
+          lockedBalance: Number(wallet.lockedBalance) || 0,
+          currency: wallet.currency || 'INR',
+          balanceType: wallet.balanceType,
+          totalSpent,
+          totalTopups,
+          lastActivity: lastActivity ? lastActivity.toISOString() : null,
+          createdAt: wallet.createdAt
+            ? wallet.createdAt.toISOString()
+            : new Date().toISOString(),
+          updatedAt: wallet.updatedAt
+            ? wallet.updatedAt.toISOString()
+            : new Date().toISOString(),
+        };
+      });
 
       return {
         data,
-        total,
+        total: result.totalRecords,
         page,
         limit,
-        totalPages: Math.ceil(total / limit),
+        totalPages: Math.ceil(result.totalRecords / limit),
+        nextCursor: result.nextCursor,
+        previousCursor: result.previousCursor,
+        totalIsEstimate: result.totalIsEstimate,
       };
     } catch (error) {
+      if (error instanceof BadRequestException) throw error;
       this.logger.error('Error getting user wallets:', error);
       throw new Error('Failed to get user wallets');
     }
@@ -3622,25 +3496,27 @@ export class AdminService {
   async updateWalletStatus(id: string, updateDto: UpdateWalletStatusDto) {
     const wallet = await this.walletRepository.findOne({
       where: { id },
-      relations: ['partner'],
     });
 
     if (!wallet) {
       throw new NotFoundException(`Wallet with ID ${id} not found`);
     }
 
-    wallet.status = updateDto.status;
-    wallet.updatedAt = new Date();
+    const changes: Partial<PartnerWalletEntity> = {
+      status: updateDto.status,
+      updatedAt: new Date(),
+    };
 
     if (updateDto.reason) {
-      wallet.metadata = {
+      changes.metadata = {
         ...wallet.metadata,
         statusChangeReason: updateDto.reason,
         statusChangedAt: new Date().toISOString(),
       };
     }
 
-    await this.walletRepository.save(wallet);
+    // Column-scoped so balances moved since the read are not overwritten
+    await this.walletRepository.update(id, changes);
 
     return {
       success: true,
@@ -3799,11 +3675,6 @@ export class AdminService {
     queryDto: AdminPayoutQueryDto,
   ): Promise<AdminPayoutListResponseDto> {
     try {
-      this.logger.log(
-        'getAllPayouts called with query:',
-        JSON.stringify(queryDto),
-      );
-
       const {
         page = 1,
         limit = 10,
@@ -3821,8 +3692,7 @@ export class AdminService {
       const queryBuilder = this.payoutRequestRepository
         .createQueryBuilder('payoutRequest')
         .leftJoinAndSelect('payoutRequest.partner', 'partner')
-        .leftJoinAndSelect('payoutRequest.bankAccount', 'bankAccount')
-        .leftJoinAndSelect('payoutRequest.payouts', 'payouts');
+        .leftJoinAndSelect('payoutRequest.bankAccount', 'bankAccount');
 
       // Apply filters
       if (search) {
@@ -3866,29 +3736,41 @@ export class AdminService {
         });
       }
 
-      // Apply sorting
-      const sortField =
-        sortBy === 'partnerName'
-          ? 'partner.firstName'
-          : `payoutRequest.${sortBy}`;
-      queryBuilder.orderBy(sortField, sortOrder);
-
-      // Apply pagination
-      const offset = (page - 1) * limit;
-      queryBuilder.skip(offset).take(limit);
-
-      this.logger.log('Executing query...');
+      // Sort columns, with the id as keyset tie-breaker
+      const sortColumns: Record<string, KeysetSortColumn> = {
+        createdAt: { column: 'payoutRequest.createdAt' },
+        updatedAt: { column: 'payoutRequest.updatedAt' },
+        amount: { column: 'payoutRequest.amount' },
+        partnerName: { column: 'partner.firstName', nullable: true },
+        status: { column: 'payoutRequest.status' },
+      };
+      const sortKey = sortColumns[sortBy] ? sortBy : 'createdAt';
 
-      // Get results and total count
-      const [payoutRequests, total] = await queryBuilder.getManyAndCount();
+      const result = await keysetPaginate(queryBuilder, {
+        sortKey,
+        sortColumn: sortColumns[sortKey].column,
+        sortOrder,
+        nullable: sortColumns[sortKey].nullable,
+        limit,
+        page,
+        afterCursor: queryDto.afterCursor,
+        beforeCursor: queryDto.beforeCursor,
+        exactCount: queryDto.exactCount,
+        cacheService: this.cacheService,
+      });
+      const payoutRequests = result.items;
 
-      this.logger.log(
-        `Found ${total} payout requests, returning ${payoutRequests.length} for current page`,
-      );
+      const walletBalances =
+        await this.adminListEnrichmentService.getPartnerWalletBalances(
+          payoutRequests.map((request) => request.partnerId),
+        );
 
       // Transform to response DTOs
       const payouts = payoutRequests.map((request) =>
-        this.mapToAdminPayoutResponseDto(request),
+        this.mapToAdminPayoutResponseDto(
+          request,
+          walletBalances.get(request.partnerId),
+        ),
       );
 
       return {
@@ -3896,11 +3778,15 @@ export class AdminService {
         pagination: {
           page,
           limit,
-          total,
-          totalPages: Math.ceil(total / limit),
+          total: result.totalRecords,
+          totalPages: Math.ceil(result.totalRecords / limit),
         },
+        nextCursor: result.nextCursor,
+        previousCursor: result.previousCursor,
+        totalIsEstimate: result.totalIsEstimate,
       };
     } catch (error) {
+      if (error instanceof BadRequestException) throw error;
       this.logger.error('Error in getAllPayouts:', error);
       this.logger.error('Error details:', {
         message: error.message,
@@ -3923,6 +3809,7 @@ export class AdminService {
 
   private mapToAdminPayoutResponseDto(
     payoutRequest: PayoutRequestEntity,
+    walletBalance = 0,
   ): AdminPayoutResponseDto {
     try {
       const partner = payoutRequest.partner;
@@ -3936,7 +3823,7 @@ export class AdminService {
           : 'Unknown Partner',
         partnerEmail: partner?.email || 'Unknown Email',
         requestedAmount: Number(payoutRequest.amount),
-        walletBalance: 0, // This would need to be fetched from wallet if needed
+        walletBalance,
         dateTime: payoutRequest.createdAt.toISOString(),
         status: payoutRequest.status as any, // Map to AdminPayoutStatus
         payoutGateway: payoutRequest.payoutMethod || 'Bank Transfer',
@@ -4442,6 +4329,11 @@ export class AdminService {
 
     const [spaces, total] = await queryBuilder.getManyAndCount();
 
+    const priceSummaries =
+      await this.adminListEnrichmentService.getSpacePriceSummaries(
+        spaces.map((space) => space.id),
+      );
+
     // Transform to response format
     const spaceItems = spaces.map((space) => ({
       id: space.id,
@@ -4456,7 +4348,7 @@ export class AdminService {
         coordinates: undefined, // TODO: Get coordinates from space or partner location
       },
       pricing: {
-        basePrice: 0,
+        basePrice: priceSummaries.get(space.id)?.basePrice ?? 0,
         currency: 'INR',
         pricePerHour: 0,
         pricePerDay: 0,
@@ -4465,7 +4357,7 @@ export class AdminService {
         minimumBookingHours: 1,
         maximumBookingHours: 24,
         discounts: null,
-      }, // TODO: Get actual pricing from space options
+      },
       status: space.status as any,
       rating: space.rating || 0,
       reviewCount: space.reviewCount || 0,
@@ -5440,10 +5332,6 @@ export class AdminService {
   async findAllBookings(
     queryDto: BookingQueryDto,
   ): Promise<BookingListResponseDto> {
-    console.log('=== ENTERING findAllBookings ===');
-    console.log('Query DTO:', JSON.stringify(queryDto, null, 2));
-    console.log('BookingRepository:', !!this.bookingRepository);
-
     try {
       const {
         search,
@@ -5524,27 +5412,29 @@ export class AdminService {
         });
       }
 
-      // Map sortBy to actual database column names
-      const sortFieldMap = {
-        createdAt: 'booking.createdAt',
-        bookingDate: 'booking.startDateTime',
-        amount: 'booking.totalAmount',
-        status: 'booking.status',
+      // Sort columns, with the id as keyset tie-breaker
+      const sortColumns: Record<string, KeysetSortColumn> = {
+        createdAt: { column: 'booking.createdAt' },
+        bookingDate: { column: 'booking.startDateTime' },
+        amount: { column: 'booking.totalAmount' },
+        status: { column: 'booking.status' },
       };
+      const sortKey = sortColumns[sortBy] ? sortBy : 'createdAt';
 
-      const actualSortField = sortFieldMap[sortBy] || 'booking.createdAt';
-      queryBuilder.orderBy(
-        actualSortField,
-        sortOrder.toUpperCase() as 'ASC' | 'DESC',
-      );
-
-      const offset = (page - 1) * limit;
-      queryBuilder.skip(offset).take(limit);
-
-      const [items, total] = await queryBuilder.getManyAndCount();
+      const result = await keysetPaginate(queryBuilder, {
+        sortKey,
+        sortColumn: sortColumns[sortKey].column,
+        sortOrder: sortOrder.toUpperCase() as 'ASC' | 'DESC',
+        limit,
+        page,
+        afterCursor: queryDto.afterCursor,
+        beforeCursor: queryDto.beforeCursor,
+        exactCount: queryDto.exactCount,
+        cacheService: this.cacheService,
+      });
 
       // Transform to BookingListItemDto
-      const bookings = items.map((booking) => ({
+      const bookings = result.items.map((booking) => ({
         id: booking.id,
         bookingReference: booking.bookingNumber,
         bookingDate: booking.startDateTime
@@ -5580,14 +5470,19 @@ export class AdminService {
       const pageOptions = new PageOptionsDto();
       Object.assign(pageOptions, { page, limit });
 
-      return new BookingListResponseDto(
-        bookings,
-        new OffsetPaginationDto(total, pageOptions),
+      return Object.assign(
+        new BookingListResponseDto(
+          bookings,
+          new OffsetPaginationDto(result.totalRecords, pageOptions),
+        ),
+        {
+          nextCursor: result.nextCursor,
+          previousCursor: result.previousCursor,
+          totalIsEstimate: result.totalIsEstimate,
+        },
       );
     } catch (error) {
-      console.error('=== ERROR in findAllBookings ===');
-      console.error('Error details:', error);
-      console.error('Stack trace:', error.stack);
+      this.logger.error('Failed to list bookings:', error);
       throw error;
     }
   }
@@ -6764,6 +6659,7 @@ export class AdminService {
 
   private mapToAdminPartnerWalletDto(
     wallet: PartnerWalletEntity,
+    lastPayoutDate?: Date,
   ): AdminPartnerWalletDto {
     try {
       const partner = wallet.partner;
@@ -6801,7 +6697,8 @@ export class AdminService {
         currentBalance: wallet.availableBalance || 0,
         pendingEarnings: wallet.pendingBalance || 0,
         commissionRate: 0, // This would need to come from partner commission settings
-        lastPayoutDate: wallet.lastTransactionDate?.toISOString() || '',
+        lastPayoutDate:
+          (lastPayoutDate ?? wallet.lastTransactionDate)?.toISOString() || '',
         status: convertStatus(wallet.status),
         createdAt: wallet.createdAt.toISOString(),
         updatedAt: wallet.updatedAt.toISOString(),
@@ -8373,8 +8270,8 @@ export class AdminService {
 
       switch (type) {
         case 'users':
-          exportData = await this.exportUsers(filters);
-          break;
+          // Users are exported by the export queue
+          return this.exportUsers(filters || {});
         case 'spaces':
           exportData = await this.exportSpaces(filters);
           break;
@@ -0,0 +1,101 @@
+import { Role } from '@/api/user/user.enum';
+import { SpaceStatus } from '@/common/enums/space.enum';
+import { DashboardDailyAggregateEntity } from '@/database/entities/dashboard-daily-aggregate.entity';
+import { Test, TestingModule } from '@nestjs/testing';
+import { getRepositoryToken } from '@nestjs/typeorm';
+import { DataSource } from 'typeorm';
+import { DashboardAggregateService } from './dashboard-aggregate.service';
+
+describe('DashboardAggregateService', () => {
+  let service: DashboardAggregateService;
+
+  const insertBuilder = {
+    insert: jest.fn().mockReturnThis(),
+    into: jest.fn().mockReturnThis(),
+    values: jest.fn().mockReturnThis(),
+    execute: jest.fn(),
+  };
+  const manager = {
+    query: jest.fn(),
+    createQueryBuilder: jest.fn(() => insertBuilder),
+  };
+  const dataSource = {
+    query: jest.fn(),
+    transaction: jest.fn((work) => work(manager)),
+  };
+
+  beforeEach(async () => {
+    jest.clearAllMocks();
+
+    const module: TestingModule = await Test.createTestingModule({
+      providers: [
+        DashboardAggregateService,
+        { provide: DataSource, useValue: dataSource },
+        {
+          provide: getRepositoryToken(DashboardDailyAggregateEntity),
+          useValue: { count: jest.fn() },
+        },
+      ],
+    }).compile();
+
+    service = module.get<DashboardAggregateService>(DashboardAggregateService);
+  });
+
+  describe('reconcile', () => {
+    it('should count non-admin users and active spaces', async () => {
+      const grouped: Record<string, unknown[]> = {
+        '"user"': [{ day: '2026-10-01', count: '5', filtered: '3' }],
+        '"partner"': [],
+        '"space"': [{ day: '2026-10-01', count: '4', filtered: '2' }],
+        '"booking"': [],
+        '"payment"': [],
+      };
+      dataSource.query.mockImplementation(async (sql: string) => {
+        const table = Object.keys(grouped).find((name) =>
+          sql.includes(`FROM ${name}`),
+        );
+        return grouped[table];
+      });
+
+      await service.reconcile({ from: new Date('2026-10-01') });
+
+      const userCall = dataSource.query.mock.calls.find(([sql]) =>
+        sql.includes('FROM "user"'),
+      );
+      const spaceCall = dataSource.query.mock.calls.find(([sql]) =>
+        sql.includes('FROM "space"'),
+      );
+      expect(userCall[1]).toEqual([
+        '2026-10-01',
+        [Role.Admin, Role.SuperAdmin],
+      ]);
+      expect(spaceCall[1]).toEqual(['2026-10-01', SpaceStatus.ACTIVE]);
+      expect(insertBuilder.values).toHaveBeenCalledWith([
+        expect.objectContaining({
+          day: '2026-10-01',
+          newUsers: 5,
+          newNonAdminUsers: 3,
+          newSpaces: 4,
+          newActiveSpaces: 2,
+        }),
+      ]);
+    });
+  });
+
+  describe('sumMany', () => {
+    it('should read each window from its own FILTER columns', async () => {
+      dataSource.query.mockResolvedValue([
+        { w0_newNonAdminUsers: '10', w1_newActiveSpaces: '4' },
+      ]);
+
+      const [totals, lastMonth] = await service.sumMany([
+        {},
+        { from: new Date('2026-09-01'), to: new Date('2026-09-30') },
+      ]);
+
+      expect(totals.newNonAdminUsers).toBe(10);
+      expect(lastMonth.newActiveSpaces).toBe(4);
+      expect(lastMonth.newUsers).toBe(0);
+    });
+  });
+});
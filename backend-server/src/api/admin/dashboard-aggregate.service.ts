@@ -0,0 +1,347 @@
+import { Role } from '@/api/user/user.enum';
+import { BookingStatus, PaymentStatus } from '@/common/enums/booking.enum';
+import {
+  BookingCompletedEvent,
+  BookingCreatedEvent,
+} from '@/common/events/domain-events/booking.events';
+import { SpaceStatus } from '@/common/enums/space.enum';
+import { DashboardDailyAggregateEntity } from '@/database/entities/dashboard-daily-aggregate.entity';
+import { Injectable, Logger, OnApplicationBootstrap } from '@nestjs/common';
+import { OnEvent } from '@nestjs/event-emitter';
+import { Cron, CronExpression } from '@nestjs/schedule';
+import { InjectRepository } from '@nestjs/typeorm';
+import { DataSource, Repository } from 'typeorm';
+
+export type DashboardCounter =
+  | 'newUsers'
+  | 'newNonAdminUsers'
+  | 'newPartners'
+  | 'newSpaces'
+  | 'newActiveSpaces'
+  | 'newBookings'
+  | 'completedBookings'
+  | 'completedPayments'
+  | 'completedRevenue';
+
+export const DASHBOARD_COUNTERS: DashboardCounter[] = [
+  'newUsers',
+  'newNonAdminUsers',
+  'newPartners',
+  'newSpaces',
+  'newActiveSpaces',
+  'newBookings',
+  'completedBookings',
+  'completedPayments',
+  'completedRevenue',
+];
+
+export type DashboardCounters = Record<DashboardCounter, number>;
+
+export interface DashboardAggregateWindow {
+  from?: Date;
+  to?: Date;
+}
+
+const TABLE = 'dashboard_daily_aggregates';
+
+/** Roles left out of the user growth KPI */
+const ADMIN_ROLES: string[] = [Role.Admin, Role.SuperAdmin];
+
+/**
+ * Per-day materialized counters for the admin dashboard.
+ *
+ * Domain events apply increments as they happen; a periodic reconciliation
+ * recomputes recent days from the source tables (covering entities without
+ * events, such as users and partners, soft deletes and missed events) and a nightly pass rebuilds the
+ * full history with one grouped scan per table.
+ */
+@Injectable()
+export class DashboardAggregateService implements OnApplicationBootstrap {
+  private readonly logger = new Logger(DashboardAggregateService.name);
+
+  constructor(
+    @InjectRepository(DashboardDailyAggregateEntity)
+    private readonly aggregateRepository: Repository<DashboardDailyAggregateEntity>,
+    private readonly dataSource: DataSource,
+  ) {}
+
+  async onApplicationBootstrap(): Promise<void> {
+    try {
+      const existing = await this.aggregateRepository.count();
+      if (existing === 0) {
+        await this.reconcile();
+      }
+    } catch (error) {
+      this.logger.error(
+        `Failed to seed dashboard aggregates: ${error.message}`,
+        error,
+      );
+    }
+  }
+
+  /**
+   * Atomically add deltas to the counters of the given day.
+   */
+  async increment(
+    date: Date,
+    deltas: Partial<DashboardCounters>,
+  ): Promise<void> {
+    const counters = DASHBOARD_COUNTERS.filter((c) => deltas[c]);
+    if (counters.length === 0) return;
+
+    const columns = counters.map((c) => `"${c}"`).join(', ');
+    const placeholders = counters.map((_, i) => `$${i + 2}`).join(', ');
+    const updates = counters
+      .map((c) => `"${c}" = ${TABLE}."${c}" + EXCLUDED."${c}"`)
+      .join(', ');
+
+    await this.dataSource.query(
+      `INSERT INTO ${TABLE} ("day", ${columns})
+       VALUES ($1, ${placeholders})
+       ON CONFLICT ("day") DO UPDATE SET ${updates}, "updatedAt" = now()`,
+      [this.toDay(date), ...counters.map((c) => deltas[c])],
+    );
+  }
+
+  /**
+   * Sum counters over an optional [from, to] day window.
+   */
+  async sum(window: DashboardAggregateWindow = {}): Promise<DashboardCounters> {
+    const [totals] = await this.sumMany([window]);
+    return totals;
+  }
+
+  /**
+   * Sum counters for several windows in a single statement using
+   * `FILTER` clauses, e.g. all-time totals alongside this month.
+   */
+  async sumMany(
+    windows: DashboardAggregateWindow[],
+  ): Promise<DashboardCounters[]> {
+    const params: string[] = [];
+    const selects: string[] = [];
+
+    windows.forEach((window, w) => {
+      const conditions: string[] = [];
+      if (window.from) {
+        params.push(this.toDay(window.from));
+        conditions.push(`"day" >= $${params.length}`);
+      }
+      if (window.to) {
+        params.push(this.toDay(window.to));
+        conditions.push(`"day" <= $${params.length}`);
+      }
+      const filter = conditions.length
+        ? ` FILTER (WHERE ${conditions.join(' AND ')})`
+        : '';
+      for (const counter of DASHBOARD_COUNTERS) {
+        selects.push(
+          `COALESCE(SUM("${counter}")${filter}, 0) AS "w${w}_${counter}"`,
+        );
+      }
+    });
+
+    const [row] = await this.dataSource.query(
+      `SELECT ${selects.join(', ')} FROM ${TABLE}`,
+      params,
+    );
+
+    return windows.map((_, w) => {
+      const totals = {} as DashboardCounters;
+      for (const counter of DASHBOARD_COUNTERS) {
+        totals[counter] = parseFloat(row?.[`w${w}_${counter}`] ?? '0') || 0;
+      }
+      return totals;
+    });
+  }
+
+  /**
+   * Recompute the counters for the given day window (the whole history when
+   * omitted) from the source tables, replacing whatever was stored.
+   */
+  async reconcile(window: DashboardAggregateWindow = {}): Promise<number> {
+    const startedAt = Date.now();
+    const from = window.from ? this.toDay(window.from) : null;
+    const to = window.to ? this.toDay(window.to) : null;
+
+    const range = (column: string) => {
+      const conditions: string[] = [];
+      if (from) conditions.push(`DATE(${column}) >= $1`);
+      if (to) conditions.push(`DATE(${column}) <= $${from ? 2 : 1}`);
+      return conditions.length ? ` AND ${conditions.join(' AND ')}` : '';
+    };
+    const params = [from, to].filter(Boolean);
+
+    const grouped = async (
+      sql: string,
+      column: string,
+      extraParams: unknown[] = [],
+    ): Promise<
+      Array<{ day: string; count: string; total?: string; filtered?: string }>
+    > =>
+      this.dataSource.query(
+        `${sql}${range(column)} GROUP BY 1`,
+        [...params, ...extraParams],
+      );
+
+    const statusParam = `$${params.length + 1}`;
+    const [users, partners, spaces, bookings, completed, payments] =
+      await Promise.all([
+        grouped(
+          `SELECT DATE("createdAt")::text AS day, COUNT(*) AS count, COUNT(*) FILTER (WHERE "role"::text <> ALL(${statusParam})) AS filtered FROM "user" WHERE "deletedAt" IS NULL`,
+          '"createdAt"',
+          [ADMIN_ROLES],
+        ),
+        grouped(
+          `SELECT DATE("createdAt")::text AS day, COUNT(*) AS count FROM "partner" WHERE "deletedAt" IS NULL`,
+          '"createdAt"',
+        ),
+        grouped(
+          `SELECT DATE("createdAt")::text AS day, COUNT(*) AS count, COUNT(*) FILTER (WHERE "status" = ${statusParam}) AS filtered FROM "space" WHERE "deletedAt" IS NULL`,
+          '"createdAt"',
+          [SpaceStatus.ACTIVE],
+        ),
+        grouped(
+          `SELECT DATE("createdAt")::text AS day, COUNT(*) AS count FROM "booking" WHERE "deletedAt" IS NULL`,
+          '"createdAt"',
+        ),
+        grouped(
+          `SELECT DATE("updatedAt")::text AS day, COUNT(*) AS count FROM "booking" WHERE "deletedAt" IS NULL AND "status" = ${statusParam}`,
+          '"updatedAt"',
+          [BookingStatus.COMPLETED],
+        ),
+        grouped(
+          `SELECT DATE(COALESCE("completedAt", "createdAt"))::text AS day, COUNT(*) AS count, COALESCE(SUM("amount"), 0) AS total FROM "payment" WHERE "deletedAt" IS NULL AND "status" = ${statusParam}`,
+          'COALESCE("completedAt", "createdAt")',
+          [PaymentStatus.COMPLETED],
+        ),
+      ]);
+
+    const days = new Map<string, DashboardCounters>();
+    const row = (day: string) => {
+      if (!days.has(day)) {
+        days.set(day, {
+          newUsers: 0,
+          newNonAdminUsers: 0,
+          newPartners: 0,
+          newSpaces: 0,
+          newActiveSpaces: 0,
+          newBookings: 0,
+          completedBookings: 0,
+          completedPayments: 0,
+          completedRevenue: 0,
+        });
+      }
+      return days.get(day);
+    };
+
+    users.forEach((r) => {
+      row(r.day).newUsers = Number(r.count);
+      row(r.day).newNonAdminUsers = Number(r.filtered);
+    });
+    partners.forEach((r) => (row(r.day).newPartners = Number(r.count)));
+    spaces.forEach((r) => {
+      row(r.day).newSpaces = Number(r.count);
+      row(r.day).newActiveSpaces = Number(r.filtered);
+    });
+    bookings.forEach((r) => (row(r.day).newBookings = Number(r.count)));
+    completed.forEach((r) => (row(r.day).completedBookings = Number(r.count)));
+    payments.forEach((r) => {
+      row(r.day).completedPayments = Number(r.count);
+      row(r.day).completedRevenue = parseFloat(r.total) || 0;
+    });
+
+    await this.dataSource.transaction(async (manager) => {
+      const deleteConditions: string[] = [];
+      if (from) deleteConditions.push(`"day" >= $1`);
+      if (to) deleteConditions.push(`"day" <= $${from ? 2 : 1}`);
+      await manager.query(
+        `DELETE FROM ${TABLE}${deleteConditions.length ? ` WHERE ${deleteConditions.join(' AND ')}` : ''}`,
+        params,
+      );
+
+      const rows = Array.from(days.entries()).map(([day, counters]) => ({
+        day,
+        ...counters,
+      }));
+      const chunkSize = 500;
+      for (let i = 0; i < rows.length; i += chunkSize) {
+        await manager
+          .createQueryBuilder()
+          .insert()
+          .into(DashboardDailyAggregateEntity)
+          .values(rows.slice(i, i + chunkSize))
+          .execute();
+      }
+    });
+
+    this.logger.log(
+      `Reconciled ${days.size} dashboard aggregate day(s) in ${Date.now() - startedAt}ms`,
+    );
+    return days.size;
+  }
+
+  @Cron(CronExpression.EVERY_10_MINUTES)
+  async reconcileRecentDays(): Promise<void> {
+    try {
+      const yesterday = new Date(Date.now() - 24 * 60 * 60 * 1000);
+      await this.reconcile({ from: yesterday });
+    } catch (error) {
+      this.logger.error(
+        `Failed to reconcile recent dashboard aggregates: ${error.message}`,
+      );
+    }
+  }
+
+  @Cron(CronExpression.EVERY_DAY_AT_3AM)
+  async reconcileAll(): Promise<void> {
+    try {
+      await this.reconcile();
+    } catch (error) {
+      this.logger.error(
+        `Failed to rebuild dashboard aggregates: ${error.message}`,
+      );
+    }
+  }
+
+  @OnEvent('booking.created')
+  async handleBookingCreated(event: BookingCreatedEvent): Promise<void> {
+    await this.safeIncrement(event.occurredAt, { newBookings: 1 });
+  }
+
+  @OnEvent('booking.completed')
+  async handleBookingCompleted(event: BookingCompletedEvent): Promise<void> {
+    await this.safeIncrement(event.completedAt ?? event.occurredAt, {
+      completedBookings: 1,
+    });
+  }
+
+  @OnEvent('payment.completed')
+  async handlePaymentCompleted(event: {
+    amount: number;
+    occurredAt?: Date;
+  }): Promise<void> {
+    await this.safeIncrement(event.occurredAt, {
+      completedPayments: 1,
+      completedRevenue: Number(event.amount) || 0,
+    });
+  }
+
+  private async safeIncrement(
+    date: Date | undefined,
+    deltas: Partial<DashboardCounters>,
+  ): Promise<void> {
+    try {
+      await this.increment(date ?? new Date(), deltas);
+    } catch (error) {
+      // Reconciliation repairs the day on its next run
+      this.logger.warn(
+        `Failed to update dashboard aggregates: ${error.message}`,
+      );
+    }
+  }
+
+  private toDay(date: Date | string): string {
+    return new Date(date).toISOString().slice(0, 10);
+  }
+}
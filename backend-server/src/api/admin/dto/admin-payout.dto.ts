@@ -1,3 +1,5 @@
+import { KeysetPageInfoDto } from '@/common/dto/keyset-pagination/keyset-page-info.dto';
+import { KeysetQueryDto } from '@/common/dto/keyset-pagination/keyset-query.dto';
 import { ApiProperty, ApiPropertyOptional } from '@nestjs/swagger';
 import { Transform, Type } from 'class-transformer';
 import {
@@ -31,7 +33,7 @@ export enum AdminPayoutSortOrder {
 }
 
 // Query DTO for admin payout listing
-export class AdminPayoutQueryDto {
+export class AdminPayoutQueryDto extends KeysetQueryDto {
   @ApiPropertyOptional({ description: 'Page number', default: 1, minimum: 1 })
   @Type(() => Number)
   @IsNumber()
@@ -169,7 +171,7 @@ export class AdminPayoutResponseDto {
 }
 
 // Paginated response DTO for admin payouts
-export class AdminPayoutListResponseDto {
+export class AdminPayoutListResponseDto extends KeysetPageInfoDto {
   @ApiProperty({
     description: 'List of payouts',
     type: [AdminPayoutResponseDto],
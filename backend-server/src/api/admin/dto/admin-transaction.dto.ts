@@ -4,6 +4,8 @@ import {
   TransactionStatus,
   TransactionType,
 } from '@/api/transaction/dto/financial-transaction.dto';
+import { KeysetPageInfoDto } from '@/common/dto/keyset-pagination/keyset-page-info.dto';
+import { KeysetQueryDto } from '@/common/dto/keyset-pagination/keyset-query.dto';
 import { ApiProperty, ApiPropertyOptional } from '@nestjs/swagger';
 import { Type } from 'class-transformer';
 import {
@@ -18,7 +20,7 @@ import {
   Min,
 } from 'class-validator';
 
-export class AdminTransactionQueryDto {
+export class AdminTransactionQueryDto extends KeysetQueryDto {
   @ApiPropertyOptional({ description: 'Page number', default: 1 })
   @Type(() => Number)
   @IsNumber()
@@ -167,7 +169,7 @@ export class AdminTransactionResponseDto {
   processedAt?: string;
 }
 
-export class AdminTransactionListResponseDto {
+export class AdminTransactionListResponseDto extends KeysetPageInfoDto {
   @ApiProperty({ type: [AdminTransactionResponseDto] })
   data: AdminTransactionResponseDto[];
 
@@ -618,24 +620,32 @@ export class TransactionExportDto {
 }
 
 export class TransactionExportResponseDto {
+  @ApiProperty({ description: 'Export ID' })
+  exportId: string;
+
+  @ApiProperty({ description: 'Export job state' })
+  status: string;
+
   @ApiProperty({ description: 'Export file URL' })
   fileUrl: string;
 
-  @ApiProperty({ description: 'Export file name' })
-  fileName: string;
+  @ApiPropertyOptional({ description: 'Export file name, once completed' })
+  fileName?: string;
 
   @ApiProperty({ description: 'Export format' })
   format: 'csv' | 'excel';
 
-  @ApiProperty({ description: 'Number of records exported' })
-  recordCount: number;
+  @ApiPropertyOptional({
+    description: 'Number of records exported, once completed',
+  })
+  recordCount?: number;
 
   @ApiProperty({ description: 'Export creation date' })
   createdAt: string;
 
-  @ApiProperty({ description: 'File size in bytes' })
-  fileSize: number;
+  @ApiPropertyOptional({ description: 'File size in bytes, once completed' })
+  fileSize?: number;
 
-  @ApiProperty({ description: 'Export expiry date' })
-  expiresAt: string;
+  @ApiPropertyOptional({ description: 'Export expiry date, once completed' })
+  expiresAt?: string;
 }
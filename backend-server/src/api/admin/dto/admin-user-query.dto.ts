@@ -1,4 +1,5 @@
 import { Role as UserRole, UserStatus } from '@/api/user/user.enum';
+import { KeysetQueryDto } from '@/common/dto/keyset-pagination/keyset-query.dto';
 import { OffsetPaginationDto } from '@/common/dto/offset-pagination/offset-pagination.dto';
 import { ApiPropertyOptional } from '@nestjs/swagger';
 import { Transform, Type } from 'class-transformer';
@@ -13,7 +14,7 @@ import {
   Min,
 } from 'class-validator';
 
-export class AdminUserQueryDto {
+export class AdminUserQueryDto extends KeysetQueryDto {
   @ApiPropertyOptional({ description: 'Search query for user name or email' })
   @IsOptional()
   @IsString()
@@ -1,3 +1,5 @@
+import { KeysetPageInfoDto } from '@/common/dto/keyset-pagination/keyset-page-info.dto';
+import { KeysetQueryDto } from '@/common/dto/keyset-pagination/keyset-query.dto';
 import { BalanceType } from '@/common/enums/wallet.enum';
 import { ApiProperty, ApiPropertyOptional } from '@nestjs/swagger';
 import { Transform, Type } from 'class-transformer';
@@ -26,7 +28,7 @@ export enum SortOrder {
   DESC = 'desc',
 }
 
-export class AdminUserWalletQueryDto {
+export class AdminUserWalletQueryDto extends KeysetQueryDto {
   @ApiPropertyOptional({
     description: 'Search by user name, email, or user ID',
   })
@@ -82,7 +84,7 @@ export class AdminUserWalletQueryDto {
   sortOrder?: SortOrder;
 }
 
-export class AdminUserWalletListResponseDto {
+export class AdminUserWalletListResponseDto extends KeysetPageInfoDto {
   @ApiProperty({ description: 'List of user wallets' })
   data: AdminUserWalletDto[];
 
@@ -1,3 +1,5 @@
+import { KeysetPageInfoDto } from '@/common/dto/keyset-pagination/keyset-page-info.dto';
+import { KeysetQueryDto } from '@/common/dto/keyset-pagination/keyset-query.dto';
 import { WalletStatus } from '@/common/enums/wallet.enum';
 import { ApiProperty, ApiPropertyOptional } from '@nestjs/swagger';
 import { Transform, Type } from 'class-transformer';
@@ -25,7 +27,7 @@ export enum SortOrder {
   DESC = 'desc',
 }
 
-export class AdminWalletQueryDto {
+export class AdminWalletQueryDto extends KeysetQueryDto {
   @ApiPropertyOptional({
     description: 'Search by partner name, email, or partner ID',
   })
@@ -81,7 +83,7 @@ export class AdminWalletQueryDto {
   sortOrder?: SortOrder;
 }
 
-export class AdminWalletListResponseDto {
+export class AdminWalletListResponseDto extends KeysetPageInfoDto {
   @ApiProperty({ description: 'List of partner wallets' })
   data: AdminPartnerWalletDto[];
 
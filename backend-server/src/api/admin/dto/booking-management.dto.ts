@@ -1,5 +1,10 @@
 import { BookingStatus, PaymentStatus } from '@/common/enums/booking.enum';
-import { ApiProperty, ApiPropertyOptional } from '@nestjs/swagger';
+import { KeysetQueryDto } from '@/common/dto/keyset-pagination/keyset-query.dto';
+import {
+  ApiProperty,
+  ApiPropertyOptional,
+  IntersectionType,
+} from '@nestjs/swagger';
 import { Transform, Type } from 'class-transformer';
 import {
   IsArray,
@@ -29,7 +34,10 @@ export enum BookingSortBy {
   STATUS = 'status',
 }
 
-export class BookingQueryDto extends PageOptionsDto {
+export class BookingQueryDto extends IntersectionType(
+  PageOptionsDto,
+  KeysetQueryDto,
+) {
   @ApiPropertyOptional({
     description: 'Search by booking reference, user name, or space name',
   })
@@ -158,6 +166,23 @@ export class BookingListItemDto {
 export class BookingListResponseDto extends OffsetPaginatedDto<BookingListItemDto> {
   @ApiProperty({ type: [BookingListItemDto] })
   declare data: BookingListItemDto[];
+
+  @ApiPropertyOptional({
+    description: 'Pass as `afterCursor` to fetch the next page',
+    nullable: true,
+  })
+  nextCursor?: string | null;
+
+  @ApiPropertyOptional({
+    description: 'Pass as `beforeCursor` to fetch the previous page',
+    nullable: true,
+  })
+  previousCursor?: string | null;
+
+  @ApiPropertyOptional({
+    description: 'Whether the total is the query planner estimate',
+  })
+  totalIsEstimate?: boolean;
 }
 
 export class BookingDetailsDto {
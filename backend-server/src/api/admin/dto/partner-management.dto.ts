@@ -1,3 +1,5 @@
+import { KeysetPageInfoDto } from '@/common/dto/keyset-pagination/keyset-page-info.dto';
+import { KeysetQueryDto } from '@/common/dto/keyset-pagination/keyset-query.dto';
 import { PartnerStatus, VerificationStatus } from '@/common/enums/partner.enum';
 import { ApiProperty, ApiPropertyOptional } from '@nestjs/swagger';
 import { Transform, Type } from 'class-transformer';
@@ -31,7 +33,7 @@ export enum SortOrder {
 }
 
 // Query parameters for partner listing
-export class PartnerQueryDto {
+export class PartnerQueryDto extends KeysetQueryDto {
   @ApiPropertyOptional({ description: 'Search by name, email, or company' })
   @IsOptional()
   @IsString()
@@ -176,7 +178,7 @@ export class PartnerListItemDto {
 }
 
 // Partner list response DTO
-export class PartnerListResponseDto {
+export class PartnerListResponseDto extends KeysetPageInfoDto {
   @ApiProperty({ type: [PartnerListItemDto], description: 'List of partners' })
   data: PartnerListItemDto[];
 
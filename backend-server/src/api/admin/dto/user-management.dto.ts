@@ -48,6 +48,23 @@ export class UserListResponseDto extends OffsetPaginatedDto<UserListItemDto> {
   @IsArray()
   @Type(() => UserListItemDto)
   declare data: UserListItemDto[];
+
+  @ApiPropertyOptional({
+    description: 'Pass as `afterCursor` to fetch the next page',
+    nullable: true,
+  })
+  nextCursor?: string | null;
+
+  @ApiPropertyOptional({
+    description: 'Pass as `beforeCursor` to fetch the previous page',
+    nullable: true,
+  })
+  previousCursor?: string | null;
+
+  @ApiPropertyOptional({
+    description: 'Whether the total is the query planner estimate',
+  })
+  totalIsEstimate?: boolean;
 }
 
 export class UserDetailsDto extends UserListItemDto {
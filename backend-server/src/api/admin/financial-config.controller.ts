@@ -152,10 +152,11 @@ export class FinancialConfigController {
     @Query('region') region?: string,
     @Query('category') category?: string,
   ): Promise<ConfigurationResponseDto> {
-    // Implementation would determine effective configuration based on hierarchy
-    const configuration = await this.configService.getConfiguration(
+    const configuration = await this.configService.getEffectiveConfiguration(
       type,
-      ConfigurationScope.GLOBAL,
+      partnerId,
+      region,
+      category,
     );
 
     return {
@@ -0,0 +1,129 @@
+import { Test, TestingModule } from '@nestjs/testing';
+import { getRepositoryToken } from '@nestjs/typeorm';
+import { AnalyticsRollupService } from './analytics-rollup.service';
+import {
+  AnalyticsRollupEntity,
+  RollupResolution,
+} from './entities/analytics-rollup.entity';
+import { TimeGranularity } from './entities/analytics.entity';
+
+describe('AnalyticsRollupService', () => {
+  let service: AnalyticsRollupService;
+
+  const queryBuilder = {
+    select: jest.fn().mockReturnThis(),
+    addSelect: jest.fn().mockReturnThis(),
+    where: jest.fn().mockReturnThis(),
+    andWhere: jest.fn().mockReturnThis(),
+    orderBy: jest.fn().mockReturnThis(),
+    addOrderBy: jest.fn().mockReturnThis(),
+    getRawMany: jest.fn(),
+  };
+  const rollupRepository = {
+    createQueryBuilder: jest.fn(() => queryBuilder),
+  };
+  const manager = { query: jest.fn() };
+
+  beforeEach(async () => {
+    jest.clearAllMocks();
+
+    const module: TestingModule = await Test.createTestingModule({
+      providers: [
+        AnalyticsRollupService,
+        {
+          provide: getRepositoryToken(AnalyticsRollupEntity),
+          useValue: rollupRepository,
+        },
+      ],
+    }).compile();
+
+    service = module.get<AnalyticsRollupService>(AnalyticsRollupService);
+  });
+
+  describe('pickResolution', () => {
+    it('should pick the coarsest resolution aligned to both bounds', () => {
+      expect(
+        service.pickResolution(
+          new Date('2026-10-01T00:00:00Z'),
+          new Date('2026-10-15T00:00:00Z'),
+        ),
+      ).toBe(RollupResolution.DAY);
+      expect(
+        service.pickResolution(
+          new Date('2026-10-01T00:00:00Z'),
+          new Date('2026-10-15T13:00:00Z'),
+        ),
+      ).toBe(RollupResolution.HOUR);
+      expect(
+        service.pickResolution(
+          new Date('2026-10-01T09:30:00Z'),
+          new Date('2026-10-15T13:00:00Z'),
+        ),
+      ).toBe(RollupResolution.MINUTE);
+    });
+  });
+
+  describe('getSeries', () => {
+    it('should group bucket rows by metric', async () => {
+      const first = new Date('2026-10-01T00:00:00Z');
+      const second = new Date('2026-10-02T00:00:00Z');
+      queryBuilder.getRawMany.mockResolvedValue([
+        {
+          metricName: 'revenue',
+          bucketStart: first,
+          value: '100.00',
+          changePercentage: null,
+        },
+        {
+          metricName: 'revenue',
+          bucketStart: second,
+          value: '120.50',
+          changePercentage: '20.5000',
+        },
+        {
+          metricName: 'users',
+          bucketStart: first,
+          value: '7.00',
+          changePercentage: null,
+        },
+      ]);
+
+      const series = await service.getSeries(
+        ['revenue', 'users'],
+        TimeGranularity.DAILY,
+        first,
+        second,
+      );
+
+      expect(series.get('revenue')).toEqual([
+        { bucketStart: first, value: 100, changePercentage: undefined },
+        { bucketStart: second, value: 120.5, changePercentage: 20.5 },
+      ]);
+      expect(series.get('users')).toHaveLength(1);
+      expect(queryBuilder.where).toHaveBeenCalledWith(
+        'rollup.resolution = :resolution',
+        { resolution: RollupResolution.DAY },
+      );
+    });
+  });
+
+  describe('rebuildDays', () => {
+    it('should rebuild each distinct day once', async () => {
+      const key = {
+        metricName: 'revenue',
+        granularity: TimeGranularity.DAILY,
+        day: '2026-10-01',
+      };
+
+      await service.rebuildDays(manager as any, [key, { ...key }]);
+
+      expect(manager.query).toHaveBeenCalledTimes(2);
+      expect(manager.query.mock.calls[0][0]).toContain('DELETE');
+      expect(manager.query.mock.calls[1][1]).toEqual([
+        'revenue',
+        TimeGranularity.DAILY,
+        '2026-10-01',
+      ]);
+    });
+  });
+});
@@ -0,0 +1,216 @@
+import { Injectable } from '@nestjs/common';
+import { InjectRepository } from '@nestjs/typeorm';
+import { EntityManager, Repository } from 'typeorm';
+import {
+  AnalyticsRollupEntity,
+  RollupResolution,
+} from './entities/analytics-rollup.entity';
+import { TimeGranularity } from './entities/analytics.entity';
+
+export interface RollupPoint {
+  bucketStart: Date;
+  value: number;
+  changePercentage?: number;
+}
+
+/** Day of an analytics record whose buckets need rebuilding */
+export interface RollupDayKey {
+  metricName: string;
+  granularity: TimeGranularity;
+  day: string;
+}
+
+/**
+ * When a record was observed, as a UTC timestamp: its collection time if
+ * that falls on the record's date, else the start of that date. It always
+ * lies within the record's date, so a day's buckets only depend on the
+ * records dated that day.
+ */
+const OBSERVED_AT = `CASE
+  WHEN (a."collectedAt" AT TIME ZONE 'UTC')::date = a."date"
+  THEN a."collectedAt" AT TIME ZONE 'UTC'
+  ELSE a."date"::timestamp
+END`;
+
+const HOUR_MS = 60 * 60 * 1000;
+const DAY_MS = 24 * HOUR_MS;
+
+const RESOLUTIONS = Object.values(RollupResolution)
+  .map((resolution) => `('${resolution}')`)
+  .join(', ');
+
+/**
+ * Minute, hour and day rollups of the analytics table.
+ *
+ * New records are folded into their buckets in the transaction that
+ * inserts them, so the rollups are always current. Updates and deletes
+ * can't be folded in (a bucket's min, max and last value can't be
+ * un-applied), so the buckets of the affected day are rebuilt instead.
+ *
+ * Trend queries read the coarsest resolution that lines up with the
+ * requested window, which keeps them to a handful of rows per point however
+ * many raw records there are.
+ */
+@Injectable()
+export class AnalyticsRollupService {
+  constructor(
+    @InjectRepository(AnalyticsRollupEntity)
+    private readonly rollupRepository: Repository<AnalyticsRollupEntity>,
+  ) {}
+
+  /**
+   * Fold newly inserted records into their buckets. Call it in the
+   * transaction that inserted them.
+   */
+  async applyInserted(manager: EntityManager, ids: string[]): Promise<void> {
+    if (ids.length === 0) return;
+    await this.upsertBuckets(manager, `a."id" = ANY($1::uuid[])`, [ids]);
+  }
+
+  /**
+   * Recompute every bucket of the given days from the raw records
+   */
+  async rebuildDays(
+    manager: EntityManager,
+    keys: RollupDayKey[],
+  ): Promise<void> {
+    const unique = new Map(
+      keys.map((key) => [
+        `${key.metricName}|${key.granularity}|${key.day}`,
+        key,
+      ]),
+    );
+
+    for (const { metricName, granularity, day } of unique.values()) {
+      await manager.query(
+        `DELETE FROM "analytics_rollups"
+         WHERE "metric_name" = $1 AND "granularity" = $2
+           AND "bucket_start" >= $3::date::timestamp AT TIME ZONE 'UTC'
+           AND "bucket_start" < ($3::date + 1)::timestamp AT TIME ZONE 'UTC'`,
+        [metricName, granularity, day],
+      );
+      await this.upsertBuckets(
+        manager,
+        `a."metricName" = $1 AND a."granularity"::text = $2
+           AND a."date" = $3::date`,
+        [metricName, granularity, day],
+      );
+    }
+  }
+
+  /**
+   * Coarsest resolution whose buckets start on both window bounds, so
+   * whole-day windows read day buckets
+   */
+  pickResolution(from: Date, to: Date): RollupResolution {
+    const isAligned = (date: Date, unitMs: number) =>
+      date.getTime() % unitMs === 0;
+
+    if (isAligned(from, DAY_MS) && isAligned(to, DAY_MS)) {
+      return RollupResolution.DAY;
+    }
+    if (isAligned(from, HOUR_MS) && isAligned(to, HOUR_MS)) {
+      return RollupResolution.HOUR;
+    }
+    return RollupResolution.MINUTE;
+  }
+
+  /**
+   * Bucket series for several metrics in one query, keyed by metric name.
+   * Buckets starting anywhere in [from, to] are included; metrics without
+   * any are absent. Buckets are per metric, not per entity, so each point
+   * is the bucket's latest value across all of the metric's records.
+   */
+  async getSeries(
+    metricNames: string[],
+    granularity: TimeGranularity,
+    from: Date,
+    to: Date,
+  ): Promise<Map<string, RollupPoint[]>> {
+    const rows = await this.rollupRepository
+      .createQueryBuilder('rollup')
+      .select('rollup.metricName', 'metricName')
+      .addSelect('rollup.bucketStart', 'bucketStart')
+      .addSelect('rollup.lastValue', 'value')
+      .addSelect('rollup.lastChangePercentage', 'changePercentage')
+      .where('rollup.resolution = :resolution', {
+        resolution: this.pickResolution(from, to),
+      })
+      .andWhere('rollup.metricName IN (:...metricNames)', { metricNames })
+      .andWhere('rollup.granularity = :granularity', { granularity })
+      .andWhere('rollup.bucketStart BETWEEN :from AND :to', { from, to })
+      .orderBy('rollup.metricName', 'ASC')
+      .addOrderBy('rollup.bucketStart', 'ASC')
+      .getRawMany<{
+        metricName: string;
+        bucketStart: Date;
+        value: string;
+        changePercentage: string | null;
+      }>();
+
+    const series = new Map<string, RollupPoint[]>();
+    for (const row of rows) {
+      const points = series.get(row.metricName) ?? [];
+      points.push({
+        bucketStart: row.bucketStart,
+        value: parseFloat(row.value),
+        changePercentage:
+          row.changePercentage === null
+            ? undefined
+            : parseFloat(row.changePercentage),
+      });
+      series.set(row.metricName, points);
+    }
+    return series;
+  }
+
+  /**
+   * Merge the active records matching `where` (over alias `a`) into their
+   * buckets at every resolution. Buckets are written in key order so
+   * concurrent writers lock them in the same order.
+   */
+  private async upsertBuckets(
+    manager: EntityManager,
+    where: string,
+    params: unknown[],
+  ): Promise<void> {
+    await manager.query(
+      `INSERT INTO "analytics_rollups" AS r (
+         "resolution", "metric_name", "granularity", "bucket_start",
+         "sample_count", "value_sum", "value_min", "value_max",
+         "last_value", "last_change_percentage", "last_observed_at"
+       )
+       SELECT res."resolution", o."metricName", o."granularity"::text,
+         date_trunc(res."resolution", o."observedAt") AT TIME ZONE 'UTC',
+         COUNT(*), SUM(o."value"), MIN(o."value"), MAX(o."value"),
+         (array_agg(o."value" ORDER BY o."observedAt" DESC, o."id" DESC))[1],
+         (array_agg(o."changePercentage"
+           ORDER BY o."observedAt" DESC, o."id" DESC))[1],
+         MAX(o."observedAt") AT TIME ZONE 'UTC'
+       FROM (
+         SELECT a.*, ${OBSERVED_AT} AS "observedAt"
+         FROM "analytics" a
+         WHERE ${where} AND a."isActive"
+       ) o
+       CROSS JOIN (VALUES ${RESOLUTIONS}) AS res("resolution")
+       GROUP BY 1, 2, 3, 4
+       ORDER BY 1, 2, 3, 4
+       ON CONFLICT ("resolution", "metric_name", "granularity", "bucket_start")
+       DO UPDATE SET
+         "sample_count" = r."sample_count" + EXCLUDED."sample_count",
+         "value_sum" = r."value_sum" + EXCLUDED."value_sum",
+         "value_min" = LEAST(r."value_min", EXCLUDED."value_min"),
+         "value_max" = GREATEST(r."value_max", EXCLUDED."value_max"),
+         "last_value" = CASE
+           WHEN EXCLUDED."last_observed_at" >= r."last_observed_at"
+           THEN EXCLUDED."last_value" ELSE r."last_value" END,
+         "last_change_percentage" = CASE
+           WHEN EXCLUDED."last_observed_at" >= r."last_observed_at"
+           THEN EXCLUDED."last_change_percentage"
+           ELSE r."last_change_percentage" END,
+         "last_observed_at" =
+           GREATEST(r."last_observed_at", EXCLUDED."last_observed_at")`,
+      params,
+    );
+  }
+}
@@ -4,19 +4,26 @@ import { IdGeneratorService } from '@/utils/id-generator.service';
 import { Module } from '@nestjs/common';
 import { EventEmitterModule } from '@nestjs/event-emitter';
 import { TypeOrmModule } from '@nestjs/typeorm';
+import { AnalyticsRollupService } from './analytics-rollup.service';
 import { AnalyticsController } from './analytics.controller';
 import { AnalyticsService } from './analytics.service';
+import { AnalyticsRollupEntity } from './entities/analytics-rollup.entity';
 import { AnalyticsEntity } from './entities/analytics.entity';
 import { AnalyticsEventHandler } from './events/analytics-event.handler';
 
 @Module({
   imports: [
-    TypeOrmModule.forFeature([AnalyticsEntity, UserEntity]),
+    TypeOrmModule.forFeature([
+      AnalyticsEntity,
+      AnalyticsRollupEntity,
+      UserEntity,
+    ]),
     EventEmitterModule,
   ],
   controllers: [AnalyticsController],
   providers: [
     AnalyticsService,
+    AnalyticsRollupService,
     RolesGuard,
     IdGeneratorService,
     AnalyticsEventHandler,
@@ -0,0 +1,91 @@
+import { NotFoundException } from '@nestjs/common';
+import { Test, TestingModule } from '@nestjs/testing';
+import { getRepositoryToken } from '@nestjs/typeorm';
+import { DataSource } from 'typeorm';
+import { AnalyticsRollupService } from './analytics-rollup.service';
+import { AnalyticsService } from './analytics.service';
+import { AnalyticsEntity, TimeGranularity } from './entities/analytics.entity';
+
+describe('AnalyticsService', () => {
+  let service: AnalyticsService;
+
+  const rollupService = { getSeries: jest.fn() };
+
+  beforeEach(async () => {
+    jest.clearAllMocks();
+
+    const module: TestingModule = await Test.createTestingModule({
+      providers: [
+        AnalyticsService,
+        { provide: getRepositoryToken(AnalyticsEntity), useValue: {} },
+        { provide: AnalyticsRollupService, useValue: rollupService },
+        { provide: DataSource, useValue: {} },
+      ],
+    }).compile();
+
+    service = module.get<AnalyticsService>(AnalyticsService);
+  });
+
+  describe('getMetricTrends', () => {
+    it('should return one data point per bucket, not per record', async () => {
+      // Two buckets, each the latest value across every entity in it
+      rollupService.getSeries.mockResolvedValue(
+        new Map([
+          [
+            'total_revenue',
+            [
+              { bucketStart: new Date('2026-10-01T00:00:00Z'), value: 100 },
+              {
+                bucketStart: new Date('2026-10-02T00:00:00Z'),
+                value: 130,
+                changePercentage: 30,
+              },
+            ],
+          ],
+        ]),
+      );
+
+      const trends = await service.getMetricTrends(
+        ['total_revenue', 'total_bookings'],
+        '2026-10-01',
+        '2026-10-02',
+      );
+
+      expect(rollupService.getSeries).toHaveBeenCalledWith(
+        ['total_revenue', 'total_bookings'],
+        TimeGranularity.DAILY,
+        new Date('2026-10-01'),
+        new Date('2026-10-02'),
+      );
+      expect(trends).toHaveLength(1);
+      expect(trends[0].dataPoints).toEqual([
+        {
+          date: new Date('2026-10-01T00:00:00Z'),
+          value: 100,
+          changePercentage: undefined,
+        },
+        {
+          date: new Date('2026-10-02T00:00:00Z'),
+          value: 130,
+          changePercentage: 30,
+        },
+      ]);
+      expect(trends[0].trend).toEqual({
+        direction: 'up',
+        percentage: 30,
+        significance: 'high',
+      });
+      expect(trends[0].summary).toMatchObject({ min: 100, max: 130, avg: 115 });
+    });
+  });
+
+  describe('getMetricTrend', () => {
+    it('should throw when the metric has no buckets in range', async () => {
+      rollupService.getSeries.mockResolvedValue(new Map());
+
+      await expect(
+        service.getMetricTrend('total_revenue', '2026-10-01', '2026-10-02'),
+      ).rejects.toThrow(NotFoundException);
+    });
+  });
+});
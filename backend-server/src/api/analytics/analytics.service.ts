@@ -4,7 +4,12 @@ import {
   NotFoundException,
 } from '@nestjs/common';
 import { InjectRepository } from '@nestjs/typeorm';
-import { Between, In, Repository } from 'typeorm';
+import { DataSource, In, Repository } from 'typeorm';
+import {
+  AnalyticsRollupService,
+  RollupDayKey,
+  RollupPoint,
+} from './analytics-rollup.service';
 import {
   AnalyticsQueryDto,
   AnalyticsStatsDto,
@@ -22,65 +27,35 @@ import {
   TimeGranularity,
 } from './entities/analytics.entity';
 
+/** Records per multi-row INSERT */
+const INSERT_BATCH_SIZE = 1000;
+
+const toDay = (date: Date | string): string =>
+  new Date(date).toISOString().split('T')[0];
+
 @Injectable()
 export class AnalyticsService {
   constructor(
     @InjectRepository(AnalyticsEntity)
     private readonly analyticsRepository: Repository<AnalyticsEntity>,
+    private readonly rollupService: AnalyticsRollupService,
+    private readonly dataSource: DataSource,
   ) {}
 
   async create(
     createAnalyticsDto: CreateAnalyticsDto,
   ): Promise<AnalyticsEntity> {
     try {
-      // Validate date format
-      const date = new Date(createAnalyticsDto.date);
-      if (isNaN(date.getTime())) {
-        throw new BadRequestException('Invalid date format');
-      }
+      const analytics = this.buildRecord(createAnalyticsDto);
 
       // Check for duplicate metric on the same date
-      const existing = await this.analyticsRepository.findOne({
-        where: {
-          metricName: createAnalyticsDto.metricName,
-          date: date,
-          entityType: createAnalyticsDto.entityType || null,
-          entityId: createAnalyticsDto.entityId || null,
-          granularity: createAnalyticsDto.granularity || TimeGranularity.DAILY,
-        },
-      });
-
-      if (existing) {
-        throw new BadRequestException(
-          `Analytics record already exists for metric '${createAnalyticsDto.metricName}' on ${date.toISOString().split('T')[0]}`,
-        );
-      }
-
-      // Calculate change percentage if previous value is provided
-      let changePercentage = createAnalyticsDto.changePercentage;
-      if (
-        createAnalyticsDto.previousValue &&
-        createAnalyticsDto.previousValue > 0
-      ) {
-        changePercentage =
-          ((createAnalyticsDto.value - createAnalyticsDto.previousValue) /
-            createAnalyticsDto.previousValue) *
-          100;
+      const duplicates = await this.findDuplicates([analytics]);
+      if (duplicates.has(0)) {
+        throw new BadRequestException(this.duplicateMessage(analytics));
       }
 
-      const analytics = this.analyticsRepository.create({
-        ...createAnalyticsDto,
-        date,
-        changePercentage,
-        granularity: createAnalyticsDto.granularity || TimeGranularity.DAILY,
-        isActive: createAnalyticsDto.isActive ?? true,
-        isPublic: createAnalyticsDto.isPublic ?? false,
-        collectedAt: createAnalyticsDto.collectedAt
-          ? new Date(createAnalyticsDto.collectedAt)
-          : new Date(),
-      });
-
-      return await this.analyticsRepository.save(analytics);
+      const [created] = await this.insertRecords([analytics]);
+      return created;
     } catch (error) {
       if (error instanceof BadRequestException) {
         throw error;
@@ -91,27 +66,47 @@ export class AnalyticsService {
     }
   }
 
+  /**
+   * Validate every record up front, then write the valid ones with
+   * multi-row inserts in one transaction. Without `skipErrors`, the first
+   * invalid record fails the whole batch and nothing is written.
+   */
   async bulkCreate(bulkCreateDto: BulkCreateAnalyticsDto): Promise<{
     created: AnalyticsEntity[];
     errors: Array<{ index: number; error: string }>;
   }> {
-    const created: AnalyticsEntity[] = [];
+    const records: AnalyticsEntity[] = [];
+    const indexes: number[] = [];
     const errors: Array<{ index: number; error: string }> = [];
 
-    for (let i = 0; i < bulkCreateDto.records.length; i++) {
+    bulkCreateDto.records.forEach((recordDto, index) => {
       try {
-        const record = await this.create(bulkCreateDto.records[i]);
-        created.push(record);
+        records.push(this.buildRecord(recordDto));
+        indexes.push(index);
       } catch (error) {
-        errors.push({ index: i, error: error.message });
-        if (!bulkCreateDto.skipErrors) {
-          throw new BadRequestException(
-            `Bulk create failed at index ${i}: ${error.message}`,
-          );
-        }
+        errors.push({ index, error: error.message });
       }
+    });
+
+    const duplicates = await this.findDuplicates(records);
+    for (const position of duplicates) {
+      errors.push({
+        index: indexes[position],
+        error: this.duplicateMessage(records[position]),
+      });
+    }
+
+    errors.sort((a, b) => a.index - b.index);
+    if (errors.length > 0 && !bulkCreateDto.skipErrors) {
+      const [{ index, error }] = errors;
+      throw new BadRequestException(
+        `Bulk create failed at index ${index}: ${error}`,
+      );
     }
 
+    const created = await this.insertRecords(
+      records.filter((_, position) => !duplicates.has(position)),
+    );
     return { created, errors };
   }
 
@@ -238,17 +233,23 @@ export class AnalyticsService {
         100;
     }
 
+    const previous = this.rollupDayKey(analytics);
     Object.assign(analytics, {
       ...updateAnalyticsDto,
       changePercentage,
     });
 
-    return await this.analyticsRepository.save(analytics);
+    return await this.saveAndRebuild(analytics, previous);
   }
 
   async remove(id: string): Promise<void> {
     const analytics = await this.findOne(id);
-    await this.analyticsRepository.remove(analytics);
+    const key = this.rollupDayKey(analytics);
+
+    await this.dataSource.transaction(async (manager) => {
+      await manager.remove(analytics);
+      await this.rollupService.rebuildDays(manager, [key]);
+    });
   }
 
   async getStats(): Promise<AnalyticsStatsDto> {
@@ -399,90 +400,54 @@ export class AnalyticsService {
     endDate: string,
     granularity: TimeGranularity = TimeGranularity.DAILY,
   ): Promise<MetricTrendDto> {
-    const dataPoints = await this.analyticsRepository.find({
-      where: {
-        metricName,
-        date: Between(new Date(startDate), new Date(endDate)),
-        granularity,
-        isActive: true,
-      },
-      order: { date: 'ASC' },
-    });
+    const [trend] = await this.getMetricTrends(
+      [metricName],
+      startDate,
+      endDate,
+      granularity,
+    );
 
-    if (dataPoints.length === 0) {
+    if (!trend) {
       throw new NotFoundException(
         `No data found for metric '${metricName}' in the specified date range`,
       );
     }
 
-    // Calculate trend analysis
-    const values = dataPoints.map((dp) => dp.value);
-    const firstValue = values[0];
-    const lastValue = values[values.length - 1];
-    const trendPercentage =
-      firstValue > 0 ? ((lastValue - firstValue) / firstValue) * 100 : 0;
-
-    let direction: 'up' | 'down' | 'stable' = 'stable';
-    if (Math.abs(trendPercentage) > 5) {
-      direction = trendPercentage > 0 ? 'up' : 'down';
-    }
-
-    const significance: 'high' | 'medium' | 'low' =
-      Math.abs(trendPercentage) > 20
-        ? 'high'
-        : Math.abs(trendPercentage) > 10
-          ? 'medium'
-          : 'low';
+    return trend;
+  }
 
-    // Calculate statistical summary
-    const min = Math.min(...values);
-    const max = Math.max(...values);
-    const avg = values.reduce((sum, val) => sum + val, 0) / values.length;
-    const sortedValues = [...values].sort((a, b) => a - b);
-    const median =
-      sortedValues.length % 2 === 0
-        ? (sortedValues[sortedValues.length / 2 - 1] +
-            sortedValues[sortedValues.length / 2]) /
-          2
-        : sortedValues[Math.floor(sortedValues.length / 2)];
-    const variance =
-      values.reduce((sum, val) => sum + Math.pow(val - avg, 2), 0) /
-      values.length;
-    const stdDev = Math.sqrt(variance);
+  /**
+   * Trends for several metrics from a single rollup query. Metrics without
+   * data in the range are left out.
+   *
+   * Each data point is one bucket of the requested granularity and holds
+   * the latest value recorded for the metric in that bucket, whichever
+   * entity it was recorded for; records are not listed individually.
+   */
+  async getMetricTrends(
+    metricNames: string[],
+    startDate: string,
+    endDate: string,
+    granularity: TimeGranularity = TimeGranularity.DAILY,
+  ): Promise<MetricTrendDto[]> {
+    const series = await this.rollupService.getSeries(
+      metricNames,
+      granularity,
+      new Date(startDate),
+      new Date(endDate),
+    );
 
-    return {
-      metricName,
-      dataPoints: dataPoints.map((dp) => ({
-        date: dp.date,
-        value: dp.value,
-        changePercentage: dp.changePercentage,
-      })),
-      trend: {
-        direction,
-        percentage: trendPercentage,
-        significance,
-      },
-      summary: {
-        min,
-        max,
-        avg,
-        median,
-        stdDev,
-      },
-    };
+    return metricNames
+      .filter((metricName) => series.has(metricName))
+      .map((metricName) =>
+        this.summarizeTrend(metricName, series.get(metricName)),
+      );
   }
 
   async getDashboard(
     startDate?: string,
     endDate?: string,
   ): Promise<DashboardDto> {
-    const dateFilter =
-      startDate && endDate
-        ? {
-            date: Between(new Date(startDate), new Date(endDate)),
-          }
-        : {};
-
     // Get KPIs
     const kpiMetrics = [
       'daily_active_users',
@@ -491,39 +456,55 @@ export class AnalyticsService {
       'booking_conversion_rate',
     ];
 
-    const kpis = await Promise.all(
-      kpiMetrics.map(async (metricName) => {
-        const latest = await this.analyticsRepository.findOne({
-          where: { metricName, isActive: true, ...dateFilter },
-          order: { date: 'DESC' },
-        });
-
-        if (!latest) {
-          return {
-            name: metricName,
-            value: 0,
-            unit: 'count',
-            change: 0,
-            trend: 'stable' as const,
-          };
-        }
+    // Latest record per KPI in one query
+    const latestQuery = this.analyticsRepository
+      .createQueryBuilder('analytics')
+      .distinctOn(['analytics.metricName'])
+      .where('analytics.metricName IN (:...kpiMetrics)', { kpiMetrics })
+      .andWhere('analytics.isActive = true')
+      .orderBy('analytics.metricName', 'ASC')
+      .addOrderBy('analytics.date', 'DESC');
+    if (startDate && endDate) {
+      latestQuery.andWhere('analytics.date BETWEEN :startDate AND :endDate', {
+        startDate: new Date(startDate),
+        endDate: new Date(endDate),
+      });
+    }
+    const latestByMetric = new Map(
+      (await latestQuery.getMany()).map((record) => [
+        record.metricName,
+        record,
+      ]),
+    );
 
-        const trend: 'up' | 'down' | 'stable' =
-          latest.changePercentage > 5
-            ? 'up'
-            : latest.changePercentage < -5
-              ? 'down'
-              : 'stable';
+    const kpis = kpiMetrics.map((metricName) => {
+      const latest = latestByMetric.get(metricName);
 
+      if (!latest) {
         return {
           name: metricName,
-          value: latest.value,
-          unit: latest.unit || 'count',
-          change: latest.changePercentage || 0,
-          trend,
+          value: 0,
+          unit: 'count',
+          change: 0,
+          trend: 'stable' as const,
         };
-      }),
-    );
+      }
+
+      const trend: 'up' | 'down' | 'stable' =
+        latest.changePercentage > 5
+          ? 'up'
+          : latest.changePercentage < -5
+            ? 'down'
+            : 'stable';
+
+      return {
+        name: metricName,
+        value: latest.value,
+        unit: latest.unit || 'count',
+        change: latest.changePercentage || 0,
+        trend,
+      };
+    });
 
     // Get trends for key metrics
     const trendMetrics = [
@@ -531,35 +512,30 @@ export class AnalyticsService {
       'total_bookings',
       'total_revenue',
     ];
-    const trends = await Promise.all(
-      trendMetrics.map(async (metricName) => {
-        try {
-          const endDateStr = endDate || new Date().toISOString().split('T')[0];
-          const startDateStr =
-            startDate ||
-            new Date(Date.now() - 30 * 24 * 60 * 60 * 1000)
-              .toISOString()
-              .split('T')[0];
-
-          return await this.getMetricTrend(
-            metricName,
-            startDateStr,
-            endDateStr,
-          );
-        } catch (error) {
-          // Return empty trend if no data
-          return {
-            metricName,
-            dataPoints: [],
-            trend: {
-              direction: 'stable' as const,
-              percentage: 0,
-              significance: 'low' as const,
-            },
-            summary: { min: 0, max: 0, avg: 0, median: 0, stdDev: 0 },
-          };
-        }
-      }),
+    const endDateStr = endDate || new Date().toISOString().split('T')[0];
+    const startDateStr =
+      startDate ||
+      new Date(Date.now() - 30 * 24 * 60 * 60 * 1000)
+        .toISOString()
+        .split('T')[0];
+    const trendsByMetric = new Map(
+      (
+        await this.getMetricTrends(trendMetrics, startDateStr, endDateStr)
+      ).map((trend) => [trend.metricName, trend]),
+    );
+    const trends = trendMetrics.map(
+      (metricName) =>
+        // Empty trend if no data
+        trendsByMetric.get(metricName) ?? {
+          metricName,
+          dataPoints: [],
+          trend: {
+            direction: 'stable' as const,
+            percentage: 0,
+            significance: 'low' as const,
+          },
+          summary: { min: 0, max: 0, avg: 0, median: 0, stdDev: 0 },
+        },
     );
 
     // Get alerts (metrics that exceed thresholds)
@@ -687,7 +663,7 @@ export class AnalyticsService {
   async toggleMetricStatus(id: string): Promise<AnalyticsEntity> {
     const analytics = await this.findOne(id);
     analytics.isActive = !analytics.isActive;
-    return await this.analyticsRepository.save(analytics);
+    return await this.saveAndRebuild(analytics);
   }
 
   async toggleMetricVisibility(id: string): Promise<AnalyticsEntity> {
@@ -732,4 +708,193 @@ export class AnalyticsService {
 
     return results;
   }
+
+  private summarizeTrend(
+    metricName: string,
+    dataPoints: RollupPoint[],
+  ): MetricTrendDto {
+    // Calculate trend analysis
+    const values = dataPoints.map((dp) => dp.value);
+    const firstValue = values[0];
+    const lastValue = values[values.length - 1];
+    const trendPercentage =
+      firstValue > 0 ? ((lastValue - firstValue) / firstValue) * 100 : 0;
+
+    let direction: 'up' | 'down' | 'stable' = 'stable';
+    if (Math.abs(trendPercentage) > 5) {
+      direction = trendPercentage > 0 ? 'up' : 'down';
+    }
+
+    const significance: 'high' | 'medium' | 'low' =
+      Math.abs(trendPercentage) > 20
+        ? 'high'
+        : Math.abs(trendPercentage) > 10
+          ? 'medium'
+          : 'low';
+
+    // Calculate statistical summary
+    const min = Math.min(...values);
+    const max = Math.max(...values);
+    const avg = values.reduce((sum, val) => sum + val, 0) / values.length;
+    const sortedValues = [...values].sort((a, b) => a - b);
+    const median =
+      sortedValues.length % 2 === 0
+        ? (sortedValues[sortedValues.length / 2 - 1] +
+            sortedValues[sortedValues.length / 2]) /
+          2
+        : sortedValues[Math.floor(sortedValues.length / 2)];
+    const variance =
+      values.reduce((sum, val) => sum + Math.pow(val - avg, 2), 0) /
+      values.length;
+    const stdDev = Math.sqrt(variance);
+
+    return {
+      metricName,
+      dataPoints: dataPoints.map((dp) => ({
+        date: dp.bucketStart,
+        value: dp.value,
+        changePercentage: dp.changePercentage,
+      })),
+      trend: {
+        direction,
+        percentage: trendPercentage,
+        significance,
+      },
+      summary: {
+        min,
+        max,
+        avg,
+        median,
+        stdDev,
+      },
+    };
+  }
+
+  private buildRecord(dto: CreateAnalyticsDto): AnalyticsEntity {
+    // Validate date format
+    const date = new Date(dto.date);
+    if (isNaN(date.getTime())) {
+      throw new BadRequestException('Invalid date format');
+    }
+
+    // Calculate change percentage if previous value is provided
+    let changePercentage = dto.changePercentage;
+    if (dto.previousValue && dto.previousValue > 0) {
+      changePercentage =
+        ((dto.value - dto.previousValue) / dto.previousValue) * 100;
+    }
+
+    return this.analyticsRepository.create({
+      ...dto,
+      date,
+      changePercentage,
+      granularity: dto.granularity || TimeGranularity.DAILY,
+      isActive: dto.isActive ?? true,
+      isPublic: dto.isPublic ?? false,
+      collectedAt: dto.collectedAt ? new Date(dto.collectedAt) : new Date(),
+    });
+  }
+
+  /**
+   * Positions of records that repeat an existing record, or an earlier one
+   * in the list, for the same metric, date, entity and granularity
+   */
+  private async findDuplicates(
+    records: AnalyticsEntity[],
+  ): Promise<Set<number>> {
+    const duplicates = new Set<number>();
+    if (records.length === 0) return duplicates;
+
+    const keyOf = (record: AnalyticsEntity) =>
+      [
+        record.metricName,
+        toDay(record.date),
+        record.entityType || '',
+        record.entityId || '',
+        record.granularity,
+      ].join('|');
+
+    const existing = await this.analyticsRepository
+      .createQueryBuilder('analytics')
+      .select([
+        'analytics.id',
+        'analytics.metricName',
+        'analytics.date',
+        'analytics.entityType',
+        'analytics.entityId',
+        'analytics.granularity',
+      ])
+      .where('analytics.metricName IN (:...metricNames)', {
+        metricNames: Array.from(new Set(records.map((r) => r.metricName))),
+      })
+      .andWhere('analytics.date IN (:...dates)', {
+        dates: Array.from(new Set(records.map((r) => toDay(r.date)))),
+      })
+      .getMany();
+
+    const seen = new Set(existing.map(keyOf));
+    records.forEach((record, position) => {
+      const key = keyOf(record);
+      if (seen.has(key)) duplicates.add(position);
+      seen.add(key);
+    });
+    return duplicates;
+  }
+
+  private duplicateMessage(record: AnalyticsEntity): string {
+    return `Analytics record already exists for metric '${record.metricName}' on ${toDay(record.date)}`;
+  }
+
+  /**
+   * Insert records in multi-row batches and fold them into the rollups, all
+   * in one transaction. The records get their generated ids.
+   */
+  private async insertRecords(
+    records: AnalyticsEntity[],
+  ): Promise<AnalyticsEntity[]> {
+    if (records.length === 0) return records;
+
+    await this.dataSource.transaction(async (manager) => {
+      for (let i = 0; i < records.length; i += INSERT_BATCH_SIZE) {
+        const batch = records.slice(i, i + INSERT_BATCH_SIZE);
+        await manager
+          .createQueryBuilder()
+          .insert()
+          .into(AnalyticsEntity)
+          .values(batch)
+          .execute();
+        await this.rollupService.applyInserted(
+          manager,
+          batch.map((record) => record.id),
+        );
+      }
+    });
+    return records;
+  }
+
+  /**
+   * Save a changed record and rebuild the rollups of its day, and of the day
+   * it was in before when that differs
+   */
+  private async saveAndRebuild(
+    analytics: AnalyticsEntity,
+    previous = this.rollupDayKey(analytics),
+  ): Promise<AnalyticsEntity> {
+    return await this.dataSource.transaction(async (manager) => {
+      const saved = await manager.save(analytics);
+      await this.rollupService.rebuildDays(manager, [
+        previous,
+        this.rollupDayKey(saved),
+      ]);
+      return saved;
+    });
+  }
+
+  private rollupDayKey(analytics: AnalyticsEntity): RollupDayKey {
+    return {
+      metricName: analytics.metricName,
+      granularity: analytics.granularity,
+      day: toDay(analytics.date),
+    };
+  }
 }
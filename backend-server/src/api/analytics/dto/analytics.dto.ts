@@ -741,7 +741,11 @@ export class MetricTrendDto {
   @ApiProperty({ description: 'Metric name' })
   metricName: string;
 
-  @ApiProperty({ description: 'Time series data points', type: [Object] })
+  @ApiProperty({
+    description:
+      'Time series data points, one per bucket holding its latest value',
+    type: [Object],
+  })
   dataPoints: Array<{
     date: Date;
     value: number;
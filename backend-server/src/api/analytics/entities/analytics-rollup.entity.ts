@@ -0,0 +1,63 @@
+import { Column, Entity, PrimaryColumn } from 'typeorm';
+import { TimeGranularity } from './analytics.entity';
+
+/** Bucket sizes analytics are rolled up to, finest first */
+export enum RollupResolution {
+  MINUTE = 'minute',
+  HOUR = 'hour',
+  DAY = 'day',
+}
+
+/**
+ * Aggregates of active analytics records per metric, record granularity and
+ * UTC time bucket. Maintained as records are written; see
+ * AnalyticsRollupService.
+ */
+@Entity('analytics_rollups')
+export class AnalyticsRollupEntity {
+  @PrimaryColumn({ name: 'resolution', type: 'varchar', length: 10 })
+  resolution: RollupResolution;
+
+  @PrimaryColumn({ name: 'metric_name', type: 'varchar', length: 100 })
+  metricName: string;
+
+  @PrimaryColumn({ name: 'granularity', type: 'varchar', length: 20 })
+  granularity: TimeGranularity;
+
+  @PrimaryColumn({ name: 'bucket_start', type: 'timestamptz' })
+  bucketStart: Date;
+
+  @Column({ name: 'sample_count', type: 'int', default: 0 })
+  sampleCount: number;
+
+  @Column({
+    name: 'value_sum',
+    type: 'decimal',
+    precision: 20,
+    scale: 2,
+    default: 0,
+  })
+  valueSum: number;
+
+  @Column({ name: 'value_min', type: 'decimal', precision: 15, scale: 2 })
+  valueMin: number;
+
+  @Column({ name: 'value_max', type: 'decimal', precision: 15, scale: 2 })
+  valueMax: number;
+
+  /** Value of the most recently observed record in the bucket */
+  @Column({ name: 'last_value', type: 'decimal', precision: 15, scale: 2 })
+  lastValue: number;
+
+  @Column({
+    name: 'last_change_percentage',
+    type: 'decimal',
+    precision: 10,
+    scale: 4,
+    nullable: true,
+  })
+  lastChangePercentage?: number;
+
+  @Column({ name: 'last_observed_at', type: 'timestamptz' })
+  lastObservedAt: Date;
+}
@@ -9,6 +9,7 @@ import { AuditLogEntity } from './entities/audit-log.entity';
 import { SystemHealthEntity } from './entities/system-health.entity';
 import { AuditInterceptor } from './interceptors/audit.interceptor';
 import { AuditIntegrityService } from './services/audit-integrity.service';
+import { AuditLogWriterService } from './services/audit-log-writer.service';
 import { HealthCheckService } from './services/health-check.service';
 
 @Module({
@@ -22,6 +23,7 @@ import { HealthCheckService } from './services/health-check.service';
     AuditInterceptor,
     HealthCheckService,
     AuditIntegrityService,
+    AuditLogWriterService,
     IdGeneratorService,
   ],
   exports: [
@@ -29,6 +31,7 @@ import { HealthCheckService } from './services/health-check.service';
     AuditInterceptor,
     HealthCheckService,
     AuditIntegrityService,
+    AuditLogWriterService,
   ],
 })
 export class AuditModule {}
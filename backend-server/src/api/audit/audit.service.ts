@@ -24,6 +24,7 @@ import {
   AuditIntegrityService,
   AuditLogContent,
 } from './services/audit-integrity.service';
+import { AuditLogWriterService } from './services/audit-log-writer.service';
 
 @Injectable()
 export class AuditService {
@@ -37,6 +38,7 @@ export class AuditService {
     @InjectRepository(UserEntity)
     private userRepository: Repository<UserEntity>,
     private auditIntegrityService: AuditIntegrityService,
+    private auditLogWriter: AuditLogWriterService,
   ) {}
 
   // Audit Log Methods
@@ -44,60 +46,11 @@ export class AuditService {
     createAuditLogDto: CreateAuditLogDto,
   ): Promise<AuditLogEntity> {
     try {
-      // Create the audit log with basic data
-      const auditLogData = {
-        ...createAuditLogDto,
-        severity: createAuditLogDto.severity || AuditSeverity.LOW,
-        isSuccessful: createAuditLogDto.isSuccessful ?? true,
-        createdAt: new Date(),
-      };
-
-      // Generate integrity data
-      const content: AuditLogContent = {
-        userId: auditLogData.userId,
-        action: auditLogData.action,
-        resourceType: auditLogData.resourceType,
-        resourceId: auditLogData.resourceId,
-        description: auditLogData.description,
-        oldValues: auditLogData.oldValues,
-        newValues: auditLogData.newValues,
-        ipAddress: auditLogData.ipAddress,
-        userAgent: auditLogData.userAgent,
-        severity: auditLogData.severity,
-        metadata: auditLogData.metadata,
-        sessionId: auditLogData.sessionId,
-        requestId: auditLogData.requestId,
-        endpoint: auditLogData.endpoint,
-        httpMethod: auditLogData.httpMethod,
-        responseStatus: auditLogData.responseStatus,
-        executionTime: auditLogData.executionTime,
-        isSuccessful: auditLogData.isSuccessful,
-        errorMessage: auditLogData.errorMessage,
-        createdAt: auditLogData.createdAt,
-      };
-
-      const integrityData =
-        await this.auditIntegrityService.generateIntegrityData(content);
-
-      // Create the audit log with integrity data
-      const auditLog = this.auditLogRepository.create({
-        ...auditLogData,
-        contentHash: integrityData.contentHash,
-        previousHash: integrityData.previousHash,
-        sequenceNumber: integrityData.sequenceNumber,
-        hashAlgorithm: integrityData.hashAlgorithm,
-        integrityVerified: false,
-      });
-
-      const savedLog = await this.auditLogRepository.save(auditLog);
-
-      // Log critical events
-      if (createAuditLogDto.severity === AuditSeverity.CRITICAL) {
-        this.logger.error(
-          `Critical audit event: ${createAuditLogDto.action} - ${createAuditLogDto.description}`,
-        );
-      }
-
+      const savedLog = await this.auditLogWriter.write(
+        AuditLogEntity,
+        this.buildAuditLog(createAuditLogDto),
+      );
+      this.logCriticalEvent(createAuditLogDto);
       return savedLog;
     } catch (error) {
       this.logger.error('Failed to create audit log', error.stack);
@@ -105,6 +58,68 @@ export class AuditService {
     }
   }
 
+  /**
+   * Queue an audit log without waiting for it to be stored. The hash chain
+   * is linked when the writer flushes.
+   */
+  async recordAuditLog(createAuditLogDto: CreateAuditLogDto): Promise<void> {
+    await this.auditLogWriter.enqueue(
+      AuditLogEntity,
+      this.buildAuditLog(createAuditLogDto),
+    );
+    this.logCriticalEvent(createAuditLogDto);
+  }
+
+  private buildAuditLog(
+    createAuditLogDto: CreateAuditLogDto,
+  ): Partial<AuditLogEntity> {
+    const auditLogData = {
+      ...createAuditLogDto,
+      severity: createAuditLogDto.severity || AuditSeverity.LOW,
+      isSuccessful: createAuditLogDto.isSuccessful ?? true,
+      createdAt: new Date(),
+    };
+
+    const content: AuditLogContent = {
+      userId: auditLogData.userId,
+      action: auditLogData.action,
+      resourceType: auditLogData.resourceType,
+      resourceId: auditLogData.resourceId,
+      description: auditLogData.description,
+      oldValues: auditLogData.oldValues,
+      newValues: auditLogData.newValues,
+      ipAddress: auditLogData.ipAddress,
+      userAgent: auditLogData.userAgent,
+      severity: auditLogData.severity,
+      metadata: auditLogData.metadata,
+      sessionId: auditLogData.sessionId,
+      requestId: auditLogData.requestId,
+      endpoint: auditLogData.endpoint,
+      httpMethod: auditLogData.httpMethod,
+      responseStatus: auditLogData.responseStatus,
+      executionTime: auditLogData.executionTime,
+      isSuccessful: auditLogData.isSuccessful,
+      errorMessage: auditLogData.errorMessage,
+      createdAt: auditLogData.createdAt,
+    };
+
+    // previousHash and sequenceNumber are assigned by the writer
+    return {
+      ...auditLogData,
+      contentHash: this.auditIntegrityService.generateContentHash(content),
+      hashAlgorithm: 'SHA256',
+      integrityVerified: false,
+    };
+  }
+
+  private logCriticalEvent(createAuditLogDto: CreateAuditLogDto): void {
+    if (createAuditLogDto.severity === AuditSeverity.CRITICAL) {
+      this.logger.error(
+        `Critical audit event: ${createAuditLogDto.action} - ${createAuditLogDto.description}`,
+      );
+    }
+  }
+
   // Integrity verification methods
   async verifyAuditLogIntegrity(logId: string): Promise<boolean> {
     try {
@@ -155,7 +170,7 @@ export class AuditService {
     severity: AuditSeverity = AuditSeverity.LOW,
   ): Promise<void> {
     try {
-      await this.createAuditLog({
+      await this.recordAuditLog({
         userId,
         action,
         resourceType,
@@ -178,7 +193,7 @@ export class AuditService {
     severity: AuditSeverity = AuditSeverity.MEDIUM,
   ): Promise<void> {
     try {
-      await this.createAuditLog({
+      await this.recordAuditLog({
         action,
         description,
         metadata,
@@ -199,7 +214,7 @@ export class AuditService {
     metadata?: Record<string, any>,
   ): Promise<void> {
     try {
-      await this.createAuditLog({
+      await this.recordAuditLog({
         userId,
         action,
         description,
@@ -121,7 +121,7 @@ export class AuditInterceptor implements NestInterceptor {
       const resourceType = this.extractResourceType(url);
       const resourceId = this.extractResourceId(params);
 
-      await this.auditService.createAuditLog({
+      await this.auditService.recordAuditLog({
         userId,
         action,
         resourceType,
@@ -1,7 +1,7 @@
 import { Injectable, Logger } from '@nestjs/common';
 import { InjectRepository } from '@nestjs/typeorm';
 import * as crypto from 'crypto';
-import { Repository } from 'typeorm';
+import { EntityManager, Repository } from 'typeorm';
 import { AuditLogEntity } from '../entities/audit-log.entity';
 
 export interface AuditLogContent {
@@ -51,12 +51,15 @@ export class AuditIntegrityService {
   /**
    * Get the hash of the previous audit log for chain integrity
    */
-  async getPreviousHash(): Promise<{
+  async getPreviousHash(manager?: EntityManager): Promise<{
     hash: string;
     sequenceNumber: number;
   } | null> {
     try {
-      const lastLog = await this.auditLogRepository.findOne({
+      const repository = manager
+        ? manager.getRepository(AuditLogEntity)
+        : this.auditLogRepository;
+      const lastLog = await repository.findOne({
         where: {},
         order: { sequenceNumber: 'DESC' },
         select: ['contentHash', 'sequenceNumber'],
@@ -68,7 +71,8 @@ export class AuditIntegrityService {
 
       return {
         hash: lastLog.contentHash,
-        sequenceNumber: lastLog.sequenceNumber || 0,
+        // bigint columns are read back as strings
+        sequenceNumber: Number(lastLog.sequenceNumber) || 0,
       };
     } catch (error) {
       this.logger.error('Failed to get previous hash', error.stack);
@@ -87,15 +91,32 @@ export class AuditIntegrityService {
   }> {
     const contentHash = this.generateContentHash(content);
     const previousData = await this.getPreviousHash();
+    const [link] = this.chainIntegrityData([contentHash], previousData);
 
     return {
       contentHash,
-      previousHash: previousData?.hash || null,
-      sequenceNumber: (previousData?.sequenceNumber || 0) + 1,
+      ...link,
       hashAlgorithm: 'SHA256',
     };
   }
 
+  /**
+   * Link a run of logs, in insertion order, onto the end of the chain
+   */
+  chainIntegrityData(
+    contentHashes: string[],
+    previous: { hash: string; sequenceNumber: number } | null,
+  ): { previousHash: string | null; sequenceNumber: number }[] {
+    let previousHash = previous?.hash || null;
+    let sequenceNumber = previous?.sequenceNumber || 0;
+
+    return contentHashes.map((contentHash) => {
+      const link = { previousHash, sequenceNumber: ++sequenceNumber };
+      previousHash = contentHash;
+      return link;
+    });
+  }
+
   /**
    * Verify the integrity of a single audit log
    */
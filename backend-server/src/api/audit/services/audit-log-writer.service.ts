@@ -0,0 +1,359 @@
+import { GlobalConfig } from '@/config/config.type';
+import { Injectable, Logger, OnApplicationShutdown } from '@nestjs/common';
+import { ConfigService } from '@nestjs/config';
+import { Interval } from '@nestjs/schedule';
+import {
+  appendFile,
+  mkdir,
+  readFile,
+  readdir,
+  rename,
+  rm,
+} from 'node:fs/promises';
+import path from 'node:path';
+import { setTimeout as sleep } from 'node:timers/promises';
+import { DataSource, EntityTarget, ObjectLiteral } from 'typeorm';
+import { AuditLogEntity } from '../entities/audit-log.entity';
+import { AuditIntegrityService } from './audit-integrity.service';
+
+interface AuditWrite {
+  table: string;
+  target: EntityTarget<ObjectLiteral>;
+  values: ObjectLiteral;
+  /** Set by write(); settled once the row is inserted */
+  deferred?: {
+    resolve: (row: ObjectLiteral) => void;
+    reject: (error: Error) => void;
+  };
+}
+
+interface SpilledWrite {
+  table: string;
+  values: ObjectLiteral;
+}
+
+const BUFFER_CAPACITY = 10000;
+/** Buffered rows that trigger a flush before the next interval */
+const FLUSH_BATCH_SIZE = 500;
+const FLUSH_INTERVAL_MS = 1000;
+const FLUSH_MAX_ROWS = 2000;
+const INSERT_CHUNK_SIZE = 500;
+/** How long enqueue() waits for a flush to free space before spilling */
+const BACKPRESSURE_WAIT_MS = 100;
+const REPLAY_INTERVAL_MS = 30000;
+const SPILL_SUFFIX = '.ndjson';
+const REPLAY_SUFFIX = '.replaying';
+const AUDIT_CHAIN_LOCK = 'audit_logs.chain';
+
+/**
+ * Fixed-capacity FIFO queue over a preallocated array
+ */
+class RingBuffer<T> {
+  private readonly items: (T | undefined)[];
+  private head = 0;
+  private length = 0;
+
+  constructor(readonly capacity: number) {
+    this.items = new Array(capacity);
+  }
+
+  get size(): number {
+    return this.length;
+  }
+
+  push(item: T): boolean {
+    if (this.length === this.capacity) return false;
+    this.items[(this.head + this.length) % this.capacity] = item;
+    this.length++;
+    return true;
+  }
+
+  shift(count: number): T[] {
+    const taken = Math.min(count, this.length);
+    const result = new Array<T>(taken);
+    for (let i = 0; i < taken; i++) {
+      result[i] = this.items[this.head];
+      this.items[this.head] = undefined;
+      this.head = (this.head + 1) % this.capacity;
+    }
+    this.length -= taken;
+    return result;
+  }
+}
+
+/**
+ * Single ingestion pipeline for audit rows.
+ *
+ * Rows for audit_logs and the module audit trails are buffered in a
+ * bounded ring buffer and written with multi-row INSERTs, either once
+ * FLUSH_BATCH_SIZE rows are waiting or every FLUSH_INTERVAL_MS. audit_logs
+ * rows are linked into the integrity hash chain at flush time, under a
+ * transaction-scoped advisory lock, so the chain stays linear across
+ * instances. When the buffer is full, or a flush fails, rows are appended
+ * to NDJSON files under `app.auditSpillDir` and replayed later.
+ */
+@Injectable()
+export class AuditLogWriterService implements OnApplicationShutdown {
+  private readonly logger = new Logger(AuditLogWriterService.name);
+  private readonly buffer = new RingBuffer<AuditWrite>(BUFFER_CAPACITY);
+  /** Entity targets by table, used to map spilled rows back on replay */
+  private readonly targets = new Map<string, EntityTarget<ObjectLiteral>>();
+  private readonly spillDir: string;
+  private spillFile: string | null = null;
+  private spilling: Promise<void> = Promise.resolve();
+  private flushing: Promise<void> | null = null;
+  private flushRequested = false;
+  /** Flushes and replays both extend the hash chain, so they never overlap */
+  private exclusive: Promise<void> = Promise.resolve();
+
+  constructor(
+    private readonly dataSource: DataSource,
+    private readonly auditIntegrityService: AuditIntegrityService,
+    private readonly configService: ConfigService<GlobalConfig>,
+  ) {
+    this.spillDir = path.resolve(
+      this.configService.get('app.auditSpillDir', { infer: true }),
+    );
+  }
+
+  /**
+   * Queue a row for the next flush. Resolves once the row is buffered; when
+   * the buffer is full it waits briefly for a flush to make room and
+   * otherwise spills the row to disk, so a slow database never holds the
+   * caller for long.
+   */
+  async enqueue<T extends ObjectLiteral>(
+    target: EntityTarget<T>,
+    values: Partial<T>,
+  ): Promise<void> {
+    const write = this.toWrite(target, values);
+    if (this.offer(write)) return;
+
+    await Promise.race([this.flush(), sleep(BACKPRESSURE_WAIT_MS)]);
+    if (!this.offer(write)) {
+      await this.spill([write]);
+    }
+  }
+
+  /**
+   * Queue a row and wait until it is inserted, for callers that need the
+   * stored row. These rows are never spilled; a failed insert rejects.
+   */
+  async write<T extends ObjectLiteral>(
+    target: EntityTarget<T>,
+    values: Partial<T>,
+  ): Promise<T> {
+    const write = this.toWrite(target, values);
+    const inserted = new Promise<ObjectLiteral>((resolve, reject) => {
+      write.deferred = { resolve, reject };
+    });
+
+    while (!this.offer(write)) {
+      await this.flush();
+    }
+    void this.flush();
+    return inserted as Promise<T>;
+  }
+
+  @Interval(FLUSH_INTERVAL_MS)
+  flush(): Promise<void> {
+    if (this.flushing) {
+      // Rows buffered after this flush started get a flush of their own
+      this.flushRequested = true;
+      return this.flushing;
+    }
+
+    this.flushing = this.runExclusive(async () => {
+      do {
+        await this.insert(this.buffer.shift(FLUSH_MAX_ROWS));
+      } while (this.buffer.size >= FLUSH_BATCH_SIZE);
+    }).finally(() => {
+      this.flushing = null;
+      if (this.flushRequested) {
+        this.flushRequested = false;
+        void this.flush();
+      }
+    });
+    return this.flushing;
+  }
+
+  /**
+   * Re-insert spilled rows. Each file is claimed by renaming it first, so
+   * instances sharing the directory never replay the same file twice.
+   */
+  @Interval(REPLAY_INTERVAL_MS)
+  async replaySpilled(): Promise<void> {
+    // The database is still behind; leave the files for a later run
+    if (this.buffer.size >= FLUSH_BATCH_SIZE) return;
+
+    // Start a new spill file so the current one can be replayed
+    await this.spilling;
+    this.spillFile = null;
+
+    let files: string[];
+    try {
+      files = (await readdir(this.spillDir)).filter((file) =>
+        file.endsWith(SPILL_SUFFIX),
+      );
+    } catch {
+      return;
+    }
+
+    for (const file of files) {
+      const claimed = path.join(this.spillDir, `${file}${REPLAY_SUFFIX}`);
+      try {
+        await rename(path.join(this.spillDir, file), claimed);
+      } catch {
+        continue;
+      }
+
+      const writes: AuditWrite[] = [];
+      for (const line of (await readFile(claimed, 'utf8')).split('\n')) {
+        if (!line) continue;
+        try {
+          const { table, values } = JSON.parse(line) as SpilledWrite;
+          writes.push({
+            table,
+            target: this.targets.get(table) || table,
+            values,
+          });
+        } catch {
+          // A line torn by a crash mid-append
+          this.logger.warn(`Skipping unreadable line in ${file}`);
+        }
+      }
+
+      // Rows that fail again are spilled to a new file by insert()
+      await this.runExclusive(async () => {
+        for (let i = 0; i < writes.length; i += FLUSH_MAX_ROWS) {
+          await this.insert(writes.slice(i, i + FLUSH_MAX_ROWS));
+        }
+      });
+      await rm(claimed, { force: true });
+      this.logger.log(`Replayed ${writes.length} spilled audit rows`);
+    }
+  }
+
+  async onApplicationShutdown(): Promise<void> {
+    await this.flush();
+    await this.spilling;
+  }
+
+  private offer(write: AuditWrite): boolean {
+    if (!this.buffer.push(write)) return false;
+    if (this.buffer.size >= FLUSH_BATCH_SIZE) {
+      void this.flush();
+    }
+    return true;
+  }
+
+  private toWrite(
+    target: EntityTarget<ObjectLiteral>,
+    values: ObjectLiteral,
+  ): AuditWrite {
+    const metadata = this.dataSource.getMetadata(target);
+    this.targets.set(metadata.tableName, target);
+
+    // Stamp the event time now rather than when the row is flushed
+    const createDate = metadata.createDateColumn;
+    if (createDate && values[createDate.propertyName] == null) {
+      values = { ...values, [createDate.propertyName]: new Date() };
+    }
+
+    return { table: metadata.tableName, target, values };
+  }
+
+  /**
+   * Insert a batch, one transaction per table. Failed rows are spilled,
+   * except rows from write(), whose callers get the error instead.
+   */
+  private async insert(writes: AuditWrite[]): Promise<void> {
+    if (writes.length === 0) return;
+
+    const byTable = new Map<string, AuditWrite[]>();
+    for (const write of writes) {
+      const group = byTable.get(write.table) || [];
+      group.push(write);
+      byTable.set(write.table, group);
+    }
+
+    for (const [table, group] of byTable) {
+      try {
+        await this.insertRows(table, group);
+      } catch (error) {
+        this.logger.error(
+          `Failed to write ${group.length} rows to ${table}`,
+          error.stack,
+        );
+        group.forEach((write) => write.deferred?.reject(error));
+        await this.spill(group.filter((write) => !write.deferred));
+      }
+    }
+  }
+
+  private async insertRows(table: string, writes: AuditWrite[]): Promise<void> {
+    const target = writes[0].target;
+    const rows = writes.map((write) => ({ ...write.values }));
+
+    await this.dataSource.transaction(async (manager) => {
+      if (table === this.dataSource.getMetadata(AuditLogEntity).tableName) {
+        await manager.query('SELECT pg_advisory_xact_lock(hashtext($1))', [
+          AUDIT_CHAIN_LOCK,
+        ]);
+        const previous =
+          await this.auditIntegrityService.getPreviousHash(manager);
+        const links = this.auditIntegrityService.chainIntegrityData(
+          rows.map((row) => row.contentHash),
+          previous,
+        );
+        rows.forEach((row, i) => Object.assign(row, links[i]));
+      }
+
+      for (let i = 0; i < rows.length; i += INSERT_CHUNK_SIZE) {
+        const chunk = rows.slice(i, i + INSERT_CHUNK_SIZE);
+        const result = await manager
+          .createQueryBuilder()
+          .insert()
+          .into(target)
+          .values(chunk)
+          .execute();
+        chunk.forEach((row, j) =>
+          Object.assign(row, result.generatedMaps[j] || {}),
+        );
+      }
+    });
+
+    writes.forEach((write, i) => write.deferred?.resolve(rows[i]));
+  }
+
+  private spill(writes: AuditWrite[]): Promise<void> {
+    if (writes.length === 0) return this.spilling;
+
+    const lines = writes
+      .map(({ table, values }) => JSON.stringify({ table, values }))
+      .join('\n');
+
+    this.spilling = this.spilling
+      .then(async () => {
+        await mkdir(this.spillDir, { recursive: true });
+        this.spillFile ??= path.join(
+          this.spillDir,
+          `audit-${process.pid}-${Date.now()}${SPILL_SUFFIX}`,
+        );
+        await appendFile(this.spillFile, `${lines}\n`);
+      })
+      .catch((error) => {
+        this.logger.error(
+          `Failed to spill ${writes.length} audit rows`,
+          error.stack,
+        );
+      });
+    return this.spilling;
+  }
+
+  private runExclusive(task: () => Promise<void>): Promise<void> {
+    const run = this.exclusive.then(task);
+    this.exclusive = run.catch(() => undefined);
+    return run;
+  }
+}
@@ -0,0 +1,125 @@
+import { ConfigService } from '@nestjs/config';
+import { Test, TestingModule } from '@nestjs/testing';
+import { getRepositoryToken } from '@nestjs/typeorm';
+import { mkdtemp, readdir, rm } from 'node:fs/promises';
+import { tmpdir } from 'node:os';
+import path from 'node:path';
+import { DataSource } from 'typeorm';
+import { InventoryAuditTrailEntity } from '../../space-inventory/entities/space-inventory.entity';
+import { AuditAction, AuditLogEntity } from '../entities/audit-log.entity';
+import { AuditIntegrityService } from '../services/audit-integrity.service';
+import { AuditLogWriterService } from '../services/audit-log-writer.service';
+
+describe('AuditLogWriterService', () => {
+  let service: AuditLogWriterService;
+  let spillDir: string;
+
+  const execute = jest.fn();
+  const values = jest.fn(() => ({ execute }));
+  const mockManager = {
+    query: jest.fn(),
+    getRepository: jest.fn(() => mockAuditLogRepository),
+    createQueryBuilder: jest.fn(() => ({
+      insert: () => ({ into: () => ({ values }) }),
+    })),
+  };
+  const mockAuditLogRepository = { findOne: jest.fn() };
+  const mockDataSource = {
+    getMetadata: jest.fn((target) => ({
+      tableName:
+        target === AuditLogEntity ? 'audit_logs' : 'inventory_audit_trail',
+      createDateColumn: { propertyName: 'createdAt' },
+    })),
+    transaction: jest.fn((work) => work(mockManager)),
+  };
+
+  beforeEach(async () => {
+    spillDir = await mkdtemp(path.join(tmpdir(), 'audit-spill-'));
+    execute.mockImplementation(async () => ({ generatedMaps: [] }));
+
+    const module: TestingModule = await Test.createTestingModule({
+      providers: [
+        AuditLogWriterService,
+        AuditIntegrityService,
+        { provide: DataSource, useValue: mockDataSource },
+        {
+          provide: getRepositoryToken(AuditLogEntity),
+          useValue: mockAuditLogRepository,
+        },
+        { provide: ConfigService, useValue: { get: () => spillDir } },
+      ],
+    }).compile();
+
+    service = module.get<AuditLogWriterService>(AuditLogWriterService);
+  });
+
+  afterEach(async () => {
+    jest.clearAllMocks();
+    await rm(spillDir, { recursive: true, force: true });
+  });
+
+  it('should link buffered audit logs onto the chain in one insert', async () => {
+    mockAuditLogRepository.findOne.mockResolvedValue({
+      contentHash: 'previous',
+      sequenceNumber: '41',
+    });
+
+    for (const contentHash of ['a', 'b', 'c']) {
+      await service.enqueue(AuditLogEntity, {
+        action: AuditAction.UPDATE,
+        contentHash,
+      });
+    }
+    expect(values).not.toHaveBeenCalled();
+
+    await service.flush();
+
+    expect(mockManager.query).toHaveBeenCalledWith(
+      'SELECT pg_advisory_xact_lock(hashtext($1))',
+      ['audit_logs.chain'],
+    );
+    expect(values).toHaveBeenCalledTimes(1);
+    expect(
+      values.mock.calls[0][0].map((row) => [
+        row.previousHash,
+        row.sequenceNumber,
+      ]),
+    ).toEqual([
+      ['previous', 42],
+      ['a', 43],
+      ['b', 44],
+    ]);
+  });
+
+  it('should spill rows when the insert fails and replay them later', async () => {
+    execute.mockRejectedValueOnce(new Error('statement timeout'));
+
+    await service.enqueue(InventoryAuditTrailEntity, {
+      inventoryId: 'inventory-1',
+      action: 'UPDATE',
+    });
+    await service.flush();
+
+    expect(await readdir(spillDir)).toHaveLength(1);
+
+    await service.replaySpilled();
+
+    expect(values).toHaveBeenCalledTimes(2);
+    expect(values.mock.calls[1][0]).toEqual([
+      expect.objectContaining({
+        inventoryId: 'inventory-1',
+        action: 'UPDATE',
+      }),
+    ]);
+    expect(await readdir(spillDir)).toHaveLength(0);
+  });
+
+  it('should reject write() instead of spilling when the insert fails', async () => {
+    execute.mockRejectedValueOnce(new Error('connection refused'));
+
+    await expect(
+      service.write(AuditLogEntity, { action: AuditAction.CREATE }),
+    ).rejects.toThrow('connection refused');
+    expect(await readdir(spillDir)).toHaveLength(0);
+  });
+});
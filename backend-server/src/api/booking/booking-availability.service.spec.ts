@@ -0,0 +1,139 @@
+import { BookingStatus } from '@/common/enums/booking.enum';
+import { BookingEntity } from '@/database/entities/booking.entity';
+import { NotFoundException } from '@nestjs/common';
+import { Test, TestingModule } from '@nestjs/testing';
+import { getRepositoryToken } from '@nestjs/typeorm';
+import { BookingAvailabilityService } from './booking-availability.service';
+
+describe('BookingAvailabilityService', () => {
+  let service: BookingAvailabilityService;
+
+  const HOUR = 60 * 60 * 1000;
+  const base = Date.now() + 24 * HOUR;
+  const at = (hours: number) => new Date(base + hours * HOUR);
+
+  const bookingRow = (id: string, startHour: number, endHour: number) => ({
+    spaceId: 'space-1',
+    partnerId: 'partner-1',
+    id,
+    userId: 'user-1',
+    startDateTime: at(startHour),
+    endDateTime: at(endHour),
+    guestCount: 2,
+    specialRequests: null,
+    totalAmount: '500.00',
+    status: BookingStatus.CONFIRMED,
+    createdAt: new Date(),
+    updatedAt: new Date(),
+  });
+
+  const mockBookingRepository = { query: jest.fn() };
+
+  beforeEach(async () => {
+    const module: TestingModule = await Test.createTestingModule({
+      providers: [
+        BookingAvailabilityService,
+        {
+          provide: getRepositoryToken(BookingEntity),
+          useValue: mockBookingRepository,
+        },
+      ],
+    }).compile();
+
+    service = module.get<BookingAvailabilityService>(
+      BookingAvailabilityService,
+    );
+  });
+
+  afterEach(() => {
+    jest.clearAllMocks();
+  });
+
+  describe('checkAvailability', () => {
+    it('should answer repeated checks from the interval cache', async () => {
+      mockBookingRepository.query.mockResolvedValue([
+        bookingRow('booking-1', 0, 2),
+        bookingRow('booking-2', 1, 8),
+        bookingRow('booking-3', 10, 12),
+      ]);
+
+      const busy = await service.checkAvailability('space-1', at(7), at(9));
+      const free = await service.checkAvailability('space-1', at(8), at(10));
+
+      expect(busy.available).toBe(false);
+      expect(busy.conflicts.map((c) => c.id)).toEqual(['booking-2']);
+      expect(busy.conflicts[0].totalAmount).toBe(500);
+      expect(free.available).toBe(true);
+      expect(mockBookingRepository.query).toHaveBeenCalledTimes(1);
+    });
+
+    it('should reload a space after a booking lifecycle event', async () => {
+      mockBookingRepository.query.mockResolvedValueOnce([
+        { spaceId: 'space-1', id: null },
+      ]);
+      expect(
+        (await service.checkAvailability('space-1', at(0), at(2))).available,
+      ).toBe(true);
+
+      service.handleBookingLifecycleEvent({ spaceId: 'space-1' });
+      mockBookingRepository.query.mockResolvedValueOnce([
+        bookingRow('booking-1', 0, 2),
+      ]);
+
+      const result = await service.checkAvailability('space-1', at(0), at(2));
+
+      expect(result.available).toBe(false);
+      expect(mockBookingRepository.query).toHaveBeenCalledTimes(2);
+    });
+
+    it('should bypass the cache for consistent reads', async () => {
+      mockBookingRepository.query.mockResolvedValue([
+        bookingRow('booking-1', 0, 2),
+      ]);
+
+      await service.checkAvailability('space-1', at(0), at(2));
+      const result = await service.checkAvailability('space-1', at(0), at(2), {
+        consistent: true,
+        excludeBookingId: 'booking-1',
+      });
+
+      expect(result.available).toBe(true);
+      expect(mockBookingRepository.query).toHaveBeenCalledTimes(2);
+    });
+
+    it('should throw NotFoundException when space not found', async () => {
+      mockBookingRepository.query.mockResolvedValue([]);
+
+      await expect(
+        service.checkAvailability('missing', at(0), at(2)),
+      ).rejects.toThrow(NotFoundException);
+    });
+  });
+
+  describe('checkAvailabilityBatch', () => {
+    it('should resolve slots beyond the cache horizon in one existence query', async () => {
+      const farFuture = (days: number) =>
+        new Date(Date.now() + days * 24 * HOUR);
+      mockBookingRepository.query.mockResolvedValue([
+        { idx: '1', spaceExists: true, conflict: false },
+        { idx: '2', spaceExists: true, conflict: true },
+      ]);
+
+      const result = await service.checkAvailabilityBatch([
+        {
+          spaceId: 'space-1',
+          startDateTime: farFuture(200),
+          endDateTime: farFuture(201),
+        },
+        {
+          spaceId: 'space-2',
+          startDateTime: farFuture(200),
+          endDateTime: farFuture(201),
+        },
+      ]);
+
+      expect(result.map((slot) => slot.available)).toEqual([true, false]);
+      expect(mockBookingRepository.query).toHaveBeenCalledTimes(1);
+    });
+  });
+});
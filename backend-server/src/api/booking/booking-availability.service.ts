@@ -0,0 +1,455 @@
+import { BookingStatus } from '@/common/enums/booking.enum';
+import { Uuid } from '@/common/types/common.type';
+import { ErrorResponseUtil } from '@/common/utils/error-response.util';
+import { BookingEntity } from '@/database/entities/booking.entity';
+import { Injectable } from '@nestjs/common';
+import { OnEvent } from '@nestjs/event-emitter';
+import { InjectRepository } from '@nestjs/typeorm';
+import { Repository } from 'typeorm';
+import {
+  AvailabilityResponseDto,
+  BookingDto,
+  SlotAvailabilityDto,
+} from './booking.dto';
+
+export interface AvailabilitySlot {
+  spaceId: string;
+  startDateTime: string | Date;
+  endDateTime: string | Date;
+}
+
+export interface AvailabilityCheckOptions {
+  /**
+   * Read straight from the database instead of the interval cache. Use on
+   * write paths that must not act on a stale view.
+   */
+  consistent?: boolean;
+  /**
+   * Ignore this booking when looking for conflicts (rescheduling)
+   */
+  excludeBookingId?: string;
+}
+
+interface BookingInterval {
+  id: string;
+  userId: string;
+  partnerId: string;
+  start: number;
+  end: number;
+  guestCount: number;
+  specialRequests: string;
+  totalAmount: number;
+  status: BookingStatus;
+  createdAt: Date;
+  updatedAt: Date;
+}
+
+interface OverlapRow {
+  idx: string;
+  spaceExists: boolean;
+  conflict: boolean;
+}
+
+interface SpaceIntervals {
+  /** Active bookings sorted by start */
+  intervals: BookingInterval[];
+  /** Running maximum of `end` over `intervals[0..i]` */
+  maxEnd: number[];
+  windowStart: number;
+  windowEnd: number;
+  expiresAt: number;
+}
+
+const DAY_MS = 24 * 60 * 60 * 1000;
+const CACHE_HORIZON_DAYS = 90;
+const CACHE_TTL_MS = 30000;
+const CACHE_MAX_SPACES = 5000;
+
+/**
+ * Booking availability lookups.
+ *
+ * Overlap checks hit a GiST index on the booking time range and only read
+ * the columns needed for a yes/no answer and the conflict list. Checks
+ * within the next few months are answered from a per-space interval cache
+ * that booking lifecycle events invalidate; a short TTL bounds staleness
+ * for changes made without an event. Write paths pass `consistent: true`
+ * and always read from the database.
+ */
+@Injectable()
+export class BookingAvailabilityService {
+  private readonly cache = new Map<string, SpaceIntervals>();
+  private generation = 0;
+
+  constructor(
+    @InjectRepository(BookingEntity)
+    private readonly bookingRepository: Repository<BookingEntity>,
+  ) {}
+
+  /**
+   * Availability of one space for one time slot, with conflicts
+   */
+  async checkAvailability(
+    spaceId: string,
+    startDateTime: string | Date,
+    endDateTime: string | Date,
+    options: AvailabilityCheckOptions = {},
+  ): Promise<AvailabilityResponseDto> {
+    const start = new Date(startDateTime).getTime();
+    const end = new Date(endDateTime).getTime();
+
+    let conflicts: BookingInterval[];
+    if (!options.consistent && this.isWithinHorizon(start, end)) {
+      const spaces = await this.getCachedIntervals([spaceId]);
+      if (!spaces.has(spaceId)) {
+        throw ErrorResponseUtil.notFound('Space', spaceId);
+      }
+      conflicts = this.findOverlaps(spaces.get(spaceId), start, end);
+    } else {
+      const spaces = await this.loadIntervals([spaceId], start, end);
+      if (!spaces.has(spaceId)) {
+        throw ErrorResponseUtil.notFound('Space', spaceId);
+      }
+      conflicts = spaces.get(spaceId).intervals;
+    }
+
+    if (options.excludeBookingId) {
+      conflicts = conflicts.filter((c) => c.id !== options.excludeBookingId);
+    }
+
+    return {
+      available: conflicts.length === 0,
+      conflicts:
+        conflicts.length > 0
+          ? conflicts.map((conflict) => this.toBookingDto(spaceId, conflict))
+          : undefined,
+    };
+  }
+
+  /**
+   * Existence-only check: true when no active booking overlaps the slot
+   */
+  async isAvailable(
+    spaceId: string,
+    startDateTime: string | Date,
+    endDateTime: string | Date,
+    options: AvailabilityCheckOptions = {},
+  ): Promise<boolean> {
+    const [result] = await this.checkAvailabilityBatch(
+      [{ spaceId, startDateTime, endDateTime }],
+      options,
+    );
+    return result.available;
+  }
+
+  /**
+   * Availability for many space/slot pairs in one call (search results,
+   * calendar views). Slots inside the cache horizon are answered from the
+   * interval cache, loading all uncached spaces with one query; the rest
+   * are resolved with one existence query for the whole batch.
+   */
+  async checkAvailabilityBatch(
+    slots: AvailabilitySlot[],
+    options: AvailabilityCheckOptions = {},
+  ): Promise<SlotAvailabilityDto[]> {
+    const normalized = slots.map((slot) => ({
+      spaceId: slot.spaceId,
+      startDateTime: new Date(slot.startDateTime),
+      endDateTime: new Date(slot.endDateTime),
+    }));
+    const results: SlotAvailabilityDto[] = new Array(normalized.length);
+
+    const cachedIndexes: number[] = [];
+    const databaseIndexes: number[] = [];
+    normalized.forEach((slot, index) => {
+      const cacheable =
+        !options.consistent &&
+        !options.excludeBookingId &&
+        this.isWithinHorizon(
+          slot.startDateTime.getTime(),
+          slot.endDateTime.getTime(),
+        );
+      (cacheable ? cachedIndexes : databaseIndexes).push(index);
+    });
+
+    if (cachedIndexes.length > 0) {
+      const spaces = await this.getCachedIntervals(
+        cachedIndexes.map((index) => normalized[index].spaceId),
+      );
+
+      for (const index of cachedIndexes) {
+        const slot = normalized[index];
+        const space = spaces.get(slot.spaceId);
+        if (!space) {
+          throw ErrorResponseUtil.notFound('Space', slot.spaceId);
+        }
+        results[index] = {
+          ...slot,
+          spaceId: slot.spaceId as Uuid,
+          available:
+            this.findOverlaps(
+              space,
+              slot.startDateTime.getTime(),
+              slot.endDateTime.getTime(),
+            ).length === 0,
+        };
+      }
+    }
+
+    if (databaseIndexes.length > 0) {
+      const conflicts = await this.queryOverlapExistence(
+        databaseIndexes.map((index) => normalized[index]),
+        options.excludeBookingId,
+      );
+
+      databaseIndexes.forEach((index, position) => {
+        const slot = normalized[index];
+        const conflict = conflicts[position];
+        if (conflict === null) {
+          throw ErrorResponseUtil.notFound('Space', slot.spaceId);
+        }
+        results[index] = {
+          ...slot,
+          spaceId: slot.spaceId as Uuid,
+          available: !conflict,
+        };
+      });
+    }
+
+    return results;
+  }
+
+  /**
+   * Drop cached intervals for a space, or for every space when omitted
+   */
+  invalidate(spaceId?: string): void {
+    this.generation++;
+    if (spaceId) {
+      this.cache.delete(spaceId);
+    } else {
+      this.cache.clear();
+    }
+  }
+
+  @OnEvent('booking.created')
+  @OnEvent('booking.confirmed')
+  @OnEvent('booking.cancelled')
+  @OnEvent('booking.completed')
+  @OnEvent('booking.modified')
+  handleBookingLifecycleEvent(event: { spaceId?: string }): void {
+    // Events without a space id cannot be targeted, so drop everything
+    this.invalidate(event?.spaceId || undefined);
+  }
+
+  private isWithinHorizon(start: number, end: number): boolean {
+    const now = Date.now();
+    return start >= now - DAY_MS && end <= now + CACHE_HORIZON_DAYS * DAY_MS;
+  }
+
+  /**
+   * Bookings overlapping [start, end); binary search bounds the candidates
+   * by start time and the running max end stops the backward scan early
+   */
+  private findOverlaps(
+    space: SpaceIntervals,
+    start: number,
+    end: number,
+  ): BookingInterval[] {
+    let low = 0;
+    let high = space.intervals.length;
+    while (low < high) {
+      const mid = (low + high) >>> 1;
+      if (space.intervals[mid].start < end) {
+        low = mid + 1;
+      } else {
+        high = mid;
+      }
+    }
+
+    const overlaps: BookingInterval[] = [];
+    for (let i = low - 1; i >= 0 && space.maxEnd[i] > start; i--) {
+      if (space.intervals[i].end > start) {
+        overlaps.push(space.intervals[i]);
+      }
+    }
+    return overlaps.reverse();
+  }
+
+  /**
+   * Cached horizon intervals per space; spaces that do not exist are
+   * absent from the result
+   */
+  private async getCachedIntervals(
+    spaceIds: string[],
+  ): Promise<Map<string, SpaceIntervals>> {
+    const now = Date.now();
+    const result = new Map<string, SpaceIntervals>();
+    const missing: string[] = [];
+
+    for (const spaceId of new Set(spaceIds)) {
+      const cached = this.cache.get(spaceId);
+      if (cached && cached.expiresAt > now) {
+        result.set(spaceId, cached);
+      } else {
+        missing.push(spaceId);
+      }
+    }
+
+    if (missing.length > 0) {
+      const generation = this.generation;
+      const loaded = await this.loadIntervals(
+        missing,
+        now - DAY_MS,
+        now + CACHE_HORIZON_DAYS * DAY_MS,
+      );
+
+      for (const [spaceId, intervals] of loaded) {
+        result.set(spaceId, intervals);
+        // An invalidation during the load may have made this data stale
+        if (generation === this.generation) {
+          this.store(spaceId, intervals);
+        }
+      }
+    }
+
+    return result;
+  }
+
+  private store(spaceId: string, intervals: SpaceIntervals): void {
+    this.cache.delete(spaceId);
+    this.cache.set(spaceId, intervals);
+
+    if (this.cache.size > CACHE_MAX_SPACES) {
+      // Map iteration order is insertion order, so this is the oldest entry
+      this.cache.delete(this.cache.keys().next().value);
+    }
+  }
+
+  /**
+   * Active bookings overlapping [windowStart, windowEnd) per space, read
+   * with one query. The status filter is inlined so the planner can match
+   * the partial range index. Every existing space gets an entry, even without
+   * bookings, so callers can tell an empty calendar from an unknown space.
+   */
+  private async loadIntervals(
+    spaceIds: string[],
+    windowStart: number,
+    windowEnd: number,
+  ): Promise<Map<string, SpaceIntervals>> {
+    const rows: Array<Record<string, any>> = await this.bookingRepository.query(
+      `SELECT s."id" AS "spaceId", l."partner_id" AS "partnerId",
+              b."id", b."userId", b."startDateTime", b."endDateTime",
+              b."guestCount", b."specialRequests", b."totalAmount",
+              b."status", b."createdAt", b."updatedAt"
+       FROM "space" s
+       LEFT JOIN "partner_listings" l ON l."id" = s."listing_id"
+       LEFT JOIN "space_option" so
+         ON so."space_id" = s."id" AND so."deletedAt" IS NULL
+       LEFT JOIN "booking" b
+         ON b."spaceOptionId" = so."id"
+        AND b."status" <> '${BookingStatus.CANCELLED}'
+        AND b."deletedAt" IS NULL
+        AND tsrange(b."startDateTime", b."endDateTime")
+            && tsrange($2::timestamp, $3::timestamp)
+       WHERE s."id" = ANY($1) AND s."deletedAt" IS NULL
+       ORDER BY b."startDateTime" ASC`,
+      [spaceIds, new Date(windowStart), new Date(windowEnd)],
+    );
+
+    const expiresAt = Date.now() + CACHE_TTL_MS;
+    const spaces = new Map<string, SpaceIntervals>();
+
+    for (const row of rows) {
+      let space = spaces.get(row.spaceId);
+      if (!space) {
+        space = {
+          intervals: [],
+          maxEnd: [],
+          windowStart,
+          windowEnd,
+          expiresAt,
+        };
+        spaces.set(row.spaceId, space);
+      }
+      if (!row.id) continue;
+
+      const end = new Date(row.endDateTime).getTime();
+      const previousMax = space.maxEnd[space.maxEnd.length - 1] ?? -Infinity;
+      space.intervals.push({
+        id: row.id,
+        userId: row.userId,
+        partnerId: row.partnerId,
+        start: new Date(row.startDateTime).getTime(),
+        end,
+        guestCount: row.guestCount,
+        specialRequests: row.specialRequests,
+        totalAmount: Number(row.totalAmount),
+        status: row.status,
+        createdAt: row.createdAt,
+        updatedAt: row.updatedAt,
+      });
+      space.maxEnd.push(Math.max(previousMax, end));
+    }
+
+    return spaces;
+  }
+
+  /**
+   * Whether any active booking overlaps each slot, in one round trip.
+   * Returns null for slots whose space does not exist.
+   */
+  private async queryOverlapExistence(
+    slots: Array<{ spaceId: string; startDateTime: Date; endDateTime: Date }>,
+    excludeBookingId?: string,
+  ): Promise<Array<boolean | null>> {
+    const rows: OverlapRow[] = await this.bookingRepository.query(
+      `SELECT slot."idx",
+              EXISTS (
+                SELECT 1 FROM "space" s
+                WHERE s."id" = slot."space_id" AND s."deletedAt" IS NULL
+              ) AS "spaceExists",
+              EXISTS (
+                SELECT 1
+                FROM "space_option" so
+                JOIN "booking" b ON b."spaceOptionId" = so."id"
+                WHERE so."space_id" = slot."space_id"
+                  AND so."deletedAt" IS NULL
+                  AND b."status" <> '${BookingStatus.CANCELLED}'
+                  AND b."deletedAt" IS NULL
+                  AND ($4::varchar IS NULL OR b."id" <> $4)
+                  AND tsrange(b."startDateTime", b."endDateTime")
+                      && tsrange(slot."start_at", slot."end_at")
+              ) AS "conflict"
+       FROM unnest($1::varchar[], $2::timestamp[], $3::timestamp[])
+            WITH ORDINALITY AS slot("space_id", "start_at", "end_at", "idx")`,
+      [
+        slots.map((slot) => slot.spaceId),
+        slots.map((slot) => slot.startDateTime),
+        slots.map((slot) => slot.endDateTime),
+        excludeBookingId ?? null,
+      ],
+    );
+
+    const results: Array<boolean | null> = new Array(slots.length).fill(null);
+    for (const row of rows) {
+      results[Number(row.idx) - 1] = row.spaceExists ? row.conflict : null;
+    }
+    return results;
+  }
+
+  private toBookingDto(spaceId: string, interval: BookingInterval): BookingDto {
+    return {
+      id: interval.id as Uuid,
+      spaceId: spaceId as Uuid,
+      userId: interval.userId as Uuid,
+      partnerId: (interval.partnerId as Uuid) || ('' as Uuid),
+      startDateTime: new Date(interval.start),
+      endDateTime: new Date(interval.end),
+      guests: interval.guestCount,
+      notes: interval.specialRequests,
+      totalAmount: interval.totalAmount,
+      status: interval.status,
+      createdAt: interval.createdAt,
+      updatedAt: interval.updatedAt,
+    };
+  }
+}
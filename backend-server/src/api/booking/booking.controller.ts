@@ -27,8 +27,10 @@ import {
 } from '@nestjs/swagger';
 import {
   AvailabilityResponseDto,
+  BatchAvailabilityResponseDto,
   BookingDto,
   BookingKycStatusDto,
+  CheckAvailabilityBatchDto,
   CheckAvailabilityDto,
   CreateBookingDto,
   CursorPaginatedBookingDto,
@@ -54,6 +56,19 @@ export class BookingController {
     return this.bookingService.checkAvailability(checkAvailabilityDto);
   }
 
+  @Post('check-availability/batch')
+  @ApiOperation({
+    summary: 'Check availability for many spaces or time slots at once',
+  })
+  @ApiResponse({ status: 200, type: BatchAvailabilityResponseDto })
+  async checkAvailabilityBatch(
+    @Body() checkAvailabilityBatchDto: CheckAvailabilityBatchDto,
+  ): Promise<BatchAvailabilityResponseDto> {
+    return this.bookingService.checkAvailabilityBatch(
+      checkAvailabilityBatchDto,
+    );
+  }
+
   @Post()
   @ApiOperation({ summary: 'Create a new booking' })
   @ApiResponse({ status: 201, type: BookingDto })
@@ -7,6 +7,8 @@ import { Uuid } from '@/common/types/common.type';
 import { ApiProperty, ApiPropertyOptional, PartialType } from '@nestjs/swagger';
 import { Transform, Type } from 'class-transformer';
 import {
+  ArrayMaxSize,
+  ArrayMinSize,
   IsArray,
   IsBoolean,
   IsDateString,
@@ -203,6 +205,41 @@ export class AvailabilityResponseDto {
   conflicts?: BookingDto[];
 }
 
+export class CheckAvailabilityBatchDto {
+  @ApiProperty({
+    description: 'Space and time slot pairs to check',
+    type: [CheckAvailabilityDto],
+  })
+  @IsArray()
+  @ArrayMinSize(1)
+  @ArrayMaxSize(500)
+  @ValidateNested({ each: true })
+  @Type(() => CheckAvailabilityDto)
+  slots: CheckAvailabilityDto[];
+}
+
+export class SlotAvailabilityDto {
+  @ApiProperty({ description: 'Space ID' })
+  spaceId: Uuid;
+
+  @ApiProperty({ description: 'Start date and time' })
+  startDateTime: Date;
+
+  @ApiProperty({ description: 'End date and time' })
+  endDateTime: Date;
+
+  @ApiProperty({ description: 'Whether the space is available' })
+  available: boolean;
+}
+
+export class BatchAvailabilityResponseDto {
+  @ApiProperty({
+    description: 'Availability per requested slot, in request order',
+    type: [SlotAvailabilityDto],
+  })
+  slots: SlotAvailabilityDto[];
+}
+
 export class BookingKycStatusDto {
   @ApiProperty({ description: 'Booking ID' })
   bookingId: string;
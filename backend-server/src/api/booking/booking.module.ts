@@ -7,11 +7,13 @@ import { JobsModule } from '../jobs/jobs.module';
 import { NotificationModule } from '../notification/notification.module';
 import { RefundPolicyModule } from '../refund-policy/refund-policy.module';
 import { WalletModule } from '../wallet/wallet.module';
+import { BookingAvailabilityService } from './booking-availability.service';
 import { BookingController } from './booking.controller';
 import { BookingService } from './booking.service';
 import { BookingEventHandler } from './events/booking-event.handler';
 
 import { UserEntity } from '@/auth/entities/user.entity';
+import { EventStoreModule } from '@/common/events/event-store/event-store.module';
 import { BookingEntity } from '@/database/entities/booking.entity';
 import { PartnerEntity } from '@/database/entities/partner.entity';
 import { PaymentEntity } from '@/database/entities/payment.entity';
@@ -29,6 +31,7 @@ import { WalletTransactionEntity } from '@/database/entities/wallet-transaction.
       WalletTransactionEntity,
     ]),
     EventEmitterModule,
+    EventStoreModule,
     CouponModule,
     JobsModule,
     NotificationModule,
@@ -37,7 +40,7 @@ import { WalletTransactionEntity } from '@/database/entities/wallet-transaction.
     WalletModule,
   ],
   controllers: [BookingController],
-  providers: [BookingService, BookingEventHandler],
-  exports: [BookingService],
+  providers: [BookingService, BookingAvailabilityService, BookingEventHandler],
+  exports: [BookingService, BookingAvailabilityService],
 })
 export class BookingModule {}
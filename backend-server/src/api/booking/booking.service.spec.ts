@@ -3,6 +3,7 @@ import { UserSession } from '@/auth/auth.type';
 import { UserEntity } from '@/auth/entities/user.entity';
 import { OffsetPaginationDto } from '@/common/dto/offset-pagination/offset-pagination.dto';
 import { BookingStatus } from '@/common/enums/booking.enum';
+import { EventBusService } from '@/common/events/event-bus.service';
 import { SpaceSubtype } from '@/common/enums/partner.enum';
 import { BookingModel, SpaceStatus } from '@/common/enums/space.enum';
 import { Uuid } from '@/common/types/common.type';
@@ -22,7 +23,7 @@ import {
 } from '@nestjs/common';
 import { Test, TestingModule } from '@nestjs/testing';
 import { getRepositoryToken } from '@nestjs/typeorm';
-import { Repository } from 'typeorm';
+import { DataSource, Repository } from 'typeorm';
 import { CouponService } from '../coupon/coupon.service';
 import { NotificationService } from '../notification/notification.service';
 import { PaymentService } from '../payment/payment.service';
@@ -32,6 +33,7 @@ import {
   QueryBookingsOffsetDto,
   UpdateBookingDto,
 } from './booking.dto';
+import { BookingAvailabilityService } from './booking-availability.service';
 import { BookingService } from './booking.service';
 
 describe('BookingService', () => {
@@ -228,6 +230,24 @@ describe('BookingService', () => {
     sendBookingConfirmation: jest.fn(),
   };
 
+  const mockBookingAvailabilityService = {
+    checkAvailability: jest.fn(),
+    checkAvailabilityBatch: jest.fn(),
+    invalidate: jest.fn(),
+  };
+
+  const mockEventBusService = {
+    publishAll: jest.fn(),
+  };
+
+  const mockManager = {
+    getRepository: jest.fn(() => mockBookingRepository),
+  };
+
+  const mockDataSource = {
+    transaction: jest.fn((work) => work(mockManager)),
+  };
+
   beforeEach(async () => {
     const module: TestingModule = await Test.createTestingModule({
       providers: [
@@ -260,6 +280,18 @@ describe('BookingService', () => {
           provide: NotificationService,
           useValue: mockNotificationService,
         },
+        {
+          provide: BookingAvailabilityService,
+          useValue: mockBookingAvailabilityService,
+        },
+        {
+          provide: EventBusService,
+          useValue: mockEventBusService,
+        },
+        {
+          provide: DataSource,
+          useValue: mockDataSource,
+        },
       ],
     }).compile();
 
@@ -286,50 +318,71 @@ describe('BookingService', () => {
   });
 
   describe('checkAvailability', () => {
-    it('should return available when no conflicts', async () => {
-      const checkAvailabilityDto: CheckAvailabilityDto = {
-        spaceId: mockSpace.id as Uuid,
-        startDateTime: '2024-01-15T10:00:00Z',
-        endDateTime: '2024-01-15T12:00:00Z',
-      };
+    const checkAvailabilityDto: CheckAvailabilityDto = {
+      spaceId: mockSpace.id as Uuid,
+      startDateTime: '2024-01-15T10:00:00Z',
+      endDateTime: '2024-01-15T12:00:00Z',
+    };
 
-      mockSpaceRepository.findOne.mockResolvedValue(mockSpace);
-      mockBookingRepository.find.mockResolvedValue([]);
+    it('should delegate to the availability service', async () => {
+      mockBookingAvailabilityService.checkAvailability.mockResolvedValue({
+        available: true,
+      });
 
       const result = await service.checkAvailability(checkAvailabilityDto);
 
       expect(result.available).toBe(true);
       expect(result.conflicts).toBeUndefined();
+      expect(
+        mockBookingAvailabilityService.checkAvailability,
+      ).toHaveBeenCalledWith(
+        checkAvailabilityDto.spaceId,
+        checkAvailabilityDto.startDateTime,
+        checkAvailabilityDto.endDateTime,
+      );
+      expect(mockBookingRepository.find).not.toHaveBeenCalled();
     });
 
-    it('should return conflicts when space is not available', async () => {
-      const checkAvailabilityDto: CheckAvailabilityDto = {
-        spaceId: mockSpace.id as Uuid,
-        startDateTime: '2024-01-15T10:00:00Z',
-        endDateTime: '2024-01-15T12:00:00Z',
-      };
-
-      mockSpaceRepository.findOne.mockResolvedValue(mockSpace);
-      mockBookingRepository.find.mockResolvedValue([mockBooking]);
-
-      const result = await service.checkAvailability(checkAvailabilityDto);
+    it('should propagate NotFoundException when space not found', async () => {
+      mockBookingAvailabilityService.checkAvailability.mockRejectedValue(
+        new NotFoundException(),
+      );
 
-      expect(result.available).toBe(false);
-      expect(result.conflicts).toHaveLength(1);
+      await expect(
+        service.checkAvailability(checkAvailabilityDto),
+      ).rejects.toThrow(NotFoundException);
     });
+  });
 
-    it('should throw NotFoundException when space not found', async () => {
-      const checkAvailabilityDto: CheckAvailabilityDto = {
-        spaceId: mockSpace.id as Uuid,
-        startDateTime: '2024-01-15T10:00:00Z',
-        endDateTime: '2024-01-15T12:00:00Z',
-      };
+  describe('checkAvailabilityBatch', () => {
+    it('should return one result per requested slot', async () => {
+      const slots = [
+        {
+          spaceId: 'space-1' as Uuid,
+          startDateTime: '2024-01-15T10:00:00Z',
+          endDateTime: '2024-01-15T12:00:00Z',
+        },
+        {
+          spaceId: 'space-2' as Uuid,
+          startDateTime: '2024-01-15T10:00:00Z',
+          endDateTime: '2024-01-15T12:00:00Z',
+        },
+      ];
+      mockBookingAvailabilityService.checkAvailabilityBatch.mockResolvedValue(
+        slots.map((slot, index) => ({
+          ...slot,
+          startDateTime: new Date(slot.startDateTime),
+          endDateTime: new Date(slot.endDateTime),
+          available: index === 0,
+        })),
+      );
 
-      mockSpaceRepository.findOne.mockResolvedValue(null);
+      const result = await service.checkAvailabilityBatch({ slots });
 
-      await expect(
-        service.checkAvailability(checkAvailabilityDto),
-      ).rejects.toThrow(NotFoundException);
+      expect(result.slots.map((slot) => slot.available)).toEqual([
+        true,
+        false,
+      ]);
     });
   });
 
@@ -424,7 +477,9 @@ describe('BookingService', () => {
 
       mockBookingRepository.findOne.mockResolvedValue(mockBooking);
       mockPartnerRepository.findOne.mockResolvedValue(null);
-      mockBookingRepository.find.mockResolvedValue([]);
+      mockBookingAvailabilityService.checkAvailability.mockResolvedValue({
+        available: true,
+      });
       mockSpaceRepository.findOne.mockResolvedValue(mockSpace);
       mockBookingRepository.save.mockResolvedValue({
         ...mockBooking,
@@ -437,8 +492,16 @@ describe('BookingService', () => {
         mockUserSession,
       );
 
-      expect(mockBookingRepository.find).toHaveBeenCalled();
+      expect(
+        mockBookingAvailabilityService.checkAvailability,
+      ).toHaveBeenCalledWith(
+        undefined,
+        timeUpdateDto.startDateTime,
+        timeUpdateDto.endDateTime,
+        { consistent: true, excludeBookingId: mockBooking.id },
+      );
       expect(mockBookingRepository.save).toHaveBeenCalled();
+      expect(mockBookingAvailabilityService.invalidate).toHaveBeenCalled();
     });
   });
 
@@ -586,6 +649,18 @@ describe('BookingService', () => {
 
       expect(result.status).toBe(BookingStatus.COMPLETED);
       expect(mockBookingRepository.save).toHaveBeenCalled();
+      // Stored with the booking; the outbox delivers it after commit
+      expect(mockEventBusService.publishAll).toHaveBeenCalledWith(
+        [
+          expect.objectContaining({
+            eventType: 'booking.completed',
+            bookingId: confirmedBooking.id,
+          }),
+        ],
+        {},
+        mockManager,
+      );
+      expect(mockBookingAvailabilityService.invalidate).toHaveBeenCalled();
     });
 
     it('should complete booking successfully as partner', async () => {
@@ -5,9 +5,8 @@ import {
 import { CouponEntity } from '@/database/entities/coupon.entity';
 import { DynamicPricingService } from '@/services/dynamic-pricing.service';
 import { Injectable } from '@nestjs/common';
-import { EventEmitter2 } from '@nestjs/event-emitter';
 import { InjectRepository } from '@nestjs/typeorm';
-import { Between, In, LessThan, MoreThan, Not, Repository } from 'typeorm';
+import { DataSource, Repository } from 'typeorm';
 import { CouponService } from '../coupon/coupon.service';
 import { NotificationService } from '../notification/notification.service';
 
@@ -18,16 +17,21 @@ import { CursorPaginatedDto } from '@/common/dto/cursor-pagination/paginated.dto
 import { OffsetPaginationDto } from '@/common/dto/offset-pagination/offset-pagination.dto';
 import { OffsetPaginatedDto } from '@/common/dto/offset-pagination/paginated.dto';
 import { BookingStatus } from '@/common/enums/booking.enum';
+import { DomainEvent } from '@/common/events/domain-event.interface';
+import { EventBusService } from '@/common/events/event-bus.service';
 import { Uuid } from '@/common/types/common.type';
 import { BookingEntity } from '@/database/entities/booking.entity';
 import { PartnerEntity } from '@/database/entities/partner.entity';
 import { SpaceEntity } from '@/database/entities/space.entity';
 import { buildPaginator } from '@/utils/pagination/cursor-pagination';
 import { paginate } from '@/utils/pagination/offset-pagination';
+import { BookingAvailabilityService } from './booking-availability.service';
 import {
   AvailabilityResponseDto,
+  BatchAvailabilityResponseDto,
   BookingKycStatus,
   BookingKycStatusDto,
+  CheckAvailabilityBatchDto,
   CheckAvailabilityDto,
   CreateBookingDto,
   QueryBookingsCursorDto,
@@ -56,7 +60,9 @@ export class BookingService {
     private readonly couponService: CouponService,
     private readonly notificationService: NotificationService,
     private readonly dynamicPricingService: DynamicPricingService,
-    private readonly eventEmitter: EventEmitter2,
+    private readonly eventBusService: EventBusService,
+    private readonly bookingAvailabilityService: BookingAvailabilityService,
+    private readonly dataSource: DataSource,
   ) {}
 
   async checkAvailability(
@@ -64,52 +70,21 @@ export class BookingService {
   ): Promise<AvailabilityResponseDto> {
     const { spaceId, startDateTime, endDateTime } = checkAvailabilityDto;
 
-    // Validate space exists
-    const space = await this.spaceRepository.findOne({
-      where: { id: spaceId },
-    });
-    if (!space) {
-      throw ErrorResponseUtil.notFound('Space', spaceId);
-    }
+    return this.bookingAvailabilityService.checkAvailability(
+      spaceId,
+      startDateTime,
+      endDateTime,
+    );
+  }
 
-    const conflictingBookings = await this.bookingRepository.find({
-      where: {
-        spaceOption: {
-          spaceId: checkAvailabilityDto.spaceId,
-        },
-        status: Not(In([BookingStatus.CANCELLED])),
-        startDateTime: LessThan(new Date(endDateTime)),
-        endDateTime: MoreThan(new Date(startDateTime)),
-      },
-      relations: [
-        'spaceOption',
-        'spaceOption.space',
-        'spaceOption.space.listing',
-      ],
-    });
+  async checkAvailabilityBatch(
+    checkAvailabilityBatchDto: CheckAvailabilityBatchDto,
+  ): Promise<BatchAvailabilityResponseDto> {
+    const slots = await this.bookingAvailabilityService.checkAvailabilityBatch(
+      checkAvailabilityBatchDto.slots,
+    );
 
-    return {
-      available: conflictingBookings.length === 0,
-      conflicts:
-        conflictingBookings.length > 0
-          ? conflictingBookings.map((booking) => ({
-              id: booking.id as Uuid,
-              spaceId: booking.spaceOption?.spaceId as Uuid,
-              userId: booking.userId as Uuid,
-              partnerId:
-                (booking.spaceOption?.space?.listing?.partner_id as Uuid) ||
-                ('' as Uuid),
-              startDateTime: booking.startDateTime,
-              endDateTime: booking.endDateTime,
-              guests: booking.guestCount,
-              notes: booking.specialRequests,
-              totalAmount: Number(booking.totalAmount),
-              status: booking.status,
-              createdAt: booking.createdAt,
-              updatedAt: booking.updatedAt,
-            }))
-          : undefined,
-    };
+    return { slots };
   }
 
   async createBooking(
@@ -142,12 +117,14 @@ export class BookingService {
       );
     }
 
-    // Check availability
-    const availability = await this.checkAvailability({
-      spaceId,
-      startDateTime,
-      endDateTime,
-    });
+    // Check availability against the database, not the interval cache
+    const availability =
+      await this.bookingAvailabilityService.checkAvailability(
+        spaceId,
+        startDateTime,
+        endDateTime,
+        { consistent: true },
+      );
 
     if (!availability.available) {
       throw ErrorResponseUtil.conflict(
@@ -230,21 +207,21 @@ export class BookingService {
       booking.kycStatus = BookingKycStatus.NOT_REQUIRED;
     }
 
-    const savedBooking = await this.bookingRepository.save(booking);
-
-    // Emit booking created event
-    const bookingCreatedEvent = new BookingCreatedEvent(
-      savedBooking.id as Uuid,
-      savedBooking.userId as Uuid,
-      spaceId,
-      space.listing?.partner?.id || ('' as Uuid),
-      savedBooking.totalAmount,
-      savedBooking.startDateTime,
-      savedBooking.endDateTime,
-      savedBooking.guestCount,
-      kycRequired,
+    const savedBooking = await this.saveWithEvent(
+      booking,
+      (saved) =>
+        new BookingCreatedEvent(
+          saved.id as Uuid,
+          saved.userId as Uuid,
+          spaceId,
+          space.listing?.partner?.id || ('' as Uuid),
+          saved.totalAmount,
+          saved.startDateTime,
+          saved.endDateTime,
+          saved.guestCount,
+          kycRequired,
+        ),
     );
-    this.eventEmitter.emit('booking.created', bookingCreatedEvent);
 
     // Note: Coupon usage is already incremented atomically in applyCouponAtomic method
 
@@ -527,19 +504,14 @@ export class BookingService {
       const endTime =
         updateBookingDto.endDateTime || booking.endDateTime.toISOString();
 
-      const availability = await this.checkAvailability({
-        spaceId: booking.spaceOption?.spaceId as Uuid,
-        startDateTime: startTime,
-        endDateTime: endTime,
-      });
-
-      // Filter out current booking from conflicts
-      if (availability.conflicts) {
-        availability.conflicts = availability.conflicts.filter(
-          (conflict) => conflict.id !== booking.id,
+      // The booking itself is not a conflict for its own new time slot
+      const availability =
+        await this.bookingAvailabilityService.checkAvailability(
+          booking.spaceOption?.spaceId as Uuid,
+          startTime,
+          endTime,
+          { consistent: true, excludeBookingId: booking.id },
         );
-        availability.available = availability.conflicts.length === 0;
-      }
 
       if (!availability.available) {
         throw ErrorResponseUtil.conflict(
@@ -564,7 +536,13 @@ export class BookingService {
     }
 
     Object.assign(booking, updateBookingDto);
-    return this.bookingRepository.save(booking);
+    const savedBooking = await this.bookingRepository.save(booking);
+
+    if (updateBookingDto.startDateTime || updateBookingDto.endDateTime) {
+      this.bookingAvailabilityService.invalidate(booking.spaceOption?.spaceId);
+    }
+
+    return savedBooking;
   }
 
   async cancelBooking(id: Uuid, user: UserSession): Promise<BookingEntity> {
@@ -600,22 +578,20 @@ export class BookingService {
 
     booking.status = BookingStatus.CANCELLED;
     const cancelledAt = new Date();
-    const savedBooking = await this.bookingRepository.save(booking);
-
-    // Emit booking cancelled event
-    const bookingCancelledEvent = new BookingCancelledEvent(
-      savedBooking.id as Uuid,
-      savedBooking.userId as Uuid,
-      (savedBooking.spaceOption?.spaceId as Uuid) || ('' as Uuid),
-      (savedBooking.spaceOption?.space?.listing?.partner_id as Uuid) ||
-        ('' as Uuid),
-      savedBooking.totalAmount,
-      cancelledAt,
-      'User cancelled', // Default reason
+    return this.saveWithEvent(
+      booking,
+      (saved) =>
+        new BookingCancelledEvent(
+          saved.id as Uuid,
+          saved.userId as Uuid,
+          (saved.spaceOption?.spaceId as Uuid) || ('' as Uuid),
+          (saved.spaceOption?.space?.listing?.partner_id as Uuid) ||
+            ('' as Uuid),
+          saved.totalAmount,
+          cancelledAt,
+          'User cancelled', // Default reason
+        ),
     );
-    this.eventEmitter.emit('booking.cancelled', bookingCancelledEvent);
-
-    return savedBooking;
   }
 
   async confirmBooking(id: Uuid, user: UserSession): Promise<BookingEntity> {
@@ -644,22 +620,20 @@ export class BookingService {
     }
 
     booking.status = BookingStatus.CONFIRMED;
-    const savedBooking = await this.bookingRepository.save(booking);
-
-    // Emit booking confirmed event
-    const bookingConfirmedEvent = new BookingConfirmedEvent(
-      savedBooking.id as Uuid,
-      savedBooking.userId as Uuid,
-      (savedBooking.spaceOption?.spaceId as Uuid) || ('' as Uuid),
-      (savedBooking.spaceOption?.space?.listing?.partner_id as Uuid) ||
-        ('' as Uuid),
-      savedBooking.totalAmount,
-      savedBooking.startDateTime,
-      savedBooking.endDateTime,
+    return this.saveWithEvent(
+      booking,
+      (saved) =>
+        new BookingConfirmedEvent(
+          saved.id as Uuid,
+          saved.userId as Uuid,
+          (saved.spaceOption?.spaceId as Uuid) || ('' as Uuid),
+          (saved.spaceOption?.space?.listing?.partner_id as Uuid) ||
+            ('' as Uuid),
+          saved.totalAmount,
+          saved.startDateTime,
+          saved.endDateTime,
+        ),
     );
-    this.eventEmitter.emit('booking.confirmed', bookingConfirmedEvent);
-
-    return savedBooking;
   }
 
   async completeBooking(id: Uuid, userId: string): Promise<BookingEntity> {
@@ -684,23 +658,21 @@ export class BookingService {
 
     booking.status = BookingStatus.COMPLETED;
     const completedAt = new Date();
-    const savedBooking = await this.bookingRepository.save(booking);
-
-    // Emit booking completed event
-    const bookingCompletedEvent = new BookingCompletedEvent(
-      savedBooking.id as Uuid,
-      savedBooking.userId as Uuid,
-      (savedBooking.spaceOption?.spaceId as Uuid) || ('' as Uuid),
-      (savedBooking.spaceOption?.space?.listing?.partner_id as Uuid) ||
-        ('' as Uuid),
-      savedBooking.totalAmount,
-      savedBooking.startDateTime,
-      savedBooking.endDateTime,
-      completedAt,
+    return this.saveWithEvent(
+      booking,
+      (saved) =>
+        new BookingCompletedEvent(
+          saved.id as Uuid,
+          saved.userId as Uuid,
+          (saved.spaceOption?.spaceId as Uuid) || ('' as Uuid),
+          (saved.spaceOption?.space?.listing?.partner_id as Uuid) ||
+            ('' as Uuid),
+          saved.totalAmount,
+          saved.startDateTime,
+          saved.endDateTime,
+          completedAt,
+        ),
     );
-    this.eventEmitter.emit('booking.completed', bookingCompletedEvent);
-
-    return savedBooking;
   }
 
   async canCancelBooking(id: Uuid, userId: string): Promise<boolean> {
@@ -807,6 +779,29 @@ export class BookingService {
     return this.bookingRepository.save(booking);
   }
 
+  /**
+   * Save the booking and store its lifecycle event in the same transaction;
+   * the outbox poller delivers the event once committed, so nothing can fail
+   * the request after the booking is saved. This instance's availability
+   * cache is dropped right away rather than on delivery.
+   */
+  private async saveWithEvent(
+    booking: BookingEntity,
+    buildEvent: (saved: BookingEntity) => DomainEvent & { spaceId: string },
+  ): Promise<BookingEntity> {
+    const { saved, event } = await this.dataSource.transaction(
+      async (manager) => {
+        const saved = await manager.getRepository(BookingEntity).save(booking);
+        const event = buildEvent(saved);
+        await this.eventBusService.publishAll([event], {}, manager);
+        return { saved, event };
+      },
+    );
+
+    this.bookingAvailabilityService.invalidate(event.spaceId || undefined);
+    return saved;
+  }
+
   private isKycRequired(booking: BookingEntity): boolean {
     // Define KYC requirements based on business rules
     // For example: bookings over a certain amount, specific space types, etc.
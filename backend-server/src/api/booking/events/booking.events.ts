@@ -1,7 +1,14 @@
 import { BookingStatus } from '@/common/enums/booking.enum';
+import { BaseDomainEvent } from '@/common/events/domain-event.interface';
 import { Uuid } from '@/common/types/common.type';
 
-export class BookingCreatedEvent {
+/**
+ * Booking lifecycle events. Each event type is the topic its listeners
+ * subscribe to, so the event bus dispatches them under the same name.
+ */
+export class BookingCreatedEvent extends BaseDomainEvent {
+  public readonly eventType = 'booking.created';
+
   constructor(
     public readonly bookingId: Uuid,
     public readonly userId: Uuid,
@@ -12,10 +19,14 @@ export class BookingCreatedEvent {
     public readonly endDateTime: Date,
     public readonly guestCount: number,
     public readonly kycRequired: boolean,
-  ) {}
+  ) {
+    super(bookingId, 'Booking', userId);
+  }
 }
 
-export class BookingConfirmedEvent {
+export class BookingConfirmedEvent extends BaseDomainEvent {
+  public readonly eventType = 'booking.confirmed';
+
   constructor(
     public readonly bookingId: Uuid,
     public readonly userId: Uuid,
@@ -24,10 +35,14 @@ export class BookingConfirmedEvent {
     public readonly totalAmount: number,
     public readonly startDateTime: Date,
     public readonly endDateTime: Date,
-  ) {}
+  ) {
+    super(bookingId, 'Booking', userId);
+  }
 }
 
-export class BookingCompletedEvent {
+export class BookingCompletedEvent extends BaseDomainEvent {
+  public readonly eventType = 'booking.completed';
+
   constructor(
     public readonly bookingId: Uuid,
     public readonly userId: Uuid,
@@ -37,10 +52,14 @@ export class BookingCompletedEvent {
     public readonly startDateTime: Date,
     public readonly endDateTime: Date,
     public readonly completedAt: Date,
-  ) {}
+  ) {
+    super(bookingId, 'Booking', userId);
+  }
 }
 
-export class BookingCancelledEvent {
+export class BookingCancelledEvent extends BaseDomainEvent {
+  public readonly eventType = 'booking.cancelled';
+
   constructor(
     public readonly bookingId: Uuid,
     public readonly userId: Uuid,
@@ -49,10 +68,14 @@ export class BookingCancelledEvent {
     public readonly totalAmount: number,
     public readonly cancelledAt: Date,
     public readonly reason?: string,
-  ) {}
+  ) {
+    super(bookingId, 'Booking', userId);
+  }
 }
 
-export class BookingModifiedEvent {
+export class BookingModifiedEvent extends BaseDomainEvent {
+  public readonly eventType = 'booking.modified';
+
   constructor(
     public readonly bookingId: Uuid,
     public readonly userId: Uuid,
@@ -62,5 +85,7 @@ export class BookingModifiedEvent {
     public readonly newStatus: BookingStatus,
     public readonly modifiedAt: Date,
     public readonly changes: Record<string, any>,
-  ) {}
+  ) {
+    super(bookingId, 'Booking', userId);
+  }
 }
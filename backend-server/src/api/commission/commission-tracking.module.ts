@@ -1,8 +1,9 @@
+import { AuditModule } from '@/api/audit/audit.module';
 import { JobsModule } from '@/api/jobs/jobs.module';
 import { NotificationModule } from '@/api/notification/notification.module';
 import { WalletModule } from '@/api/wallet/wallet.module';
 import { UserEntity } from '@/auth/entities/user.entity';
-import { EventRetryService } from '@/common/events/retry/event-retry.service';
+import { EventStoreModule } from '@/common/events/event-store/event-store.module';
 import { BookingEntity } from '@/database/entities/booking.entity';
 import { Module } from '@nestjs/common';
 import { EventEmitterModule } from '@nestjs/event-emitter';
@@ -40,19 +41,19 @@ import { CommissionEventHandler } from './events/commission-event.handler';
     WalletModule,
     NotificationModule,
     JobsModule,
+    AuditModule,
+    EventStoreModule,
   ],
   controllers: [CommissionTrackingController],
   providers: [
     CommissionTrackingService,
     CommissionService,
     CommissionEventHandler,
-    EventRetryService,
   ],
   exports: [
     CommissionTrackingService,
     CommissionService,
     CommissionEventHandler,
-    EventRetryService,
   ],
 })
 export class CommissionTrackingModule {}
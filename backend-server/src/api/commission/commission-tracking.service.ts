@@ -1,3 +1,4 @@
+import { AuditLogWriterService } from '@/api/audit/services/audit-log-writer.service';
 import { UserEntity } from '@/auth/entities/user.entity';
 import { PartnerEntity } from '@/database/entities/partner.entity';
 import {
@@ -87,6 +88,7 @@ export class CommissionTrackingService {
     private partnerRepository: Repository<PartnerEntity>,
     private readonly configIntegrationService: FinancialConfigIntegrationService,
     private readonly enhancedCommissionService: EnhancedCommissionService,
+    private readonly auditLogWriter: AuditLogWriterService,
   ) {}
 
   // Commission Rules Management
@@ -1726,7 +1728,7 @@ export class CommissionTrackingService {
       null, // metadata parameter
     );
 
-    await this.commissionAuditTrailRepository.save(audit);
+    await this.auditLogWriter.enqueue(CommissionAuditTrailEntity, audit);
   }
 
   // Mapping Methods
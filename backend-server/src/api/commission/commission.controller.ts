@@ -5,10 +5,12 @@ import {
   Get,
   HttpStatus,
   Param,
+  ParseUUIDPipe,
   Post,
   Put,
   Query,
   Request,
+  StreamableFile,
   UseGuards,
   UsePipes,
   ValidationPipe,
@@ -365,6 +367,53 @@ export class CommissionController {
     return this.commissionService.exportCommissionData(exportDto, req.user.id);
   }
 
+  @Get('export/:exportId')
+  @Roles('admin', 'super_admin')
+  @ApiOperation({ summary: 'Get commission export status' })
+  @ApiParam({ name: 'exportId', description: 'Commission export ID' })
+  @ApiResponse({
+    status: HttpStatus.OK,
+    description: 'Commission export status retrieved successfully',
+  })
+  async getExportStatus(
+    @Param('exportId', ParseUUIDPipe) exportId: string,
+  ): Promise<any> {
+    return this.commissionService.getExportStatus(exportId);
+  }
+
+  @Get('export/:exportId/download')
+  @Roles('admin', 'super_admin')
+  @ApiOperation({ summary: 'Download a completed commission export' })
+  @ApiParam({ name: 'exportId', description: 'Commission export ID' })
+  @ApiResponse({
+    status: HttpStatus.OK,
+    description: 'Commission export file streamed successfully',
+  })
+  async downloadExport(
+    @Param('exportId', ParseUUIDPipe) exportId: string,
+  ): Promise<StreamableFile> {
+    const download = await this.commissionService.openExportDownload(exportId);
+    return new StreamableFile(download.stream, {
+      type: download.contentType,
+      disposition: `attachment; filename="${download.fileName}"`,
+      length: download.fileSize,
+    });
+  }
+
+  @Delete('export/:exportId')
+  @Roles('admin', 'super_admin')
+  @ApiOperation({ summary: 'Cancel a pending or running commission export' })
+  @ApiParam({ name: 'exportId', description: 'Commission export ID' })
+  @ApiResponse({
+    status: HttpStatus.OK,
+    description: 'Commission export cancelled successfully',
+  })
+  async cancelExport(
+    @Param('exportId', ParseUUIDPipe) exportId: string,
+  ): Promise<any> {
+    return this.commissionService.cancelExport(exportId);
+  }
+
   @Get('reports/:reportId')
   @Roles('admin', 'super_admin')
   @ApiOperation({ summary: 'Get commission report' })
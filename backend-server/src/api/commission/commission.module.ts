@@ -1,6 +1,7 @@
 import { UserEntity } from '@/auth/entities/user.entity';
 import { BookingEntity } from '@/database/entities/booking.entity';
 import { IdGeneratorService } from '@/utils/id-generator.service';
+import { ExportJobModule } from '@/worker/queues/export/export-job.module';
 import { Module } from '@nestjs/common';
 import { TypeOrmModule } from '@nestjs/typeorm';
 import { CommissionController } from './commission.controller';
@@ -41,6 +42,7 @@ import {
       UserEntity,
       BookingEntity,
     ]),
+    ExportJobModule,
   ],
   controllers: [CommissionController],
   providers: [CommissionService, IdGeneratorService],
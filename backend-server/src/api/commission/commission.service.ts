@@ -1,5 +1,11 @@
 import { UserEntity } from '@/auth/entities/user.entity';
+import { Job } from '@/constants/job.constant';
 import { BookingEntity } from '@/database/entities/booking.entity';
+import {
+  COMMISSION_EXPORT_TYPES,
+  ExportDownload,
+  ExportJobService,
+} from '@/worker/queues/export/export-job.service';
 import {
   BadRequestException,
   ConflictException,
@@ -44,6 +50,8 @@ import {
   CommissionSettingsEntity,
 } from './entities/commission.entity';
 
+const ExportJob = Job.Export;
+
 @Injectable()
 export class CommissionService {
   constructor(
@@ -65,6 +73,7 @@ export class CommissionService {
     private readonly userRepository: Repository<UserEntity>,
     @InjectRepository(BookingEntity)
     private readonly bookingRepository: Repository<BookingEntity>,
+    private readonly exportJobService: ExportJobService,
     // private readonly configIntegrationService: FinancialConfigIntegrationService,
     // private readonly enhancedCommissionService: EnhancedCommissionService,
   ) {}
@@ -871,6 +880,17 @@ export class CommissionService {
     exportDto: CommissionExportDto,
     userId: string,
   ): Promise<{ exportId: string; downloadUrl: string }> {
+    if (exportDto.format === ExportFormat.PDF) {
+      throw new BadRequestException(
+        'Only CSV and Excel commission exports are supported',
+      );
+    }
+    if (!COMMISSION_EXPORT_TYPES.includes(exportDto.exportType)) {
+      throw new BadRequestException(
+        `Export type must be one of: ${COMMISSION_EXPORT_TYPES.join(', ')}`,
+      );
+    }
+
     const exportEntity = this.exportRepository.create({
       exportType: exportDto.exportType,
       format: exportDto.format,
@@ -886,22 +906,28 @@ export class CommissionService {
 
     const savedExport = await this.exportRepository.save(exportEntity);
 
-    // TODO: Implement actual export processing in background
-    // For now, just mark as completed
-    setTimeout(async () => {
-      savedExport.markAsCompleted(
-        `/exports/${savedExport.id}.${exportDto.format.toLowerCase()}`,
-        100,
-      );
-      await this.exportRepository.save(savedExport);
-    }, 1000);
-
-    // Generate download URL for the export
-    const downloadUrl = `/api/commission/export/${savedExport.id}/download`;
+    await this.exportJobService.enqueue(ExportJob.Commission, {
+      exportId: savedExport.id,
+      format: exportDto.format === ExportFormat.EXCEL ? 'xlsx' : 'csv',
+      requestedBy: userId,
+      exportType: exportDto.exportType,
+      partnerIds: exportDto.partnerIds,
+      dateFrom: exportDto.dateFrom
+        ? new Date(exportDto.dateFrom).toISOString()
+        : undefined,
+      dateTo: exportDto.dateTo
+        ? new Date(exportDto.dateTo).toISOString()
+        : undefined,
+      filters: exportDto.filters && {
+        status: exportDto.filters.status,
+        minAmount: exportDto.filters.minAmount,
+        maxAmount: exportDto.filters.maxAmount,
+      },
+    });
 
     return {
       exportId: savedExport.id,
-      downloadUrl,
+      downloadUrl: `/api/v1/commission/export/${savedExport.id}/download`,
     };
   }
 
@@ -924,6 +950,45 @@ export class CommissionService {
     };
   }
 
+  async openExportDownload(exportId: string): Promise<ExportDownload> {
+    const exportEntity = await this.exportRepository.findOne({
+      where: { id: exportId },
+    });
+    if (!exportEntity) {
+      throw new NotFoundException('Export not found');
+    }
+
+    const download =
+      exportEntity.status === 'completed' && !exportEntity.isExpired()
+        ? await this.exportJobService.openDownload(exportId)
+        : null;
+    if (!download) {
+      throw new BadRequestException('Export is not available for download');
+    }
+
+    return download;
+  }
+
+  async cancelExport(exportId: string): Promise<any> {
+    const exportEntity = await this.exportRepository.findOne({
+      where: { id: exportId },
+    });
+    if (!exportEntity) {
+      throw new NotFoundException('Export not found');
+    }
+    if (!['pending', 'processing'].includes(exportEntity.status)) {
+      throw new BadRequestException('Export is no longer running');
+    }
+
+    await this.exportJobService.cancel(exportId);
+    // A running job records the cancellation itself once it stops
+    if (exportEntity.status === 'pending') {
+      await this.exportRepository.update(exportId, { status: 'cancelled' });
+    }
+
+    return this.getExportStatus(exportId);
+  }
+
   // Report Generation
   async generateReport(
     reportDto: CommissionReportDto,
@@ -0,0 +1,29 @@
+import {
+  ArrayMaxSize,
+  ArrayMinSize,
+  IsArray,
+  IsBoolean,
+  IsObject,
+  IsOptional,
+} from 'class-validator';
+import { PaymentAnalysis } from '../services/fraud-detection.service';
+
+export class BatchPaymentAnalysisDto {
+  // @ApiProperty({
+  //   description: 'Payments to re-score, in the PaymentAnalysis shape',
+  //   maxItems: 5000,
+  // })
+  @IsArray()
+  @ArrayMinSize(1)
+  @ArrayMaxSize(5000)
+  @IsObject({ each: true })
+  payments: PaymentAnalysis[];
+
+  // @ApiPropertyOptional({
+  //   description: 'Create fraud alerts for payments that cross the threshold',
+  //   default: false,
+  // })
+  @IsOptional()
+  @IsBoolean()
+  createAlerts?: boolean;
+}
@@ -37,6 +37,7 @@ import {
   RecalculateScoreDto,
   UpdateFraudScoreDto,
 } from './dto/fraud-score.dto';
+import { BatchPaymentAnalysisDto } from './dto/payment-analysis.dto';
 import {
   FraudDetectionService,
   PaymentAnalysis,
@@ -74,6 +75,34 @@ export class FraudController {
     }
   }
 
+  @Post('analyze/payments/batch')
+  @Roles('admin', 'super_admin')
+  @ApiOperation({ summary: 'Re-score a batch of payments for fraud' })
+  @ApiResponse({ status: 200, description: 'Payment batch scored' })
+  @ApiResponse({ status: 400, description: 'Invalid payment data' })
+  async analyzePaymentBatch(@Body() batchDto: BatchPaymentAnalysisDto) {
+    try {
+      const results = await this.fraudDetectionService.analyzePaymentBatch(
+        batchDto.payments,
+        { createAlerts: batchDto.createAlerts },
+      );
+      return {
+        success: true,
+        data: {
+          processed: results.length,
+          flagged: results.filter((r) => r.shouldAlert).length,
+          results,
+        },
+      };
+    } catch (error) {
+      this.logger.error('Error analyzing payment batch:', error);
+      throw new HttpException(
+        'Failed to analyze payment batch',
+        HttpStatus.INTERNAL_SERVER_ERROR,
+      );
+    }
+  }
+
   @Post('analyze/behavior')
   @Roles('admin', 'super_admin')
   @ApiOperation({ summary: 'Analyze user behavior for fraud detection' })
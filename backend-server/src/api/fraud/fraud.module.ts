@@ -1,16 +1,21 @@
 import { UserEntity } from '@/auth/entities/user.entity';
 import { RolesGuard } from '@/guards/roles.guard';
+import { RedisModule } from '@/shared/redis/redis.module';
 import { Module } from '@nestjs/common';
 import { TypeOrmModule } from '@nestjs/typeorm';
 import { FraudAlert } from './entities/fraud-alert.entity';
 import { FraudScore } from './entities/fraud-score.entity';
 import { FraudController } from './fraud.controller';
 import { FraudDetectionService } from './services/fraud-detection.service';
+import { FraudFeatureStoreService } from './services/fraud-feature-store.service';
 
 @Module({
-  imports: [TypeOrmModule.forFeature([FraudAlert, FraudScore, UserEntity])],
+  imports: [
+    TypeOrmModule.forFeature([FraudAlert, FraudScore, UserEntity]),
+    RedisModule,
+  ],
   controllers: [FraudController],
-  providers: [FraudDetectionService, RolesGuard],
+  providers: [FraudDetectionService, FraudFeatureStoreService, RolesGuard],
   exports: [FraudDetectionService],
 })
 export class FraudModule {}
@@ -1,6 +1,6 @@
 import { Injectable, Logger } from '@nestjs/common';
 import { InjectRepository } from '@nestjs/typeorm';
-import { Repository } from 'typeorm';
+import { In, Repository } from 'typeorm';
 import {
   CreateFraudAlertDto,
   FraudAlertQueryDto,
@@ -22,6 +22,11 @@ import {
   RiskLevel,
   ScoreFactors,
 } from '../entities/fraud-score.entity';
+import {
+  FraudFeatureStoreService,
+  VelocitySnapshot,
+  VelocitySubjects,
+} from './fraud-feature-store.service';
 
 export interface PaymentAnalysis {
   amount: number;
@@ -29,9 +34,13 @@ export interface PaymentAnalysis {
   paymentMethod: string;
   userId: string;
   bookingId?: string;
+  paymentId?: string;
   metadata?: Record<string, any>;
   ipAddress?: string;
   userAgent?: string;
+  deviceId?: string;
+  /** When the payment was made; defaults to now */
+  timestamp?: Date | string;
   location?: {
     country?: string;
     city?: string;
@@ -58,6 +67,11 @@ export interface FraudAnalysisResult {
   confidence: number;
 }
 
+interface PaymentVelocity {
+  payments: VelocitySnapshot;
+  alerts: VelocitySnapshot;
+}
+
 @Injectable()
 export class FraudDetectionService {
   private readonly logger = new Logger(FraudDetectionService.name);
@@ -67,6 +81,7 @@ export class FraudDetectionService {
     private fraudAlertRepository: Repository<FraudAlert>,
     @InjectRepository(FraudScore)
     private fraudScoreRepository: Repository<FraudScore>,
+    private readonly fraudFeatureStore: FraudFeatureStoreService,
   ) {}
 
   // Payment Fraud Detection
@@ -74,94 +89,102 @@ export class FraudDetectionService {
     analysis: PaymentAnalysis,
   ): Promise<FraudAnalysisResult> {
     try {
-      const userId = analysis.userId;
-      const userScore = await this.getUserFraudScore(userId);
-
-      let riskScore = userScore?.overallScore || 0;
-      const flags: string[] = [];
-      const recommendations: string[] = [];
-
-      // Amount-based analysis
-      const amountRisk = await this.analyzePaymentAmount(analysis);
-      riskScore += amountRisk.score;
-      flags.push(...amountRisk.flags);
-
-      // Frequency analysis
-      const frequencyRisk = await this.analyzePaymentFrequency(analysis);
-      riskScore += frequencyRisk.score;
-      flags.push(...frequencyRisk.flags);
-
-      // Payment method analysis
-      const methodRisk = await this.analyzePaymentMethod(analysis);
-      riskScore += methodRisk.score;
-      flags.push(...methodRisk.flags);
-
-      // Location analysis
-      const locationRisk = await this.analyzeLocation(analysis);
-      riskScore += locationRisk.score;
-      flags.push(...locationRisk.flags);
+      const at = this.paymentTime(analysis);
+      const subjects = this.velocitySubjects(analysis);
+      const [userScore, payments, alerts] = await Promise.all([
+        this.getUserFraudScore(analysis.userId),
+        this.fraudFeatureStore.record('payment', subjects, at),
+        this.fraudFeatureStore.count(
+          'payment_alert',
+          { user: analysis.userId },
+          at,
+        ),
+      ]);
+
+      const result = await this.scorePayment(analysis, userScore, {
+        payments,
+        alerts,
+      });
 
-      // Device analysis
-      const deviceRisk = await this.analyzeDevice(analysis);
-      riskScore += deviceRisk.score;
-      flags.push(...deviceRisk.flags);
+      // Create fraud alert if necessary
+      if (result.shouldAlert) {
+        await this.createFraudAlert(this.buildPaymentAlert(analysis, result));
+      }
 
-      // Normalize score to 0-100
-      riskScore = Math.min(100, Math.max(0, riskScore));
+      return result;
+    } catch (error) {
+      this.logger.error('Error analyzing payment:', error);
+      throw error;
+    }
+  }
 
-      const riskLevel = this.calculateRiskLevel(riskScore);
-      const shouldBlock = riskScore >= 80;
-      const shouldAlert = riskScore >= 60;
-      const confidence = this.calculateConfidence(flags.length, riskScore);
+  /**
+   * Re-score a backlog of payments. Fraud scores are loaded with one query
+   * and velocity counts with one round trip per event type; the payments
+   * are not recorded again. Alerts are only created when asked for.
+   */
+  async analyzePaymentBatch(
+    analyses: PaymentAnalysis[],
+    options: { createAlerts?: boolean } = {},
+  ): Promise<FraudAnalysisResult[]> {
+    try {
+      const userIds = [...new Set(analyses.map((a) => a.userId))];
+      const [scores, payments, alerts] = await Promise.all([
+        userIds.length
+          ? this.fraudScoreRepository.find({ where: { userId: In(userIds) } })
+          : [],
+        this.fraudFeatureStore.countMany(
+          'payment',
+          analyses.map((analysis) => ({
+            subjects: this.velocitySubjects(analysis),
+            at: this.paymentTime(analysis),
+          })),
+        ),
+        this.fraudFeatureStore.countMany(
+          'payment_alert',
+          analyses.map((analysis) => ({
+            subjects: { user: analysis.userId },
+            at: this.paymentTime(analysis),
+          })),
+        ),
+      ]);
+      const scoresByUser = new Map(
+        scores.map((score) => [score.userId, score]),
+      );
 
-      // Generate recommendations
-      if (riskScore >= 80) {
-        recommendations.push('Block transaction immediately');
-        recommendations.push('Require manual review');
-      } else if (riskScore >= 60) {
-        recommendations.push('Require additional verification');
-        recommendations.push('Monitor closely');
-      } else if (riskScore >= 40) {
-        recommendations.push('Apply enhanced monitoring');
-      }
+      const results = await Promise.all(
+        analyses.map((analysis, i) =>
+          this.scorePayment(analysis, scoresByUser.get(analysis.userId), {
+            payments: payments[i],
+            alerts: alerts[i],
+          }),
+        ),
+      );
 
-      // Create fraud alert if necessary
-      if (shouldAlert) {
-        await this.createFraudAlert({
-          userId: analysis.userId,
-          bookingId: analysis.bookingId,
-          type: FraudAlertType.PAYMENT_FRAUD,
-          severity:
-            riskScore >= 80
-              ? FraudAlertSeverity.CRITICAL
-              : FraudAlertSeverity.HIGH,
-          title: `Suspicious payment detected`,
-          description: `Payment of ${analysis.amount} ${analysis.currency} flagged with risk score ${riskScore}`,
-          metadata: {
-            analysis,
-            flags,
-            riskScore,
-            recommendations,
-          },
-          riskScore,
-          flags,
-          ipAddress: analysis.ipAddress,
-          userAgent: analysis.userAgent,
-          location: analysis.location,
-        });
+      if (options.createAlerts) {
+        const flagged = analyses
+          .map((analysis, i) => ({ analysis, result: results[i] }))
+          .filter(({ result }) => result.shouldAlert);
+        await this.fraudAlertRepository.save(
+          flagged.map(({ analysis, result }) =>
+            this.fraudAlertRepository.create(
+              this.buildPaymentAlert(analysis, result),
+            ),
+          ),
+          { chunk: 500 },
+        );
+        await Promise.all(
+          flagged.map(({ analysis }) =>
+            this.fraudFeatureStore.record('payment_alert', {
+              user: analysis.userId,
+            }),
+          ),
+        );
       }
 
-      return {
-        riskScore,
-        riskLevel,
-        flags,
-        recommendations,
-        shouldBlock,
-        shouldAlert,
-        confidence,
-      };
+      return results;
     } catch (error) {
-      this.logger.error('Error analyzing payment:', error);
+      this.logger.error('Error analyzing payment batch:', error);
       throw error;
     }
   }
@@ -313,7 +336,15 @@ export class FraudDetectionService {
   async createFraudAlert(createDto: CreateFraudAlertDto): Promise<FraudAlert> {
     try {
       const alert = this.fraudAlertRepository.create(createDto);
-      return await this.fraudAlertRepository.save(alert);
+      const saved = await this.fraudAlertRepository.save(alert);
+
+      // Feeds the alert frequency check in analyzePaymentFrequency
+      if (createDto.type === FraudAlertType.PAYMENT_FRAUD && createDto.userId) {
+        await this.fraudFeatureStore.record('payment_alert', {
+          user: createDto.userId,
+        });
+      }
+      return saved;
     } catch (error) {
       this.logger.error('Failed to create fraud alert', error.stack);
       throw error;
@@ -563,6 +594,100 @@ export class FraudDetectionService {
   }
 
   // Private helper methods
+  private async scorePayment(
+    analysis: PaymentAnalysis,
+    userScore: FraudScore | null | undefined,
+    velocity: PaymentVelocity,
+  ): Promise<FraudAnalysisResult> {
+    let riskScore = userScore?.overallScore || 0;
+    const flags: string[] = [];
+    const recommendations: string[] = [];
+
+    // The analyzers are independent of each other
+    const risks = await Promise.all([
+      this.analyzePaymentAmount(analysis),
+      this.analyzePaymentFrequency(analysis, velocity),
+      this.analyzePaymentMethod(analysis),
+      this.analyzeLocation(analysis),
+      this.analyzeDevice(analysis),
+    ]);
+    for (const risk of risks) {
+      riskScore += risk.score;
+      flags.push(...risk.flags);
+    }
+
+    // Normalize score to 0-100
+    riskScore = Math.min(100, Math.max(0, riskScore));
+
+    const riskLevel = this.calculateRiskLevel(riskScore);
+    const shouldBlock = riskScore >= 80;
+    const shouldAlert = riskScore >= 60;
+    const confidence = this.calculateConfidence(flags.length, riskScore);
+
+    // Generate recommendations
+    if (riskScore >= 80) {
+      recommendations.push('Block transaction immediately');
+      recommendations.push('Require manual review');
+    } else if (riskScore >= 60) {
+      recommendations.push('Require additional verification');
+      recommendations.push('Monitor closely');
+    } else if (riskScore >= 40) {
+      recommendations.push('Apply enhanced monitoring');
+    }
+
+    return {
+      riskScore,
+      riskLevel,
+      flags,
+      recommendations,
+      shouldBlock,
+      shouldAlert,
+      confidence,
+    };
+  }
+
+  private buildPaymentAlert(
+    analysis: PaymentAnalysis,
+    result: FraudAnalysisResult,
+  ): CreateFraudAlertDto {
+    const { riskScore, flags, recommendations } = result;
+    return {
+      userId: analysis.userId,
+      bookingId: analysis.bookingId,
+      paymentId: analysis.paymentId,
+      type: FraudAlertType.PAYMENT_FRAUD,
+      severity:
+        riskScore >= 80 ? FraudAlertSeverity.CRITICAL : FraudAlertSeverity.HIGH,
+      title: `Suspicious payment detected`,
+      description: `Payment of ${analysis.amount} ${analysis.currency} flagged with risk score ${riskScore}`,
+      metadata: {
+        analysis,
+        flags,
+        riskScore,
+        recommendations,
+      },
+      riskScore,
+      flags,
+      ipAddress: analysis.ipAddress,
+      userAgent: analysis.userAgent,
+      location: analysis.location,
+    };
+  }
+
+  private velocitySubjects(analysis: PaymentAnalysis): VelocitySubjects {
+    return {
+      user: analysis.userId,
+      device: analysis.deviceId || analysis.metadata?.deviceId,
+      ip: analysis.ipAddress,
+    };
+  }
+
+  private paymentTime(analysis: PaymentAnalysis): number {
+    return analysis.timestamp
+      ? new Date(analysis.timestamp).getTime()
+      : Date.now();
+  }
+
   private async analyzePaymentAmount(
     analysis: PaymentAnalysis,
   ): Promise<{ score: number; flags: string[] }> {
@@ -589,19 +714,13 @@ export class FraudDetectionService {
 
   private async analyzePaymentFrequency(
     analysis: PaymentAnalysis,
+    velocity: PaymentVelocity,
   ): Promise<{ score: number; flags: string[] }> {
     const flags: string[] = [];
     let score = 0;
 
-    // Check recent payment frequency for this user
-    const recentPayments = await this.fraudAlertRepository
-      .createQueryBuilder('alert')
-      .where('alert.userId = :userId', { userId: analysis.userId })
-      .andWhere('alert.type = :type', { type: FraudAlertType.PAYMENT_FRAUD })
-      .andWhere('alert.createdAt >= :date', {
-        date: new Date(Date.now() - 24 * 60 * 60 * 1000),
-      })
-      .getCount();
+    // Payment fraud alerts raised for this user in the last 24h
+    const recentPayments = velocity.alerts.user?.day || 0;
 
     if (recentPayments > 5) {
       score += 25;
@@ -611,6 +730,20 @@ export class FraudDetectionService {
       flags.push('elevated_frequency');
     }
 
+    // Payments from the same user, device or IP in the last hour
+    if ((velocity.payments.user?.hour || 0) > 5) {
+      score += 10;
+      flags.push('user_velocity');
+    }
+    if ((velocity.payments.device?.hour || 0) > 5) {
+      score += 10;
+      flags.push('device_velocity');
+    }
+    if ((velocity.payments.ip?.hour || 0) > 10) {
+      score += 15;
+      flags.push('ip_velocity');
+    }
+
     return { score, flags };
   }
 
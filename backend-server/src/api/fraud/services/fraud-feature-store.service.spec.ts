@@ -0,0 +1,85 @@
+import { RedisService } from '@/shared/redis/redis.service';
+import { Test, TestingModule } from '@nestjs/testing';
+import { FraudFeatureStoreService } from './fraud-feature-store.service';
+
+describe('FraudFeatureStoreService', () => {
+  let service: FraudFeatureStoreService;
+
+  const HOUR = 60 * 60 * 1000;
+  const now = Date.parse('2025-01-01T12:00:00Z');
+
+  beforeEach(async () => {
+    // Redis is never ready here, so the in-process counters are used
+    const module: TestingModule = await Test.createTestingModule({
+      providers: [
+        FraudFeatureStoreService,
+        {
+          provide: RedisService,
+          useValue: { client: {}, isReady: () => false },
+        },
+      ],
+    }).compile();
+
+    service = module.get<FraudFeatureStoreService>(FraudFeatureStoreService);
+  });
+
+  describe('record', () => {
+    it('should count events per dimension over sliding windows', async () => {
+      await service.record('payment', { user: 'user-1' }, now - 25 * HOUR);
+      await service.record('payment', { user: 'user-1' }, now - 2 * HOUR);
+      await service.record(
+        'payment',
+        { user: 'user-1', ip: '10.0.0.1' },
+        now - 10 * 60 * 1000,
+      );
+
+      const snapshot = await service.record(
+        'payment',
+        { user: 'user-1', device: 'device-1', ip: '10.0.0.1' },
+        now,
+      );
+
+      expect(snapshot).toEqual({
+        user: { hour: 2, day: 3 },
+        device: { hour: 1, day: 1 },
+        ip: { hour: 2, day: 2 },
+      });
+    });
+
+    it('should skip dimensions without an identifier', async () => {
+      const snapshot = await service.record(
+        'payment',
+        { user: 'user-1', device: undefined },
+        now,
+      );
+
+      expect(snapshot).toEqual({ user: { hour: 1, day: 1 } });
+    });
+  });
+
+  describe('countMany', () => {
+    it('should count each lookup at its own time without recording', async () => {
+      await service.record(
+        'payment_alert',
+        { user: 'user-1' },
+        now - HOUR / 2,
+      );
+
+      const [current, earlier, other] = await service.countMany(
+        'payment_alert',
+        [
+          { subjects: { user: 'user-1' }, at: now },
+          { subjects: { user: 'user-1' }, at: now - HOUR },
+          { subjects: { user: 'user-2' }, at: now },
+        ],
+      );
+
+      expect(current).toEqual({ user: { hour: 1, day: 1 } });
+      expect(earlier).toEqual({ user: { hour: 0, day: 0 } });
+      expect(other).toEqual({ user: { hour: 0, day: 0 } });
+      expect(
+        await service.count('payment_alert', { user: 'user-1' }, now),
+      ).toEqual({ user: { hour: 1, day: 1 } });
+    });
+  });
+});
@@ -0,0 +1,214 @@
+import { RedisService } from '@/shared/redis/redis.service';
+import { Injectable, Logger } from '@nestjs/common';
+import { randomUUID } from 'crypto';
+import { Redis } from 'ioredis';
+
+export type VelocityEvent = 'payment' | 'payment_alert';
+
+export type VelocityDimension = 'user' | 'device' | 'ip';
+
+/** Identifiers to count an event against; missing dimensions are skipped */
+export type VelocitySubjects = Partial<Record<VelocityDimension, string>>;
+
+export interface VelocityCounts {
+  hour: number;
+  day: number;
+}
+
+export type VelocitySnapshot = Partial<
+  Record<VelocityDimension, VelocityCounts>
+>;
+
+const HOUR_MS = 60 * 60 * 1000;
+const DAY_MS = 24 * HOUR_MS;
+const KEY_PREFIX = 'fraud:velocity';
+const LOCAL_MAX_KEYS = 100000;
+
+/**
+ * Sliding-window event counters for fraud scoring.
+ *
+ * Events are kept per (event, dimension, id) for the longest window, as
+ * Redis sorted sets scored by event time so every instance sees the same
+ * counts. While Redis is unreachable the counters fall back to in-process
+ * timestamp lists, which only see events handled by this instance.
+ */
+@Injectable()
+export class FraudFeatureStoreService {
+  private readonly logger = new Logger(FraudFeatureStoreService.name);
+  private readonly redis: Redis;
+  /** Sorted event times per key, used while Redis is unavailable */
+  private readonly local = new Map<string, number[]>();
+
+  constructor(private readonly redisService: RedisService) {
+    this.redis = redisService.client;
+  }
+
+  /**
+   * Record an event and return the counts that include it
+   */
+  async record(
+    event: VelocityEvent,
+    subjects: VelocitySubjects,
+    at: number = Date.now(),
+  ): Promise<VelocitySnapshot> {
+    const entries = this.entries(event, subjects);
+    if (entries.length === 0) return {};
+
+    if (this.redisService.isReady()) {
+      const member = `${at}:${randomUUID()}`;
+      const pipeline = this.redis.multi();
+      for (const [, key] of entries) {
+        pipeline
+          .zadd(key, at, member)
+          .zremrangebyscore(key, '-inf', at - DAY_MS)
+          .pexpire(key, DAY_MS);
+      }
+      this.addCounts(pipeline, entries, at);
+
+      try {
+        const results = await pipeline.exec();
+        return this.snapshot(entries, results.slice(entries.length * 3));
+      } catch (error) {
+        this.logger.warn(`Velocity record fell back to local: ${error}`);
+      }
+    }
+
+    for (const [, key] of entries) {
+      this.localRecord(key, at);
+    }
+    return this.localSnapshot(entries, at);
+  }
+
+  async count(
+    event: VelocityEvent,
+    subjects: VelocitySubjects,
+    at: number = Date.now(),
+  ): Promise<VelocitySnapshot> {
+    const [snapshot] = await this.countMany(event, [{ subjects, at }]);
+    return snapshot;
+  }
+
+  /**
+   * Counts for many lookups in one Redis round trip
+   */
+  async countMany(
+    event: VelocityEvent,
+    lookups: { subjects: VelocitySubjects; at?: number }[],
+  ): Promise<VelocitySnapshot[]> {
+    const now = Date.now();
+    const resolved = lookups.map(({ subjects, at }) => ({
+      entries: this.entries(event, subjects),
+      at: at ?? now,
+    }));
+
+    if (this.redisService.isReady()) {
+      const pipeline = this.redis.pipeline();
+      for (const { entries, at } of resolved) {
+        this.addCounts(pipeline, entries, at);
+      }
+
+      try {
+        const results = await pipeline.exec();
+        let offset = 0;
+        return resolved.map(({ entries }) => {
+          const counts = results.slice(offset, offset + entries.length * 2);
+          offset += entries.length * 2;
+          return this.snapshot(entries, counts);
+        });
+      } catch (error) {
+        this.logger.warn(`Velocity count fell back to local: ${error}`);
+      }
+    }
+
+    return resolved.map(({ entries, at }) => this.localSnapshot(entries, at));
+  }
+
+  private entries(
+    event: VelocityEvent,
+    subjects: VelocitySubjects,
+  ): [VelocityDimension, string][] {
+    return (Object.keys(subjects) as VelocityDimension[])
+      .filter((dimension) => subjects[dimension])
+      .map((dimension) => [
+        dimension,
+        `${KEY_PREFIX}:${event}:${dimension}:${subjects[dimension]}`,
+      ]);
+  }
+
+  private addCounts(
+    pipeline: ReturnType<Redis['pipeline']>,
+    entries: [VelocityDimension, string][],
+    at: number,
+  ): void {
+    for (const [, key] of entries) {
+      pipeline.zcount(key, `(${at - HOUR_MS}`, at);
+      pipeline.zcount(key, `(${at - DAY_MS}`, at);
+    }
+  }
+
+  private snapshot(
+    entries: [VelocityDimension, string][],
+    results: [Error | null, unknown][],
+  ): VelocitySnapshot {
+    const snapshot: VelocitySnapshot = {};
+    entries.forEach(([dimension], i) => {
+      const [hourError, hour] = results[i * 2];
+      const [dayError, day] = results[i * 2 + 1];
+      if (hourError || dayError) throw hourError || dayError;
+      snapshot[dimension] = { hour: Number(hour), day: Number(day) };
+    });
+    return snapshot;
+  }
+
+  private localRecord(key: string, at: number): void {
+    const times = this.prune(key, at) || [];
+    // Events arrive roughly in order, so this is usually a push
+    times.splice(this.upperBound(times, at), 0, at);
+
+    this.local.delete(key);
+    this.local.set(key, times);
+    if (this.local.size > LOCAL_MAX_KEYS) {
+      // Map iteration order is insertion order, so this is the stalest key
+      this.local.delete(this.local.keys().next().value);
+    }
+  }
+
+  private localSnapshot(
+    entries: [VelocityDimension, string][],
+    at: number,
+  ): VelocitySnapshot {
+    const snapshot: VelocitySnapshot = {};
+    for (const [dimension, key] of entries) {
+      const times = this.local.get(key) || [];
+      const until = this.upperBound(times, at);
+      snapshot[dimension] = {
+        hour: until - this.upperBound(times, at - HOUR_MS),
+        day: until - this.upperBound(times, at - DAY_MS),
+      };
+    }
+    return snapshot;
+  }
+
+  private prune(key: string, at: number): number[] | undefined {
+    const times = this.local.get(key);
+    if (times) {
+      times.splice(0, this.upperBound(times, at - DAY_MS));
+    }
+    return times;
+  }
+
+  /** Index of the first time greater than `value` */
+  private upperBound(times: number[], value: number): number {
+    let low = 0;
+    let high = times.length;
+    while (low < high) {
+      const mid = (low + high) >>> 1;
+      if (times[mid] <= value) {
+        low = mid + 1;
+      } else {
+        high = mid;
+      }
+    }
+    return low;
+  }
+}
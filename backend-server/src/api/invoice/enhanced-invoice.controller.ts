@@ -324,14 +324,14 @@ export class EnhancedInvoiceController {
 
   @Post('generate-recurring')
   @Roles('admin', 'finance')
-  @ApiOperation({ summary: 'Generate recurring invoices' })
+  @ApiOperation({ summary: 'Queue a recurring invoice billing run' })
   @ApiResponse({
     status: HttpStatus.OK,
-    description: 'Recurring invoices generated successfully',
+    description: 'Recurring invoice billing run queued',
   })
   async generateRecurringInvoices(
     @Request() req: any,
-  ): Promise<{ generated: number; failed: number; details: any[] }> {
+  ): Promise<{ runId: string; runDate: string }> {
     return this.enhancedInvoiceService.generateRecurringInvoices(req.user.id);
   }
 
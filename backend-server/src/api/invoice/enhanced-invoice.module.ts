@@ -3,6 +3,7 @@ import { TypeOrmModule } from '@nestjs/typeorm';
 
 import { UserEntity } from '@/auth/entities/user.entity';
 import { IdGeneratorService } from '@/utils/id-generator.service';
+import { BillingJobModule } from '@/worker/queues/billing/billing-job.module';
 import { EnhancedInvoiceController } from './enhanced-invoice.controller';
 import { EnhancedInvoiceService } from './enhanced-invoice.service';
 import {
@@ -29,6 +30,7 @@ import {
       InvoiceSettingsEntity,
       UserEntity,
     ]),
+    BillingJobModule,
   ],
   controllers: [EnhancedInvoiceController],
   providers: [EnhancedInvoiceService, IdGeneratorService],
@@ -16,6 +16,7 @@ import {
 } from 'typeorm';
 
 import { UserEntity } from '@/auth/entities/user.entity';
+import { BillingJobService } from '@/worker/queues/billing/billing-job.service';
 import {
   BulkInvoiceOperationDto,
   BulkOperationResponseDto,
@@ -73,6 +74,7 @@ export class EnhancedInvoiceService {
     private settingsRepository: Repository<InvoiceSettingsEntity>,
     @InjectRepository(UserEntity)
     private userRepository: Repository<UserEntity>,
+    private billingJobService: BillingJobService,
   ) {}
 
   // Invoice Management
@@ -103,9 +105,16 @@ export class EnhancedInvoiceService {
     let invoiceNumber = dto.invoiceNumber;
     if (!invoiceNumber) {
       const settings = await this.getOrCreateSettings();
+      // Reserved atomically, as billing runs reserve numbers concurrently
+      const [rows]: [Array<{ nextNumber: number }>, number] =
+        await this.settingsRepository.query(
+          `UPDATE "invoice_settings" SET "nextNumber" = "nextNumber" + 1
+           WHERE "id" = $1
+           RETURNING "nextNumber"`,
+          [settings.id],
+        );
+      settings.nextNumber = rows[0].nextNumber - 1;
       invoiceNumber = settings.generateNextInvoiceNumber();
-      settings.incrementNextNumber();
-      await this.settingsRepository.save(settings);
     }
 
     // Check for duplicate invoice number
@@ -451,54 +460,16 @@ export class EnhancedInvoiceService {
   }
 
   // Recurring Invoice Generation
+  /**
+   * Queue a billing run for every recurring invoice due today. Runs are
+   * billed in chunks by the worker; see BillingQueueService.
+   */
   async generateRecurringInvoices(
     userId: string,
-  ): Promise<{ generated: number; failed: number; details: any[] }> {
-    const recurringInvoices = await this.recurringRepository.find({
-      where: { isActive: true },
-      relations: ['template'],
-    });
-
-    const results = {
-      generated: 0,
-      failed: 0,
-      details: [],
-    };
-
-    for (const recurring of recurringInvoices) {
-      try {
-        if (recurring.shouldGenerate()) {
-          const invoiceData = {
-            ...recurring.template.templateData,
-            customerId: recurring.customerId,
-            partnerId: recurring.createdBy,
-            type: recurring.template.type,
-          };
-
-          await this.createInvoice(invoiceData as CreateInvoiceDto, userId);
-          recurring.nextGenerationDate = new Date(
-            Date.now() + 30 * 24 * 60 * 60 * 1000,
-          ); // Add 30 days
-          await this.recurringRepository.save(recurring);
-
-          results.generated++;
-          results.details.push({
-            recurringId: recurring.id,
-            status: 'success',
-            message: 'Invoice generated successfully',
-          });
-        }
-      } catch (error) {
-        results.failed++;
-        results.details.push({
-          recurringId: recurring.id,
-          status: 'failed',
-          message: error.message,
-        });
-      }
-    }
-
-    return results;
+  ): Promise<{ runId: string; runDate: string }> {
+    const { runId, runDate } =
+      await this.billingJobService.enqueueRecurringRun({ requestedBy: userId });
+    return { runId, runDate };
   }
 
   async createRecurringInvoice(
@@ -806,7 +777,7 @@ export class EnhancedInvoiceService {
   }
 
   async generatePdf(invoiceId: string): Promise<{ downloadUrl: string }> {
-    // Implementation for generating PDF
+    await this.billingJobService.enqueueInvoicePdfs([invoiceId]);
     return {
       downloadUrl: `/api/invoice/${invoiceId}/pdf/download`,
     };
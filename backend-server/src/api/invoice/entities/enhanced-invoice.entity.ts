@@ -37,6 +37,13 @@ import {
 @Index(['totalAmount'])
 @Index(['paymentStatus'])
 @Index(['createdAt'])
+// One invoice per recurring schedule and billing date, so billing runs can
+// be retried without issuing duplicates
+@Index(
+  'IDX_enhanced_invoices_recurring_issue',
+  ['recurringInvoiceId', 'issueDate'],
+  { unique: true, where: '"recurringInvoiceId" IS NOT NULL' },
+)
 export class EnhancedInvoiceEntity {
   @PrimaryGeneratedColumn('uuid')
   id: string;
@@ -78,6 +85,9 @@ export class EnhancedInvoiceEntity {
   @Index()
   bookingId: string;
 
+  @Column({ type: 'uuid', nullable: true })
+  recurringInvoiceId?: string;
+
   @Column({ type: 'jsonb' })
   billTo: {
     name: string;
@@ -481,6 +491,9 @@ export class InvoiceTemplateEntity {
 @Index(['templateId', 'isActive'])
 @Index(['customerId', 'isActive'])
 @Index(['nextGenerationDate'])
+@Index('IDX_recurring_invoices_due', ['nextGenerationDate', 'id'], {
+  where: '"isActive"',
+})
 @Index(['frequency'])
 export class RecurringInvoiceEntity {
   @PrimaryGeneratedColumn('uuid')
@@ -0,0 +1,165 @@
+/** Recorded values are stored in units of 0.1ms */
+const UNITS_PER_MS = 10;
+/** Linear sub-buckets per power of two; bounds the relative error to 1/32 */
+const SUB_BUCKET_BITS = 6;
+const SUB_BUCKETS = 1 << SUB_BUCKET_BITS;
+const HALF_SUB_BUCKETS = SUB_BUCKETS >> 1;
+/** Values above this are clamped, so the bucket array has a fixed size */
+const MAX_VALUE_MS = 5 * 60 * 1000;
+
+export interface LatencySummary {
+  count: number;
+  mean: number;
+  p50: number;
+  p95: number;
+  p99: number;
+  max: number;
+}
+
+function bucketIndex(units: number): number {
+  if (units < SUB_BUCKETS) return units;
+  const shift = 31 - Math.clz32(units) - (SUB_BUCKET_BITS - 1);
+  return (
+    SUB_BUCKETS +
+    (shift - 1) * HALF_SUB_BUCKETS +
+    ((units >>> shift) - HALF_SUB_BUCKETS)
+  );
+}
+
+/** Highest value, in units, that falls into a bucket */
+function bucketUpperBound(index: number): number {
+  if (index < SUB_BUCKETS) return index;
+  const offset = index - SUB_BUCKETS;
+  const shift = Math.floor(offset / HALF_SUB_BUCKETS) + 1;
+  const subBucket = (offset % HALF_SUB_BUCKETS) + HALF_SUB_BUCKETS;
+  return ((subBucket + 1) << shift) - 1;
+}
+
+const MAX_UNITS = MAX_VALUE_MS * UNITS_PER_MS;
+const BUCKET_COUNT = bucketIndex(MAX_UNITS) + 1;
+
+/**
+ * Fixed-memory latency histogram in milliseconds.
+ *
+ * Buckets are HDR-style log-linear: each power of two is split into
+ * linear sub-buckets, so percentiles stay within ~3% of the true value at
+ * any magnitude while memory stays at one small typed array no matter how
+ * many values are recorded.
+ */
+export class LatencyHistogram {
+  private readonly counts = new Uint32Array(BUCKET_COUNT);
+  private total = 0;
+  private sum = 0;
+  private maxValue = 0;
+
+  get count(): number {
+    return this.total;
+  }
+
+  record(ms: number): void {
+    if (!(ms >= 0)) return;
+    const units = Math.min(MAX_UNITS, Math.round(ms * UNITS_PER_MS));
+    this.counts[bucketIndex(units)]++;
+    this.total++;
+    this.sum += ms;
+    if (ms > this.maxValue) this.maxValue = ms;
+  }
+
+  /** Add another histogram's values into this one */
+  merge(other: LatencyHistogram): void {
+    for (let i = 0; i < BUCKET_COUNT; i++) {
+      this.counts[i] += other.counts[i];
+    }
+    this.total += other.total;
+    this.sum += other.sum;
+    this.maxValue = Math.max(this.maxValue, other.maxValue);
+  }
+
+  reset(): void {
+    this.counts.fill(0);
+    this.total = 0;
+    this.sum = 0;
+    this.maxValue = 0;
+  }
+
+  /** Value at quantile `q` (0-1), reported as its bucket's upper bound */
+  percentile(q: number): number {
+    if (this.total === 0) return 0;
+    const rank = Math.max(1, Math.ceil(q * this.total));
+    let seen = 0;
+    for (let i = 0; i < BUCKET_COUNT; i++) {
+      seen += this.counts[i];
+      if (seen >= rank) {
+        return Math.min(this.maxValue, bucketUpperBound(i) / UNITS_PER_MS);
+      }
+    }
+    return this.maxValue;
+  }
+
+  summary(): LatencySummary {
+    return {
+      count: this.total,
+      mean: this.total ? this.sum / this.total : 0,
+      p50: this.percentile(0.5),
+      p95: this.percentile(0.95),
+      p99: this.percentile(0.99),
+      max: this.maxValue,
+    };
+  }
+}
+
+/**
+ * Latency over a trailing window, kept as a ring of per-slot histograms.
+ * Slots older than the window are reset as time moves past them.
+ */
+export class RollingLatencyHistogram {
+  private readonly slots: LatencyHistogram[];
+  private readonly slotStarts: number[];
+  private readonly errors: number[];
+
+  constructor(
+    private readonly windowMs: number = 60000,
+    private readonly slotCount: number = 6,
+  ) {
+    this.slots = Array.from(
+      { length: slotCount },
+      () => new LatencyHistogram(),
+    );
+    this.slotStarts = new Array(slotCount).fill(-Infinity);
+    this.errors = new Array(slotCount).fill(0);
+  }
+
+  record(ms: number, isError = false, now: number = Date.now()): void {
+    const slot = this.slot(now);
+    this.slots[slot].record(ms);
+    if (isError) this.errors[slot]++;
+  }
+
+  /** Merged view of the slots inside the window */
+  snapshot(now: number = Date.now()): {
+    histogram: LatencyHistogram;
+    errors: number;
+  } {
+    const histogram = new LatencyHistogram();
+    let errors = 0;
+    for (let i = 0; i < this.slotCount; i++) {
+      if (this.slotStarts[i] > now - this.windowMs) {
+        histogram.merge(this.slots[i]);
+        errors += this.errors[i];
+      }
+    }
+    return { histogram, errors };
+  }
+
+  private slot(now: number): number {
+    const slotMs = this.windowMs / this.slotCount;
+    const start = now - (now % slotMs);
+    const index = Math.floor(start / slotMs) % this.slotCount;
+    if (this.slotStarts[index] !== start) {
+      this.slots[index].reset();
+      this.errors[index] = 0;
+      this.slotStarts[index] = start;
+    }
+    return index;
+  }
+}
@@ -0,0 +1,84 @@
+const MINUTE_MS = 60 * 1000;
+const HOUR_MS = 60 * MINUTE_MS;
+
+type NumericRecord<T> = { [K in keyof T]: number };
+
+export type TimestampedMetrics<T> = T & { timestamp: Date };
+
+interface Sample<T> {
+  timestamp: number;
+  values: T;
+}
+
+interface Bucket<T> {
+  start: number;
+  sums: NumericRecord<T>;
+  count: number;
+}
+
+/**
+ * Bounded, downsampled history of numeric snapshots.
+ *
+ * Samples are kept at full resolution for `fineRetentionMs`; older ones are
+ * averaged into `bucketMs` buckets kept for `coarseRetentionMs`, so a day
+ * of per-minute samples costs a few hundred entries instead of thousands.
+ */
+export class MetricsTimeSeries<T extends NumericRecord<T>> {
+  private readonly fine: Sample<T>[] = [];
+  private readonly coarse: Bucket<T>[] = [];
+
+  constructor(
+    private readonly fineRetentionMs: number = 2 * HOUR_MS,
+    private readonly bucketMs: number = 15 * MINUTE_MS,
+    private readonly coarseRetentionMs: number = 7 * 24 * HOUR_MS,
+  ) {}
+
+  record(values: T, at: number = Date.now()): void {
+    this.fine.push({ timestamp: at, values: { ...values } });
+
+    while (
+      this.fine.length &&
+      this.fine[0].timestamp <= at - this.fineRetentionMs
+    ) {
+      this.rollUp(this.fine.shift());
+    }
+    while (
+      this.coarse.length &&
+      this.coarse[0].start <= at - this.coarseRetentionMs
+    ) {
+      this.coarse.shift();
+    }
+  }
+
+  /** Samples at or after `since`, oldest first; older ones are averages */
+  since(since: number): TimestampedMetrics<T>[] {
+    const result: TimestampedMetrics<T>[] = [];
+    for (const { start, sums, count } of this.coarse) {
+      if (start < since) continue;
+      const values = {} as NumericRecord<T>;
+      for (const key in sums) {
+        values[key] = sums[key] / count;
+      }
+      result.push({ ...(values as T), timestamp: new Date(start) });
+    }
+    for (const { timestamp, values } of this.fine) {
+      if (timestamp < since) continue;
+      result.push({ ...values, timestamp: new Date(timestamp) });
+    }
+    return result;
+  }
+
+  private rollUp({ timestamp, values }: Sample<T>): void {
+    const start = timestamp - (timestamp % this.bucketMs);
+    let bucket = this.coarse[this.coarse.length - 1];
+    if (!bucket || bucket.start !== start) {
+      bucket = { start, sums: {} as NumericRecord<T>, count: 0 };
+      this.coarse.push(bucket);
+    }
+
+    for (const key in values) {
+      bucket.sums[key] = (bucket.sums[key] ?? 0) + values[key];
+    }
+    bucket.count++;
+  }
+}
@@ -0,0 +1,48 @@
+export type QueryOperation =
+  | 'SELECT'
+  | 'INSERT'
+  | 'UPDATE'
+  | 'DELETE'
+  | 'TRANSACTION'
+  | 'OTHER';
+
+const TRANSACTION_KEYWORDS = new Set([
+  'START',
+  'BEGIN',
+  'COMMIT',
+  'ROLLBACK',
+  'SAVEPOINT',
+  'RELEASE',
+]);
+
+/**
+ * Normalize a SQL statement so every execution of the same query shape maps
+ * to one key: comments are dropped, literals and bind parameters become `?`,
+ * IN lists collapse to `(?+)` and whitespace is squeezed.
+ */
+export function fingerprintQuery(sql: string): string {
+  return sql
+    .replace(/--[^\n]*/g, ' ')
+    .replace(/\/\*[\s\S]*?\*\//g, ' ')
+    .replace(/'(?:[^']|'')*'/g, '?')
+    .replace(/\$\d+/g, '?')
+    .replace(/\b\d+(?:\.\d+)?\b/g, '?')
+    .replace(/\(\s*\?(?:\s*,\s*\?)*\s*\)/g, '(?+)')
+    .replace(/\s+/g, ' ')
+    .trim();
+}
+
+export function queryOperation(sql: string): QueryOperation {
+  const keyword = /^\s*\(?\s*(\w+)/.exec(sql)?.[1]?.toUpperCase();
+  switch (keyword) {
+    case 'SELECT':
+    case 'WITH':
+      return 'SELECT';
+    case 'INSERT':
+    case 'UPDATE':
+    case 'DELETE':
+      return keyword;
+    default:
+      return TRANSACTION_KEYWORDS.has(keyword) ? 'TRANSACTION' : 'OTHER';
+  }
+}
@@ -0,0 +1,114 @@
+import { Test, TestingModule } from '@nestjs/testing';
+import { getToken } from '@willsoto/nestjs-prometheus';
+import { DataSource } from 'typeorm';
+import { fingerprintQuery } from './query-fingerprint';
+import {
+  DB_POOL_CONNECTIONS,
+  DB_QUERY_DURATION,
+  DB_SLOW_QUERIES,
+  QueryMetricsService,
+} from './query-metrics.service';
+
+describe('QueryMetricsService', () => {
+  let service: QueryMetricsService;
+
+  const mockDataSource = {
+    subscribers: [],
+    driver: {
+      master: {
+        totalCount: 9,
+        idleCount: 1,
+        waitingCount: 3,
+        options: { max: 10 },
+      },
+    },
+  };
+  const mockHistogram = { observe: jest.fn() };
+  const mockCounter = { inc: jest.fn() };
+  const mockGauge = { set: jest.fn() };
+
+  beforeEach(async () => {
+    mockDataSource.subscribers = [];
+
+    const module: TestingModule = await Test.createTestingModule({
+      providers: [
+        QueryMetricsService,
+        { provide: DataSource, useValue: mockDataSource },
+        { provide: getToken(DB_QUERY_DURATION), useValue: mockHistogram },
+        { provide: getToken(DB_SLOW_QUERIES), useValue: mockCounter },
+        { provide: getToken(DB_POOL_CONNECTIONS), useValue: mockGauge },
+      ],
+    }).compile();
+
+    service = module.get<QueryMetricsService>(QueryMetricsService);
+  });
+
+  afterEach(() => {
+    jest.clearAllMocks();
+  });
+
+  it('should subscribe to the data source', () => {
+    expect(mockDataSource.subscribers).toEqual([service]);
+  });
+
+  it('should normalize literals, parameters and IN lists', () => {
+    expect(
+      fingerprintQuery(
+        `SELECT "b"."id" FROM "bookings" "b"
+         WHERE "b"."status" IN ($1, $2, $3) AND "b"."amount" > 100
+         AND "b"."note" = 'it''s' LIMIT 10 -- admin list`,
+      ),
+    ).toBe(
+      'SELECT "b"."id" FROM "bookings" "b" WHERE "b"."status" IN (?+) ' +
+        'AND "b"."amount" > ? AND "b"."note" = ? LIMIT ?',
+    );
+  });
+
+  it('should group queries by fingerprint and capture slow ones', () => {
+    service.afterQuery({
+      query: 'SELECT * FROM "users" WHERE "id" = $1',
+      executionTime: 4,
+      success: true,
+    } as any);
+    service.afterQuery({
+      query: `SELECT * FROM "users" WHERE "id" = 'abc'`,
+      executionTime: 1500,
+      success: true,
+    } as any);
+    service.afterQuery({
+      query: 'UPDATE "wallets" SET "balance" = $1',
+      executionTime: 20,
+      success: false,
+    } as any);
+
+    const [users, wallets] = service.getTopQueries();
+
+    expect(users).toMatchObject({
+      fingerprint: 'SELECT * FROM "users" WHERE "id" = ?',
+      operation: 'SELECT',
+      count: 2,
+      slowCount: 1,
+    });
+    expect(wallets).toMatchObject({ operation: 'UPDATE', failures: 1 });
+    expect(service.getSlowQueries()).toEqual([
+      expect.objectContaining({ durationMs: 1500 }),
+    ]);
+    expect(service.getWindowStats()).toMatchObject({
+      count: 3,
+      slowQueries: 1,
+    });
+    expect(mockCounter.inc).toHaveBeenCalledWith({ operation: 'SELECT' });
+  });
+
+  it('should report pool saturation', () => {
+    expect(service.getPoolStats()).toEqual({
+      total: 9,
+      idle: 1,
+      active: 8,
+      waiting: 3,
+      max: 10,
+      utilization: 80,
+    });
+    expect(mockGauge.set).toHaveBeenCalledWith({ state: 'waiting' }, 3);
+  });
+});
@@ -0,0 +1,250 @@
+import { Injectable, Logger } from '@nestjs/common';
+import { Interval } from '@nestjs/schedule';
+import { InjectMetric } from '@willsoto/nestjs-prometheus';
+import { Counter, Gauge, Histogram } from 'prom-client';
+import {
+  AfterQueryEvent,
+  DataSource,
+  EntitySubscriberInterface,
+} from 'typeorm';
+import { LatencyHistogram, RollingLatencyHistogram } from './latency-histogram';
+import {
+  fingerprintQuery,
+  QueryOperation,
+  queryOperation,
+} from './query-fingerprint';
+
+export const DB_QUERY_DURATION = 'db_query_duration_seconds';
+export const DB_SLOW_QUERIES = 'db_slow_queries_total';
+export const DB_POOL_CONNECTIONS = 'db_pool_connections';
+
+export const SLOW_QUERY_THRESHOLD_MS = 1000;
+
+const WINDOW_MS = 60 * 1000;
+/** Distinct query shapes tracked; the least recently seen is evicted */
+const MAX_FINGERPRINTS = 1000;
+const MAX_SLOW_QUERIES = 50;
+const POOL_SAMPLE_INTERVAL_MS = 10000;
+
+export interface QueryWindowStats {
+  count: number;
+  mean: number;
+  p95: number;
+  p99: number;
+  slowQueries: number;
+}
+
+export interface QueryFingerprintStats {
+  fingerprint: string;
+  operation: QueryOperation;
+  count: number;
+  failures: number;
+  slowCount: number;
+  totalMs: number;
+  meanMs: number;
+  p95Ms: number;
+  maxMs: number;
+}
+
+export interface SlowQuery {
+  fingerprint: string;
+  durationMs: number;
+  success: boolean;
+  timestamp: Date;
+}
+
+export interface PoolStats {
+  total: number;
+  idle: number;
+  active: number;
+  waiting: number;
+  max: number;
+  utilization: number; // %
+}
+
+interface FingerprintEntry {
+  fingerprint: string;
+  operation: QueryOperation;
+  latency: LatencyHistogram;
+  failures: number;
+  slowCount: number;
+  totalMs: number;
+}
+
+/** The pg.Pool fields read for saturation */
+interface PgPool {
+  totalCount: number;
+  idleCount: number;
+  waitingCount: number;
+  options?: { max?: number };
+}
+
+/**
+ * Times every TypeORM query through the afterQuery subscriber hook.
+ *
+ * Queries are grouped by fingerprint, the SQL with literals and bind
+ * parameters normalized away, so the stats show which query shapes are
+ * slow or hot rather than individual executions. Parameters are never
+ * kept, since they may hold personal data.
+ */
+@Injectable()
+export class QueryMetricsService implements EntitySubscriberInterface {
+  private readonly logger = new Logger(QueryMetricsService.name);
+  private readonly window = new RollingLatencyHistogram(WINDOW_MS);
+  /** Keyed by raw SQL, which TypeORM repeats verbatim for a query shape */
+  private readonly fingerprints = new Map<string, FingerprintEntry>();
+  private readonly slowQueries: SlowQuery[] = [];
+
+  constructor(
+    private readonly dataSource: DataSource,
+    @InjectMetric(DB_QUERY_DURATION)
+    private readonly queryDuration: Histogram<string>,
+    @InjectMetric(DB_SLOW_QUERIES)
+    private readonly slowQueryCounter: Counter<string>,
+    @InjectMetric(DB_POOL_CONNECTIONS)
+    private readonly poolConnections: Gauge<string>,
+  ) {
+    this.dataSource.subscribers.push(this);
+  }
+
+  afterQuery(event: AfterQueryEvent<unknown>): void {
+    if (event.executionTime == null) return;
+    this.record(event.query, event.executionTime, event.success);
+  }
+
+  record(sql: string, durationMs: number, success = true): void {
+    const entry = this.fingerprintEntry(sql);
+    const isSlow = durationMs >= SLOW_QUERY_THRESHOLD_MS;
+
+    this.window.record(durationMs, isSlow);
+    entry.latency.record(durationMs);
+    entry.totalMs += durationMs;
+    if (!success) entry.failures++;
+
+    this.queryDuration.observe(
+      { operation: entry.operation },
+      durationMs / 1000,
+    );
+
+    if (isSlow) {
+      entry.slowCount++;
+      this.slowQueryCounter.inc({ operation: entry.operation });
+      this.slowQueries.push({
+        fingerprint: entry.fingerprint,
+        durationMs,
+        success,
+        timestamp: new Date(),
+      });
+      if (this.slowQueries.length > MAX_SLOW_QUERIES) {
+        this.slowQueries.shift();
+      }
+      this.logger.warn(
+        `Slow query (${Math.round(durationMs)}ms): ${entry.fingerprint}`,
+      );
+    }
+  }
+
+  /** Query latency over the last minute; slow queries are counted as errors */
+  getWindowStats(): QueryWindowStats {
+    const { histogram, errors } = this.window.snapshot();
+    const summary = histogram.summary();
+    return {
+      count: summary.count,
+      mean: summary.mean,
+      p95: summary.p95,
+      p99: summary.p99,
+      slowQueries: errors,
+    };
+  }
+
+  /** Query shapes by total time spent, the best candidates for tuning */
+  getTopQueries(limit = 20): QueryFingerprintStats[] {
+    // Different raw SQL can normalize to the same fingerprint
+    const groups = new Map<string, FingerprintEntry>();
+    for (const entry of this.fingerprints.values()) {
+      const group = groups.get(entry.fingerprint);
+      if (!group) {
+        groups.set(entry.fingerprint, {
+          ...entry,
+          latency: new LatencyHistogram(),
+        });
+      } else {
+        group.failures += entry.failures;
+        group.slowCount += entry.slowCount;
+        group.totalMs += entry.totalMs;
+      }
+      groups.get(entry.fingerprint).latency.merge(entry.latency);
+    }
+
+    return Array.from(groups.values())
+      .sort((a, b) => b.totalMs - a.totalMs)
+      .slice(0, limit)
+      .map(({ latency, ...group }) => {
+        const summary = latency.summary();
+        return {
+          ...group,
+          count: summary.count,
+          meanMs: summary.mean,
+          p95Ms: summary.p95,
+          maxMs: summary.max,
+        };
+      });
+  }
+
+  getSlowQueries(): SlowQuery[] {
+    return [...this.slowQueries].reverse();
+  }
+
+  @Interval(POOL_SAMPLE_INTERVAL_MS)
+  samplePool(): void {
+    this.getPoolStats();
+  }
+
+  /** Connection pool saturation, also published to Prometheus */
+  getPoolStats(): PoolStats {
+    const pool = (this.dataSource.driver as unknown as { master?: PgPool })
+      .master;
+    const total = pool?.totalCount ?? 0;
+    const idle = pool?.idleCount ?? 0;
+    const waiting = pool?.waitingCount ?? 0;
+    // pg.Pool's default size
+    const max = pool?.options?.max ?? 10;
+    const active = total - idle;
+
+    this.poolConnections.set({ state: 'active' }, active);
+    this.poolConnections.set({ state: 'idle' }, idle);
+    this.poolConnections.set({ state: 'waiting' }, waiting);
+    this.poolConnections.set({ state: 'max' }, max);
+
+    return {
+      total,
+      idle,
+      active,
+      waiting,
+      max,
+      utilization: max ? (active / max) * 100 : 0,
+    };
+  }
+
+  private fingerprintEntry(sql: string): FingerprintEntry {
+    let entry = this.fingerprints.get(sql);
+    if (entry) {
+      // Re-insert so Map order tracks recency
+      this.fingerprints.delete(sql);
+    } else {
+      entry = {
+        fingerprint: fingerprintQuery(sql),
+        operation: queryOperation(sql),
+        latency: new LatencyHistogram(),
+        failures: 0,
+        slowCount: 0,
+        totalMs: 0,
+      };
+      if (this.fingerprints.size >= MAX_FINGERPRINTS) {
+        this.fingerprints.delete(this.fingerprints.keys().next().value);
+      }
+    }
+    this.fingerprints.set(sql, entry);
+    return entry;
+  }
+}
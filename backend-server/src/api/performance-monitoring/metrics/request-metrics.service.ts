@@ -0,0 +1,145 @@
+import { Injectable, OnModuleInit } from '@nestjs/common';
+import { HttpAdapterHost } from '@nestjs/core';
+import { InjectMetric } from '@willsoto/nestjs-prometheus';
+import { FastifyInstance, FastifyReply, FastifyRequest } from 'fastify';
+import { Histogram } from 'prom-client';
+import {
+  LatencyHistogram,
+  LatencySummary,
+  RollingLatencyHistogram,
+} from './latency-histogram';
+
+export const HTTP_REQUEST_DURATION = 'http_request_duration_seconds';
+
+const WINDOW_MS = 60 * 1000;
+/** Routes tracked individually; later ones are folded into OTHER_ROUTE */
+const MAX_ROUTES = 500;
+const OTHER_ROUTE = 'other';
+const UNMATCHED_ROUTE = 'unmatched';
+
+export interface RequestWindowStats extends LatencySummary {
+  requestsPerSecond: number;
+  errors: number;
+  errorRate: number; // %
+}
+
+export interface RouteLatencyStats extends LatencySummary {
+  method: string;
+  route: string;
+  errors: number;
+  errorRate: number; // %
+}
+
+interface RouteStats {
+  method: string;
+  route: string;
+  latency: LatencyHistogram;
+  errors: number;
+}
+
+/**
+ * Request latency measured from a Fastify onResponse hook.
+ *
+ * Requests are keyed by method and route pattern (never the raw URL, so
+ * ids don't explode cardinality) and recorded into fixed-memory histograms:
+ * one per route since start-up and a rolling one-minute window across all
+ * routes. The same timings are exported to Prometheus.
+ */
+@Injectable()
+export class RequestMetricsService implements OnModuleInit {
+  private readonly window = new RollingLatencyHistogram(WINDOW_MS);
+  private readonly routes = new Map<string, RouteStats>();
+
+  constructor(
+    private readonly adapterHost: HttpAdapterHost,
+    @InjectMetric(HTTP_REQUEST_DURATION)
+    private readonly requestDuration: Histogram<string>,
+  ) {}
+
+  onModuleInit(): void {
+    const fastify: FastifyInstance =
+      this.adapterHost.httpAdapter?.getInstance();
+    if (!fastify) return;
+
+    fastify.addHook(
+      'onResponse',
+      async (request: FastifyRequest, reply: FastifyReply) => {
+        this.record(
+          request.method,
+          request.routeOptions?.url || UNMATCHED_ROUTE,
+          reply.statusCode,
+          reply.elapsedTime,
+        );
+      },
+    );
+  }
+
+  record(
+    method: string,
+    route: string,
+    statusCode: number,
+    durationMs: number,
+  ): void {
+    const isError = statusCode >= 500;
+    this.window.record(durationMs, isError);
+
+    const stats = this.routeStats(method, route);
+    stats.latency.record(durationMs);
+    if (isError) stats.errors++;
+
+    this.requestDuration.observe(
+      {
+        method,
+        route: stats.route,
+        status_code: String(statusCode),
+      },
+      durationMs / 1000,
+    );
+  }
+
+  /** Throughput, errors and latency over the last minute */
+  getWindowStats(): RequestWindowStats {
+    const { histogram, errors } = this.window.snapshot();
+    const summary = histogram.summary();
+    return {
+      ...summary,
+      requestsPerSecond: summary.count / (WINDOW_MS / 1000),
+      errors,
+      errorRate: summary.count ? (errors / summary.count) * 100 : 0,
+    };
+  }
+
+  /** Per-route latency since start-up, slowest p95 first */
+  getRouteStats(limit = 20): RouteLatencyStats[] {
+    return Array.from(this.routes.values())
+      .map(({ method, route, latency, errors }) => {
+        const summary = latency.summary();
+        return {
+          method,
+          route,
+          ...summary,
+          errors,
+          errorRate: summary.count ? (errors / summary.count) * 100 : 0,
+        };
+      })
+      .sort((a, b) => b.p95 - a.p95)
+      .slice(0, limit);
+  }
+
+  private routeStats(method: string, route: string): RouteStats {
+    let key = `${method} ${route}`;
+    let stats = this.routes.get(key);
+    if (stats) return stats;
+
+    if (this.routes.size >= MAX_ROUTES) {
+      route = OTHER_ROUTE;
+      key = `${method} ${route}`;
+      stats = this.routes.get(key);
+      if (stats) return stats;
+    }
+
+    stats = { method, route, latency: new LatencyHistogram(), errors: 0 };
+    this.routes.set(key, stats);
+    return stats;
+  }
+}
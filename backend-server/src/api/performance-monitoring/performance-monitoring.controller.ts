@@ -19,6 +19,12 @@ import {
 import { Roles } from '../../decorators/roles.decorator';
 import { RolesGuard } from '../../guards/roles.guard';
 import { Role as UserRole } from '../user/user.enum';
+import { TimestampedMetrics } from './metrics/metrics-time-series';
+import {
+  QueryFingerprintStats,
+  SlowQuery,
+} from './metrics/query-metrics.service';
+import { RouteLatencyStats } from './metrics/request-metrics.service';
 import {
   PerformanceAlert,
   PerformanceMetrics,
@@ -30,6 +36,8 @@ class PerformanceMetricsDto {
   averageQueryTime: number;
   slowQueries: number;
   databaseConnections: number;
+  databasePoolUtilization: number;
+  databasePoolWaiting: number;
   databaseCpuUsage: number;
   databaseMemoryUsage: number;
 
@@ -46,6 +54,7 @@ class PerformanceMetricsDto {
   memoryUsage: number;
   diskUsage: number;
   networkLatency: number;
+  eventLoopLagP99: number;
   uptime: number;
 
   // Application Performance
@@ -125,10 +134,59 @@ export class PerformanceMonitoringController {
   })
   async getMetricsHistory(
     @Query('hours') hours: number = 24,
-  ): Promise<PerformanceMetrics[]> {
+  ): Promise<TimestampedMetrics<PerformanceMetrics>[]> {
     return this.performanceMonitoringService.getPerformanceHistory(hours);
   }
 
+  @Get('metrics/routes')
+  @Roles(UserRole.Admin)
+  @ApiOperation({
+    summary: 'Get per-route API latency',
+    description:
+      'Latency percentiles and error rates per route since start-up, slowest p95 first',
+  })
+  @ApiQuery({
+    name: 'limit',
+    required: false,
+    type: Number,
+    description: 'Number of routes to return (default: 20)',
+    example: 20,
+  })
+  @ApiResponse({
+    status: HttpStatus.OK,
+    description: 'Route latency retrieved successfully',
+  })
+  async getRouteLatency(
+    @Query('limit') limit: number = 20,
+  ): Promise<RouteLatencyStats[]> {
+    return this.performanceMonitoringService.getRouteLatency(limit);
+  }
+
+  @Get('metrics/queries')
+  @Roles(UserRole.Admin)
+  @ApiOperation({
+    summary: 'Get database query statistics',
+    description:
+      'Normalized query shapes by total time spent, and the most recent slow queries',
+  })
+  @ApiQuery({
+    name: 'limit',
+    required: false,
+    type: Number,
+    description: 'Number of query shapes to return (default: 20)',
+    example: 20,
+  })
+  @ApiResponse({
+    status: HttpStatus.OK,
+    description: 'Query statistics retrieved successfully',
+  })
+  async getQueryStats(@Query('limit') limit: number = 20): Promise<{
+    topQueries: QueryFingerprintStats[];
+    slowQueries: SlowQuery[];
+  }> {
+    return this.performanceMonitoringService.getQueryStats(limit);
+  }
+
   @Get('alerts')
   @Roles(UserRole.Admin)
   @ApiOperation({
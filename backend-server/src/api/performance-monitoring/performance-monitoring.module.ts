@@ -5,6 +5,21 @@ import { PaymentEntity } from '@/database/entities/payment.entity';
 import { Module } from '@nestjs/common';
 import { ScheduleModule } from '@nestjs/schedule';
 import { TypeOrmModule } from '@nestjs/typeorm';
+import {
+  makeCounterProvider,
+  makeGaugeProvider,
+  makeHistogramProvider,
+} from '@willsoto/nestjs-prometheus';
+import {
+  DB_POOL_CONNECTIONS,
+  DB_QUERY_DURATION,
+  DB_SLOW_QUERIES,
+  QueryMetricsService,
+} from './metrics/query-metrics.service';
+import {
+  HTTP_REQUEST_DURATION,
+  RequestMetricsService,
+} from './metrics/request-metrics.service';
 import { PerformanceMonitoringController } from './performance-monitoring.controller';
 import { PerformanceMonitoringService } from './performance-monitoring.service';
 
@@ -15,7 +30,33 @@ import { PerformanceMonitoringService } from './performance-monitoring.service';
     NotificationModule,
   ],
   controllers: [PerformanceMonitoringController],
-  providers: [PerformanceMonitoringService],
+  providers: [
+    PerformanceMonitoringService,
+    RequestMetricsService,
+    QueryMetricsService,
+    makeHistogramProvider({
+      name: HTTP_REQUEST_DURATION,
+      help: 'HTTP request latency by method, route pattern and status',
+      labelNames: ['method', 'route', 'status_code'],
+      buckets: [0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10],
+    }),
+    makeHistogramProvider({
+      name: DB_QUERY_DURATION,
+      help: 'Database query latency by statement type',
+      labelNames: ['operation'],
+      buckets: [0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5],
+    }),
+    makeCounterProvider({
+      name: DB_SLOW_QUERIES,
+      help: 'Database queries slower than the slow query threshold',
+      labelNames: ['operation'],
+    }),
+    makeGaugeProvider({
+      name: DB_POOL_CONNECTIONS,
+      help: 'Database connection pool connections by state',
+      labelNames: ['state'],
+    }),
+  ],
   exports: [PerformanceMonitoringService],
 })
 export class PerformanceMonitoringModule {}
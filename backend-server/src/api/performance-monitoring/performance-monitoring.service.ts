@@ -2,17 +2,33 @@ import { WebSocketService } from '@/api/notification/services/websocket.service'
 import { UserEntity } from '@/auth/entities/user.entity';
 import { BookingEntity } from '@/database/entities/booking.entity';
 import { PaymentEntity } from '@/database/entities/payment.entity';
-import { Injectable, Logger } from '@nestjs/common';
+import { Injectable, Logger, OnModuleDestroy } from '@nestjs/common';
 import { EventEmitter2 } from '@nestjs/event-emitter';
 import { Cron, CronExpression } from '@nestjs/schedule';
 import { InjectRepository } from '@nestjs/typeorm';
+import { monitorEventLoopDelay } from 'node:perf_hooks';
 import { Between, Repository } from 'typeorm';
+import {
+  MetricsTimeSeries,
+  TimestampedMetrics,
+} from './metrics/metrics-time-series';
+import {
+  QueryFingerprintStats,
+  QueryMetricsService,
+  SlowQuery,
+} from './metrics/query-metrics.service';
+import {
+  RequestMetricsService,
+  RouteLatencyStats,
+} from './metrics/request-metrics.service';
 
 export interface PerformanceMetrics {
   // Database Performance
   averageQueryTime: number;
   slowQueries: number;
   databaseConnections: number;
+  databasePoolUtilization: number; // %
+  databasePoolWaiting: number;
   databaseCpuUsage: number;
   databaseMemoryUsage: number;
 
@@ -29,6 +45,7 @@ export interface PerformanceMetrics {
   memoryUsage: number;
   diskUsage: number;
   networkLatency: number;
+  eventLoopLagP99: number; // ms
   uptime: number;
 
   // Application Performance
@@ -76,6 +93,7 @@ export interface PerformanceThresholds {
     maxMemoryUsage: number; // %
     maxDiskUsage: number; // %
     maxNetworkLatency: number; // ms
+    maxEventLoopLag: number; // ms
     minUptime: number; // %
   };
   application: {
@@ -91,9 +109,12 @@ export interface PerformanceThresholds {
 }
 
 @Injectable()
-export class PerformanceMonitoringService {
+export class PerformanceMonitoringService implements OnModuleDestroy {
   private readonly logger = new Logger(PerformanceMonitoringService.name);
-  private performanceHistory: PerformanceMetrics[] = [];
+  /** Per-minute samples, downsampled to 15-minute averages after 2 hours */
+  private readonly performanceHistory =
+    new MetricsTimeSeries<PerformanceMetrics>();
+  private readonly eventLoopDelay = monitorEventLoopDelay({ resolution: 20 });
   private activeAlerts: Map<string, PerformanceAlert> = new Map();
 
   private readonly thresholds: PerformanceThresholds = {
@@ -116,6 +137,7 @@ export class PerformanceMonitoringService {
       maxMemoryUsage: 85,
       maxDiskUsage: 90,
       maxNetworkLatency: 100, // 100ms
+      maxEventLoopLag: 100, // 100ms
       minUptime: 99.5, // 99.5%
     },
     application: {
@@ -139,7 +161,15 @@ export class PerformanceMonitoringService {
     private userRepository: Repository<UserEntity>,
     private webSocketService: WebSocketService,
     private eventEmitter: EventEmitter2,
-  ) {}
+    private requestMetricsService: RequestMetricsService,
+    private queryMetricsService: QueryMetricsService,
+  ) {
+    this.eventLoopDelay.enable();
+  }
+
+  onModuleDestroy(): void {
+    this.eventLoopDelay.disable();
+  }
 
   async getCurrentPerformanceMetrics(): Promise<PerformanceMetrics> {
     try {
@@ -165,12 +195,6 @@ export class PerformanceMonitoringService {
         ...businessMetrics,
       };
 
-      // Store in history (keep last 100 entries)
-      this.performanceHistory.push(metrics);
-      if (this.performanceHistory.length > 100) {
-        this.performanceHistory.shift();
-      }
-
       return metrics;
     } catch (error) {
       this.logger.error('Failed to get performance metrics:', error);
@@ -180,17 +204,26 @@ export class PerformanceMonitoringService {
 
   async getPerformanceHistory(
     hours: number = 24,
-  ): Promise<PerformanceMetrics[]> {
-    // In a real implementation, this would fetch from a time-series database
-    // For now, return the in-memory history
-    const cutoffTime = new Date(Date.now() - hours * 60 * 60 * 1000);
-    return this.performanceHistory.filter((_, index) => {
-      // Approximate time filtering based on index
-      const estimatedTime = new Date(
-        Date.now() - (this.performanceHistory.length - index) * 60 * 1000,
-      );
-      return estimatedTime >= cutoffTime;
-    });
+  ): Promise<TimestampedMetrics<PerformanceMetrics>[]> {
+    // Samples are recorded by the collector; long-term history lives in
+    // Prometheus, this only covers the last week of this instance
+    return this.performanceHistory.since(
+      Date.now() - Number(hours) * 60 * 60 * 1000,
+    );
+  }
+
+  async getRouteLatency(limit: number = 20): Promise<RouteLatencyStats[]> {
+    return this.requestMetricsService.getRouteStats(Number(limit));
+  }
+
+  async getQueryStats(limit: number = 20): Promise<{
+    topQueries: QueryFingerprintStats[];
+    slowQueries: SlowQuery[];
+  }> {
+    return {
+      topQueries: this.queryMetricsService.getTopQueries(Number(limit)),
+      slowQueries: this.queryMetricsService.getSlowQueries(),
+    };
   }
 
   async getPerformanceAlerts(): Promise<PerformanceAlert[]> {
@@ -218,6 +251,21 @@ export class PerformanceMonitoringService {
       );
     }
 
+    if (
+      metrics.databasePoolUtilization > this.thresholds.database.maxConnections
+    ) {
+      alerts.push(
+        this.createAlert(
+          'database',
+          metrics.databasePoolWaiting > 0 ? 'critical' : 'high',
+          'databasePoolUtilization',
+          metrics.databasePoolUtilization,
+          this.thresholds.database.maxConnections,
+          `Database pool is ${metrics.databasePoolUtilization}% in use with ${metrics.databasePoolWaiting} requests waiting`,
+        ),
+      );
+    }
+
     if (metrics.databaseCpuUsage > this.thresholds.database.maxCpuUsage) {
       alerts.push(
         this.createAlert(
@@ -285,6 +333,19 @@ export class PerformanceMonitoringService {
       );
     }
 
+    if (metrics.eventLoopLagP99 > this.thresholds.system.maxEventLoopLag) {
+      alerts.push(
+        this.createAlert(
+          'system',
+          'high',
+          'eventLoopLagP99',
+          metrics.eventLoopLagP99,
+          this.thresholds.system.maxEventLoopLag,
+          `Event loop lag p99 (${metrics.eventLoopLagP99}ms) is too high`,
+        ),
+      );
+    }
+
     // Application alerts
     if (metrics.queueLength > this.thresholds.application.maxQueueLength) {
       alerts.push(
@@ -422,6 +483,9 @@ export class PerformanceMonitoringService {
   async collectPerformanceMetrics(): Promise<void> {
     try {
       const metrics = await this.getCurrentPerformanceMetrics();
+      this.performanceHistory.record(metrics);
+      // Each sample's event loop lag covers the minute since the last one
+      this.eventLoopDelay.reset();
       const alerts = await this.checkPerformanceThresholds(metrics);
 
       if (alerts.length > 0) {
@@ -464,30 +528,36 @@ export class PerformanceMonitoringService {
 
   // Private helper methods
   private async getDatabaseMetrics() {
-    // Mock database metrics - in real implementation, these would come from database monitoring
+    // Query timings over the last minute, measured by QueryMetricsService
+    const queries = this.queryMetricsService.getWindowStats();
+    const pool = this.queryMetricsService.getPoolStats();
+
     return {
-      averageQueryTime: Math.random() * 200 + 50, // 50-250ms
-      slowQueries: Math.floor(Math.random() * 5),
-      databaseConnections: Math.floor(Math.random() * 50 + 20),
-      databaseCpuUsage: Math.random() * 60 + 20, // 20-80%
-      databaseMemoryUsage: Math.random() * 50 + 30, // 30-80%
+      averageQueryTime: round(queries.mean),
+      slowQueries: queries.slowQueries,
+      databaseConnections: pool.active,
+      databasePoolUtilization: round(pool.utilization),
+      databasePoolWaiting: pool.waiting,
+      // Server-side CPU and memory aren't visible from the pool; they are
+      // scraped from postgres-exporter instead
+      databaseCpuUsage: 0,
+      databaseMemoryUsage: 0,
     };
   }
 
   private async getApiMetrics() {
-    // Calculate real API metrics from recent requests
-    const now = new Date();
-    const oneMinuteAgo = new Date(now.getTime() - 60 * 1000);
-
     try {
-      // Mock API metrics - in real implementation, these would come from request logging
+      // Requests over the last minute, measured by RequestMetricsService
+      const requests = this.requestMetricsService.getWindowStats();
+      const errorRate = round(requests.errorRate);
+
       return {
-        averageResponseTime: Math.random() * 300 + 100, // 100-400ms
-        requestsPerSecond: Math.random() * 100 + 50, // 50-150 RPS
-        errorRate: Math.random() * 3, // 0-3%
-        successRate: 100 - Math.random() * 3, // 97-100%
-        p95ResponseTime: Math.random() * 500 + 200, // 200-700ms
-        p99ResponseTime: Math.random() * 1000 + 500, // 500-1500ms
+        averageResponseTime: round(requests.mean),
+        requestsPerSecond: round(requests.requestsPerSecond),
+        errorRate,
+        successRate: requests.count ? round(100 - errorRate) : 100,
+        p95ResponseTime: round(requests.p95),
+        p99ResponseTime: round(requests.p99),
       };
     } catch (error) {
       this.logger.error('Failed to get API metrics:', error);
@@ -509,6 +579,7 @@ export class PerformanceMonitoringService {
       memoryUsage: Math.random() * 50 + 30, // 30-80%
       diskUsage: Math.random() * 40 + 40, // 40-80%
       networkLatency: Math.random() * 50 + 10, // 10-60ms
+      eventLoopLagP99: round(this.eventLoopDelay.percentile(99) / 1e6),
       uptime: 99.5 + Math.random() * 0.5, // 99.5-100%
     };
   }
@@ -580,3 +651,7 @@ export class PerformanceMonitoringService {
     };
   }
 }
+
+function round(value: number): number {
+  return Math.round(value * 100) / 100;
+}
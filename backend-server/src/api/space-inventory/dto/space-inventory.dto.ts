@@ -88,6 +88,7 @@ export enum ExportStatus {
   COMPLETED = 'completed',
   FAILED = 'failed',
   EXPIRED = 'expired',
+  CANCELLED = 'cancelled',
 }
 
 export enum BulkOperationType {
@@ -1230,6 +1231,27 @@ export class PricingCalculationResponseDto {
   breakdown: Record<string, any>;
 }
 
+export class BatchCalculatePricingDto {
+  @ApiProperty({
+    description: 'Pricing calculations to run',
+    type: [CalculatePricingDto],
+  })
+  @IsArray()
+  @ArrayMinSize(1)
+  @ArrayMaxSize(100)
+  @ValidateNested({ each: true })
+  @Type(() => CalculatePricingDto)
+  items: CalculatePricingDto[];
+}
+
+export class BatchPricingCalculationResponseDto {
+  @ApiProperty({
+    description: 'Pricing results, in request order',
+    type: [PricingCalculationResponseDto],
+  })
+  results: PricingCalculationResponseDto[];
+}
+
 // Analytics DTOs
 export class InventoryAnalyticsDto {
   @ApiPropertyOptional({ description: 'Start date for analytics' })
@@ -0,0 +1,158 @@
+import { NotFoundException } from '@nestjs/common';
+import { Test, TestingModule } from '@nestjs/testing';
+import { getRepositoryToken } from '@nestjs/typeorm';
+import { SpacePackageEntity } from '../space/entities/space-inventory.entity';
+import { DiscountType } from './dto/space-inventory.dto';
+import { ExtrasEntity } from './entities/space-inventory.entity';
+import { PricingEngineService } from './pricing-engine.service';
+
+describe('PricingEngineService', () => {
+  let service: PricingEngineService;
+
+  const DAY = 24 * 60 * 60 * 1000;
+
+  const rule = (overrides: Record<string, any>) => ({
+    discountType: DiscountType.PERCENTAGE,
+    discountValue: '10.00',
+    minQuantity: null,
+    maxQuantity: null,
+    minDuration: null,
+    validFrom: null,
+    validUntil: null,
+    isActive: true,
+    ...overrides,
+  });
+
+  const spacePackage = (id: string, pricingRules: any[]) => ({
+    id,
+    name: `Package ${id}`,
+    pricingRules,
+    calculatePrice: jest.fn().mockReturnValue(100),
+  });
+
+  const mockSpacePackageRepository = { find: jest.fn() };
+  const mockExtrasRepository = { find: jest.fn() };
+
+  beforeEach(async () => {
+    const module: TestingModule = await Test.createTestingModule({
+      providers: [
+        PricingEngineService,
+        {
+          provide: getRepositoryToken(SpacePackageEntity),
+          useValue: mockSpacePackageRepository,
+        },
+        {
+          provide: getRepositoryToken(ExtrasEntity),
+          useValue: mockExtrasRepository,
+        },
+      ],
+    }).compile();
+
+    service = module.get<PricingEngineService>(PricingEngineService);
+  });
+
+  afterEach(() => {
+    jest.clearAllMocks();
+  });
+
+  describe('quote', () => {
+    it('should apply rules by validity window and quantity threshold', async () => {
+      const now = Date.now();
+      mockSpacePackageRepository.find.mockResolvedValue([
+        spacePackage('package-1', [
+          rule({ discountValue: '10.00' }),
+          rule({ discountValue: '20.00', minQuantity: 5 }),
+          rule({
+            discountType: DiscountType.FIXED_AMOUNT,
+            discountValue: '15.00',
+            validFrom: new Date(now - DAY),
+            validUntil: new Date(now + 7 * DAY),
+          }),
+          rule({ discountValue: '50.00', isActive: false }),
+        ]),
+      ]);
+
+      const inWindow = await service.quote({
+        spacePackageId: 'package-1',
+        quantity: 2,
+        duration: 4,
+      });
+      const afterWindow = await service.quote({
+        spacePackageId: 'package-1',
+        quantity: 5,
+        duration: 4,
+        startDate: new Date(now + 30 * DAY),
+      });
+
+      expect(inWindow.discountAmount).toBe(25);
+      expect(inWindow.totalPrice).toBe(75);
+      expect(afterWindow.discountAmount).toBe(30);
+      expect(mockSpacePackageRepository.find).toHaveBeenCalledTimes(1);
+    });
+
+    it('should recompile a package after a pricing change', async () => {
+      mockSpacePackageRepository.find.mockResolvedValueOnce([
+        spacePackage('package-1', []),
+      ]);
+      await service.quote({
+        spacePackageId: 'package-1',
+        quantity: 1,
+        duration: 1,
+      });
+
+      service.handlePricingChanged({ spacePackageId: 'package-1' });
+      mockSpacePackageRepository.find.mockResolvedValueOnce([
+        spacePackage('package-1', [rule({ discountValue: '50.00' })]),
+      ]);
+
+      const result = await service.quote({
+        spacePackageId: 'package-1',
+        quantity: 1,
+        duration: 1,
+      });
+
+      expect(result.discountAmount).toBe(50);
+      expect(mockSpacePackageRepository.find).toHaveBeenCalledTimes(2);
+    });
+
+    it('should throw NotFoundException when package not found', async () => {
+      mockSpacePackageRepository.find.mockResolvedValue([]);
+
+      await expect(
+        service.quote({ spacePackageId: 'missing', quantity: 1, duration: 1 }),
+      ).rejects.toThrow(NotFoundException);
+    });
+  });
+
+  describe('quoteBatch', () => {
+    it('should load every package and extra once for the whole batch', async () => {
+      mockSpacePackageRepository.find.mockResolvedValue([
+        spacePackage('package-1', []),
+        spacePackage('package-2', [rule({ minDuration: 8 })]),
+      ]);
+      mockExtrasRepository.find.mockResolvedValue([
+        {
+          id: 'extras-1',
+          name: 'Parking',
+          pricingRules: [],
+          calculatePrice: jest.fn().mockReturnValue(20),
+        },
+      ]);
+
+      const results = await service.quoteBatch([
+        { spacePackageId: 'package-1', quantity: 1, duration: 2 },
+        { spacePackageId: 'package-2', quantity: 1, duration: 2 },
+        {
+          spacePackageId: 'package-2',
+          extrasIds: ['extras-1'],
+          quantity: 1,
+          duration: 8,
+        },
+      ]);
+
+      expect(results.map((r) => r.totalPrice)).toEqual([100, 100, 110]);
+      expect(mockSpacePackageRepository.find).toHaveBeenCalledTimes(1);
+      expect(mockExtrasRepository.find).toHaveBeenCalledTimes(1);
+    });
+  });
+});
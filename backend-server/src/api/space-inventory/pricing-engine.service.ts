@@ -0,0 +1,392 @@
+import { Injectable, NotFoundException } from '@nestjs/common';
+import { OnEvent } from '@nestjs/event-emitter';
+import { InjectRepository } from '@nestjs/typeorm';
+import { In, Repository } from 'typeorm';
+import { SpacePackageEntity } from '../space/entities/space-inventory.entity';
+import {
+  DiscountType,
+  PricingCalculationResponseDto,
+} from './dto/space-inventory.dto';
+import {
+  ExtrasEntity,
+  PricingRuleEntity,
+} from './entities/space-inventory.entity';
+
+export interface PricingQuoteRequest {
+  spacePackageId?: string;
+  extrasIds?: string[];
+  quantity: number;
+  duration: number;
+  startDate?: string | Date;
+}
+
+/**
+ * Emitted as `pricing.changed` whenever a package, extra or one of their
+ * pricing rules is written. Omit both ids to drop every compiled evaluator.
+ */
+export interface PricingChangedEvent {
+  spacePackageId?: string;
+  extrasId?: string;
+}
+
+type PricedItemType = 'space_package' | 'extras';
+
+interface CompiledRule {
+  discountType: DiscountType;
+  discountValue: number;
+  /** 0 when the rule has no lower bound */
+  minQuantity: number;
+  maxQuantity: number | null;
+  minDuration: number | null;
+}
+
+interface RuleWindow {
+  /** Window start in epoch ms; the window ends where the next one starts */
+  start: number;
+  /** Rules valid throughout the window, sorted by minQuantity */
+  rules: CompiledRule[];
+}
+
+interface CompiledPricing {
+  type: PricedItemType;
+  id: string;
+  name: string;
+  basePrice: (quantity: number, duration: number) => number;
+  /** Sorted by start; the first window starts at -Infinity */
+  windows: RuleWindow[];
+  expiresAt: number;
+}
+
+const CACHE_TTL_MS = 5 * 60 * 1000;
+const CACHE_MAX_ITEMS = 10000;
+
+/**
+ * Quotes space packages and extras from compiled pricing rules.
+ *
+ * Each package or extra is compiled once into validity windows, split at
+ * every rule's validFrom/validUntil, holding the active rules sorted by
+ * minimum quantity. A quote is then a binary search for the booking date
+ * and a scan of the rules whose quantity threshold is met. Compiled
+ * evaluators are dropped on `pricing.changed`; the TTL bounds staleness
+ * for writes made by other instances.
+ */
+@Injectable()
+export class PricingEngineService {
+  private readonly cache = new Map<string, CompiledPricing>();
+  private generation = 0;
+
+  constructor(
+    @InjectRepository(SpacePackageEntity)
+    private readonly spacePackageRepository: Repository<SpacePackageEntity>,
+    @InjectRepository(ExtrasEntity)
+    private readonly extrasRepository: Repository<ExtrasEntity>,
+  ) {}
+
+  async quote(
+    request: PricingQuoteRequest,
+  ): Promise<PricingCalculationResponseDto> {
+    const [result] = await this.quoteBatch([request]);
+    return result;
+  }
+
+  /**
+   * Price many package/extras/duration combinations in one call. Every
+   * package and extra not already compiled is loaded with one query per
+   * type for the whole batch.
+   */
+  async quoteBatch(
+    requests: PricingQuoteRequest[],
+  ): Promise<PricingCalculationResponseDto[]> {
+    const packages = await this.getCompiled(
+      'space_package',
+      requests.map((r) => r.spacePackageId).filter(Boolean),
+    );
+    const extras = await this.getCompiled(
+      'extras',
+      requests.flatMap((r) => r.extrasIds || []),
+    );
+
+    const now = Date.now();
+    return requests.map((request) => {
+      const items: CompiledPricing[] = [];
+      if (request.spacePackageId) {
+        const spacePackage = packages.get(request.spacePackageId);
+        if (!spacePackage) {
+          throw new NotFoundException('Space package not found');
+        }
+        items.push(spacePackage);
+      }
+      for (const extrasId of new Set(request.extrasIds || [])) {
+        // Unknown extras are skipped rather than failing the quote
+        if (extras.has(extrasId)) items.push(extras.get(extrasId));
+      }
+
+      return this.evaluate(items, request, now);
+    });
+  }
+
+  /**
+   * Drop a compiled evaluator, or every evaluator when no id is given
+   */
+  invalidate(event: PricingChangedEvent = {}): void {
+    this.generation++;
+    if (!event.spacePackageId && !event.extrasId) {
+      this.cache.clear();
+      return;
+    }
+    if (event.spacePackageId) {
+      this.cache.delete(this.cacheKey('space_package', event.spacePackageId));
+    }
+    if (event.extrasId) {
+      this.cache.delete(this.cacheKey('extras', event.extrasId));
+    }
+  }
+
+  @OnEvent('pricing.changed')
+  handlePricingChanged(event: PricingChangedEvent): void {
+    this.invalidate(event || {});
+  }
+
+  private evaluate(
+    items: CompiledPricing[],
+    request: PricingQuoteRequest,
+    now: number,
+  ): PricingCalculationResponseDto {
+    const { quantity, duration } = request;
+    const bookingTime = request.startDate
+      ? new Date(request.startDate).getTime()
+      : now;
+
+    let totalPrice = 0;
+    let totalDiscount = 0;
+    const breakdown = [];
+
+    for (const item of items) {
+      const basePrice = item.basePrice(quantity, duration);
+      let discount = 0;
+
+      for (const rule of this.applicableRules(item, quantity, duration, [
+        bookingTime,
+        now,
+      ])) {
+        switch (rule.discountType) {
+          case DiscountType.PERCENTAGE:
+            discount += (basePrice * rule.discountValue) / 100;
+            break;
+          case DiscountType.FIXED_AMOUNT:
+            discount += rule.discountValue;
+            break;
+        }
+      }
+
+      const finalPrice = Math.max(0, basePrice - discount);
+      totalPrice += finalPrice;
+      totalDiscount += discount;
+
+      breakdown.push({
+        type: item.type,
+        id: item.id,
+        name: item.name,
+        basePrice,
+        discount,
+        finalPrice,
+        quantity,
+        duration,
+      });
+    }
+
+    return {
+      basePrice: totalPrice - totalDiscount,
+      extrasPrice: 0, // Calculate from breakdown if needed
+      subtotal: totalPrice - totalDiscount,
+      discountAmount: totalDiscount,
+      taxAmount: 0, // Calculate tax if needed
+      totalPrice: totalPrice,
+      appliedRules: [], // Map from applicable rules if needed
+      breakdown,
+    };
+  }
+
+  /**
+   * Rules valid at every given time whose quantity and duration thresholds
+   * are met. Rules must be valid both at the booking date and now, as with
+   * PricingRuleEntity.isApplicable.
+   */
+  private applicableRules(
+    item: CompiledPricing,
+    quantity: number,
+    duration: number,
+    times: number[],
+  ): CompiledRule[] {
+    const [first, ...others] = times.map((time) =>
+      this.findWindow(item.windows, time),
+    );
+    const candidates = others.reduce<CompiledRule[]>(
+      (rules, window) => rules.filter((rule) => window.rules.includes(rule)),
+      first.rules,
+    );
+
+    const applicable: CompiledRule[] = [];
+    for (const rule of candidates) {
+      // Sorted by minQuantity, so nothing past here qualifies
+      if (rule.minQuantity > quantity) break;
+      if (rule.maxQuantity !== null && quantity > rule.maxQuantity) continue;
+      if (
+        rule.minDuration !== null &&
+        duration &&
+        duration < rule.minDuration
+      ) {
+        continue;
+      }
+      applicable.push(rule);
+    }
+    return applicable;
+  }
+
+  private findWindow(windows: RuleWindow[], time: number): RuleWindow {
+    let low = 0;
+    let high = windows.length - 1;
+    while (low < high) {
+      const mid = (low + high + 1) >>> 1;
+      if (windows[mid].start <= time) {
+        low = mid;
+      } else {
+        high = mid - 1;
+      }
+    }
+    return windows[low];
+  }
+
+  private async getCompiled(
+    type: PricedItemType,
+    ids: string[],
+  ): Promise<Map<string, CompiledPricing>> {
+    const now = Date.now();
+    const result = new Map<string, CompiledPricing>();
+    const missing: string[] = [];
+
+    for (const id of new Set(ids)) {
+      const cached = this.cache.get(this.cacheKey(type, id));
+      if (cached && cached.expiresAt > now) {
+        result.set(id, cached);
+      } else {
+        missing.push(id);
+      }
+    }
+
+    if (missing.length > 0) {
+      const generation = this.generation;
+      const compiled = await this.load(type, missing);
+
+      for (const pricing of compiled) {
+        result.set(pricing.id, pricing);
+        // An invalidation during the load may have made this data stale
+        if (generation === this.generation) {
+          this.store(this.cacheKey(type, pricing.id), pricing);
+        }
+      }
+    }
+
+    return result;
+  }
+
+  /**
+   * Load and compile packages or extras with their pricing rules. Base
+   * prices still come from the entities' own calculatePrice.
+   */
+  private async load(
+    type: PricedItemType,
+    ids: string[],
+  ): Promise<CompiledPricing[]> {
+    if (type === 'space_package') {
+      const packages = await this.spacePackageRepository.find({
+        where: { id: In(ids) },
+        relations: ['pricingRules'],
+      });
+      return packages.map((spacePackage) =>
+        this.compile(
+          type,
+          spacePackage,
+          spacePackage.pricingRules,
+          (quantity, duration) =>
+            spacePackage.calculatePrice(duration, quantity),
+        ),
+      );
+    }
+
+    const extras = await this.extrasRepository.find({
+      where: { id: In(ids) },
+      relations: ['pricingRules'],
+    });
+    return extras.map((extra) =>
+      this.compile(type, extra, extra.pricingRules, (quantity, duration) =>
+        extra.calculatePrice(duration, quantity),
+      ),
+    );
+  }
+
+  private compile(
+    type: PricedItemType,
+    item: { id: string; name: string },
+    pricingRules: PricingRuleEntity[],
+    basePrice: CompiledPricing['basePrice'],
+  ): CompiledPricing {
+    const rules = (pricingRules || [])
+      .filter((rule) => rule.isActive)
+      .map((rule) => ({
+        validFrom: rule.validFrom
+          ? new Date(rule.validFrom).getTime()
+          : -Infinity,
+        // validUntil is inclusive, so the rule stops applying 1ms later
+        validTo: rule.validUntil
+          ? new Date(rule.validUntil).getTime() + 1
+          : Infinity,
+        compiled: {
+          discountType: rule.discountType,
+          discountValue: Number(rule.discountValue) || 0,
+          minQuantity: rule.minQuantity || 0,
+          maxQuantity: rule.maxQuantity || null,
+          minDuration: rule.minDuration || null,
+        },
+      }))
+      .sort((a, b) => a.compiled.minQuantity - b.compiled.minQuantity);
+
+    const boundaries = new Set<number>([-Infinity]);
+    for (const rule of rules) {
+      if (Number.isFinite(rule.validFrom)) boundaries.add(rule.validFrom);
+      if (Number.isFinite(rule.validTo)) boundaries.add(rule.validTo);
+    }
+
+    const windows = [...boundaries]
+      .sort((a, b) => a - b)
+      .map((start) => ({
+        start,
+        rules: rules
+          .filter((rule) => rule.validFrom <= start && start < rule.validTo)
+          .map((rule) => rule.compiled),
+      }));
+
+    return {
+      type,
+      id: item.id,
+      name: item.name,
+      basePrice,
+      windows,
+      expiresAt: Date.now() + CACHE_TTL_MS,
+    };
+  }
+
+  private store(key: string, pricing: CompiledPricing): void {
+    this.cache.delete(key);
+    this.cache.set(key, pricing);
+
+    if (this.cache.size > CACHE_MAX_ITEMS) {
+      // Map iteration order is insertion order, so this is the oldest entry
+      this.cache.delete(this.cache.keys().next().value);
+    }
+  }
+
+  private cacheKey(type: PricedItemType, id: string): string {
+    return `${type}:${id}`;
+  }
+}
@@ -8,10 +8,12 @@ import {
   Get,
   HttpStatus,
   Param,
+  ParseUUIDPipe,
   Post,
   Put,
   Query,
   Request,
+  StreamableFile,
   UseGuards,
   UsePipes,
   ValidationPipe,
@@ -27,6 +29,8 @@ import {
 } from '@nestjs/swagger';
 import { ParseCoworsIdPipe } from '../../common/pipes/parse-cowors-id.pipe';
 import {
+  BatchCalculatePricingDto,
+  BatchPricingCalculationResponseDto,
   BulkInventoryOperationDto,
   BulkOperationResponseDto,
   CalculatePricingDto,
@@ -536,6 +540,23 @@ export class SpaceInventoryController {
     return this.spaceInventoryService.calculatePricing(calculationDto);
   }
 
+  @Post('calculate-pricing/batch')
+  @Roles('admin', 'manager', 'staff')
+  @ApiOperation({
+    summary: 'Calculate pricing for many packages and durations at once',
+  })
+  @ApiResponse({
+    status: HttpStatus.OK,
+    description: 'Pricing calculated successfully',
+    type: BatchPricingCalculationResponseDto,
+  })
+  @UsePipes(new ValidationPipe({ transform: true }))
+  async calculatePricingBatch(
+    @Body() batchDto: BatchCalculatePricingDto,
+  ): Promise<BatchPricingCalculationResponseDto> {
+    return this.spaceInventoryService.calculatePricingBatch(batchDto);
+  }
+
   // Analytics and Reporting
   @Get('analytics')
   @Roles('admin', 'manager')
@@ -599,6 +620,41 @@ export class SpaceInventoryController {
     return this.spaceInventoryService.getExportStatus(exportId);
   }
 
+  @Get('exports/:exportId/download')
+  @Roles('admin', 'manager')
+  @ApiOperation({ summary: 'Download a completed export' })
+  @ApiParam({ name: 'exportId', description: 'Export ID' })
+  @ApiResponse({
+    status: HttpStatus.OK,
+    description: 'Export file streamed successfully',
+  })
+  async downloadExport(
+    @Param('exportId', ParseUUIDPipe) exportId: string,
+  ): Promise<StreamableFile> {
+    const download =
+      await this.spaceInventoryService.openExportDownload(exportId);
+    return new StreamableFile(download.stream, {
+      type: download.contentType,
+      disposition: `attachment; filename="${download.fileName}"`,
+      length: download.fileSize,
+    });
+  }
+
+  @Delete('exports/:exportId')
+  @Roles('admin', 'manager')
+  @ApiOperation({ summary: 'Cancel a pending or running export' })
+  @ApiParam({ name: 'exportId', description: 'Export ID' })
+  @ApiResponse({
+    status: HttpStatus.OK,
+    description: 'Export cancelled successfully',
+    type: ExportResponseDto,
+  })
+  async cancelExport(
+    @Param('exportId', ParseUUIDPipe) exportId: string,
+  ): Promise<ExportResponseDto> {
+    return this.spaceInventoryService.cancelExport(exportId);
+  }
+
   // Settings Management
   @Get('settings')
   @Roles('admin', 'manager')
@@ -1,5 +1,7 @@
+import { AuditModule } from '@/api/audit/audit.module';
 import { UserEntity } from '@/auth/entities/user.entity';
 import { IdGeneratorService } from '@/utils/id-generator.service';
+import { ExportJobModule } from '@/worker/queues/export/export-job.module';
 import { Module } from '@nestjs/common';
 import { TypeOrmModule } from '@nestjs/typeorm';
 import { SpacePackageEntity } from '../space/entities/space-inventory.entity';
@@ -12,6 +14,7 @@ import {
   InventorySettingsEntity,
   PricingRuleEntity,
 } from './entities/space-inventory.entity';
+import { PricingEngineService } from './pricing-engine.service';
 import { SpaceInventoryController } from './space-inventory.controller';
 import { SpaceInventoryService } from './space-inventory.service';
 
@@ -28,9 +31,11 @@ import { SpaceInventoryService } from './space-inventory.service';
       InventorySettingsEntity,
       UserEntity,
     ]),
+    ExportJobModule,
+    AuditModule,
   ],
   controllers: [SpaceInventoryController],
-  providers: [SpaceInventoryService, IdGeneratorService],
+  providers: [SpaceInventoryService, PricingEngineService, IdGeneratorService],
   exports: [SpaceInventoryService],
 })
 export class SpaceInventoryModule {}
@@ -1,9 +1,16 @@
+import { AuditLogWriterService } from '@/api/audit/services/audit-log-writer.service';
+import { Job } from '@/constants/job.constant';
+import {
+  ExportDownload,
+  ExportJobService,
+} from '@/worker/queues/export/export-job.service';
 import {
   BadRequestException,
   ConflictException,
   Injectable,
   NotFoundException,
 } from '@nestjs/common';
+import { EventEmitter2 } from '@nestjs/event-emitter';
 import { InjectRepository } from '@nestjs/typeorm';
 import {
   Between,
@@ -19,6 +26,8 @@ import {
 } from '../space/entities/space-inventory.entity';
 
 import {
+  BatchCalculatePricingDto,
+  BatchPricingCalculationResponseDto,
   BulkInventoryOperationDto,
   BulkOperationResponseDto,
   BulkOperationType,
@@ -62,6 +71,12 @@ import {
   InventorySettingsEntity,
   PricingRuleEntity,
 } from './entities/space-inventory.entity';
+import {
+  PricingChangedEvent,
+  PricingEngineService,
+} from './pricing-engine.service';
+
+const ExportJob = Job.Export;
 
 @Injectable()
 export class SpaceInventoryService {
@@ -74,14 +89,16 @@ export class SpaceInventoryService {
     private readonly inventoryRepository: Repository<InventoryEntity>,
     @InjectRepository(PricingRuleEntity)
     private readonly pricingRuleRepository: Repository<PricingRuleEntity>,
-    @InjectRepository(InventoryAuditTrailEntity)
-    private readonly auditTrailRepository: Repository<InventoryAuditTrailEntity>,
     @InjectRepository(InventoryExportEntity)
     private readonly exportRepository: Repository<InventoryExportEntity>,
     @InjectRepository(InventoryReportEntity)
     private readonly reportRepository: Repository<InventoryReportEntity>,
     @InjectRepository(InventorySettingsEntity)
     private readonly settingsRepository: Repository<InventorySettingsEntity>,
+    private readonly exportJobService: ExportJobService,
+    private readonly pricingEngineService: PricingEngineService,
+    private readonly auditLogWriter: AuditLogWriterService,
+    private readonly eventEmitter: EventEmitter2,
   ) {}
 
   // Space Package Management
@@ -249,6 +266,7 @@ export class SpaceInventoryService {
 
     Object.assign(spacePackage, updateDto, { updatedBy: userId });
     const updatedPackage = await this.spacePackageRepository.save(spacePackage);
+    this.emitPricingChanged({ spacePackageId: id });
 
     // Fetch updated package with relations
     const packageWithRelations = await this.spacePackageRepository.findOne({
@@ -283,6 +301,7 @@ export class SpaceInventoryService {
     }
 
     await this.spacePackageRepository.remove(spacePackage);
+    this.emitPricingChanged({ spacePackageId: id });
   }
 
   async activateSpacePackage(
@@ -316,6 +335,7 @@ export class SpaceInventoryService {
     spacePackage.isActive = isActive;
     spacePackage.updatedBy = userId;
     const updatedPackage = await this.spacePackageRepository.save(spacePackage);
+    this.emitPricingChanged({ spacePackageId: id });
 
     // Fetch updated package with relations
     const packageWithRelations = await this.spacePackageRepository.findOne({
@@ -428,6 +448,7 @@ export class SpaceInventoryService {
 
     Object.assign(extras, updateDto, { updatedBy: userId });
     const updatedExtras = await this.extrasRepository.save(extras);
+    this.emitPricingChanged({ extrasId: id });
 
     return this.mapExtrasToResponse(updatedExtras);
   }
@@ -440,6 +461,7 @@ export class SpaceInventoryService {
     }
 
     await this.extrasRepository.remove(extras);
+    this.emitPricingChanged({ extrasId: id });
   }
 
   // Inventory Management
@@ -739,6 +761,7 @@ export class SpaceInventoryService {
     });
 
     const savedRule = await this.pricingRuleRepository.save(pricingRule);
+    this.emitPricingChanged(savedRule);
     return this.mapPricingRuleToResponse(savedRule);
   }
 
@@ -778,8 +801,11 @@ export class SpaceInventoryService {
       throw new NotFoundException('Pricing rule not found');
     }
 
+    // The rule may move to another package or extra
+    this.emitPricingChanged(pricingRule);
     Object.assign(pricingRule, updateDto, { updatedBy: userId });
     const updatedRule = await this.pricingRuleRepository.save(pricingRule);
+    this.emitPricingChanged(updatedRule);
 
     return this.mapPricingRuleToResponse(updatedRule);
   }
@@ -793,109 +819,22 @@ export class SpaceInventoryService {
       throw new NotFoundException('Pricing rule not found');
     }
 
+    const { spacePackageId, extrasId } = pricingRule;
     await this.pricingRuleRepository.remove(pricingRule);
+    this.emitPricingChanged({ spacePackageId, extrasId });
   }
 
   async calculatePricing(
     calculationDto: CalculatePricingDto,
   ): Promise<PricingCalculationResponseDto> {
-    const { spacePackageId, extrasIds, quantity, duration, startDate } =
-      calculationDto;
-    const bookingDate = startDate ? new Date(startDate) : new Date();
-
-    let totalPrice = 0;
-    let totalDiscount = 0;
-    const breakdown = [];
-
-    // Calculate space package price
-    if (spacePackageId) {
-      const spacePackage = await this.spacePackageRepository.findOne({
-        where: { id: spacePackageId },
-        relations: ['pricingRules'],
-      });
-
-      if (!spacePackage) {
-        throw new NotFoundException('Space package not found');
-      }
-
-      const basePrice = spacePackage.calculatePrice(duration, quantity);
-      let packageDiscount = 0;
-
-      // Apply pricing rules
-      const applicableRules = spacePackage.pricingRules.filter(
-        (rule) =>
-          rule.isApplicable(quantity, duration) &&
-          rule.isValidForDate(bookingDate),
-      );
-
-      for (const rule of applicableRules) {
-        packageDiscount += rule.calculateDiscount(basePrice, quantity);
-      }
-
-      const finalPrice = Math.max(0, basePrice - packageDiscount);
-      totalPrice += finalPrice;
-      totalDiscount += packageDiscount;
-
-      breakdown.push({
-        type: 'space_package',
-        id: spacePackage.id,
-        name: spacePackage.name,
-        basePrice,
-        discount: packageDiscount,
-        finalPrice,
-        quantity,
-        duration,
-      });
-    }
-
-    // Calculate extras prices
-    if (extrasIds && extrasIds.length > 0) {
-      const extras = await this.extrasRepository.find({
-        where: { id: In(extrasIds) },
-        relations: ['pricingRules'],
-      });
-
-      for (const extra of extras) {
-        const basePrice = extra.calculatePrice(duration, quantity);
-        let extrasDiscount = 0;
-
-        // Apply pricing rules
-        const applicableRules = extra.pricingRules.filter(
-          (rule) =>
-            rule.isApplicable(quantity, duration) &&
-            rule.isValidForDate(bookingDate),
-        );
-
-        for (const rule of applicableRules) {
-          extrasDiscount += rule.calculateDiscount(basePrice, quantity);
-        }
-
-        const finalPrice = Math.max(0, basePrice - extrasDiscount);
-        totalPrice += finalPrice;
-        totalDiscount += extrasDiscount;
-
-        breakdown.push({
-          type: 'extras',
-          id: extra.id,
-          name: extra.name,
-          basePrice,
-          discount: extrasDiscount,
-          finalPrice,
-          quantity,
-          duration,
-        });
-      }
-    }
+    return this.pricingEngineService.quote(calculationDto);
+  }
 
+  async calculatePricingBatch(
+    batchDto: BatchCalculatePricingDto,
+  ): Promise<BatchPricingCalculationResponseDto> {
     return {
-      basePrice: totalPrice - totalDiscount,
-      extrasPrice: 0, // Calculate from breakdown if needed
-      subtotal: totalPrice - totalDiscount,
-      discountAmount: totalDiscount,
-      taxAmount: 0, // Calculate tax if needed
-      totalPrice: totalPrice,
-      appliedRules: [], // Map from applicable rules if needed
-      breakdown,
+      results: await this.pricingEngineService.quoteBatch(batchDto.items),
     };
   }
 
@@ -1006,6 +945,15 @@ export class SpaceInventoryService {
     exportDto: ExportInventoryDto,
     userId: string,
   ): Promise<ExportResponseDto> {
+    if (
+      exportDto.format !== ExportFormat.CSV &&
+      exportDto.format !== ExportFormat.EXCEL
+    ) {
+      throw new BadRequestException(
+        'Only CSV and Excel inventory exports are supported',
+      );
+    }
+
     const exportEntity = this.exportRepository.create({
       format: exportDto.format,
       filters: exportDto.filters,
@@ -1016,27 +964,14 @@ export class SpaceInventoryService {
 
     const savedExport = await this.exportRepository.save(exportEntity);
 
-    // In a real implementation, this would trigger an async job
-    // For now, we'll simulate the export process
-    setTimeout(async () => {
-      try {
-        // Simulate export processing
-        const downloadUrl = await this.processExport(savedExport.id, exportDto);
-
-        await this.exportRepository.update(savedExport.id, {
-          status: ExportStatus.COMPLETED,
-          downloadUrl,
-          completedAt: new Date(),
-          recordCount: 100, // This would be the actual count
-          fileSize: 1024 * 1024, // This would be the actual file size
-        });
-      } catch (error) {
-        await this.exportRepository.update(savedExport.id, {
-          status: ExportStatus.FAILED,
-          errorMessage: error.message,
-        });
-      }
-    }, 1000);
+    await this.exportJobService.enqueue(ExportJob.Inventory, {
+      exportId: savedExport.id,
+      format: exportDto.format === ExportFormat.EXCEL ? 'xlsx' : 'csv',
+      requestedBy: userId,
+      filters: exportDto.filters,
+      fields: exportDto.fields,
+      includeRelated: exportDto.includeRelated || false,
+    });
 
     return {
       exportId: savedExport.id,
@@ -1085,6 +1020,52 @@ export class SpaceInventoryService {
     return exportEntity.downloadUrl;
   }
 
+  async openExportDownload(exportId: string): Promise<ExportDownload> {
+    const exportEntity = await this.exportRepository.findOne({
+      where: { id: exportId },
+    });
+
+    if (!exportEntity) {
+      throw new NotFoundException('Export not found');
+    }
+
+    const download = exportEntity.canDownload()
+      ? await this.exportJobService.openDownload(exportId)
+      : null;
+    if (!download) {
+      throw new BadRequestException('Export is not available for download');
+    }
+
+    return download;
+  }
+
+  async cancelExport(exportId: string): Promise<ExportResponseDto> {
+    const exportEntity = await this.exportRepository.findOne({
+      where: { id: exportId },
+    });
+
+    if (!exportEntity) {
+      throw new NotFoundException('Export not found');
+    }
+
+    if (
+      exportEntity.status !== ExportStatus.PENDING &&
+      exportEntity.status !== ExportStatus.PROCESSING
+    ) {
+      throw new BadRequestException('Export is no longer running');
+    }
+
+    await this.exportJobService.cancel(exportId);
+    // A running job records the cancellation itself once it stops
+    if (exportEntity.status === ExportStatus.PENDING) {
+      await this.exportRepository.update(exportId, {
+        status: ExportStatus.CANCELLED,
+      });
+    }
+
+    return this.getExportStatus(exportId);
+  }
+
   // Settings Management
   async getInventorySettings(): Promise<InventorySettingsResponseDto> {
     const settings = await this.settingsRepository.findOne({
@@ -1221,6 +1202,15 @@ export class SpaceInventoryService {
   }
 
   // Private Helper Methods
+  /** Drop compiled pricing for a package or extra (see PricingEngineService) */
+  private emitPricingChanged({
+    spacePackageId,
+    extrasId,
+  }: PricingChangedEvent): void {
+    const event: PricingChangedEvent = { spacePackageId, extrasId };
+    this.eventEmitter.emit('pricing.changed', event);
+  }
+
   private async createAuditTrail(
     inventoryId: string,
     action: string,
@@ -1229,25 +1219,17 @@ export class SpaceInventoryService {
     reason: string,
     userId: string,
   ): Promise<void> {
-    const auditTrail = this.auditTrailRepository.create({
-      inventoryId,
-      action,
-      oldValues,
-      newValues,
-      reason,
-      createdBy: userId,
-    });
-
-    await this.auditTrailRepository.save(auditTrail);
-  }
-
-  private async processExport(
-    exportId: string,
-    exportDto: ExportInventoryDto,
-  ): Promise<string> {
-    // This would implement the actual export logic
-    // For now, return a mock URL
-    return `https://example.com/exports/${exportId}.${exportDto.format}`;
+    await this.auditLogWriter.enqueue(
+      InventoryAuditTrailEntity,
+      InventoryAuditTrailEntity.createAuditEntry(
+        inventoryId,
+        action,
+        reason,
+        oldValues,
+        newValues,
+        userId,
+      ),
+    );
   }
 
   private groupInventoryData(
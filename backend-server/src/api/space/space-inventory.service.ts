@@ -7,6 +7,7 @@ import {
   Injectable,
   NotFoundException,
 } from '@nestjs/common';
+import { EventEmitter2 } from '@nestjs/event-emitter';
 import { InjectRepository } from '@nestjs/typeorm';
 import {
   Between,
@@ -28,6 +29,7 @@ import {
   InventorySettingsEntity,
   PricingRuleEntity,
 } from '../space-inventory/entities/space-inventory.entity';
+import { PricingChangedEvent } from '../space-inventory/pricing-engine.service';
 import {
   BulkInventoryOperationDto,
   BulkInventoryOperationType,
@@ -82,6 +84,7 @@ export class SpaceInventoryService {
     private userRepository: Repository<UserEntity>,
     @InjectRepository(BookingEntity)
     private bookingRepository: Repository<BookingEntity>,
+    private eventEmitter: EventEmitter2,
   ) {}
 
   // Space Package Management
@@ -134,6 +137,7 @@ export class SpaceInventoryService {
     Object.assign(spacePackage, updateDto, { updatedBy: userId });
 
     const savedPackage = await this.spacePackageRepository.save(spacePackage);
+    this.emitPricingChanged({ spacePackageId: packageId });
 
     await this.createAuditTrail(
       spacePackage.spaceOptionId,
@@ -235,6 +239,7 @@ export class SpaceInventoryService {
     );
 
     await this.spacePackageRepository.remove(spacePackage);
+    this.emitPricingChanged({ spacePackageId: packageId });
   }
 
   // Space Extras Management
@@ -504,6 +509,7 @@ export class SpaceInventoryService {
 
     const savedConfig: PricingRuleEntity =
       await this.pricingRuleRepository.save(pricingConfig);
+    this.emitPricingChanged(savedConfig);
 
     await this.createAuditTrail(
       createDto.spaceId,
@@ -551,6 +557,8 @@ export class SpaceInventoryService {
 
     const savedConfig: PricingRuleEntity =
       await this.pricingRuleRepository.save(pricingConfig);
+    this.emitPricingChanged(oldValues);
+    this.emitPricingChanged(savedConfig);
 
     await this.createAuditTrail(
       pricingConfig.spacePackageId || 'unknown',
@@ -652,7 +660,9 @@ export class SpaceInventoryService {
       userId,
     );
 
+    const { spacePackageId, extrasId } = pricingRule;
     await this.pricingRuleRepository.remove(pricingRule);
+    this.emitPricingChanged({ spacePackageId, extrasId });
   }
 
   // Bulk Operations
@@ -1159,6 +1169,15 @@ export class SpaceInventoryService {
   }
 
   // Private Helper Methods
+  /** Drop compiled pricing for a package or extra (see PricingEngineService) */
+  private emitPricingChanged({
+    spacePackageId,
+    extrasId,
+  }: PricingChangedEvent): void {
+    const event: PricingChangedEvent = { spacePackageId, extrasId };
+    this.eventEmitter.emit('pricing.changed', event);
+  }
+
   private async createAuditTrail(
     spaceId: string,
     action: string,
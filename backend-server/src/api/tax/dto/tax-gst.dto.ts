@@ -446,6 +446,65 @@ export class UpdateTaxCalculationDto {
   calculationParams?: Record<string, any>;
 }
 
+export class TaxBatchLineItemDto {
+  @ApiPropertyOptional({ description: 'Caller reference (invoice line, etc.)' })
+  @IsOptional()
+  @IsUUID()
+  referenceId?: string;
+
+  @ApiProperty({ description: 'Base amount for tax calculation' })
+  @IsNumber({ maxDecimalPlaces: 2 })
+  @Min(0)
+  amount: number;
+
+  @ApiPropertyOptional({
+    description: 'Tax type',
+    enum: TaxType,
+    default: TaxType.GST,
+  })
+  @IsOptional()
+  @IsEnum(TaxType)
+  taxType?: TaxType;
+
+  @ApiPropertyOptional({ description: 'HSN/SAC code' })
+  @IsOptional()
+  @IsString()
+  hsnSacCode?: string;
+
+  @ApiPropertyOptional({ description: 'State code for tax calculation' })
+  @IsOptional()
+  @IsString()
+  stateCode?: string;
+
+  @ApiPropertyOptional({ description: 'Transaction date (defaults to now)' })
+  @IsOptional()
+  @IsDateString()
+  transactionDate?: string;
+}
+
+export class CalculateTaxBatchDto {
+  @ApiProperty({ description: 'Line items', type: [TaxBatchLineItemDto] })
+  @IsArray()
+  @ArrayMinSize(1)
+  @ArrayMaxSize(10000)
+  @ValidateNested({ each: true })
+  @Type(() => TaxBatchLineItemDto)
+  items: TaxBatchLineItemDto[];
+
+  @ApiPropertyOptional({
+    description: 'Store a tax calculation record for each computed item',
+    default: false,
+  })
+  @IsOptional()
+  @IsBoolean()
+  persist?: boolean = false;
+
+  @ApiPropertyOptional({ description: 'Reference type for stored records' })
+  @IsOptional()
+  @IsString()
+  referenceType?: string;
+}
+
 export class GetTaxCalculationsDto extends PaginationDto {
   @ApiPropertyOptional({ description: 'Search term' })
   @IsOptional()
@@ -1080,6 +1139,61 @@ export class TaxCalculationResponseDto {
   createdBy: string;
 }
 
+export class TaxBatchLineResultDto {
+  @ApiPropertyOptional({ description: 'Caller reference' })
+  referenceId?: string;
+
+  @ApiProperty({ description: 'Base amount' })
+  baseAmount: number;
+
+  @ApiProperty({ description: 'Tax type', enum: TaxType })
+  taxType: TaxType;
+
+  @ApiProperty({ description: 'Effective tax rate applied' })
+  taxRate: number;
+
+  @ApiProperty({ description: 'Tax amount calculated' })
+  taxAmount: number;
+
+  @ApiProperty({ description: 'Total amount including tax' })
+  totalAmount: number;
+
+  @ApiProperty({ description: 'Calculation breakdown' })
+  calculationBreakdown: Record<string, number>;
+
+  @ApiProperty({ description: 'Applied tax rules' })
+  appliedRules: {
+    ruleId: string;
+    ruleName: string;
+    taxType: TaxType;
+    taxRate: number;
+    taxAmount: number;
+  }[];
+
+  @ApiPropertyOptional({ description: 'Error when no rule applies' })
+  error?: string;
+}
+
+export class TaxBatchCalculationResponseDto {
+  @ApiProperty({
+    description: 'Results, in request order',
+    type: [TaxBatchLineResultDto],
+  })
+  results: TaxBatchLineResultDto[];
+
+  @ApiProperty({ description: 'Sum of base amounts of computed items' })
+  totalBaseAmount: number;
+
+  @ApiProperty({ description: 'Sum of tax amounts of computed items' })
+  totalTaxAmount: number;
+
+  @ApiProperty({ description: 'Number of items computed' })
+  successCount: number;
+
+  @ApiProperty({ description: 'Number of items without an applicable rule' })
+  failureCount: number;
+}
+
 export class TaxReturnResponseDto {
   @ApiProperty({ description: 'Tax return ID' })
   id: string;
@@ -0,0 +1,88 @@
+import { Test, TestingModule } from '@nestjs/testing';
+import { getRepositoryToken } from '@nestjs/typeorm';
+import { TaxType } from '../dto/tax-gst.dto';
+import { TaxRuleEntity } from '../entities/tax-gst.entity';
+import { TaxRuleIndexService } from './tax-rule-index.service';
+
+describe('TaxRuleIndexService', () => {
+  let service: TaxRuleIndexService;
+
+  const rule = (id: string, overrides: Partial<TaxRuleEntity> = {}) =>
+    ({
+      id,
+      name: id,
+      type: TaxType.GST,
+      rate: 18,
+      hsnSacCodes: null,
+      applicableStates: null,
+      effectiveFrom: null,
+      effectiveTo: null,
+      ...overrides,
+    }) as TaxRuleEntity;
+
+  const mockTaxRuleRepository = { find: jest.fn() };
+
+  beforeEach(async () => {
+    const module: TestingModule = await Test.createTestingModule({
+      providers: [
+        TaxRuleIndexService,
+        {
+          provide: getRepositoryToken(TaxRuleEntity),
+          useValue: mockTaxRuleRepository,
+        },
+      ],
+    }).compile();
+
+    service = module.get<TaxRuleIndexService>(TaxRuleIndexService);
+  });
+
+  afterEach(() => {
+    jest.clearAllMocks();
+  });
+
+  describe('findApplicableRules', () => {
+    it('should match by code, state and effective date from one load', async () => {
+      mockTaxRuleRepository.find.mockResolvedValue([
+        rule('all'),
+        rule('sac-998', { hsnSacCodes: ['998'] }),
+        rule('karnataka', { applicableStates: ['KA'] }),
+        rule('old-rate', {
+          effectiveTo: new Date('2024-03-31T23:59:59.999Z'),
+        }),
+        rule('tds', { type: TaxType.TDS }),
+      ]);
+
+      const current = await service.findApplicableRules(
+        TaxType.GST,
+        '998',
+        'MH',
+        new Date('2025-01-01'),
+      );
+      const past = await service.findApplicableRules(
+        TaxType.GST,
+        '123',
+        'KA',
+        new Date('2024-03-31T23:59:59.999Z'),
+      );
+
+      expect(current.map((r) => r.id)).toEqual(['all', 'sac-998']);
+      expect(past.map((r) => r.id)).toEqual(['all', 'karnataka', 'old-rate']);
+      expect(mockTaxRuleRepository.find).toHaveBeenCalledTimes(1);
+    });
+
+    it('should reload after invalidation', async () => {
+      mockTaxRuleRepository.find.mockResolvedValueOnce([]);
+      expect(await service.findApplicableRules(TaxType.TCS)).toEqual([]);
+
+      service.handleTaxConfigEvent({ configType: 'tax_rule' });
+      mockTaxRuleRepository.find.mockResolvedValueOnce([
+        rule('tcs', { type: TaxType.TCS, rate: 1 }),
+      ]);
+
+      const rules = await service.findApplicableRules(TaxType.TCS);
+
+      expect(rules.map((r) => r.id)).toEqual(['tcs']);
+      expect(mockTaxRuleRepository.find).toHaveBeenCalledTimes(2);
+    });
+  });
+});
@@ -0,0 +1,222 @@
+import { Injectable, Logger } from '@nestjs/common';
+import { OnEvent } from '@nestjs/event-emitter';
+import { InjectRepository } from '@nestjs/typeorm';
+import { Repository } from 'typeorm';
+import { TaxStatus, TaxType } from '../dto/tax-gst.dto';
+import { TaxRuleEntity } from '../entities/tax-gst.entity';
+
+interface IndexedRule {
+  rule: TaxRuleEntity;
+  hsnSacCodes: Set<string> | null;
+  applicableStates: Set<string> | null;
+  effectiveFrom: number;
+  /** Exclusive end; effectiveTo is inclusive in the rule */
+  effectiveTo: number;
+}
+
+interface RuleWindow {
+  /** Window start in epoch ms; the window ends where the next one starts */
+  start: number;
+  rules: TaxRuleEntity[];
+}
+
+interface TaxRuleIndex {
+  byType: Map<TaxType, IndexedRule[]>;
+  /** Effective-date windows per (taxType, HSN/SAC, stateCode), built lazily */
+  windows: Map<string, RuleWindow[]>;
+  expiresAt: number;
+}
+
+const INDEX_TTL_MS = 60000;
+const INDEX_MAX_KEYS = 5000;
+
+/**
+ * In-process index of active tax rules.
+ *
+ * All active rules are read with one query and grouped by tax type. For
+ * each (taxType, HSN/SAC, stateCode) key the matching rules are split into
+ * effective-date windows on first use, so resolving the rules for a line
+ * item is a map lookup and a binary search. Rule writes in this module
+ * and `tax.config.*` events from DynamicTaxConfigService and
+ * TaxManagementService drop the index; the TTL bounds staleness for writes
+ * made by other instances.
+ */
+@Injectable()
+export class TaxRuleIndexService {
+  private readonly logger = new Logger(TaxRuleIndexService.name);
+  private index: TaxRuleIndex | null = null;
+  private loading: Promise<TaxRuleIndex> | null = null;
+  private generation = 0;
+
+  constructor(
+    @InjectRepository(TaxRuleEntity)
+    private readonly taxRuleRepository: Repository<TaxRuleEntity>,
+  ) {}
+
+  /**
+   * Active rules of a type in effect at `at`, matching the HSN/SAC code and
+   * state when given. Rules without codes or states apply everywhere.
+   */
+  async findApplicableRules(
+    taxType: TaxType,
+    hsnSacCode?: string,
+    stateCode?: string,
+    at: Date = new Date(),
+  ): Promise<TaxRuleEntity[]> {
+    const index = await this.getIndex();
+    return this.resolve(index, taxType, hsnSacCode, stateCode, at);
+  }
+
+  /**
+   * Resolver bound to one snapshot of the index, for pricing many line
+   * items without awaiting per item
+   */
+  async getResolver(): Promise<
+    (
+      taxType: TaxType,
+      hsnSacCode?: string,
+      stateCode?: string,
+      at?: Date,
+    ) => TaxRuleEntity[]
+  > {
+    const index = await this.getIndex();
+    return (taxType, hsnSacCode, stateCode, at = new Date()) =>
+      this.resolve(index, taxType, hsnSacCode, stateCode, at);
+  }
+
+  invalidate(): void {
+    this.generation++;
+    this.index = null;
+    this.loading = null;
+  }
+
+  @OnEvent('tax.config.created')
+  @OnEvent('tax.config.updated')
+  @OnEvent('tax.config.deleted')
+  @OnEvent('tax.config.rollback')
+  handleTaxConfigEvent(event: { configType?: string }): void {
+    if (!event?.configType || event.configType === 'tax_rule') {
+      this.invalidate();
+    }
+  }
+
+  private resolve(
+    index: TaxRuleIndex,
+    taxType: TaxType,
+    hsnSacCode: string | undefined,
+    stateCode: string | undefined,
+    at: Date,
+  ): TaxRuleEntity[] {
+    const key = `${taxType}|${hsnSacCode || ''}|${stateCode || ''}`;
+    let windows = index.windows.get(key);
+    if (!windows) {
+      windows = this.buildWindows(
+        (index.byType.get(taxType) || []).filter(
+          (entry) =>
+            (!hsnSacCode ||
+              !entry.hsnSacCodes ||
+              entry.hsnSacCodes.has(hsnSacCode)) &&
+            (!stateCode ||
+              !entry.applicableStates ||
+              entry.applicableStates.has(stateCode)),
+        ),
+      );
+      if (index.windows.size >= INDEX_MAX_KEYS) {
+        // Map iteration order is insertion order, so this is the oldest key
+        index.windows.delete(index.windows.keys().next().value);
+      }
+      index.windows.set(key, windows);
+    }
+
+    const time = at.getTime();
+    let low = 0;
+    let high = windows.length - 1;
+    while (low < high) {
+      const mid = (low + high + 1) >>> 1;
+      if (windows[mid].start <= time) {
+        low = mid;
+      } else {
+        high = mid - 1;
+      }
+    }
+    return windows[low].rules;
+  }
+
+  private buildWindows(entries: IndexedRule[]): RuleWindow[] {
+    const boundaries = new Set<number>([-Infinity]);
+    for (const entry of entries) {
+      if (Number.isFinite(entry.effectiveFrom)) {
+        boundaries.add(entry.effectiveFrom);
+      }
+      if (Number.isFinite(entry.effectiveTo)) {
+        boundaries.add(entry.effectiveTo);
+      }
+    }
+
+    return [...boundaries]
+      .sort((a, b) => a - b)
+      .map((start) => ({
+        start,
+        rules: entries
+          .filter(
+            (entry) => entry.effectiveFrom <= start && start < entry.effectiveTo,
+          )
+          .map((entry) => entry.rule),
+      }));
+  }
+
+  private async getIndex(): Promise<TaxRuleIndex> {
+    if (this.index && this.index.expiresAt > Date.now()) {
+      return this.index;
+    }
+    if (!this.loading) {
+      const generation = this.generation;
+      const loading = this.loadIndex()
+        .then((index) => {
+          // An invalidation during the load may have made this data stale
+          if (generation === this.generation) {
+            this.index = index;
+          }
+          return index;
+        })
+        .finally(() => {
+          if (this.loading === loading) this.loading = null;
+        });
+      this.loading = loading;
+    }
+    return this.loading;
+  }
+
+  private async loadIndex(): Promise<TaxRuleIndex> {
+    const rules = await this.taxRuleRepository.find({
+      where: { status: TaxStatus.ACTIVE },
+      order: { createdAt: 'ASC' },
+    });
+
+    const byType = new Map<TaxType, IndexedRule[]>();
+    for (const rule of rules) {
+      const entries = byType.get(rule.type) || [];
+      entries.push({
+        rule,
+        hsnSacCodes: rule.hsnSacCodes ? new Set(rule.hsnSacCodes) : null,
+        applicableStates: rule.applicableStates
+          ? new Set(rule.applicableStates)
+          : null,
+        effectiveFrom: rule.effectiveFrom
+          ? new Date(rule.effectiveFrom).getTime()
+          : -Infinity,
+        effectiveTo: rule.effectiveTo
+          ? new Date(rule.effectiveTo).getTime() + 1
+          : Infinity,
+      });
+      byType.set(rule.type, entries);
+    }
+
+    this.logger.debug(`Indexed ${rules.length} active tax rules`);
+    return {
+      byType,
+      windows: new Map(),
+      expiresAt: Date.now() + INDEX_TTL_MS,
+    };
+  }
+}
@@ -30,6 +30,7 @@ import { ParseCoworsIdPipe } from '../../common/pipes/parse-cowors-id.pipe';
 import {
   BulkOperationResponseDto,
   BulkTaxOperationDto,
+  CalculateTaxBatchDto,
   ComplianceStatus,
   CreateTaxCalculationDto,
   CreateTaxComplianceDto,
@@ -44,6 +45,7 @@ import {
   ReturnStatus,
   TaxAnalyticsDto,
   TaxAnalyticsResponseDto,
+  TaxBatchCalculationResponseDto,
   TaxCalculationResponseDto,
   TaxComplianceResponseDto,
   TaxReturnResponseDto,
@@ -337,6 +339,22 @@ export class TaxGstController {
     return this.taxGstService.calculateTax(calculateDto);
   }
 
+  @Post('calculations/calculate-batch')
+  // @Roles('admin', 'finance_manager', 'finance_user')
+  @ApiOperation({ summary: 'Calculate tax for many line items in one call' })
+  @ApiResponse({
+    status: HttpStatus.OK,
+    description: 'Tax calculated successfully',
+    type: TaxBatchCalculationResponseDto,
+  })
+  @ApiBody({ type: CalculateTaxBatchDto })
+  async calculateTaxBatch(
+    @Body() batchDto: CalculateTaxBatchDto,
+    @CurrentUserSession() user: any,
+  ): Promise<TaxBatchCalculationResponseDto> {
+    return this.taxGstService.calculateTaxBatch(batchDto, user.id);
+  }
+
   // Tax Return Management
   @Post('returns')
   // @Roles('admin', 'finance_manager')
@@ -12,6 +12,7 @@ import {
   TaxRuleEntity,
   TaxSettingsEntity,
 } from './entities/tax-gst.entity';
+import { TaxRuleIndexService } from './services/tax-rule-index.service';
 import { TaxGstController } from './tax-gst.controller';
 import { TaxGstService } from './tax-gst.service';
 
@@ -31,7 +32,7 @@ import { TaxGstService } from './tax-gst.service';
     ]),
   ],
   controllers: [TaxGstController],
-  providers: [TaxGstService],
+  providers: [TaxGstService, TaxRuleIndexService],
   exports: [TaxGstService],
 })
 export class TaxGstModule {}
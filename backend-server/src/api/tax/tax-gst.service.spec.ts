@@ -0,0 +1,121 @@
+import { UserEntity } from '@/auth/entities/user.entity';
+import { EnhancedTaxService } from '@/common/services/enhanced-tax.service';
+import { FinancialConfigIntegrationService } from '@/common/services/financial-config-integration.service';
+import { BookingEntity } from '@/database/entities/booking.entity';
+import { Test, TestingModule } from '@nestjs/testing';
+import { getRepositoryToken } from '@nestjs/typeorm';
+import { CalculationStatus, TaxType } from './dto/tax-gst.dto';
+import {
+  TaxAuditTrailEntity,
+  TaxCalculationEntity,
+  TaxComplianceEntity,
+  TaxExportEntity,
+  TaxReportEntity,
+  TaxReturnEntity,
+  TaxRuleEntity,
+  TaxSettingsEntity,
+} from './entities/tax-gst.entity';
+import { TaxGstService } from './tax-gst.service';
+import { TaxRuleIndexService } from './services/tax-rule-index.service';
+
+describe('TaxGstService', () => {
+  let service: TaxGstService;
+
+  const UUID_PATTERN =
+    /^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$/;
+
+  const gstRule = {
+    id: 'rule-gst',
+    name: 'GST 18%',
+    type: TaxType.GST,
+    rate: 18,
+  } as TaxRuleEntity;
+
+  const mockTaxCalculationRepository = {
+    create: jest.fn((data) => data),
+    save: jest.fn(),
+  };
+  const mockTaxRuleIndexService = { getResolver: jest.fn() };
+
+  beforeEach(async () => {
+    const module: TestingModule = await Test.createTestingModule({
+      providers: [
+        TaxGstService,
+        {
+          provide: getRepositoryToken(TaxCalculationEntity),
+          useValue: mockTaxCalculationRepository,
+        },
+        ...[
+          TaxRuleEntity,
+          TaxReturnEntity,
+          TaxComplianceEntity,
+          TaxAuditTrailEntity,
+          TaxExportEntity,
+          TaxReportEntity,
+          TaxSettingsEntity,
+          UserEntity,
+          BookingEntity,
+        ].map((entity) => ({
+          provide: getRepositoryToken(entity),
+          useValue: {},
+        })),
+        { provide: FinancialConfigIntegrationService, useValue: {} },
+        { provide: EnhancedTaxService, useValue: {} },
+        { provide: TaxRuleIndexService, useValue: mockTaxRuleIndexService },
+      ],
+    }).compile();
+
+    service = module.get<TaxGstService>(TaxGstService);
+  });
+
+  afterEach(() => {
+    jest.clearAllMocks();
+  });
+
+  describe('calculateTaxBatch', () => {
+    it('should persist calculated lines with uuid references', async () => {
+      mockTaxRuleIndexService.getResolver.mockResolvedValue(() => [gstRule]);
+      const referenceId = '6f1c2b8e-3d4a-4f5b-9c6d-7e8f9a0b1c2d';
+
+      const response = await service.calculateTaxBatch(
+        {
+          items: [{ referenceId, amount: 1000 }, { amount: 500 }],
+          persist: true,
+          referenceType: 'invoice',
+        },
+        'user-1',
+      );
+
+      expect(response.totalTaxAmount).toBe(270);
+      expect(mockTaxCalculationRepository.save).toHaveBeenCalledTimes(1);
+
+      const [records, options] =
+        mockTaxCalculationRepository.save.mock.calls[0];
+      expect(options).toEqual({ chunk: 500 });
+      expect(records).toHaveLength(2);
+      expect(records[0]).toEqual(
+        expect.objectContaining({
+          referenceId,
+          referenceType: 'invoice',
+          baseAmount: 1000,
+          taxAmount: 180,
+          status: CalculationStatus.CALCULATED,
+          createdBy: 'user-1',
+        }),
+      );
+      expect(records[1].referenceId).toMatch(UUID_PATTERN);
+    });
+
+    it('should not persist lines without applicable rules', async () => {
+      mockTaxRuleIndexService.getResolver.mockResolvedValue(() => []);
+
+      const response = await service.calculateTaxBatch(
+        { items: [{ amount: 1000 }], persist: true },
+        'user-1',
+      );
+
+      expect(response.results[0].error).toBe('No applicable tax rules found');
+      expect(mockTaxCalculationRepository.save).not.toHaveBeenCalled();
+    });
+  });
+});
@@ -10,6 +10,7 @@ import {
   NotFoundException,
 } from '@nestjs/common';
 import { InjectRepository } from '@nestjs/typeorm';
+import { randomUUID } from 'crypto';
 import {
   Between,
   In,
@@ -23,6 +24,7 @@ import {
   BulkOperationResponseDto,
   BulkOperationType,
   BulkTaxOperationDto,
+  CalculateTaxBatchDto,
   CalculationStatus,
   ComplianceStatus,
   ComplianceType,
@@ -41,6 +43,8 @@ import {
   ReturnStatus,
   TaxAnalyticsDto,
   TaxAnalyticsResponseDto,
+  TaxBatchCalculationResponseDto,
+  TaxBatchLineResultDto,
   TaxCalculationResponseDto,
   TaxComplianceResponseDto,
   TaxReturnResponseDto,
@@ -72,6 +76,7 @@ import {
   TaxRuleEntity,
   TaxSettingsEntity,
 } from './entities/tax-gst.entity';
+import { TaxRuleIndexService } from './services/tax-rule-index.service';
 
 @Injectable()
 export class TaxGstService {
@@ -99,6 +104,7 @@ export class TaxGstService {
     private readonly bookingRepository: Repository<BookingEntity>,
     private readonly configIntegrationService: FinancialConfigIntegrationService,
     private readonly enhancedTaxService: EnhancedTaxService,
+    private readonly taxRuleIndexService: TaxRuleIndexService,
   ) {}
 
   // Tax Rule Management
@@ -127,6 +133,7 @@ export class TaxGstService {
     });
 
     const savedRule = await this.taxRuleRepository.save(taxRule);
+    this.taxRuleIndexService.invalidate();
 
     // Create audit trail
     await this.createAuditTrail(
@@ -225,6 +232,7 @@ export class TaxGstService {
     Object.assign(rule, updateTaxRuleDto, { updatedBy: userId });
 
     const updatedRule = await this.taxRuleRepository.save(rule);
+    this.taxRuleIndexService.invalidate();
 
     // Create audit trail
     await this.createAuditTrail(
@@ -260,6 +268,7 @@ export class TaxGstService {
       // Hard delete if no calculations exist
       await this.taxRuleRepository.remove(rule);
     }
+    this.taxRuleIndexService.invalidate();
 
     // Create audit trail
     await this.createAuditTrail('TaxRule', id, 'DELETE', rule, null, userId);
@@ -295,6 +304,7 @@ export class TaxGstService {
     rule.updatedBy = userId;
 
     const updatedRule = await this.taxRuleRepository.save(rule);
+    this.taxRuleIndexService.invalidate();
 
     // Create audit trail
     await this.createAuditTrail(
@@ -355,27 +365,17 @@ export class TaxGstService {
       taxType,
       undefined, // hsnSacCode not available in this DTO
       stateCode,
+      transactionDate ? new Date(transactionDate) : undefined,
     );
 
     if (applicableRules.length === 0) {
       throw new BadRequestException('No applicable tax rules found');
     }
 
-    const calculations = [];
-    let totalTaxAmount = 0;
-
-    for (const rule of applicableRules) {
-      const taxAmount = this.calculateTaxAmount(baseAmount, rule.rate);
-      totalTaxAmount += taxAmount;
-
-      calculations.push({
-        taxType: rule.type,
-        taxRate: rule.rate,
-        taxAmount,
-        ruleName: rule.name,
-        ruleId: rule.id,
-      });
-    }
+    const { calculations, totalTaxAmount } = this.applyTaxRules(
+      baseAmount,
+      applicableRules,
+    );
 
     const totalAmount = baseAmount + totalTaxAmount;
 
@@ -409,6 +409,119 @@ export class TaxGstService {
     return this.mapTaxCalculationToResponse(savedCalculation);
   }
 
+  /**
+   * Tax for many line items in one pass. Rules are resolved from one
+   * snapshot of the rule index, so the database is read at most once per
+   * batch. Items without an applicable rule are reported per item instead
+   * of failing the batch. With `persist`, a calculation record is stored
+   * for each computed item.
+   */
+  async calculateTaxBatch(
+    batchDto: CalculateTaxBatchDto,
+    userId: string,
+  ): Promise<TaxBatchCalculationResponseDto> {
+    const resolveRules = await this.taxRuleIndexService.getResolver();
+    const now = new Date();
+
+    const results: TaxBatchLineResultDto[] = [];
+    const records: TaxCalculationEntity[] = [];
+    let totalBaseAmount = 0;
+    let totalTaxAmount = 0;
+    let failureCount = 0;
+
+    for (const item of batchDto.items) {
+      const taxType = item.taxType || TaxType.GST;
+      const transactionDate = item.transactionDate
+        ? new Date(item.transactionDate)
+        : now;
+      const rules = resolveRules(
+        taxType,
+        item.hsnSacCode,
+        item.stateCode,
+        transactionDate,
+      );
+
+      if (rules.length === 0) {
+        failureCount++;
+        results.push({
+          referenceId: item.referenceId,
+          baseAmount: item.amount,
+          taxType,
+          taxRate: 0,
+          taxAmount: 0,
+          totalAmount: item.amount,
+          calculationBreakdown: {},
+          appliedRules: [],
+          error: 'No applicable tax rules found',
+        });
+        continue;
+      }
+
+      const { calculations, totalTaxAmount: taxAmount } = this.applyTaxRules(
+        item.amount,
+        rules,
+      );
+      const calculationBreakdown = {
+        cgst: this.getCgstAmount(calculations),
+        sgst: this.getSgstAmount(calculations),
+        igst: this.getIgstAmount(calculations),
+        cess: this.getCessAmount(calculations),
+      };
+      const taxRate =
+        item.amount > 0
+          ? Math.round((taxAmount / item.amount) * 100 * 10000) / 10000
+          : 0;
+
+      totalBaseAmount += item.amount;
+      totalTaxAmount += taxAmount;
+      results.push({
+        referenceId: item.referenceId,
+        baseAmount: item.amount,
+        taxType,
+        taxRate,
+        taxAmount,
+        totalAmount: item.amount + taxAmount,
+        calculationBreakdown,
+        appliedRules: calculations,
+      });
+
+      if (batchDto.persist) {
+        records.push(
+          this.taxCalculationRepository.create({
+            referenceId: item.referenceId || randomUUID(),
+            referenceType: batchDto.referenceType || 'batch',
+            baseAmount: item.amount,
+            taxType,
+            taxRate,
+            taxAmount,
+            totalAmount: item.amount + taxAmount,
+            status: CalculationStatus.CALCULATED,
+            hsnSacCode: item.hsnSacCode || '',
+            stateCode: item.stateCode || '',
+            customerGstNumber: '',
+            supplierGstNumber: '',
+            placeOfSupply: '',
+            transactionDate,
+            calculationBreakdown,
+            createdBy: userId,
+          }),
+        );
+      }
+    }
+
+    if (records.length > 0) {
+      await this.taxCalculationRepository.save(records, { chunk: 500 });
+    }
+
+    return {
+      results,
+      totalBaseAmount: Math.round(totalBaseAmount * 100) / 100,
+      totalTaxAmount: Math.round(totalTaxAmount * 100) / 100,
+      successCount: results.length - failureCount,
+      failureCount,
+    };
+  }
+
   async getTaxCalculations(
     getTaxCalculationsDto: GetTaxCalculationsDto,
   ): Promise<{
@@ -1547,33 +1660,44 @@ export class TaxGstService {
     taxType: TaxType,
     hsnSacCode?: string,
     stateCode?: string,
+    at?: Date,
   ): Promise<TaxRuleEntity[]> {
-    const queryBuilder = this.taxRuleRepository
-      .createQueryBuilder('rule')
-      .where('rule.type = :taxType', { taxType })
-      .andWhere('rule.status = :status', { status: TaxStatus.ACTIVE })
-      .andWhere('(rule.effectiveFrom IS NULL OR rule.effectiveFrom <= :now)', {
-        now: new Date(),
-      })
-      .andWhere('(rule.effectiveTo IS NULL OR rule.effectiveTo >= :now)', {
-        now: new Date(),
-      });
+    return this.taxRuleIndexService.findApplicableRules(
+      taxType,
+      hsnSacCode,
+      stateCode,
+      at,
+    );
+  }
 
-    if (hsnSacCode) {
-      queryBuilder.andWhere(
-        '(rule.hsnSacCodes IS NULL OR :hsnSacCode = ANY(rule.hsnSacCodes))',
-        { hsnSacCode },
-      );
-    }
+  private applyTaxRules(
+    baseAmount: number,
+    rules: TaxRuleEntity[],
+  ): {
+    calculations: TaxBatchLineResultDto['appliedRules'];
+    totalTaxAmount: number;
+  } {
+    const calculations: TaxBatchLineResultDto['appliedRules'] = [];
+    let totalTaxAmount = 0;
 
-    if (stateCode) {
-      queryBuilder.andWhere(
-        '(rule.applicableStates IS NULL OR :stateCode = ANY(rule.applicableStates))',
-        { stateCode },
-      );
+    for (const rule of rules) {
+      const taxRate = Number(rule.rate);
+      const taxAmount = this.calculateTaxAmount(baseAmount, taxRate);
+      totalTaxAmount += taxAmount;
+
+      calculations.push({
+        taxType: rule.type,
+        taxRate,
+        taxAmount,
+        ruleName: rule.name,
+        ruleId: rule.id,
+      });
     }
 
-    return queryBuilder.getMany();
+    return {
+      calculations,
+      totalTaxAmount: Math.round(totalTaxAmount * 100) / 100,
+    };
   }
 
   private calculateTaxAmount(baseAmount: number, rate: number): number {
@@ -0,0 +1,151 @@
+import { UserEntity } from '@/auth/entities/user.entity';
+import { EnhancedTaxService } from '@/common/services/enhanced-tax.service';
+import { FinancialConfigIntegrationService } from '@/common/services/financial-config-integration.service';
+import { EventEmitter2 } from '@nestjs/event-emitter';
+import { Test, TestingModule } from '@nestjs/testing';
+import { getRepositoryToken } from '@nestjs/typeorm';
+import { TaxRuleStatus } from './dto/tax-management.dto';
+import {
+  TaxAuditTrailEntity,
+  TaxCollectionEntity,
+  TaxComplianceEntity,
+  TaxDeadlineEntity,
+  TaxExportEntity,
+  TaxReportEntity,
+  TaxRuleEntity,
+  TaxSettingsEntity,
+} from './entities/tax-management.entity';
+import { TaxRuleIndexService } from './services/tax-rule-index.service';
+import { TaxManagementService } from './tax-management.service';
+
+describe('TaxManagementService', () => {
+  let service: TaxManagementService;
+
+  const rule = () =>
+    ({
+      id: 'rule-1',
+      name: 'GST 18%',
+      rate: 18,
+      status: TaxRuleStatus.ACTIVE,
+      createdAt: new Date('2026-10-01T00:00:00Z'),
+      updatedAt: new Date('2026-10-01T00:00:00Z'),
+    }) as TaxRuleEntity;
+
+  const mockTaxRuleRepository = {
+    create: jest.fn((data) => data),
+    save: jest.fn(),
+    findOne: jest.fn(),
+    remove: jest.fn(),
+  };
+  const mockTaxCollectionRepository = { count: jest.fn() };
+  const mockAuditTrailRepository = {
+    create: jest.fn((data) => data),
+    save: jest.fn(),
+  };
+  const mockEventEmitter = { emit: jest.fn() };
+
+  beforeEach(async () => {
+    const module: TestingModule = await Test.createTestingModule({
+      providers: [
+        TaxManagementService,
+        {
+          provide: getRepositoryToken(TaxRuleEntity),
+          useValue: mockTaxRuleRepository,
+        },
+        {
+          provide: getRepositoryToken(TaxCollectionEntity),
+          useValue: mockTaxCollectionRepository,
+        },
+        {
+          provide: getRepositoryToken(TaxAuditTrailEntity),
+          useValue: mockAuditTrailRepository,
+        },
+        ...[
+          TaxExportEntity,
+          TaxReportEntity,
+          TaxDeadlineEntity,
+          TaxSettingsEntity,
+          TaxComplianceEntity,
+          UserEntity,
+        ].map((entity) => ({
+          provide: getRepositoryToken(entity),
+          useValue: {},
+        })),
+        { provide: FinancialConfigIntegrationService, useValue: {} },
+        { provide: EnhancedTaxService, useValue: {} },
+        { provide: EventEmitter2, useValue: mockEventEmitter },
+      ],
+    }).compile();
+
+    service = module.get<TaxManagementService>(TaxManagementService);
+  });
+
+  afterEach(() => {
+    jest.clearAllMocks();
+  });
+
+  describe('tax rule writes', () => {
+    it('should emit tax.config.created after creating a rule', async () => {
+      mockTaxRuleRepository.save.mockResolvedValue(rule());
+
+      await service.createTaxRule({ name: 'GST 18%', rate: 18 } as any, 'u1');
+
+      expect(mockEventEmitter.emit).toHaveBeenCalledWith(
+        'tax.config.created',
+        expect.objectContaining({
+          eventType: 'created',
+          configType: 'tax_rule',
+          configId: 'rule-1',
+          updatedBy: 'u1',
+        }),
+      );
+    });
+
+    it('should emit tax.config.updated after a status change', async () => {
+      mockTaxRuleRepository.findOne.mockResolvedValue(rule());
+      mockTaxRuleRepository.save.mockImplementation(async (saved) => saved);
+
+      await service.deactivateTaxRule('rule-1', 'u1');
+
+      expect(mockEventEmitter.emit).toHaveBeenCalledWith(
+        'tax.config.updated',
+        expect.objectContaining({
+          configType: 'tax_rule',
+          configId: 'rule-1',
+          previousConfiguration: { status: TaxRuleStatus.ACTIVE },
+        }),
+      );
+    });
+
+    it('should emit tax.config.deleted with the removed rule id', async () => {
+      const existing = rule();
+      mockTaxRuleRepository.findOne.mockResolvedValue(existing);
+      mockTaxCollectionRepository.count.mockResolvedValue(0);
+      // TypeORM clears the primary key on removed entities
+      mockTaxRuleRepository.remove.mockImplementation(async (removed) => {
+        removed.id = undefined;
+        return removed;
+      });
+
+      await service.deleteTaxRule('rule-1', 'u1');
+
+      expect(mockEventEmitter.emit).toHaveBeenCalledWith(
+        'tax.config.deleted',
+        expect.objectContaining({ configId: 'rule-1' }),
+      );
+    });
+
+    it('should drop the rule index through the emitted event', async () => {
+      mockTaxRuleRepository.findOne.mockResolvedValue(rule());
+      mockTaxRuleRepository.save.mockImplementation(async (saved) => saved);
+      const index = new TaxRuleIndexService({} as any);
+      const invalidate = jest.spyOn(index, 'invalidate');
+
+      await service.updateTaxRule('rule-1', { rate: 12 } as any, 'u1');
+
+      const [, event] = mockEventEmitter.emit.mock.calls[0];
+      index.handleTaxConfigEvent(event);
+      expect(invalidate).toHaveBeenCalledTimes(1);
+    });
+  });
+});
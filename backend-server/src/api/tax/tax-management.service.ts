@@ -6,6 +6,7 @@ import {
   Logger,
   NotFoundException,
 } from '@nestjs/common';
+import { EventEmitter2 } from '@nestjs/event-emitter';
 import { InjectRepository } from '@nestjs/typeorm';
 import { Between, In, LessThan, MoreThan, Repository } from 'typeorm';
 import { EnhancedTaxService } from '../../common/services/enhanced-tax.service';
@@ -57,6 +58,7 @@ import {
   TaxRuleEntity,
   TaxSettingsEntity,
 } from './entities/tax-management.entity';
+import { RealTimeTaxConfigEvent } from './services/dynamic-tax-config.service';
 
 @Injectable()
 export class TaxManagementService {
@@ -82,6 +84,7 @@ export class TaxManagementService {
     private userRepository: Repository<UserEntity>,
     private readonly configIntegrationService: FinancialConfigIntegrationService,
     private readonly enhancedTaxService: EnhancedTaxService,
+    private readonly eventEmitter: EventEmitter2,
   ) {}
 
   // Tax Rule Management
@@ -103,6 +106,7 @@ export class TaxManagementService {
       savedRule,
       userId,
     );
+    this.emitTaxRuleEvent('created', savedRule, userId);
 
     return this.mapTaxRuleToResponse(savedRule);
   }
@@ -199,6 +203,7 @@ export class TaxManagementService {
       updatedRule,
       userId,
     );
+    this.emitTaxRuleEvent('updated', updatedRule, userId, previousValues);
 
     return this.mapTaxRuleToResponse(updatedRule);
   }
@@ -222,6 +227,7 @@ export class TaxManagementService {
 
     await this.taxRuleRepository.remove(rule);
     await this.createAuditTrail('tax_rule', id, 'DELETE', rule, {}, userId);
+    this.emitTaxRuleEvent('deleted', { ...rule, id }, userId);
   }
 
   async activateTaxRule(
@@ -261,10 +267,36 @@ export class TaxManagementService {
       { status },
       userId,
     );
+    this.emitTaxRuleEvent('updated', updatedRule, userId, {
+      status: previousStatus,
+    });
 
     return this.mapTaxRuleToResponse(updatedRule);
   }
 
+  /**
+   * Announce a tax_rules write the same way DynamicTaxConfigService does,
+   * so the rule index and the config gateway pick it up
+   */
+  private emitTaxRuleEvent(
+    eventType: RealTimeTaxConfigEvent['eventType'],
+    rule: TaxRuleEntity,
+    userId: string,
+    previousConfiguration?: Partial<TaxRuleEntity>,
+  ): void {
+    const event: RealTimeTaxConfigEvent = {
+      eventType,
+      configType: 'tax_rule',
+      configId: rule.id,
+      configuration: rule,
+      previousConfiguration,
+      effectiveDate: rule.effectiveFrom || new Date(),
+      updatedBy: userId,
+      timestamp: new Date(),
+    };
+    this.eventEmitter.emit(`tax.config.${eventType}`, event);
+  }
+
   // Tax Calculation
   async calculateTax(
     calculateDto: CalculateTaxDto,
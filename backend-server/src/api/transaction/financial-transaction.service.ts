@@ -7,7 +7,13 @@ import {
   NotFoundException,
 } from '@nestjs/common';
 import { InjectRepository } from '@nestjs/typeorm';
-import { Between, FindOptionsWhere, In, Like, Repository } from 'typeorm';
+import {
+  Between,
+  FindOptionsWhere,
+  In,
+  Repository,
+  SelectQueryBuilder,
+} from 'typeorm';
 import { BookingEntity } from '../../database/entities/booking.entity';
 import {
   BulkOperationResponseDto,
@@ -134,82 +140,108 @@ export class FinancialTransactionService {
     } = dto;
     const skip = (page - 1) * limit;
 
-    const where: FindOptionsWhere<FinancialTransactionEntity> = {};
+    const sortField =
+      this.transactionRepository.metadata.hasColumnWithPropertyPath(sortBy)
+        ? sortBy
+        : 'createdAt';
+
+    const [transactions, total] = await this.createTransactionsQuery(dto, user)
+      .orderBy(`transaction.${sortField}`, sortOrder)
+      .skip(skip)
+      .take(limit)
+      .getManyAndCount();
+
+    return {
+      transactions: transactions.map((transaction) =>
+        this.mapToResponseDto(transaction),
+      ),
+      total,
+    };
+  }
+
+  /**
+   * Filtered, unordered transaction query with its to-one relations joined,
+   * for callers that paginate it themselves
+   */
+  createTransactionsQuery(
+    dto: GetTransactionsDto,
+    user: UserEntity,
+  ): SelectQueryBuilder<FinancialTransactionEntity> {
+    const query = this.transactionRepository
+      .createQueryBuilder('transaction')
+      .leftJoinAndSelect('transaction.user', 'user')
+      .leftJoinAndSelect('transaction.partner', 'partner')
+      .leftJoinAndSelect('transaction.creator', 'creator')
+      .leftJoinAndSelect('transaction.updater', 'updater');
 
     // Apply filters
     if (dto.search) {
-      where.description = Like(`%${dto.search}%`);
+      query.andWhere('transaction.description LIKE :search', {
+        search: `%${dto.search}%`,
+      });
     }
 
     if (dto.status) {
-      where.status = dto.status;
+      query.andWhere('transaction.status = :status', { status: dto.status });
     }
 
     if (dto.type) {
-      where.type = dto.type;
+      query.andWhere('transaction.type = :type', { type: dto.type });
     }
 
     if (dto.category) {
-      where.category = dto.category;
+      query.andWhere('transaction.category = :category', {
+        category: dto.category,
+      });
     }
 
     if (dto.paymentMethod) {
-      where.paymentMethod = dto.paymentMethod;
+      query.andWhere('transaction.paymentMethod = :paymentMethod', {
+        paymentMethod: dto.paymentMethod,
+      });
     }
 
     if (dto.userId) {
-      where.userId = dto.userId;
+      query.andWhere('transaction.userId = :userId', { userId: dto.userId });
     }
 
-    if (dto.partnerId) {
-      where.partnerId = dto.partnerId;
+    // Role-based access control
+    const partnerId = user.role === 'Partner' ? user.id : dto.partnerId;
+    if (partnerId) {
+      query.andWhere('transaction.partnerId = :partnerId', { partnerId });
     }
 
     if (dto.bookingId) {
-      where.bookingId = dto.bookingId;
+      query.andWhere('transaction.bookingId = :bookingId', {
+        bookingId: dto.bookingId,
+      });
     }
 
     // Date range filter
     if (dto.startDate && dto.endDate) {
-      where.transactionDate = Between(
-        new Date(dto.startDate),
-        new Date(dto.endDate),
+      query.andWhere(
+        'transaction.transactionDate BETWEEN :startDate AND :endDate',
+        {
+          startDate: new Date(dto.startDate),
+          endDate: new Date(dto.endDate),
+        },
       );
     }
 
     // Amount range filter
-    if (dto.minAmount !== undefined || dto.maxAmount !== undefined) {
-      const amountConditions: any = {};
-      if (dto.minAmount !== undefined) {
-        amountConditions.gte = dto.minAmount;
-      }
-      if (dto.maxAmount !== undefined) {
-        amountConditions.lte = dto.maxAmount;
-      }
-      where.amount = amountConditions;
+    if (dto.minAmount !== undefined) {
+      query.andWhere('transaction.amount >= :minAmount', {
+        minAmount: dto.minAmount,
+      });
     }
 
-    // Role-based access control
-    if (user.role === 'Partner') {
-      where.partnerId = user.id;
+    if (dto.maxAmount !== undefined) {
+      query.andWhere('transaction.amount <= :maxAmount', {
+        maxAmount: dto.maxAmount,
+      });
     }
 
-    const [transactions, total] = await this.transactionRepository.findAndCount(
-      {
-        where,
-        relations: ['user', 'partner', 'creator', 'updater'],
-        skip,
-        take: limit,
-        order: { [sortBy]: sortOrder },
-      },
-    );
-
-    return {
-      transactions: transactions.map((transaction) =>
-        this.mapToResponseDto(transaction),
-      ),
-      total,
-    };
+    return query;
   }
 
   async getTransactionById(
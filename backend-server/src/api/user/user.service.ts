@@ -116,6 +116,7 @@ export class UserService {
       image: dto.image,
       username: dto.username,
     });
+    await this.authService.invalidatePrincipal(userId);
 
     return await this.findOneUser(userId);
   }
@@ -0,0 +1,22 @@
+import { Column, Entity, PrimaryColumn, UpdateDateColumn } from 'typeorm';
+
+/**
+ * Credits not yet folded into `wallets.balance` for wallets in sharded ledger
+ * mode. Each credit adds to one of the wallet's `ledgerShards` rows chosen at
+ * random, so concurrent credits rarely touch the same row and never lock the
+ * wallet itself. Rows are deleted when they are folded into the wallet.
+ */
+@Entity('wallet_balance_shards')
+export class WalletBalanceShardEntity {
+  @PrimaryColumn({ name: 'wallet_id', type: 'uuid' })
+  walletId: string;
+
+  @PrimaryColumn({ type: 'smallint' })
+  shard: number;
+
+  @Column({ type: 'decimal', precision: 15, scale: 2, default: 0 })
+  amount: number;
+
+  @UpdateDateColumn({ name: 'updated_at' })
+  updatedAt: Date;
+}
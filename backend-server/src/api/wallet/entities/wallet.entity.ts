@@ -89,6 +89,13 @@ export class WalletEntity {
   })
   autoPayoutThreshold?: number;
 
+  /**
+   * Number of balance shards credits are spread over. Zero keeps the wallet
+   * on row-locked updates; see WalletLedgerService.
+   */
+  @Column({ name: 'ledger_shards', type: 'smallint', default: 0 })
+  ledgerShards: number;
+
   @Column({ name: 'last_transaction_at', type: 'timestamp', nullable: true })
   lastTransactionAt?: Date;
 
@@ -134,6 +141,10 @@ export class WalletEntity {
     return this.status === WalletStatus.ACTIVE;
   }
 
+  get usesShardedLedger(): boolean {
+    return this.ledgerShards > 0;
+  }
+
   get hasAutoPayoutEnabled(): boolean {
     return this.autoPayoutEnabled && this.autoPayoutThreshold > 0;
   }
@@ -0,0 +1,144 @@
+import { Test, TestingModule } from '@nestjs/testing';
+import { DataSource } from 'typeorm';
+import { WalletEntity } from '../entities/wallet.entity';
+import { WalletLedgerService } from './wallet-ledger.service';
+
+describe('WalletLedgerService', () => {
+  let service: WalletLedgerService;
+
+  const manager = {
+    query: jest.fn(),
+    findOne: jest.fn(),
+  };
+  const dataSource = {
+    query: jest.fn(),
+    transaction: jest.fn((work) => work(manager)),
+  };
+
+  const createWallet = (overrides: Partial<WalletEntity> = {}) =>
+    Object.assign(new WalletEntity(), {
+      id: 'wallet-1',
+      balance: '100.00',
+      availableBalance: '80.00',
+      pendingBalance: '20.00',
+      ledgerShards: 8,
+      ...overrides,
+    });
+
+  beforeEach(async () => {
+    jest.clearAllMocks();
+
+    const module: TestingModule = await Test.createTestingModule({
+      providers: [
+        WalletLedgerService,
+        { provide: DataSource, useValue: dataSource },
+      ],
+    }).compile();
+
+    service = module.get<WalletLedgerService>(WalletLedgerService);
+  });
+
+  describe('appendCredits', () => {
+    it('should upsert one shard row per wallet in id order', async () => {
+      manager.query.mockResolvedValue([
+        { walletId: 'wallet-a', balance: '150.00' },
+        { walletId: 'wallet-b', balance: '25.50' },
+      ]);
+
+      const balances = await service.appendCredits(manager as any, [
+        {
+          wallet: createWallet({ id: 'wallet-b', ledgerShards: 1 }),
+          amount: 5,
+        },
+        {
+          wallet: createWallet({ id: 'wallet-a', ledgerShards: 1 }),
+          amount: 50,
+        },
+      ]);
+
+      const [sql, params] = manager.query.mock.calls[0];
+      expect(sql).toContain('ON CONFLICT ("wallet_id", "shard") DO UPDATE');
+      expect(params).toEqual(['wallet-a', 0, 50, 'wallet-b', 0, 5]);
+      expect(balances).toEqual(
+        new Map([
+          ['wallet-a', 150],
+          ['wallet-b', 25.5],
+        ]),
+      );
+    });
+
+    it('should not query without credits', async () => {
+      await expect(service.appendCredits(manager as any, [])).resolves.toEqual(
+        new Map(),
+      );
+      expect(manager.query).not.toHaveBeenCalled();
+    });
+  });
+
+  describe('lockWallet', () => {
+    it('should fold shards into a locked sharded wallet', async () => {
+      manager.findOne.mockResolvedValue(createWallet());
+      manager.query.mockResolvedValue([[{ folded: '30.00' }], 1]);
+
+      const wallet = await service.lockWallet(manager as any, 'wallet-1');
+
+      expect(manager.findOne).toHaveBeenCalledWith(WalletEntity, {
+        where: { id: 'wallet-1' },
+        lock: { mode: 'for_no_key_update' },
+        loadEagerRelations: false,
+      });
+      expect(manager.query.mock.calls[0][0]).toContain(
+        'DELETE FROM wallet_balance_shards',
+      );
+      expect(wallet.balance).toBe(130);
+      expect(wallet.availableBalance).toBe(110);
+      expect(wallet.pendingBalance).toBe(20);
+    });
+
+    it('should skip folding for unsharded wallets', async () => {
+      manager.findOne.mockResolvedValue(createWallet({ ledgerShards: 0 }));
+
+      const wallet = await service.lockWallet(manager as any, 'wallet-1');
+
+      expect(manager.query).not.toHaveBeenCalled();
+      expect(wallet.balance).toBe(100);
+    });
+  });
+
+  describe('compact', () => {
+    it('should lock and fold each wallet in its own transaction', async () => {
+      dataSource.query.mockResolvedValue([
+        { walletId: 'wallet-1' },
+        { walletId: 'wallet-2' },
+      ]);
+      manager.query.mockResolvedValue([[], 0]);
+
+      await expect(service.compact()).resolves.toBe(2);
+
+      expect(dataSource.transaction).toHaveBeenCalledTimes(2);
+      const statements = manager.query.mock.calls.map(([sql]) => sql);
+      expect(statements[0]).toContain('FOR NO KEY UPDATE');
+      expect(statements[1]).toContain('DELETE FROM wallet_balance_shards');
+      expect(manager.query.mock.calls[2][1]).toEqual(['wallet-2']);
+    });
+  });
+
+  describe('getUnsettledTotals', () => {
+    it('should sum shards per wallet', async () => {
+      dataSource.query.mockResolvedValue([
+        { walletId: 'wallet-1', total: '42.50' },
+      ]);
+
+      const totals = await service.getUnsettledTotals([
+        'wallet-1',
+        'wallet-1',
+        'wallet-2',
+      ]);
+
+      expect(dataSource.query.mock.calls[0][1]).toEqual([
+        ['wallet-1', 'wallet-2'],
+      ]);
+      expect(totals).toEqual(new Map([['wallet-1', 42.5]]));
+    });
+  });
+});
@@ -0,0 +1,210 @@
+import { Injectable, Logger } from '@nestjs/common';
+import { Interval } from '@nestjs/schedule';
+import { DataSource, EntityManager } from 'typeorm';
+import { WalletEntity } from '../entities/wallet.entity';
+
+export interface LedgerCredit {
+  wallet: WalletEntity;
+  amount: number;
+}
+
+const SHARDS_TABLE = 'wallet_balance_shards';
+const COMPACTION_INTERVAL_MS = 5 * 1000;
+const COMPACTION_BATCH_SIZE = 500;
+
+/**
+ * Sharded balances for wallets with `ledgerShards > 0`.
+ *
+ * Credits add to one of the wallet's shard rows, picked at random, instead of
+ * locking and rewriting the wallet row, so hot wallets (the platform account,
+ * large partners) take concurrent credits without serializing on one row.
+ * The wallet's balance is `wallets.balance` plus its unfolded shards.
+ *
+ * Anything that can lower a balance must call `lockWallet`, which locks the
+ * wallet and folds its shards into it first, so overdraft checks see every
+ * committed credit. Shards are also folded periodically to keep them small.
+ *
+ * Lock order is always wallet row, then shard rows. Wallet rows are locked
+ * `FOR NO KEY UPDATE`, which doesn't conflict with the key-share locks taken
+ * by foreign keys from shard and transaction rows, so credits never wait on
+ * a debit.
+ */
+@Injectable()
+export class WalletLedgerService {
+  private readonly logger = new Logger(WalletLedgerService.name);
+  private compacting: Promise<number> | null = null;
+
+  constructor(private readonly dataSource: DataSource) {}
+
+  /**
+   * Add credits to their wallets' shards, at most one credit per wallet.
+   * Returns each wallet's balance (`balance` + all shards) right after its
+   * credit, as seen by this transaction.
+   */
+  async appendCredits(
+    manager: EntityManager,
+    credits: LedgerCredit[],
+  ): Promise<Map<string, number>> {
+    if (credits.length === 0) return new Map();
+
+    // Shard rows are locked in wallet id order so batches can't deadlock
+    const ordered = [...credits].sort((a, b) =>
+      a.wallet.id.localeCompare(b.wallet.id),
+    );
+    const params: unknown[] = [];
+    const values = ordered.map(({ wallet, amount }) => {
+      params.push(wallet.id, this.pickShard(wallet), amount);
+      const n = params.length;
+      return `($${n - 2}::uuid, $${n - 1}::smallint, $${n}::decimal)`;
+    });
+
+    // Other shards are read from the statement snapshot, so the credited
+    // shard's new amount comes from RETURNING instead
+    const rows: Array<{ walletId: string; balance: string }> =
+      await manager.query(
+        `WITH credited AS (
+           INSERT INTO ${SHARDS_TABLE} AS s ("wallet_id", "shard", "amount")
+           VALUES ${values.join(', ')}
+           ON CONFLICT ("wallet_id", "shard") DO UPDATE
+           SET "amount" = s."amount" + EXCLUDED."amount", "updated_at" = now()
+           RETURNING "wallet_id", "shard", "amount"
+         )
+         SELECT w."id" AS "walletId",
+           w."balance" + c."amount" + COALESCE((
+             SELECT SUM(o."amount") FROM ${SHARDS_TABLE} o
+             WHERE o."wallet_id" = c."wallet_id" AND o."shard" <> c."shard"
+           ), 0) AS "balance"
+         FROM credited c
+         JOIN "wallets" w ON w."id" = c."wallet_id"`,
+        params,
+      );
+
+    return new Map(
+      rows.map((row) => [row.walletId, parseFloat(row.balance) || 0]),
+    );
+  }
+
+  /**
+   * Lock a wallet and fold its shards into it, for changes that need the
+   * complete balance (debits, payouts, credits to unsharded wallets). Keep
+   * using `manager` until the transaction commits.
+   */
+  async lockWallet(
+    manager: EntityManager,
+    walletId: string,
+  ): Promise<WalletEntity | null> {
+    const wallet = await manager.findOne(WalletEntity, {
+      where: { id: walletId },
+      lock: { mode: 'for_no_key_update' },
+      // A lock can't cover the outer join to the eager partner relation
+      loadEagerRelations: false,
+    });
+    if (!wallet) return null;
+
+    wallet.balance = Number(wallet.balance);
+    wallet.availableBalance = Number(wallet.availableBalance);
+    wallet.pendingBalance = Number(wallet.pendingBalance);
+    if (!wallet.usesShardedLedger) return wallet;
+
+    const folded = await this.fold(manager, walletId);
+    wallet.balance += folded;
+    wallet.availableBalance += folded;
+    return wallet;
+  }
+
+  /**
+   * Unfolded credit total per wallet. Wallets without shards are absent.
+   */
+  async getUnsettledTotals(walletIds: string[]): Promise<Map<string, number>> {
+    const ids = Array.from(new Set(walletIds.filter(Boolean)));
+    if (ids.length === 0) return new Map();
+
+    const rows: Array<{ walletId: string; total: string }> =
+      await this.dataSource.query(
+        `SELECT "wallet_id" AS "walletId", SUM("amount") AS "total"
+         FROM ${SHARDS_TABLE}
+         WHERE "wallet_id" = ANY($1::uuid[])
+         GROUP BY "wallet_id"`,
+        [ids],
+      );
+
+    return new Map(
+      rows.map((row) => [row.walletId, parseFloat(row.total) || 0]),
+    );
+  }
+
+  /**
+   * Fold the shards of every wallet that has any into the wallet row.
+   * Each wallet is folded in its own short transaction.
+   */
+  @Interval(COMPACTION_INTERVAL_MS)
+  async compact(): Promise<number> {
+    if (this.compacting) return this.compacting;
+
+    this.compacting = this.compactAll()
+      .catch((error) => {
+        this.logger.error(
+          `Failed to compact wallet balance shards: ${error.message}`,
+          error,
+        );
+        return 0;
+      })
+      .finally(() => {
+        this.compacting = null;
+      });
+    return this.compacting;
+  }
+
+  private async compactAll(): Promise<number> {
+    const rows: Array<{ walletId: string }> = await this.dataSource.query(
+      `SELECT DISTINCT "wallet_id" AS "walletId" FROM ${SHARDS_TABLE} LIMIT $1`,
+      [COMPACTION_BATCH_SIZE],
+    );
+
+    for (const { walletId } of rows) {
+      await this.dataSource.transaction(async (manager) => {
+        await manager.query(
+          `SELECT 1 FROM "wallets" WHERE "id" = $1 FOR NO KEY UPDATE`,
+          [walletId],
+        );
+        await this.fold(manager, walletId);
+      });
+    }
+    return rows.length;
+  }
+
+  /**
+   * Move a wallet's shard amounts into its row. The caller must hold the
+   * wallet row lock.
+   */
+  private async fold(
+    manager: EntityManager,
+    walletId: string,
+  ): Promise<number> {
+    // UPDATE statements come back from the driver as [rows, rowCount]
+    const [rows]: [Array<{ folded: string }>, number] = await manager.query(
+      `WITH folded AS (
+         DELETE FROM ${SHARDS_TABLE} WHERE "wallet_id" = $1
+         RETURNING "amount", "updated_at"
+       ), total AS (
+         SELECT SUM("amount") AS "amount", MAX("updated_at") AS "lastAt"
+         FROM folded
+       )
+       UPDATE "wallets" w
+       SET "balance" = w."balance" + total."amount",
+         "available_balance" = w."available_balance" + total."amount",
+         "last_transaction_at" =
+           GREATEST(w."last_transaction_at", total."lastAt"),
+         "updated_at" = now()
+       FROM total
+       WHERE w."id" = $1 AND total."amount" IS NOT NULL
+       RETURNING total."amount" AS "folded"`,
+      [walletId],
+    );
+    return parseFloat(rows?.[0]?.folded ?? '0') || 0;
+  }
+
+  private pickShard(wallet: WalletEntity): number {
+    return Math.floor(Math.random() * wallet.ledgerShards);
+  }
+}
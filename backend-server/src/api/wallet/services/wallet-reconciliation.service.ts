@@ -18,6 +18,7 @@ import { PaymentEntity } from '../../../database/entities/payment.entity';
 import { RefundEntity } from '../../../database/entities/refund.entity';
 import { WalletTransactionEntity } from '../../../database/entities/wallet-transaction.entity';
 import { WalletEntity } from '../entities/wallet.entity';
+import { WalletLedgerService } from './wallet-ledger.service';
 
 export interface ReconciliationReport {
   walletId: string;
@@ -76,6 +77,7 @@ export class WalletReconciliationService {
     private dataSource: DataSource,
     private financialEventSourcingService: FinancialEventSourcingService,
     private eventEmitter: EventEmitter2,
+    private walletLedgerService: WalletLedgerService,
   ) {}
 
   /**
@@ -201,8 +203,12 @@ export class WalletReconciliationService {
     // Calculate expected balance from transactions
     const expectedBalance = await this.calculateExpectedBalance(wallet.id);
 
-    // Get actual balance
-    const actualBalance = wallet.balance;
+    // Get actual balance, including credits not yet folded from its shards
+    const unsettled = await this.walletLedgerService.getUnsettledTotals([
+      wallet.id,
+    ]);
+    const actualBalance =
+      Number(wallet.balance) + (unsettled.get(wallet.id) ?? 0);
 
     // Calculate discrepancy
     const discrepancy = actualBalance - expectedBalance;
@@ -251,15 +257,16 @@ export class WalletReconciliationService {
       status,
     };
 
-    // Update wallet metadata with reconciliation info
-    wallet.metadata = {
-      ...wallet.metadata,
-      lastReconciliation: new Date().toISOString(),
-      reconciliationStatus: status,
-      lastDiscrepancy: discrepancy,
-    };
-
-    await this.walletRepository.save(wallet);
+    // Update wallet metadata with reconciliation info; only that column,
+    // since shard compaction may have moved the balance read above
+    await this.walletRepository.update(wallet.id, {
+      metadata: {
+        ...wallet.metadata,
+        lastReconciliation: new Date().toISOString(),
+        reconciliationStatus: status,
+        lastDiscrepancy: discrepancy,
+      },
+    });
 
     // Emit reconciliation event
     this.eventEmitter.emit('wallet.reconciliation.completed', {
@@ -11,9 +11,11 @@ import { WalletTransactionEntity } from '../../database/entities/wallet-transact
 import { WalletEscrowController } from './controllers/wallet-escrow.controller';
 import { WalletMultiCurrencyController } from './controllers/wallet-multi-currency.controller';
 import { WalletReconciliationController } from './controllers/wallet-reconciliation.controller';
+import { WalletBalanceShardEntity } from './entities/wallet-balance-shard.entity';
 import { WalletEntity } from './entities/wallet.entity';
 import { WalletEventHandler } from './events/wallet-event.handler';
 import { WalletEscrowService } from './services/wallet-escrow.service';
+import { WalletLedgerService } from './services/wallet-ledger.service';
 import { WalletMultiCurrencyService } from './services/wallet-multi-currency.service';
 import { WalletReconciliationService } from './services/wallet-reconciliation.service';
 import { WalletController } from './wallet.controller';
@@ -23,6 +25,7 @@ import { WalletService } from './wallet.service';
   imports: [
     TypeOrmModule.forFeature([
       WalletEntity,
+      WalletBalanceShardEntity,
       WalletTransactionEntity,
       UserEntity,
       PaymentEntity,
@@ -43,6 +46,7 @@ import { WalletService } from './wallet.service';
     IdGeneratorService,
     WalletEventHandler,
     WalletEscrowService,
+    WalletLedgerService,
     WalletMultiCurrencyService,
     WalletReconciliationService,
   ],
@@ -50,6 +54,7 @@ import { WalletService } from './wallet.service';
     WalletService,
     WalletEventHandler,
     WalletEscrowService,
+    WalletLedgerService,
     WalletMultiCurrencyService,
     WalletReconciliationService,
   ],
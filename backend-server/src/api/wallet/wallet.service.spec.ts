@@ -0,0 +1,103 @@
+import { UserEntity } from '@/auth/entities/user.entity';
+import { FinancialEventSourcingService } from '@/common/events/financial-event-sourcing';
+import { WalletStatus } from '@/common/enums/wallet.enum';
+import { IdGeneratorService } from '@/utils/id-generator.service';
+import { EventEmitter2 } from '@nestjs/event-emitter';
+import { Test, TestingModule } from '@nestjs/testing';
+import { getRepositoryToken } from '@nestjs/typeorm';
+import { DataSource } from 'typeorm';
+import { WalletTransactionEntity } from '../../database/entities/wallet-transaction.entity';
+import { WalletEntity } from './entities/wallet.entity';
+import { WalletLedgerService } from './services/wallet-ledger.service';
+import { WalletService } from './wallet.service';
+
+describe('WalletService', () => {
+  let service: WalletService;
+  /** The wallets row as stored, shared by the repository mock */
+  let row: WalletEntity;
+
+  const loadRow = async () => Object.assign(new WalletEntity(), row);
+  const compact = (amount: number) => {
+    row.balance = Number(row.balance) + amount;
+    row.availableBalance = Number(row.availableBalance) + amount;
+  };
+
+  const mockWalletRepository = {
+    findOne: jest.fn(),
+    update: jest.fn(async (_id: string, changes: Partial<WalletEntity>) => {
+      Object.assign(row, changes);
+    }),
+    save: jest.fn(async (wallet: WalletEntity) => Object.assign(row, wallet)),
+  };
+  const mockWalletLedgerService = {
+    getUnsettledTotals: jest.fn(async () => new Map()),
+  };
+
+  beforeEach(async () => {
+    jest.clearAllMocks();
+    row = Object.assign(new WalletEntity(), {
+      id: 'wallet-1',
+      partnerId: 'partner-1',
+      balance: 100,
+      availableBalance: 100,
+      pendingBalance: 0,
+      currency: 'INR',
+      status: WalletStatus.ACTIVE,
+      ledgerShards: 8,
+    });
+
+    const module: TestingModule = await Test.createTestingModule({
+      providers: [
+        WalletService,
+        {
+          provide: getRepositoryToken(WalletEntity),
+          useValue: mockWalletRepository,
+        },
+        ...[WalletTransactionEntity, UserEntity].map((entity) => ({
+          provide: getRepositoryToken(entity),
+          useValue: {},
+        })),
+        { provide: DataSource, useValue: {} },
+        { provide: IdGeneratorService, useValue: {} },
+        { provide: FinancialEventSourcingService, useValue: {} },
+        { provide: EventEmitter2, useValue: { emit: jest.fn() } },
+        { provide: WalletLedgerService, useValue: mockWalletLedgerService },
+      ],
+    }).compile();
+
+    service = module.get<WalletService>(WalletService);
+  });
+
+  describe('updateWallet', () => {
+    it('should keep credits compacted between the load and the write', async () => {
+      // Shard compaction folds 50 into the row right after the first load
+      mockWalletRepository.findOne
+        .mockImplementationOnce(async () => {
+          const wallet = await loadRow();
+          compact(50);
+          return wallet;
+        })
+        .mockImplementation(loadRow);
+
+      const response = await service.updateWallet(
+        'wallet-1',
+        { status: WalletStatus.FROZEN, notes: 'Chargeback review' },
+        'admin-1',
+      );
+
+      expect(mockWalletRepository.save).not.toHaveBeenCalled();
+      expect(mockWalletRepository.update).toHaveBeenCalledWith('wallet-1', {
+        status: WalletStatus.FROZEN,
+        frozenAt: expect.any(Date),
+        frozenBy: 'admin-1',
+        frozenReason: 'Chargeback review',
+      });
+      expect(row.balance).toBe(150);
+      expect(response).toMatchObject({
+        status: WalletStatus.FROZEN,
+        balance: 150,
+        availableBalance: 150,
+      });
+    });
+  });
+});
@@ -12,7 +12,14 @@ import {
 } from '@nestjs/common';
 import { EventEmitter2 } from '@nestjs/event-emitter';
 import { InjectRepository } from '@nestjs/typeorm';
-import { Between, DataSource, FindOptionsWhere, In, Repository } from 'typeorm';
+import {
+  Between,
+  DataSource,
+  EntityManager,
+  FindOptionsWhere,
+  In,
+  Repository,
+} from 'typeorm';
 import {
   TransactionStatus,
   TransactionType,
@@ -35,6 +42,12 @@ import {
   WalletTransactionType,
 } from './dto/wallet.dto';
 import { WalletEntity } from './entities/wallet.entity';
+import { WalletLedgerService } from './services/wallet-ledger.service';
+
+export interface WalletCredit {
+  partnerId: string;
+  transactionDto: WalletTransactionDto;
+}
 
 @Injectable()
 export class WalletService {
@@ -49,6 +62,7 @@ export class WalletService {
     private idGeneratorService: IdGeneratorService,
     private financialEventSourcingService: FinancialEventSourcingService,
     private eventEmitter: EventEmitter2,
+    private walletLedgerService: WalletLedgerService,
   ) {}
 
   async createWallet(
@@ -133,6 +147,7 @@ export class WalletService {
       throw new NotFoundException('Wallet not found');
     }
 
+    await this.addUnsettledCredits([wallet]);
     return this.mapToWalletResponse(wallet);
   }
 
@@ -146,6 +161,7 @@ export class WalletService {
       throw new NotFoundException('Wallet not found');
     }
 
+    await this.addUnsettledCredits([wallet]);
     return this.mapToWalletResponse(wallet);
   }
 
@@ -179,6 +195,7 @@ export class WalletService {
       .skip((page - 1) * limit)
       .take(limit)
       .getManyAndCount();
+    await this.addUnsettledCredits(wallets);
 
     return {
       wallets: wallets.map((wallet) => this.mapToWalletResponse(wallet)),
@@ -194,30 +211,35 @@ export class WalletService {
   ): Promise<WalletResponseDto> {
     const wallet = await this.walletRepository.findOne({
       where: { id: walletId },
-      relations: ['partner'],
     });
 
     if (!wallet) {
       throw new NotFoundException('Wallet not found');
     }
 
+    const { notes, ...settings } = updateWalletDto;
+    const changes: Partial<WalletEntity> = settings;
+
     // Handle status changes
     if (updateWalletDto.status && updateWalletDto.status !== wallet.status) {
       if (updateWalletDto.status === WalletStatus.FROZEN) {
-        wallet.frozenAt = new Date();
-        wallet.frozenBy = updatedBy;
-        wallet.frozenReason = updateWalletDto.notes || 'Wallet frozen by admin';
+        changes.frozenAt = new Date();
+        changes.frozenBy = updatedBy;
+        changes.frozenReason = notes || 'Wallet frozen by admin';
       } else if (wallet.status === WalletStatus.FROZEN) {
-        wallet.frozenAt = null;
-        wallet.frozenBy = null;
-        wallet.frozenReason = null;
+        changes.frozenAt = null;
+        changes.frozenBy = null;
+        changes.frozenReason = null;
       }
     }
 
-    Object.assign(wallet, updateWalletDto);
-    const updatedWallet = await this.walletRepository.save(wallet);
+    // Only the changed columns: saving the loaded entity would write back
+    // a balance that shard compaction may have moved since it was read
+    if (Object.keys(changes).length > 0) {
+      await this.walletRepository.update(walletId, changes);
+    }
 
-    return this.mapToWalletResponse(updatedWallet);
+    return this.getWalletById(walletId);
   }
 
   // Removed duplicate methods - using the ones at the end of the file
@@ -232,20 +254,6 @@ export class WalletService {
     await queryRunner.startTransaction();
 
     try {
-      // Get wallet with lock
-      const wallet = await queryRunner.manager.findOne(WalletEntity, {
-        where: { id: walletId },
-        lock: { mode: 'pessimistic_write' },
-      });
-
-      if (!wallet) {
-        throw new NotFoundException('Wallet not found');
-      }
-
-      if (!wallet.canTransact) {
-        throw new ForbiddenException('Wallet is not active for transactions');
-      }
-
       const isCredit = [
         WalletTransactionType.CREDIT,
         WalletTransactionType.COMMISSION,
@@ -258,25 +266,50 @@ export class WalletService {
         WalletTransactionType.FEE,
       ].includes(transactionDto.type);
 
+      // Credits to sharded wallets don't lock the wallet row
+      const wallet = isCredit
+        ? await this.findWalletForCredit(queryRunner.manager, walletId)
+        : await this.walletLedgerService.lockWallet(
+            queryRunner.manager,
+            walletId,
+          );
+
+      if (!wallet) {
+        throw new NotFoundException('Wallet not found');
+      }
+
+      if (!wallet.canTransact) {
+        throw new ForbiddenException('Wallet is not active for transactions');
+      }
+
       // Check balance for debit transactions
       if (isDebit && wallet.availableBalance < transactionDto.amount) {
         throw new BadRequestException('Insufficient balance');
       }
 
       // Calculate new balances
-      const balanceBefore = wallet.balance;
       let balanceAfter: number;
 
-      if (isCredit) {
-        balanceAfter = balanceBefore + transactionDto.amount;
-        wallet.balance = balanceAfter;
-        wallet.availableBalance = balanceAfter - wallet.pendingBalance;
-      } else if (isDebit) {
-        balanceAfter = balanceBefore - transactionDto.amount;
+      if (isCredit && wallet.usesShardedLedger) {
+        const balances = await this.walletLedgerService.appendCredits(
+          queryRunner.manager,
+          [{ wallet, amount: transactionDto.amount }],
+        );
+        balanceAfter = balances.get(wallet.id);
+      } else {
+        const balanceBefore = wallet.balance;
+
+        if (isCredit) {
+          balanceAfter = balanceBefore + transactionDto.amount;
+        } else if (isDebit) {
+          balanceAfter = balanceBefore - transactionDto.amount;
+        } else {
+          balanceAfter = balanceBefore;
+        }
         wallet.balance = balanceAfter;
         wallet.availableBalance = balanceAfter - wallet.pendingBalance;
-      } else {
-        balanceAfter = balanceBefore;
+        wallet.lastTransactionAt = new Date();
+        await this.saveBalances(queryRunner.manager, wallet);
       }
 
       // Create transaction record
@@ -298,10 +331,6 @@ export class WalletService {
         ),
       });
 
-      // Update wallet
-      wallet.lastTransactionAt = new Date();
-      await queryRunner.manager.save(WalletEntity, wallet);
-
       // Save transaction
       const savedTransaction = await queryRunner.manager.save(
         WalletTransactionEntity,
@@ -765,6 +794,7 @@ export class WalletService {
       throw new NotFoundException('Wallet not found');
     }
 
+    await this.addUnsettledCredits([wallet]);
     return {
       balance: wallet.balance,
       availableBalance: wallet.availableBalance,
@@ -854,80 +884,179 @@ export class WalletService {
     transactionDto: WalletTransactionDto,
     userId: string,
   ) {
-    const wallet = await this.walletRepository.findOne({
-      where: { partnerId },
-    });
+    const [transaction] = await this.creditWallets(
+      [{ partnerId, transactionDto }],
+      userId,
+    );
+    return transaction;
+  }
 
-    if (!wallet) {
+  /**
+   * Credit several wallets in one database transaction, e.g. to settle a
+   * batch of commissions. Each sharded wallet gets a single shard increment
+   * for all of its credits; other wallets are locked in id order and
+   * updated once.
+   */
+  async creditWallets(
+    credits: WalletCredit[],
+    userId: string,
+  ): Promise<WalletTransactionResponseDto[]> {
+    if (credits.length === 0) return [];
+
+    const partnerIds = Array.from(new Set(credits.map((c) => c.partnerId)));
+    const wallets = await this.walletRepository.find({
+      where: { partnerId: In(partnerIds) },
+      loadEagerRelations: false,
+    });
+    const walletByPartner = new Map<string, WalletEntity>();
+    for (const wallet of wallets) {
+      if (!walletByPartner.has(wallet.partnerId)) {
+        walletByPartner.set(wallet.partnerId, wallet);
+      }
+    }
+    if (partnerIds.some((id) => !walletByPartner.has(id))) {
       throw new NotFoundException('Wallet not found');
     }
 
-    const transaction = this.transactionRepository.create({
-      userId: partnerId,
-      walletBalanceId: wallet.id,
-      transactionId: this.idGeneratorService.generateId(EntityType.TRANSACTION),
-      type: TransactionType.CREDIT,
-      source: TransactionSource.ADMIN_ADJUSTMENT,
-      amount: transactionDto.amount,
-      balanceAfter: wallet.balance + transactionDto.amount,
-      currency: wallet.currency,
-      status: TransactionStatus.COMPLETED,
-      description: transactionDto.description || 'Credit transaction',
-      referenceId: transactionDto.referenceId,
-      referenceType: transactionDto.referenceType,
-      processedAt: new Date(),
-      metadata: {
-        initiatedBy: userId,
-        ...transactionDto.metadata,
-      },
-    });
+    const totals = new Map<string, number>();
+    for (const { partnerId, transactionDto } of credits) {
+      const walletId = walletByPartner.get(partnerId).id;
+      totals.set(
+        walletId,
+        (totals.get(walletId) ?? 0) + Number(transactionDto.amount),
+      );
+    }
+    const credited = Array.from(walletByPartner.values()).sort((a, b) =>
+      a.id.localeCompare(b.id),
+    );
 
-    // Update wallet balance
-    wallet.balance += transactionDto.amount;
-    wallet.availableBalance = wallet.balance - wallet.pendingBalance;
-    wallet.lastTransactionAt = new Date();
+    const queryRunner = this.dataSource.createQueryRunner();
+    await queryRunner.connect();
+    await queryRunner.startTransaction();
 
-    await this.walletRepository.save(wallet);
-    const savedTransaction = await this.transactionRepository.save(transaction);
+    const balances = new Map<string, number>();
+    const pendingBalances = new Map<string, number>();
+    let savedTransactions: WalletTransactionEntity[];
+    try {
+      // Wallet rows before shard rows, as everywhere else
+      for (const wallet of credited.filter((w) => !w.usesShardedLedger)) {
+        const locked = await this.walletLedgerService.lockWallet(
+          queryRunner.manager,
+          wallet.id,
+        );
+        locked.balance += totals.get(wallet.id);
+        locked.availableBalance = locked.balance - locked.pendingBalance;
+        locked.lastTransactionAt = new Date();
+        await this.saveBalances(queryRunner.manager, locked);
+        balances.set(wallet.id, locked.balance);
+      }
 
-    // Emit wallet credited event
-    this.eventEmitter.emit('wallet.credited', {
-      walletId: wallet.id,
-      partnerId: wallet.partnerId,
-      amount: transactionDto.amount,
-      currency: wallet.currency,
-      transactionId: savedTransaction.transactionId,
-      balanceAfter: wallet.balance,
-      metadata: savedTransaction.metadata,
-    });
+      const sharded = credited.filter((w) => w.usesShardedLedger);
+      const ledgerBalances = await this.walletLedgerService.appendCredits(
+        queryRunner.manager,
+        sharded.map((wallet) => ({ wallet, amount: totals.get(wallet.id) })),
+      );
+      for (const wallet of credited) {
+        if (ledgerBalances.has(wallet.id)) {
+          balances.set(wallet.id, ledgerBalances.get(wallet.id));
+        }
+        pendingBalances.set(wallet.id, Number(wallet.pendingBalance));
+      }
 
-    // Store financial event
-    await this.financialEventSourcingService.storeEvent({
-      aggregateId: wallet.partnerId,
-      aggregateType: AggregateType.WALLET,
-      eventType: FinancialEventType.WALLET_CREDITED,
-      eventData: {
+      // Walk back from each wallet's final balance to get per-entry balances
+      const remaining = new Map(balances);
+      const balanceAfter: number[] = [];
+      for (let i = credits.length - 1; i >= 0; i--) {
+        const walletId = walletByPartner.get(credits[i].partnerId).id;
+        balanceAfter[i] = remaining.get(walletId);
+        remaining.set(
+          walletId,
+          balanceAfter[i] - Number(credits[i].transactionDto.amount),
+        );
+      }
+
+      const transactions = credits.map(({ partnerId, transactionDto }, i) => {
+        const wallet = walletByPartner.get(partnerId);
+        return this.transactionRepository.create({
+          userId: partnerId,
+          walletBalanceId: wallet.id,
+          transactionId: this.idGeneratorService.generateId(
+            EntityType.TRANSACTION,
+          ),
+          type: TransactionType.CREDIT,
+          source: TransactionSource.ADMIN_ADJUSTMENT,
+          amount: transactionDto.amount,
+          balanceAfter: balanceAfter[i],
+          currency: wallet.currency,
+          status: TransactionStatus.COMPLETED,
+          description: transactionDto.description || 'Credit transaction',
+          referenceId: transactionDto.referenceId,
+          referenceType: transactionDto.referenceType,
+          processedAt: new Date(),
+          metadata: {
+            initiatedBy: userId,
+            ...transactionDto.metadata,
+          },
+        });
+      });
+
+      savedTransactions = await queryRunner.manager.save(
+        WalletTransactionEntity,
+        transactions,
+      );
+
+      await queryRunner.commitTransaction();
+    } catch (error) {
+      await queryRunner.rollbackTransaction();
+      throw error;
+    } finally {
+      await queryRunner.release();
+    }
+
+    for (const [i, { partnerId, transactionDto }] of credits.entries()) {
+      const wallet = walletByPartner.get(partnerId);
+      const savedTransaction = savedTransactions[i];
+      const balanceAfter = savedTransaction.balanceAfter;
+
+      // Emit wallet credited event
+      this.eventEmitter.emit('wallet.credited', {
         walletId: wallet.id,
+        partnerId: wallet.partnerId,
         amount: transactionDto.amount,
         currency: wallet.currency,
         transactionId: savedTransaction.transactionId,
-        balanceAfter: wallet.balance,
-        availableBalanceAfter: wallet.availableBalance,
-        description: transactionDto.description,
-        source: TransactionSource.ADMIN_ADJUSTMENT,
-      },
-      metadata: {
-        initiatedBy: userId,
-        timestamp: new Date().toISOString(),
-        ...transactionDto.metadata,
-      },
-      userId: partnerId,
-      partnerId: wallet.partnerId,
-      amount: transactionDto.amount,
-      currency: wallet.currency,
-    });
+        balanceAfter,
+        metadata: savedTransaction.metadata,
+      });
 
-    return this.mapToTransactionResponse(savedTransaction);
+      // Store financial event
+      await this.financialEventSourcingService.storeEvent({
+        aggregateId: wallet.partnerId,
+        aggregateType: AggregateType.WALLET,
+        eventType: FinancialEventType.WALLET_CREDITED,
+        eventData: {
+          walletId: wallet.id,
+          amount: transactionDto.amount,
+          currency: wallet.currency,
+          transactionId: savedTransaction.transactionId,
+          balanceAfter,
+          availableBalanceAfter: balanceAfter - pendingBalances.get(wallet.id),
+          description: transactionDto.description,
+          source: TransactionSource.ADMIN_ADJUSTMENT,
+        },
+        metadata: {
+          initiatedBy: userId,
+          timestamp: new Date().toISOString(),
+          ...transactionDto.metadata,
+        },
+        userId: partnerId,
+        partnerId: wallet.partnerId,
+        amount: transactionDto.amount,
+        currency: wallet.currency,
+      });
+    }
+
+    return savedTransactions.map((t) => this.mapToTransactionResponse(t));
   }
 
   async debitWallet(
@@ -935,45 +1064,72 @@ export class WalletService {
     transactionDto: WalletTransactionDto,
     userId: string,
   ) {
-    const wallet = await this.walletRepository.findOne({
+    const found = await this.walletRepository.findOne({
       where: { partnerId },
+      loadEagerRelations: false,
     });
 
-    if (!wallet) {
+    if (!found) {
       throw new NotFoundException('Wallet not found');
     }
 
-    if (wallet.availableBalance < transactionDto.amount) {
-      throw new BadRequestException('Insufficient balance');
-    }
+    const queryRunner = this.dataSource.createQueryRunner();
+    await queryRunner.connect();
+    await queryRunner.startTransaction();
 
-    const transaction = this.transactionRepository.create({
-      userId: partnerId,
-      walletBalanceId: wallet.id,
-      transactionId: this.idGeneratorService.generateId(EntityType.TRANSACTION),
-      type: TransactionType.DEBIT,
-      source: TransactionSource.ADMIN_ADJUSTMENT,
-      amount: transactionDto.amount,
-      balanceAfter: wallet.balance - transactionDto.amount,
-      currency: wallet.currency,
-      status: TransactionStatus.COMPLETED,
-      description: transactionDto.description || 'Debit transaction',
-      referenceId: transactionDto.referenceId,
-      referenceType: transactionDto.referenceType,
-      processedAt: new Date(),
-      metadata: {
-        initiatedBy: userId,
-        ...transactionDto.metadata,
-      },
-    });
+    let wallet: WalletEntity;
+    let savedTransaction: WalletTransactionEntity;
+    try {
+      // Locks the wallet and folds in sharded credits before the check
+      wallet = await this.walletLedgerService.lockWallet(
+        queryRunner.manager,
+        found.id,
+      );
+
+      if (wallet.availableBalance < transactionDto.amount) {
+        throw new BadRequestException('Insufficient balance');
+      }
 
-    // Update wallet balance
-    wallet.balance -= transactionDto.amount;
-    wallet.availableBalance = wallet.balance - wallet.pendingBalance;
-    wallet.lastTransactionAt = new Date();
+      const transaction = this.transactionRepository.create({
+        userId: partnerId,
+        walletBalanceId: wallet.id,
+        transactionId: this.idGeneratorService.generateId(
+          EntityType.TRANSACTION,
+        ),
+        type: TransactionType.DEBIT,
+        source: TransactionSource.ADMIN_ADJUSTMENT,
+        amount: transactionDto.amount,
+        balanceAfter: wallet.balance - transactionDto.amount,
+        currency: wallet.currency,
+        status: TransactionStatus.COMPLETED,
+        description: transactionDto.description || 'Debit transaction',
+        referenceId: transactionDto.referenceId,
+        referenceType: transactionDto.referenceType,
+        processedAt: new Date(),
+        metadata: {
+          initiatedBy: userId,
+          ...transactionDto.metadata,
+        },
+      });
 
-    await this.walletRepository.save(wallet);
-    const savedTransaction = await this.transactionRepository.save(transaction);
+      // Update wallet balance
+      wallet.balance -= transactionDto.amount;
+      wallet.availableBalance = wallet.balance - wallet.pendingBalance;
+      wallet.lastTransactionAt = new Date();
+
+      await this.saveBalances(queryRunner.manager, wallet);
+      savedTransaction = await queryRunner.manager.save(
+        WalletTransactionEntity,
+        transaction,
+      );
+
+      await queryRunner.commitTransaction();
+    } catch (error) {
+      await queryRunner.rollbackTransaction();
+      throw error;
+    } finally {
+      await queryRunner.release();
+    }
 
     // Emit wallet debited event
     this.eventEmitter.emit('wallet.debited', {
@@ -1020,45 +1176,117 @@ export class WalletService {
     body: { amount: number; notes?: string },
     user: any,
   ) {
-    const wallet = await this.walletRepository.findOne({
+    const found = await this.walletRepository.findOne({
       where: { partnerId },
+      loadEagerRelations: false,
     });
 
-    if (!wallet) {
+    if (!found) {
       throw new NotFoundException('Wallet not found');
     }
 
-    if (wallet.availableBalance < body.amount) {
-      throw new BadRequestException('Insufficient balance for payout');
+    const queryRunner = this.dataSource.createQueryRunner();
+    await queryRunner.connect();
+    await queryRunner.startTransaction();
+
+    try {
+      // Locks the wallet and folds in sharded credits before the check
+      const wallet = await this.walletLedgerService.lockWallet(
+        queryRunner.manager,
+        found.id,
+      );
+
+      if (wallet.availableBalance < body.amount) {
+        throw new BadRequestException('Insufficient balance for payout');
+      }
+
+      const transaction = this.transactionRepository.create({
+        userId: partnerId,
+        walletBalanceId: wallet.id,
+        transactionId: this.idGeneratorService.generateId(
+          EntityType.TRANSACTION,
+        ),
+        type: TransactionType.WITHDRAWAL,
+        source: TransactionSource.WITHDRAWAL,
+        amount: body.amount,
+        balanceAfter: wallet.balance - body.amount,
+        currency: wallet.currency,
+        status: TransactionStatus.PENDING,
+        description: body.notes || 'Payout request',
+        processedAt: null,
+        metadata: {
+          initiatedBy: user?.id || partnerId,
+          notes: body.notes,
+        },
+      });
+
+      // Update wallet pending balance
+      wallet.pendingBalance += body.amount;
+      wallet.availableBalance = wallet.balance - wallet.pendingBalance;
+      wallet.lastTransactionAt = new Date();
+
+      await this.saveBalances(queryRunner.manager, wallet);
+      const savedTransaction = await queryRunner.manager.save(
+        WalletTransactionEntity,
+        transaction,
+      );
+
+      await queryRunner.commitTransaction();
+
+      return this.mapToTransactionResponse(savedTransaction);
+    } catch (error) {
+      await queryRunner.rollbackTransaction();
+      throw error;
+    } finally {
+      await queryRunner.release();
     }
+  }
 
-    const transaction = this.transactionRepository.create({
-      userId: partnerId,
-      walletBalanceId: wallet.id,
-      transactionId: this.idGeneratorService.generateId(EntityType.TRANSACTION),
-      type: TransactionType.WITHDRAWAL,
-      source: TransactionSource.WITHDRAWAL,
-      amount: body.amount,
-      balanceAfter: wallet.balance - body.amount,
-      currency: wallet.currency,
-      status: TransactionStatus.PENDING,
-      description: body.notes || 'Payout request',
-      processedAt: null,
-      metadata: {
-        initiatedBy: user?.id || partnerId,
-        notes: body.notes,
-      },
+  /**
+   * Wallet for a credit: read without a lock for sharded wallets, which
+   * take credits on their shards, and locked otherwise.
+   */
+  private async findWalletForCredit(
+    manager: EntityManager,
+    walletId: string,
+  ): Promise<WalletEntity | null> {
+    const wallet = await manager.findOne(WalletEntity, {
+      where: { id: walletId },
+      loadEagerRelations: false,
     });
+    if (!wallet || wallet.usesShardedLedger) return wallet;
+
+    return this.walletLedgerService.lockWallet(manager, walletId);
+  }
 
-    // Update wallet pending balance
-    wallet.pendingBalance += body.amount;
-    wallet.availableBalance = wallet.balance - wallet.pendingBalance;
-    wallet.lastTransactionAt = new Date();
+  private async saveBalances(
+    manager: EntityManager,
+    wallet: WalletEntity,
+  ): Promise<void> {
+    await manager.update(WalletEntity, wallet.id, {
+      balance: wallet.balance,
+      availableBalance: wallet.availableBalance,
+      pendingBalance: wallet.pendingBalance,
+      lastTransactionAt: wallet.lastTransactionAt,
+    });
+  }
 
-    await this.walletRepository.save(wallet);
-    const savedTransaction = await this.transactionRepository.save(transaction);
+  /**
+   * Add credits still held in balance shards to the loaded wallets, for
+   * reads. Balance-changing paths use WalletLedgerService.lockWallet.
+   */
+  private async addUnsettledCredits(wallets: WalletEntity[]): Promise<void> {
+    const sharded = wallets.filter((w) => w.usesShardedLedger);
+    if (sharded.length === 0) return;
 
-    return this.mapToTransactionResponse(savedTransaction);
+    const unsettled = await this.walletLedgerService.getUnsettledTotals(
+      sharded.map((w) => w.id),
+    );
+    for (const wallet of sharded) {
+      const amount = unsettled.get(wallet.id) ?? 0;
+      wallet.balance = Number(wallet.balance) + amount;
+      wallet.availableBalance = Number(wallet.availableBalance) + amount;
+    }
   }
 
   private mapToWalletResponse(wallet: WalletEntity): WalletResponseDto {
@@ -23,9 +23,7 @@ import { LoggerModule } from 'nestjs-pino';
 
 import { FastifyAdapter } from '@bull-board/fastify';
 import { GracefulShutdownModule } from 'nestjs-graceful-shutdown';
-import { ApiModule } from './api/api.module';
 import { AppController } from './app.controller';
-import { AuthModule } from './auth/auth.module';
 import { default as awsConfig } from './config/aws/aws.config';
 import {
   BULL_BOARD_PATH,
@@ -41,11 +39,13 @@ import { AppThrottlerGuard } from './config/throttler/throttler.guard';
 import { default as useI18nFactory } from './i18n/i18n.factory';
 import { CacheModule as CacheManagerModule } from './shared/cache/cache.module';
 import { MailModule } from './shared/mail/mail.module';
-import { SocketModule } from './shared/socket/socket.module';
 import { default as useLoggerFactory } from './tools/logger/logger-factory';
 import { IdGeneratorService } from './utils/id-generator.service';
-import { WorkerModule } from './worker/worker.module';
 
+/**
+ * Root module of both process roles. Each role requires its own module graph
+ * on demand, so a worker never loads the API and vice versa.
+ */
 @Module({})
 export class AppModule {
   private static common(): DynamicModule {
@@ -97,7 +97,14 @@ export class AppModule {
       ],
     };
   }
-  static main(): DynamicModule {
+  static async main(): Promise<DynamicModule> {
+    const [{ ApiModule }, { AuthModule }, { SocketModule }] =
+      await Promise.all([
+        import('./api/api.module'),
+        import('./auth/auth.module'),
+        import('./shared/socket/socket.module'),
+      ]);
+
     return {
       module: AppModule,
       imports: [
@@ -136,10 +143,15 @@ export class AppModule {
     };
   }
 
-  static worker(): DynamicModule {
+  static async worker(queues?: string[]): Promise<DynamicModule> {
+    const { WorkerModule } = await import('./worker/worker.module');
+
     return {
       module: AppModule,
-      imports: [...AppModule.common().imports, WorkerModule],
+      imports: [
+        ...AppModule.common().imports,
+        await WorkerModule.register(queues),
+      ],
     };
   }
 }
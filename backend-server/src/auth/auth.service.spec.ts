@@ -7,8 +7,11 @@ import { ConfigService } from '@nestjs/config';
 import { Test, TestingModule } from '@nestjs/testing';
 import { getRepositoryToken } from '@nestjs/typeorm';
 import { Repository } from 'typeorm';
+import { IdGeneratorService } from '../utils/id-generator.service';
 import { AuthService } from './auth.service';
+import { AccountEntity } from './entities/account.entity';
 import { UserEntity } from './entities/user.entity';
+import { TokenCacheService } from './services/token-cache.service';
 
 describe('AuthService', () => {
   let service: AuthService;
@@ -58,6 +61,19 @@ describe('AuthService', () => {
           provide: getRepositoryToken(UserEntity),
           useValue: mockUserRepository,
         },
+        {
+          provide: getRepositoryToken(AccountEntity),
+          useValue: { findOne: jest.fn() },
+        },
+        { provide: IdGeneratorService, useValue: {} },
+        {
+          provide: TokenCacheService,
+          useValue: {
+            getOrVerify: jest.fn(),
+            getPrincipal: jest.fn(),
+            setPrincipal: jest.fn(),
+          },
+        },
       ],
     }).compile();
 
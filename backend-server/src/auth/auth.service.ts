@@ -19,6 +19,7 @@ import { Repository } from 'typeorm';
 import { IdGeneratorService } from '../utils/id-generator.service';
 import { AccountEntity } from './entities/account.entity';
 import { UserEntity } from './entities/user.entity';
+import { TokenCacheService } from './services/token-cache.service';
 
 /**
  * AuthService handles authentication-related tasks for the application.
@@ -35,8 +36,17 @@ export class AuthService {
     @InjectRepository(AccountEntity)
     private readonly accountRepository: Repository<AccountEntity>,
     private readonly idGeneratorService: IdGeneratorService,
-  ) {}
+    private readonly tokenCacheService: TokenCacheService,
+  ) {
+    const nodeEnv = this.configService.get('app.nodeEnv', { infer: true });
+    this.isDevelopment = nodeEnv === 'development' || nodeEnv === 'local';
+    this.authSecret = this.configService.get('auth.authSecret', {
+      infer: true,
+    });
+  }
   private readonly logger = new Logger(AuthService.name);
+  private readonly isDevelopment: boolean;
+  private readonly authSecret: string;
 
   async sendSigninMagicLink({ email, url }: { email: string; url: string }) {
     const user = await this.userRepository.findOne({
@@ -137,55 +147,43 @@ export class AuthService {
    * Supports both backend-generated tokens and NextAuth tokens
    */
   async validateToken(token: string): Promise<any> {
-    try {
-      // Handle mock token for development
-      const nodeEnv = this.configService.get('app.nodeEnv', { infer: true });
-      this.logger.debug(`validateToken: env=${nodeEnv}`);
-      if (
-        (nodeEnv === 'development' || nodeEnv === 'local') &&
-        token === 'mock-jwt-token-for-development'
-      ) {
-        this.logger.debug('validateToken: using mock dev token');
-        return {
-          sub: 'mock-admin-id',
-          email: 'admin@test.com',
-          role: 'SuperAdmin',
-          firstName: 'Admin',
-          lastName: 'User',
-        };
-      }
-
-      const secret = this.configService.getOrThrow('auth.authSecret', {
-        infer: true,
-      });
-      const payload = verify(token, secret);
-      this.logger.debug('validateToken: token verified');
-
-      // Handle NextAuth token format
-      if (
-        payload &&
-        typeof payload === 'object' &&
-        'email' in payload &&
-        !('sub' in payload)
-      ) {
-        this.logger.debug('validateToken: converting NextAuth format');
-        // Convert NextAuth format to our expected format
-        return {
-          sub: payload.email, // Use email as identifier for NextAuth tokens
-          email: payload.email,
-          role: payload.role || 'user',
-          ...payload,
-        };
-      }
+    // Handle mock token for development
+    if (this.isDevelopment && token === 'mock-jwt-token-for-development') {
+      return {
+        sub: 'mock-admin-id',
+        email: 'admin@test.com',
+        role: 'SuperAdmin',
+        firstName: 'Admin',
+        lastName: 'User',
+      };
+    }
 
-      this.logger.debug('validateToken: returning payload');
-      return payload;
+    try {
+      // Verified payloads are cached per token until expiry or revocation
+      return await this.tokenCacheService.getOrVerify(token, () =>
+        this.verifyToken(token),
+      );
     } catch (error) {
       this.logger.error(`validateToken error: ${error.message}`);
       throw new Error('Invalid token');
     }
   }
 
+  /**
+   * Revokes an access token, on this and every other instance
+   */
+  async revokeToken(token: string): Promise<void> {
+    await this.tokenCacheService.revokeToken(token);
+  }
+
+  /**
+   * Drops the cached user for token subjects (id and/or email) on every
+   * instance, so the next request reloads it
+   */
+  async invalidatePrincipal(...subjects: string[]): Promise<void> {
+    await this.tokenCacheService.invalidatePrincipal(...subjects);
+  }
+
   /**
    * Signs in a user with email and password
    */
@@ -309,28 +307,21 @@ export class AuthService {
     token: string,
   ): Promise<{ valid: boolean; user?: UserEntity }> {
     try {
-      this.logger.debug('validateSession: start');
       const payload = await this.validateToken(token);
       if (!payload) {
-        this.logger.debug('validateSession: no payload');
         return { valid: false };
       }
 
-      this.logger.debug('validateSession: payload ok');
-      let user: UserEntity | null = null;
-
       // Dev-mode fallback: if token represents our dev admin, synthesize a user
-      const nodeEnv = this.configService.get('app.nodeEnv', { infer: true });
       if (
-        (nodeEnv === 'development' || nodeEnv === 'local') &&
+        this.isDevelopment &&
         payload.email &&
         ['admin@cowors.com', 'admin@test.com', 'admin@admin.com'].includes(
           payload.email,
         ) &&
         payload.sub === 'dev-admin-id'
       ) {
-        this.logger.debug('validateSession: using dev admin synthetic user');
-        user = {
+        const user = {
           id: 'dev-admin-id',
           email: payload.email,
           role: 'Admin' as any,
@@ -345,35 +336,24 @@ export class AuthService {
         return { valid: true, user };
       }
 
-      // Check if payload.sub contains an email (NextAuth format)
-      if (payload.sub && payload.sub.includes('@')) {
-        this.logger.debug(`validateSession: lookup by email: ${payload.sub}`);
-        // NextAuth token - find user by email
-        user = await this.userRepository.findOne({
-          where: { email: payload.sub },
-        });
-      } else {
-        this.logger.debug(`validateSession: lookup by id: ${payload.sub}`);
-        // Backend token - find user by ID (could be UUID or Cowors ID)
-        if (this.idGeneratorService.isValidCoworsId(payload.sub)) {
-          // Cowors ID format - look up by id
-          user = await this.userRepository.findOne({
-            where: { id: payload.sub },
-          });
-        } else {
-          // UUID format - look up by id
-          user = await this.userRepository.findOne({
-            where: { id: payload.sub },
-          });
-        }
+      const cachedUser = this.tokenCacheService.getPrincipal(payload.sub);
+      if (cachedUser) {
+        return { valid: true, user: cachedUser };
       }
 
+      // NextAuth tokens carry the email as subject, backend tokens the id
+      // (a UUID or Cowors ID)
+      const user = await this.userRepository.findOne({
+        where: payload.sub?.includes('@')
+          ? { email: payload.sub }
+          : { id: payload.sub },
+      });
+
       if (!user) {
-        this.logger.debug('validateSession: user not found');
         return { valid: false };
       }
 
-      this.logger.debug(`validateSession: user found id=${user.id}`);
+      this.tokenCacheService.setPrincipal(payload.sub, user);
       return { valid: true, user };
     } catch (error) {
       this.logger.error(
@@ -382,4 +362,26 @@ export class AuthService {
       return { valid: false };
     }
   }
+
+  private verifyToken(token: string): Record<string, any> {
+    const payload = verify(token, this.authSecret);
+
+    // Handle NextAuth token format
+    if (
+      payload &&
+      typeof payload === 'object' &&
+      'email' in payload &&
+      !('sub' in payload)
+    ) {
+      // Convert NextAuth format to our expected format
+      return {
+        sub: payload.email, // Use email as identifier for NextAuth tokens
+        email: payload.email,
+        role: payload.role || 'user',
+        ...payload,
+      };
+    }
+
+    return payload as Record<string, any>;
+  }
 }
@@ -64,6 +64,14 @@ export class AuthController {
   @HttpCode(HttpStatus.OK)
   async logout(@Req() req: FastifyRequest, @Res() res: FastifyReply) {
     try {
+      const [type, bearer] = req.headers.authorization?.split(' ') ?? [];
+      const token =
+        req.cookies['auth-token'] ?? (type === 'Bearer' ? bearer : undefined);
+      if (token) {
+        // The JWT stays valid until it expires unless it is revoked
+        await this.authService.revokeToken(token);
+      }
+
       res.clearCookie('auth-token');
       return res.status(200).send({
         success: true,
@@ -1,18 +1,21 @@
 import { UserEntity } from '@/auth/entities/user.entity';
 import { RefreshTokenEntity } from '@/database/entities/refresh-token.entity';
 import { CacheModule } from '@/shared/cache/cache.module';
+import { RedisModule } from '@/shared/redis/redis.module';
 import { Module } from '@nestjs/common';
 import { TypeOrmModule } from '@nestjs/typeorm';
 import { RefreshTokenController } from '../controllers/refresh-token.controller';
 import { RefreshTokenService } from '../services/refresh-token.service';
+import { TokenCacheService } from '../services/token-cache.service';
 
 @Module({
   imports: [
     TypeOrmModule.forFeature([RefreshTokenEntity, UserEntity]),
     CacheModule,
+    RedisModule,
   ],
   controllers: [RefreshTokenController],
-  providers: [RefreshTokenService],
-  exports: [RefreshTokenService],
+  providers: [RefreshTokenService, TokenCacheService],
+  exports: [RefreshTokenService, TokenCacheService],
 })
 export class RefreshTokenModule {}
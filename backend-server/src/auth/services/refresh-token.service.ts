@@ -8,6 +8,7 @@ import { InjectRepository } from '@nestjs/typeorm';
 import { randomBytes } from 'crypto';
 import { Repository } from 'typeorm';
 import { v4 as uuid } from 'uuid';
+import { TokenCacheService } from './token-cache.service';
 
 export interface RefreshTokenPayload {
   userId: string;
@@ -36,6 +37,7 @@ export class RefreshTokenService {
     private readonly userRepository: Repository<UserEntity>,
     private readonly cacheService: CacheService,
     private readonly configService: ConfigService<GlobalConfig>,
+    private readonly tokenCacheService: TokenCacheService,
   ) {
     const authConfig = this.configService.getOrThrow('auth', { infer: true });
     // Default: 7 days for refresh token, 1 hour for access token
@@ -245,6 +247,9 @@ export class RefreshTokenService {
       });
     }
 
+    // Access tokens already issued to the user stop working as well
+    await this.tokenCacheService.revokeSubject(userId);
+
     this.logger.log(`Revoked all refresh tokens for user ${userId}`);
   }
 
@@ -272,6 +277,11 @@ export class RefreshTokenService {
       });
     }
 
+    // A reused token may have been stolen, so end the access tokens too
+    for (const userId of new Set(tokens.map((token) => token.userId))) {
+      await this.tokenCacheService.revokeSubject(userId);
+    }
+
     this.logger.warn(
       `Revoked token family ${tokenFamily} due to security breach`,
     );
@@ -0,0 +1,313 @@
+import { UserEntity } from '@/auth/entities/user.entity';
+import { CacheService } from '@/shared/cache/cache.service';
+import { RedisService } from '@/shared/redis/redis.service';
+import { Injectable, Logger, OnModuleInit } from '@nestjs/common';
+import { createHash } from 'crypto';
+import { decode } from 'jsonwebtoken';
+
+export type TokenPayload = Record<string, any>;
+
+type Revocation =
+  | { type: 'token'; hash: string; expiresAt: number }
+  | { type: 'subject'; subject: string; revokedAt: number }
+  | { type: 'principal'; subjects: string[] };
+
+interface CachedToken {
+  payload: TokenPayload;
+  expiresAt: number;
+}
+
+interface CachedPrincipal {
+  user: UserEntity;
+  expiresAt: number;
+}
+
+const TOKEN_CACHE_MAX = 10000;
+/**
+ * Cached tokens are re-checked against the shared revocation store this
+ * often, covering revocations whose broadcast this instance missed
+ */
+const TOKEN_REVALIDATE_MS = 5 * 60 * 1000;
+const PRINCIPAL_CACHE_MAX = 5000;
+const PRINCIPAL_TTL_MS = 30 * 1000;
+/** Longest access token lifetime issued (AuthService.signIn) */
+const MAX_TOKEN_LIFETIME_MS = 24 * 60 * 60 * 1000;
+const REVOCATION_CHANNEL = 'auth:revocations';
+
+/**
+ * Auth fast path: verified JWTs and their users, cached in process.
+ *
+ * Tokens are keyed by SHA-256 hash and kept until they expire (or at most
+ * TOKEN_REVALIDATE_MS), so `jsonwebtoken.verify` runs once per token rather
+ * than once per request. Revocations are stored in Redis for as long as
+ * the revoked tokens could be valid, and broadcast over pub/sub so every
+ * instance drops its cached copies immediately.
+ */
+@Injectable()
+export class TokenCacheService implements OnModuleInit {
+  private readonly logger = new Logger(TokenCacheService.name);
+  private readonly tokens = new Map<string, CachedToken>();
+  private readonly principals = new Map<string, CachedPrincipal>();
+  /** Revoked token hashes, until the token's own expiry */
+  private readonly revokedTokens = new Map<string, number>();
+  /** Tokens issued to a subject at or before this time are revoked */
+  private readonly revokedSubjects = new Map<string, number>();
+
+  constructor(
+    private readonly cacheService: CacheService,
+    private readonly redisService: RedisService,
+  ) {}
+
+  async onModuleInit(): Promise<void> {
+    try {
+      await this.redisService.subscribe(REVOCATION_CHANNEL, (message) =>
+        this.onRevocationMessage(message),
+      );
+    } catch (error) {
+      this.logger.warn(
+        `Revocations from other instances apply after revalidation: ${error}`,
+      );
+    }
+  }
+
+  /**
+   * Payload of a verified, unrevoked token; runs `verify` only on a miss.
+   * `verify` should throw for invalid tokens.
+   */
+  async getOrVerify(
+    token: string,
+    verify: () => TokenPayload,
+  ): Promise<TokenPayload> {
+    const hash = this.hash(token);
+    const now = Date.now();
+
+    const cached = this.tokens.get(hash);
+    if (cached && cached.expiresAt > now) {
+      if (this.isRevokedLocally(hash, cached.payload, now)) {
+        this.tokens.delete(hash);
+        throw new Error('Token revoked');
+      }
+      // Re-insert so Map order tracks recency
+      this.tokens.delete(hash);
+      this.tokens.set(hash, cached);
+      return { ...cached.payload };
+    }
+
+    const payload = verify();
+    if (await this.isRevoked(hash, payload, now)) {
+      this.tokens.delete(hash);
+      throw new Error('Token revoked');
+    }
+
+    this.tokens.delete(hash);
+    this.tokens.set(hash, {
+      payload,
+      expiresAt: Math.min(
+        this.expiresAt(payload) ?? Infinity,
+        now + TOKEN_REVALIDATE_MS,
+      ),
+    });
+    if (this.tokens.size > TOKEN_CACHE_MAX) {
+      this.tokens.delete(this.tokens.keys().next().value);
+    }
+    return { ...payload };
+  }
+
+  getPrincipal(subject: string): UserEntity | null {
+    const cached = this.principals.get(subject);
+    if (!cached) return null;
+    if (cached.expiresAt <= Date.now()) {
+      this.principals.delete(subject);
+      return null;
+    }
+    return cached.user;
+  }
+
+  setPrincipal(subject: string, user: UserEntity): void {
+    this.principals.delete(subject);
+    this.principals.set(subject, {
+      user,
+      expiresAt: Date.now() + PRINCIPAL_TTL_MS,
+    });
+    if (this.principals.size > PRINCIPAL_CACHE_MAX) {
+      this.principals.delete(this.principals.keys().next().value);
+    }
+  }
+
+  /**
+   * Drop a cached user on every instance, e.g. after their profile, status
+   * or role changed. Pass each subject the user's tokens may carry (id and
+   * email).
+   */
+  async invalidatePrincipal(...subjects: string[]): Promise<void> {
+    await this.publish({ type: 'principal', subjects });
+  }
+
+  /**
+   * Revoke one access token, e.g. on logout
+   */
+  async revokeToken(token: string): Promise<void> {
+    const hash = this.hash(token);
+    const payload = decode(token, { json: true });
+    const expiresAt =
+      this.expiresAt(payload) ?? Date.now() + MAX_TOKEN_LIFETIME_MS;
+
+    await this.publish({ type: 'token', hash, expiresAt }, () =>
+      this.cacheService.set({ key: 'RevokedAccessToken', args: [hash] }, 1, {
+        ttl: Math.max(1, expiresAt - Date.now()),
+      }),
+    );
+  }
+
+  /**
+   * Revoke every access token issued so far to a subject (the token `sub`,
+   * a user id), e.g. when all of a user's sessions are revoked
+   */
+  async revokeSubject(subject: string): Promise<void> {
+    const revokedAt = Date.now();
+
+    await this.publish({ type: 'subject', subject, revokedAt }, () =>
+      this.cacheService.set(
+        { key: 'SubjectTokensRevokedAt', args: [subject] },
+        revokedAt,
+        { ttl: MAX_TOKEN_LIFETIME_MS },
+      ),
+    );
+  }
+
+  /**
+   * Apply a revocation here, persist it for instances that check later and
+   * broadcast it to the running ones. A Redis failure is logged rather than
+   * thrown so the local revocation still takes effect.
+   */
+  private async publish(
+    revocation: Revocation,
+    persist?: () => Promise<unknown>,
+  ): Promise<void> {
+    this.applyRevocation(revocation);
+    try {
+      await persist?.();
+      if (this.redisService.isReady()) {
+        await this.redisService.publish(
+          REVOCATION_CHANNEL,
+          JSON.stringify(revocation),
+        );
+      }
+    } catch (error) {
+      this.logger.error(
+        `Failed to share ${revocation.type} revocation`,
+        error.stack,
+      );
+    }
+  }
+
+  private onRevocationMessage(message: string): void {
+    try {
+      this.applyRevocation(JSON.parse(message) as Revocation);
+    } catch (error) {
+      this.logger.warn(`Ignoring malformed revocation: ${error}`);
+    }
+  }
+
+  private applyRevocation(revocation: Revocation): void {
+    if (revocation.type === 'principal') {
+      for (const subject of revocation.subjects) {
+        this.principals.delete(subject);
+      }
+      return;
+    }
+
+    const now = Date.now();
+    this.pruneRevocations(now);
+
+    if (revocation.type === 'token') {
+      this.revokedTokens.set(revocation.hash, revocation.expiresAt);
+      this.tokens.delete(revocation.hash);
+      return;
+    }
+
+    const { subject, revokedAt } = revocation;
+    this.revokedSubjects.set(
+      subject,
+      Math.max(revokedAt, this.revokedSubjects.get(subject) ?? 0),
+    );
+    this.principals.delete(subject);
+    for (const [hash, cached] of this.tokens) {
+      if (this.isRevokedLocally(hash, cached.payload, now)) {
+        this.tokens.delete(hash);
+      }
+    }
+  }
+
+  private async isRevoked(
+    hash: string,
+    payload: TokenPayload,
+    now: number,
+  ): Promise<boolean> {
+    if (this.isRevokedLocally(hash, payload, now)) return true;
+
+    try {
+      const [tokenRevoked, subjectRevokedAt] = await Promise.all([
+        this.cacheService.get<number>({
+          key: 'RevokedAccessToken',
+          args: [hash],
+        }),
+        payload.sub
+          ? this.cacheService.get<number>({
+              key: 'SubjectTokensRevokedAt',
+              args: [String(payload.sub)],
+            })
+          : null,
+      ]);
+      if (tokenRevoked) return true;
+      return (
+        subjectRevokedAt != null &&
+        this.issuedBefore(payload, subjectRevokedAt)
+      );
+    } catch (error) {
+      // Without Redis only revocations seen by this instance are enforced
+      this.logger.warn(`Could not check token revocations: ${error}`);
+      return false;
+    }
+  }
+
+  private isRevokedLocally(
+    hash: string,
+    payload: TokenPayload,
+    now: number,
+  ): boolean {
+    if ((this.revokedTokens.get(hash) ?? 0) > now) return true;
+
+    const revokedAt = payload.sub
+      ? this.revokedSubjects.get(String(payload.sub))
+      : undefined;
+    return revokedAt != null && this.issuedBefore(payload, revokedAt);
+  }
+
+  private issuedBefore(payload: TokenPayload, revokedAt: number): boolean {
+    // Tokens without `iat` can't be placed in time, so treat them as old
+    if (typeof payload.iat !== 'number') return true;
+    // `iat` has whole-second precision: a token signed later in the same
+    // second as the revocation carries that second and is kept
+    return payload.iat * 1000 < Math.floor(revokedAt / 1000) * 1000;
+  }
+
+  private pruneRevocations(now: number): void {
+    for (const [hash, expiresAt] of this.revokedTokens) {
+      if (expiresAt <= now) this.revokedTokens.delete(hash);
+    }
+    for (const [subject, revokedAt] of this.revokedSubjects) {
+      if (revokedAt <= now - MAX_TOKEN_LIFETIME_MS) {
+        this.revokedSubjects.delete(subject);
+      }
+    }
+  }
+
+  private expiresAt(payload: TokenPayload | null): number | undefined {
+    return typeof payload?.exp === 'number' ? payload.exp * 1000 : undefined;
+  }
+
+  private hash(token: string): string {
+    return createHash('sha256').update(token).digest('hex');
+  }
+}
@@ -7,6 +7,7 @@ import { Test, TestingModule } from '@nestjs/testing';
 import { getRepositoryToken } from '@nestjs/typeorm';
 import { Repository } from 'typeorm';
 import { RefreshTokenService } from '../services/refresh-token.service';
+import { TokenCacheService } from '../services/token-cache.service';
 
 describe('RefreshTokenService', () => {
   let service: RefreshTokenService;
@@ -72,6 +73,12 @@ describe('RefreshTokenService', () => {
             delete: jest.fn(),
           },
         },
+        {
+          provide: TokenCacheService,
+          useValue: {
+            revokeSubject: jest.fn(),
+          },
+        },
         {
           provide: ConfigService,
           useValue: {
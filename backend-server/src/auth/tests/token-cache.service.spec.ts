@@ -0,0 +1,160 @@
+import { CacheService } from '@/shared/cache/cache.service';
+import { RedisService } from '@/shared/redis/redis.service';
+import { Test, TestingModule } from '@nestjs/testing';
+import { TokenCacheService } from '../services/token-cache.service';
+
+describe('TokenCacheService', () => {
+  let service: TokenCacheService;
+
+  const nowSeconds = () => Math.floor(Date.now() / 1000);
+  const payload = (overrides: Record<string, any> = {}) => ({
+    sub: 'user-123',
+    role: 'Admin',
+    iat: nowSeconds() - 60,
+    exp: nowSeconds() + 3600,
+    ...overrides,
+  });
+
+  const mockCacheService = {
+    get: jest.fn(),
+    set: jest.fn(),
+  };
+  const mockRedisService = {
+    isReady: jest.fn(() => true),
+    publish: jest.fn(),
+    subscribe: jest.fn(),
+  };
+
+  beforeEach(async () => {
+    mockCacheService.get.mockResolvedValue(undefined);
+    const module: TestingModule = await Test.createTestingModule({
+      providers: [
+        TokenCacheService,
+        { provide: CacheService, useValue: mockCacheService },
+        { provide: RedisService, useValue: mockRedisService },
+      ],
+    }).compile();
+
+    service = module.get<TokenCacheService>(TokenCacheService);
+  });
+
+  afterEach(() => {
+    jest.clearAllMocks();
+  });
+
+  it('should verify a token once and serve copies from the cache', async () => {
+    const verify = jest.fn(() => payload());
+
+    const first = await service.getOrVerify('token-a', verify);
+    first.role = 'User';
+    const second = await service.getOrVerify('token-a', verify);
+
+    expect(verify).toHaveBeenCalledTimes(1);
+    expect(second.role).toBe('Admin');
+    expect(mockCacheService.get).toHaveBeenCalledTimes(2);
+  });
+
+  it('should reject a cached token once it is revoked', async () => {
+    await service.getOrVerify('token-a', () => payload());
+
+    await service.revokeToken('token-a');
+
+    await expect(
+      service.getOrVerify('token-a', () => payload()),
+    ).rejects.toThrow('Token revoked');
+    expect(mockCacheService.set).toHaveBeenCalledWith(
+      { key: 'RevokedAccessToken', args: [expect.any(String)] },
+      1,
+      { ttl: expect.any(Number) },
+    );
+  });
+
+  it('should revoke tokens issued to a subject before the revocation', async () => {
+    await service.getOrVerify('old-token', () => payload());
+    service.setPrincipal('user-123', { id: 'user-123' } as any);
+
+    await service.revokeSubject('user-123');
+
+    await expect(
+      service.getOrVerify('old-token', () => payload()),
+    ).rejects.toThrow('Token revoked');
+    expect(service.getPrincipal('user-123')).toBeNull();
+    await expect(
+      service.getOrVerify('new-token', () =>
+        payload({ iat: nowSeconds() + 1 }),
+      ),
+    ).resolves.toMatchObject({ sub: 'user-123' });
+  });
+
+  it('should honour revocations stored by other instances', async () => {
+    mockCacheService.get.mockImplementation(async ({ key }) =>
+      key === 'SubjectTokensRevokedAt' ? Date.now() : undefined,
+    );
+
+    await expect(
+      service.getOrVerify('token-b', () => payload()),
+    ).rejects.toThrow('Token revoked');
+  });
+
+  it('should apply revocations broadcast by other instances', async () => {
+    await service.onModuleInit();
+    const [channel, onMessage] = mockRedisService.subscribe.mock.calls[0];
+    await service.getOrVerify('token-c', () => payload());
+
+    onMessage(
+      JSON.stringify({
+        type: 'subject',
+        subject: 'user-123',
+        revokedAt: Date.now(),
+      }),
+    );
+
+    expect(channel).toBe('auth:revocations');
+    await expect(
+      service.getOrVerify('token-c', () => payload()),
+    ).rejects.toThrow('Token revoked');
+  });
+
+  it('should broadcast its own revocations', async () => {
+    await service.revokeSubject('user-123');
+
+    expect(mockRedisService.publish).toHaveBeenCalledWith(
+      'auth:revocations',
+      expect.stringContaining('"subject":"user-123"'),
+    );
+  });
+
+  it('should keep tokens issued in the second of the revocation', async () => {
+    const revokedAt = Date.now();
+    const clock = jest.spyOn(Date, 'now').mockReturnValue(revokedAt);
+    await service.revokeSubject('user-123');
+    clock.mockRestore();
+
+    const revokedSecond = Math.floor(revokedAt / 1000);
+    await expect(
+      service.getOrVerify('same-second', () => payload({ iat: revokedSecond })),
+    ).resolves.toMatchObject({ sub: 'user-123' });
+    await expect(
+      service.getOrVerify('second-before', () =>
+        payload({ iat: revokedSecond - 1 }),
+      ),
+    ).rejects.toThrow('Token revoked');
+  });
+
+  it('should drop a cached principal on every instance', async () => {
+    service.setPrincipal('user-123', { id: 'user-123' } as any);
+    service.setPrincipal('user@example.com', { id: 'user-123' } as any);
+
+    await service.invalidatePrincipal('user-123', 'user@example.com');
+
+    expect(service.getPrincipal('user-123')).toBeNull();
+    expect(service.getPrincipal('user@example.com')).toBeNull();
+    expect(mockRedisService.publish).toHaveBeenCalledWith(
+      'auth:revocations',
+      JSON.stringify({
+        type: 'principal',
+        subjects: ['user-123', 'user@example.com'],
+      }),
+    );
+  });
+});
@@ -0,0 +1,24 @@
+import { ApiPropertyOptional } from '@nestjs/swagger';
+
+/**
+ * Cursor fields returned by keyset-paginated list endpoints next to their
+ * existing page-based fields.
+ */
+export class KeysetPageInfoDto {
+  @ApiPropertyOptional({
+    description: 'Pass as `afterCursor` to fetch the next page',
+    nullable: true,
+  })
+  nextCursor?: string | null;
+
+  @ApiPropertyOptional({
+    description: 'Pass as `beforeCursor` to fetch the previous page',
+    nullable: true,
+  })
+  previousCursor?: string | null;
+
+  @ApiPropertyOptional({
+    description: 'Whether the total is the query planner estimate',
+  })
+  totalIsEstimate?: boolean;
+}
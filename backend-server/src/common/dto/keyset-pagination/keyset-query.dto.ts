@@ -0,0 +1,26 @@
+import {
+  BooleanFieldOptional,
+  StringFieldOptional,
+} from '@/decorators/field.decorators';
+
+/**
+ * Cursor parameters accepted by keyset-paginated list endpoints, alongside
+ * their existing `page`/`limit`.
+ */
+export class KeysetQueryDto {
+  @StringFieldOptional({
+    description: 'Return the page after this cursor (from `nextCursor`)',
+  })
+  afterCursor?: string;
+
+  @StringFieldOptional({
+    description: 'Return the page before this cursor (from `previousCursor`)',
+  })
+  beforeCursor?: string;
+
+  @BooleanFieldOptional({
+    description: 'Count matching rows exactly instead of estimating the total',
+    default: false,
+  })
+  exactCount?: boolean;
+}
@@ -1,5 +1,6 @@
 import { Inject, Injectable, Logger, forwardRef } from '@nestjs/common';
 import { EventEmitter2 } from '@nestjs/event-emitter';
+import { DataSource, EntityManager } from 'typeorm';
 
 import { DomainEvent } from './domain-event.interface';
 import {
@@ -7,6 +8,17 @@ import {
   EventStoreService,
 } from './event-store/event-store.service';
 
+/**
+ * How long a self-dispatched batch is hidden from the outbox poller, which
+ * only has to step in when the publishing process dies before marking it
+ */
+const DISPATCH_LEASE_MS = 30000;
+
+export interface DispatchResult {
+  dispatched: string[];
+  failed: Array<{ event: DomainEvent; error: Error }>;
+}
+
 @Injectable()
 export class EventBusService {
   private readonly logger = new Logger(EventBusService.name);
@@ -15,6 +27,7 @@ export class EventBusService {
     private readonly eventEmitter: EventEmitter2,
     @Inject(forwardRef(() => EventStoreService))
     private readonly eventStoreService: EventStoreService,
+    private readonly dataSource: DataSource,
   ) {}
 
   /**
@@ -64,24 +77,99 @@ export class EventBusService {
   }
 
   /**
-   * Publish multiple domain events
+   * Publish multiple domain events as one batch.
+   *
+   * All events are written with a single multi-row insert in one
+   * transaction, handlers run only after that transaction commits, and the
+   * delivered events are marked processed with one bulk update. Events whose
+   * dispatch fails stay in the store as failed and are redelivered by the
+   * outbox poller, so a dispatch failure does not reject the call.
+   *
+   * When `manager` is given the events join the caller's transaction and are
+   * delivered by the outbox poller once that transaction has committed.
    */
   async publishAll(
     events: DomainEvent[],
     options: EventStoreOptions = {},
+    manager?: EntityManager,
   ): Promise<void> {
-    try {
-      this.logger.debug(`Publishing ${events.length} events`);
+    if (events.length === 0) return;
 
-      for (const event of events) {
-        await this.publish(event, options);
-      }
+    this.logger.debug(`Publishing ${events.length} events`);
+
+    if (manager) {
+      await this.eventStoreService.storeEvents(events, options, {
+        manager,
+        availableAt: new Date(),
+      });
+      return;
+    }
 
-      this.logger.debug(`All ${events.length} events published successfully`);
+    try {
+      await this.dataSource.transaction((transactionManager) =>
+        this.eventStoreService.storeEvents(events, options, {
+          manager: transactionManager,
+          availableAt: new Date(Date.now() + DISPATCH_LEASE_MS),
+        }),
+      );
     } catch (error) {
       this.logger.error('Failed to publish events', error);
       throw error;
     }
+
+    await this.deliver(events, 0);
+
+    this.logger.debug(`All ${events.length} events published`);
+  }
+
+  /**
+   * Dispatch stored events and record the outcome with bulk updates.
+   *
+   * `retryCount` is the number of earlier failed deliveries; `scheduleRetry`
+   * decides when a failed event is due again (null means never).
+   */
+  async deliver(
+    events: DomainEvent[],
+    retryCount: number,
+    scheduleRetry?: (event: DomainEvent, error: Error) => Promise<Date | null>,
+  ): Promise<DispatchResult> {
+    const result = this.dispatch(events);
+
+    await this.eventStoreService.markEventsAsProcessed(result.dispatched);
+
+    for (const { event, error } of result.failed) {
+      await this.eventStoreService.markEventsAsFailed(
+        [event.eventId],
+        error.message,
+        retryCount + 1,
+        scheduleRetry ? await scheduleRetry(event, error) : new Date(),
+      );
+    }
+
+    return result;
+  }
+
+  /**
+   * Emit already stored events to their listeners
+   */
+  dispatch(events: DomainEvent[]): DispatchResult {
+    const result: DispatchResult = { dispatched: [], failed: [] };
+
+    for (const event of events) {
+      try {
+        this.eventEmitter.emit(event.eventType, event);
+        this.eventEmitter.emit('domain.event', event);
+        result.dispatched.push(event.eventId);
+      } catch (error) {
+        this.logger.error(
+          `Failed to dispatch event: ${event.eventType} (${event.eventId})`,
+          error,
+        );
+        result.failed.push({ event, error });
+      }
+    }
+
+    return result;
   }
 
   /**
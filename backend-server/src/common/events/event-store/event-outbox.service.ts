@@ -0,0 +1,90 @@
+import { Injectable, Logger } from '@nestjs/common';
+import { Cron, CronExpression } from '@nestjs/schedule';
+
+import { DomainEvent } from '../domain-event.interface';
+import { EventBusService } from '../event-bus.service';
+import { EventRetryService, RetryConfig } from '../retry/event-retry.service';
+import { EventStoreService, OutboxEvent } from './event-store.service';
+
+const OUTBOX_BATCH_SIZE = 200;
+const OUTBOX_LEASE_MS = 60000;
+const OUTBOX_STALE_AFTER_MS = 60000;
+
+const OUTBOX_RETRY_CONFIG: Partial<RetryConfig> = {
+  maxRetries: 5,
+  // Any delivery failure is worth retrying until maxRetries
+  retryableErrors: [],
+};
+
+/**
+ * Outbox poller for the event store.
+ *
+ * Redelivers events written by `EventBusService.publishAll` that were never
+ * marked processed: events published inside a caller's transaction, batches
+ * whose publisher died before marking them, and deliveries that failed.
+ * Rows stored any other way are left alone. Retries and dead
+ * lettering follow the backoff policy of `EventRetryService`; the retry
+ * state itself lives in the event store so it survives restarts.
+ */
+@Injectable()
+export class EventOutboxService {
+  private readonly logger = new Logger(EventOutboxService.name);
+  private polling = false;
+
+  constructor(
+    private readonly eventStoreService: EventStoreService,
+    private readonly eventBusService: EventBusService,
+    private readonly eventRetryService: EventRetryService,
+  ) {}
+
+  @Cron(CronExpression.EVERY_5_SECONDS)
+  async poll(): Promise<number> {
+    if (this.polling) return 0;
+    this.polling = true;
+
+    try {
+      let delivered = 0;
+      let claimed: OutboxEvent[];
+
+      do {
+        claimed = await this.eventStoreService.claimOutboxEvents({
+          batchSize: OUTBOX_BATCH_SIZE,
+          leaseMs: OUTBOX_LEASE_MS,
+          staleAfterMs: OUTBOX_STALE_AFTER_MS,
+          maxRetries: OUTBOX_RETRY_CONFIG.maxRetries,
+        });
+
+        // Retry counts differ per event, so deliver each count as one group
+        const groups = new Map<number, DomainEvent[]>();
+        for (const { event, retryCount } of claimed) {
+          groups.set(retryCount, [...(groups.get(retryCount) || []), event]);
+        }
+
+        for (const [retryCount, events] of groups) {
+          const result = await this.eventBusService.deliver(
+            events,
+            retryCount,
+            (event, error) =>
+              this.eventRetryService.scheduleStoredEventRetry(
+                event,
+                error,
+                retryCount + 1,
+                OUTBOX_RETRY_CONFIG,
+              ),
+          );
+          delivered += result.dispatched.length;
+        }
+      } while (claimed.length === OUTBOX_BATCH_SIZE);
+
+      if (delivered > 0) {
+        this.logger.log(`Outbox delivered ${delivered} event(s)`);
+      }
+      return delivered;
+    } catch (error) {
+      this.logger.error(`Outbox poll failed: ${error.message}`, error.stack);
+      return 0;
+    } finally {
+      this.polling = false;
+    }
+  }
+}
@@ -266,6 +266,33 @@ describe('EventStore Integration', () => {
       const storedEvents = await eventStoreRepository.find();
       expect(storedEvents).toHaveLength(2);
     });
+
+    it('should store a batch in sequence and mark it processed in bulk', async () => {
+      const events = [
+        new TestBookingCreatedEvent('booking-1', 'space-1', 'user-1', 100),
+        new TestBookingCreatedEvent('booking-2', 'space-2', 'user-2', 200),
+        new TestPaymentCompletedEvent('payment-1', 'booking-1', 100, 'user-1'),
+      ];
+      const dispatched: string[] = [];
+      eventBusService.subscribeToAll((event) => {
+        dispatched.push(event.eventId);
+      });
+
+      await eventBusService.publishAll(events);
+
+      const storedEvents = await eventStoreRepository.find({
+        order: { sequenceNumber: 'ASC' },
+      });
+      expect(storedEvents.map((e) => e.eventId)).toEqual(
+        events.map((e) => e.eventId),
+      );
+      expect(storedEvents[1].previousEventId).toBe(storedEvents[0].id);
+      expect(storedEvents[2].previousEventId).toBe(storedEvents[1].id);
+      expect(
+        storedEvents.every((e) => e.status === EventStatus.PROCESSED),
+      ).toBe(true);
+      expect(dispatched).toEqual(events.map((e) => e.eventId));
+    });
   });
 
   describe('Event Cleanup', () => {
@@ -4,13 +4,20 @@ import { TypeOrmModule } from '@nestjs/typeorm';
 
 import { EventStoreEntity } from '../../../database/entities/event-store.entity';
 import { EventBusService } from '../event-bus.service';
+import { EventRetryService } from '../retry/event-retry.service';
+import { EventOutboxService } from './event-outbox.service';
 import { EventStoreController } from './event-store.controller';
 import { EventStoreService } from './event-store.service';
 
 @Module({
   imports: [TypeOrmModule.forFeature([EventStoreEntity]), EventEmitterModule],
-  providers: [EventStoreService, EventBusService],
+  providers: [
+    EventStoreService,
+    EventBusService,
+    EventRetryService,
+    EventOutboxService,
+  ],
   controllers: [EventStoreController],
-  exports: [EventStoreService, EventBusService],
+  exports: [EventStoreService, EventBusService, EventRetryService],
 })
 export class EventStoreModule {}
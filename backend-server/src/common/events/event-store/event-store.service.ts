@@ -8,8 +8,14 @@ import {
 } from '@nestjs/common';
 import { EventEmitter2 } from '@nestjs/event-emitter';
 import { InjectRepository } from '@nestjs/typeorm';
-import { createHash } from 'crypto';
-import { Between, FindManyOptions, In, Repository } from 'typeorm';
+import { createHash, randomUUID } from 'crypto';
+import {
+  Between,
+  EntityManager,
+  FindManyOptions,
+  In,
+  Repository,
+} from 'typeorm';
 
 import {
   EventStatus,
@@ -25,6 +31,35 @@ export interface EventStoreOptions {
   metadata?: Record<string, any>;
 }
 
+export interface BatchStoreOptions {
+  /**
+   * Join the caller's transaction instead of using the default connection
+   */
+  manager?: EntityManager;
+  /**
+   * Earliest time the outbox poller may pick up the stored events
+   */
+  availableAt?: Date;
+}
+
+export interface OutboxClaimOptions {
+  batchSize: number;
+  /**
+   * How long claimed events stay invisible to other pollers
+   */
+  leaseMs: number;
+  /**
+   * Age after which pending events without a schedule are treated as lost
+   */
+  staleAfterMs: number;
+  maxRetries: number;
+}
+
+export interface OutboxEvent {
+  event: DomainEvent;
+  retryCount: number;
+}
+
 export interface EventReplayOptions {
   fromDate?: Date;
   toDate?: Date;
@@ -166,6 +201,186 @@ export class EventStoreService {
     }
   }
 
+  /**
+   * Store several domain events with one multi-row insert.
+   *
+   * Sequence numbers and the previous-event chain are assigned client side
+   * from a single lookup of the current tail, so the batch costs two
+   * statements regardless of its size.
+   */
+  async storeEvents(
+    events: DomainEvent[],
+    options: EventStoreOptions = {},
+    batchOptions: BatchStoreOptions = {},
+  ): Promise<EventStoreEntity[]> {
+    if (events.length === 0) return [];
+
+    const repository = batchOptions.manager
+      ? batchOptions.manager.getRepository(EventStoreEntity)
+      : this.eventStoreRepository;
+
+    try {
+      const lastEvent = await repository
+        .createQueryBuilder('event')
+        .select(['event.id', 'event.sequenceNumber'])
+        .where('event.sequenceNumber IS NOT NULL')
+        .orderBy('event.sequenceNumber', 'DESC')
+        .getOne();
+
+      let previousEventId = lastEvent?.id;
+      let sequenceNumber = Number(lastEvent?.sequenceNumber) || 0;
+
+      const entities = events.map((event) => {
+        const id = randomUUID();
+        sequenceNumber++;
+
+        const entity = repository.create({
+          id,
+          eventId: event.eventId,
+          eventType: event.eventType,
+          aggregateId: event.aggregateId,
+          aggregateType: event.aggregateType,
+          aggregateVersion: event.aggregateVersion || 1,
+          eventData: this.sanitizeEventData(event),
+          metadata: options.metadata,
+          correlationId: options.correlationId,
+          causationId: options.causationId,
+          userId: options.userId,
+          sessionId: options.sessionId,
+          occurredAt: event.occurredAt,
+          contentHash: this.generateContentHash(event, event.eventType),
+          previousEventId,
+          sequenceNumber,
+          status: EventStatus.PENDING,
+          nextRetryAt: batchOptions.availableAt,
+          outbox: true,
+        });
+
+        previousEventId = id;
+        return entity;
+      });
+
+      await repository.insert(entities);
+
+      this.logger.debug(
+        `Stored ${entities.length} events - Sequence: ${entities[0].sequenceNumber}..${sequenceNumber}`,
+      );
+
+      return entities;
+    } catch (error) {
+      this.logger.error(
+        `Failed to store ${events.length} events: ${error.message}`,
+        error.stack,
+      );
+      throw error;
+    }
+  }
+
+  /**
+   * Mark several events as processed with a single update
+   */
+  async markEventsAsProcessed(eventIds: string[]): Promise<void> {
+    if (eventIds.length === 0) return;
+
+    await this.eventStoreRepository.update(
+      { eventId: In(eventIds) },
+      {
+        status: EventStatus.PROCESSED,
+        processedAt: new Date(),
+        nextRetryAt: null,
+      },
+    );
+
+    this.logger.debug(`Marked ${eventIds.length} events as processed`);
+  }
+
+  /**
+   * Mark several events as failed with a single update
+   */
+  async markEventsAsFailed(
+    eventIds: string[],
+    errorMessage: string,
+    retryCount: number,
+    nextRetryAt?: Date,
+  ): Promise<void> {
+    if (eventIds.length === 0) return;
+
+    await this.eventStoreRepository.update(
+      { eventId: In(eventIds) },
+      {
+        status: EventStatus.FAILED,
+        failedAt: new Date(),
+        errorMessage,
+        retryCount,
+        nextRetryAt: nextRetryAt ?? null,
+      },
+    );
+
+    this.logger.warn(
+      `Marked ${eventIds.length} events as failed - ${errorMessage} (Retry count: ${retryCount})`,
+    );
+  }
+
+  /**
+   * Claim a batch of undelivered events for the outbox poller.
+   *
+   * Due events are pending events whose availability time has passed (or
+   * that were never scheduled and are older than `staleAfterMs`) and failed
+   * events whose retry time has passed. Claiming pushes `next_retry_at`
+   * forward by the lease, and `SKIP LOCKED` lets several instances poll
+   * without handing out the same event twice.
+   */
+  async claimOutboxEvents(
+    options: OutboxClaimOptions,
+  ): Promise<OutboxEvent[]> {
+    const result = await this.eventStoreRepository.query(
+      `UPDATE "event_store" SET "next_retry_at" = now() + $1 * interval '1 millisecond'
+       WHERE "id" IN (
+         SELECT "id" FROM "event_store"
+         WHERE "outbox"
+           AND (("status" = $2 AND (
+                  "next_retry_at" <= now()
+                  OR ("next_retry_at" IS NULL
+                      AND "created_at" < now() - $3 * interval '1 millisecond')))
+             OR ("status" = $4 AND "next_retry_at" <= now() AND "retry_count" < $5))
+         ORDER BY "sequence_number" ASC
+         LIMIT $6
+         FOR UPDATE SKIP LOCKED
+       )
+       RETURNING "event_id", "event_type", "aggregate_id", "aggregate_type",
+                 "aggregate_version", "occurred_at", "event_data",
+                 "retry_count", "sequence_number"`,
+      [
+        options.leaseMs,
+        EventStatus.PENDING,
+        options.staleAfterMs,
+        EventStatus.FAILED,
+        options.maxRetries,
+        options.batchSize,
+      ],
+    );
+
+    // UPDATE ... RETURNING resolves to [rows, affected] on postgres
+    const rows: Array<Record<string, any>> = Array.isArray(result[0])
+      ? result[0]
+      : result;
+
+    return rows
+      .sort((a, b) => Number(a.sequence_number) - Number(b.sequence_number))
+      .map((row) => ({
+        retryCount: row.retry_count || 0,
+        event: {
+          eventId: row.event_id,
+          eventType: row.event_type,
+          aggregateId: row.aggregate_id,
+          aggregateType: row.aggregate_type,
+          aggregateVersion: row.aggregate_version,
+          occurredAt: row.occurred_at,
+          ...row.event_data,
+        },
+      }));
+  }
+
   /**
    * Get events for replay based on criteria
    */
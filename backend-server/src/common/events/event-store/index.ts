@@ -2,6 +2,7 @@ export {
   EventStatus,
   EventStoreEntity,
 } from '../../../database/entities/event-store.entity';
+export * from './event-outbox.service';
 export * from './event-store.controller';
 export * from './event-store.interceptor';
 export * from './event-store.module';
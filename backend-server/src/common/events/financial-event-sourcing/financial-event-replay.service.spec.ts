@@ -0,0 +1,175 @@
+import { EventEmitter2 } from '@nestjs/event-emitter';
+import { Test, TestingModule } from '@nestjs/testing';
+import { getRepositoryToken } from '@nestjs/typeorm';
+import { DataSource } from 'typeorm';
+import { FinancialAggregateEntity } from './financial-aggregate.entity';
+import { FinancialEventReplayService } from './financial-event-replay.service';
+import { FinancialEventRollupService } from './financial-event-rollup.service';
+import { FinancialEventSourcingService } from './financial-event-sourcing.service';
+import {
+  FinancialEventEntity,
+  FinancialEventType,
+} from './financial-event.entity';
+import { FinancialSnapshotEntity } from './financial-snapshot.entity';
+
+describe('FinancialEventReplayService', () => {
+  let replayService: FinancialEventReplayService;
+  let eventSourcingService: FinancialEventSourcingService;
+
+  /** Events of one wallet aggregate, credited 10 per version */
+  const history = Array.from({ length: 7 }, (_, i) =>
+    Object.assign(new FinancialEventEntity(), {
+      id: `event-${i + 1}`,
+      aggregateId: 'wallet-1',
+      eventType: FinancialEventType.WALLET_CREDITED,
+      amount: 10,
+      version: i + 1,
+      eventData: {},
+    }),
+  );
+
+  let pageQueries: Array<{ lastVersion: number; take: number }>;
+
+  /** Query builder serving `history` by keyset, recording each page */
+  const createEventQueryBuilder = () => {
+    const params: Record<string, any> = {};
+    let take = Infinity;
+    const qb: any = {
+      where: jest.fn((_, p) => (Object.assign(params, p), qb)),
+      andWhere: jest.fn((_, p) => (Object.assign(params, p), qb)),
+      orderBy: jest.fn(() => qb),
+      take: jest.fn((n: number) => ((take = n), qb)),
+      getMany: jest.fn(async () => {
+        pageQueries.push({ lastVersion: params.lastVersion, take });
+        return history
+          .filter((event) => event.version > params.lastVersion)
+          .filter(
+            (event) =>
+              params.toVersion === undefined ||
+              event.version <= params.toVersion,
+          )
+          .slice(0, take);
+      }),
+      getCount: jest.fn(
+        async () =>
+          history.filter((event) => event.version > params.afterVersion)
+            .length,
+      ),
+    };
+    return qb;
+  };
+
+  const eventRepository = {
+    createQueryBuilder: jest.fn(createEventQueryBuilder),
+  };
+  const snapshotRepository = {
+    findOne: jest.fn(),
+    create: jest.fn((data) => data),
+    save: jest.fn(),
+  };
+  const aggregateRepository = { update: jest.fn() };
+
+  beforeEach(async () => {
+    jest.clearAllMocks();
+    pageQueries = [];
+
+    const module: TestingModule = await Test.createTestingModule({
+      providers: [
+        FinancialEventReplayService,
+        FinancialEventSourcingService,
+        {
+          provide: getRepositoryToken(FinancialEventEntity),
+          useValue: eventRepository,
+        },
+        {
+          provide: getRepositoryToken(FinancialAggregateEntity),
+          useValue: aggregateRepository,
+        },
+        {
+          provide: getRepositoryToken(FinancialSnapshotEntity),
+          useValue: snapshotRepository,
+        },
+        { provide: DataSource, useValue: {} },
+        { provide: EventEmitter2, useValue: { emit: jest.fn() } },
+        { provide: FinancialEventRollupService, useValue: {} },
+      ],
+    }).compile();
+
+    replayService = module.get(FinancialEventReplayService);
+    eventSourcingService = module.get(FinancialEventSourcingService);
+  });
+
+  describe('replayAggregate', () => {
+    it('should resume from the latest snapshot', async () => {
+      snapshotRepository.findOne.mockResolvedValue({
+        aggregateId: 'wallet-1',
+        version: 5,
+        state: { balance: 50 },
+        eventCount: 5,
+      });
+
+      const result = await replayService.replayAggregate('wallet-1');
+
+      expect(result.fromSnapshotVersion).toBe(5);
+      expect(result.eventsProcessed).toBe(2);
+      expect(result.finalVersion).toBe(7);
+      expect(result.finalState.balance).toBe(70);
+      expect(pageQueries[0].lastVersion).toBe(5);
+    });
+
+    it('should stream the history in keyset pages', async () => {
+      snapshotRepository.findOne.mockResolvedValue(null);
+
+      const result = await replayService.replayAggregate('wallet-1', {
+        pageSize: 3,
+      });
+
+      expect(result.finalState.balance).toBe(70);
+      expect(pageQueries).toEqual([
+        { lastVersion: 0, take: 3 },
+        { lastVersion: 3, take: 3 },
+        { lastVersion: 6, take: 3 },
+      ]);
+    });
+  });
+
+  describe('FinancialEventSourcingService.replayEventsWithCheckpoints', () => {
+    it('should replay the tail after the snapshot in pages', async () => {
+      snapshotRepository.findOne.mockResolvedValue({
+        aggregateId: 'wallet-1',
+        version: 2,
+        state: { balance: 20 },
+      });
+      const progress = jest.fn();
+
+      const result = await eventSourcingService.replayEventsWithCheckpoints(
+        'wallet-1',
+        { batchSize: 2, progressCallback: progress },
+      );
+
+      expect(result.eventsProcessed).toBe(5);
+      expect(result.finalState.balance).toBe(70);
+      expect(pageQueries.map((q) => q.lastVersion)).toEqual([2, 4, 6]);
+      expect(progress).toHaveBeenLastCalledWith(
+        expect.objectContaining({ processed: 5, total: 5 }),
+      );
+    });
+
+    it('should replay from version 0 for checkpoints', async () => {
+      snapshotRepository.findOne.mockResolvedValue({
+        aggregateId: 'wallet-1',
+        version: 5,
+        state: { balance: 50 },
+      });
+
+      const result = await eventSourcingService.replayEventsWithCheckpoints(
+        'wallet-1',
+        { checkpoints: [3] },
+      );
+
+      expect(snapshotRepository.findOne).not.toHaveBeenCalled();
+      expect(result.eventsProcessed).toBe(7);
+      expect(result.finalState.balance).toBe(70);
+    });
+  });
+});
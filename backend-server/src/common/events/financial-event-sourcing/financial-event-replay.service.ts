@@ -0,0 +1,380 @@
+import { Inject, Injectable, Logger, forwardRef } from '@nestjs/common';
+import { InjectRepository } from '@nestjs/typeorm';
+import { Repository } from 'typeorm';
+
+import { runWorkPool } from '@/common/utils/concurrency.util';
+import {
+  AggregateType,
+  FinancialAggregateEntity,
+} from './financial-aggregate.entity';
+import { FinancialEventSourcingService } from './financial-event-sourcing.service';
+import {
+  FinancialEventEntity,
+  FinancialEventType,
+} from './financial-event.entity';
+import { FinancialSnapshotEntity } from './financial-snapshot.entity';
+
+export interface StreamingReplayOptions {
+  /**
+   * Start from the latest persisted snapshot instead of version 0
+   */
+  useSnapshots?: boolean;
+  /**
+   * Stop at this version (inclusive)
+   */
+  toVersion?: number;
+  /**
+   * Number of events fetched per keyset page
+   */
+  pageSize?: number;
+  /**
+   * Write the rebuilt state back to the aggregate row
+   */
+  persistState?: boolean;
+  /**
+   * Persist a fresh snapshot once this many events were replayed past the
+   * starting snapshot
+   */
+  snapshotThreshold?: number;
+}
+
+export interface BulkReplayOptions extends StreamingReplayOptions {
+  /**
+   * Explicit aggregates to rebuild; otherwise every aggregate matching the
+   * filters below is streamed from the aggregate table
+   */
+  aggregateIds?: string[];
+  aggregateType?: AggregateType;
+  partnerId?: string;
+  /**
+   * Number of aggregates replayed concurrently
+   */
+  concurrency?: number;
+  failFast?: boolean;
+  progressCallback?: (progress: BulkReplayProgress) => void;
+}
+
+export interface ReplayStartingPoint {
+  state: Record<string, any>;
+  version: number;
+  snapshot: FinancialSnapshotEntity | null;
+}
+
+export interface AggregateReplayResult {
+  aggregateId: string;
+  finalState: Record<string, any>;
+  fromSnapshotVersion: number;
+  finalVersion: number;
+  eventsProcessed: number;
+  duration: number;
+  eventsPerSecond: number;
+  snapshotCreated: boolean;
+}
+
+export interface BulkReplayProgress {
+  aggregatesCompleted: number;
+  aggregatesFailed: number;
+  eventsProcessed: number;
+  eventsPerSecond: number;
+}
+
+export interface BulkReplayResult extends BulkReplayProgress {
+  results: Record<string, AggregateReplayResult>;
+  errors: Array<{ aggregateId: string; error: string }>;
+  duration: number;
+}
+
+const DEFAULT_PAGE_SIZE = 500;
+const DEFAULT_CONCURRENCY = 8;
+
+/**
+ * Snapshot-backed streaming replay for financial aggregates.
+ *
+ * Each aggregate starts from its latest snapshot and streams the remaining
+ * events in version order using keyset pages, so memory stays bounded by
+ * the page size regardless of history length. Bulk rebuilds run on a
+ * work-stealing pool that pulls aggregate ids lazily from the database.
+ */
+@Injectable()
+export class FinancialEventReplayService {
+  private readonly logger = new Logger(FinancialEventReplayService.name);
+
+  constructor(
+    @InjectRepository(FinancialEventEntity)
+    private readonly eventRepository: Repository<FinancialEventEntity>,
+    @InjectRepository(FinancialAggregateEntity)
+    private readonly aggregateRepository: Repository<FinancialAggregateEntity>,
+    @InjectRepository(FinancialSnapshotEntity)
+    private readonly snapshotRepository: Repository<FinancialSnapshotEntity>,
+    @Inject(forwardRef(() => FinancialEventSourcingService))
+    private readonly eventSourcingService: FinancialEventSourcingService,
+  ) {}
+
+  /**
+   * State to resume a replay from: the latest snapshot at or below
+   * `toVersion`, or the empty state before the first event
+   */
+  async getStartingPoint(
+    aggregateId: string,
+    options: { useSnapshots?: boolean; toVersion?: number } = {},
+  ): Promise<ReplayStartingPoint> {
+    const snapshot =
+      options.useSnapshots !== false
+        ? await this.eventSourcingService.getLatestSnapshot(
+            aggregateId,
+            options.toVersion,
+          )
+        : null;
+
+    return {
+      state: snapshot ? { ...snapshot.state } : {},
+      version: snapshot?.version ?? 0,
+      snapshot,
+    };
+  }
+
+  /**
+   * Number of events `streamEvents` would yield with the same arguments
+   */
+  async countEvents(
+    aggregateId: string,
+    afterVersion = 0,
+    options: { toVersion?: number; eventTypes?: FinancialEventType[] } = {},
+  ): Promise<number> {
+    const queryBuilder = this.eventRepository
+      .createQueryBuilder('event')
+      .where('event.aggregateId = :aggregateId', { aggregateId })
+      .andWhere('event.version > :afterVersion', { afterVersion });
+
+    if (options.toVersion !== undefined) {
+      queryBuilder.andWhere('event.version <= :toVersion', {
+        toVersion: options.toVersion,
+      });
+    }
+    if (options.eventTypes?.length) {
+      queryBuilder.andWhere('event.eventType IN (:...eventTypes)', {
+        eventTypes: options.eventTypes,
+      });
+    }
+
+    return queryBuilder.getCount();
+  }
+
+  /**
+   * Stream an aggregate's events after `afterVersion` in ordered pages
+   */
+  async *streamEvents(
+    aggregateId: string,
+    afterVersion = 0,
+    options: {
+      toVersion?: number;
+      pageSize?: number;
+      eventTypes?: FinancialEventType[];
+    } = {},
+  ): AsyncGenerator<FinancialEventEntity[]> {
+    const pageSize = options.pageSize || DEFAULT_PAGE_SIZE;
+    let lastVersion = afterVersion;
+
+    while (true) {
+      const queryBuilder = this.eventRepository
+        .createQueryBuilder('event')
+        .where('event.aggregateId = :aggregateId', { aggregateId })
+        .andWhere('event.version > :lastVersion', { lastVersion })
+        .orderBy('event.version', 'ASC')
+        .take(pageSize);
+
+      if (options.toVersion !== undefined) {
+        queryBuilder.andWhere('event.version <= :toVersion', {
+          toVersion: options.toVersion,
+        });
+      }
+      if (options.eventTypes?.length) {
+        queryBuilder.andWhere('event.eventType IN (:...eventTypes)', {
+          eventTypes: options.eventTypes,
+        });
+      }
+
+      const page = await queryBuilder.getMany();
+      if (page.length === 0) return;
+
+      yield page;
+
+      lastVersion = page[page.length - 1].version;
+      if (page.length < pageSize) return;
+    }
+  }
+
+  /**
+   * Rebuild one aggregate from its latest snapshot plus the event tail
+   */
+  async replayAggregate(
+    aggregateId: string,
+    options: StreamingReplayOptions = {},
+  ): Promise<AggregateReplayResult> {
+    const startTime = Date.now();
+    const start = await this.getStartingPoint(aggregateId, options);
+    const snapshot = start.snapshot;
+
+    let state = start.state;
+    const fromSnapshotVersion = start.version;
+    let finalVersion = fromSnapshotVersion;
+    let eventsProcessed = 0;
+    let aggregateType = snapshot?.aggregateType;
+
+    for await (const page of this.streamEvents(
+      aggregateId,
+      fromSnapshotVersion,
+      { toVersion: options.toVersion, pageSize: options.pageSize },
+    )) {
+      for (const event of page) {
+        state = this.eventSourcingService.applyEventToState(state, event);
+      }
+      eventsProcessed += page.length;
+      finalVersion = page[page.length - 1].version;
+      aggregateType = page[page.length - 1].aggregateType;
+    }
+
+    if (options.persistState && eventsProcessed > 0) {
+      await this.aggregateRepository.update(
+        { id: aggregateId },
+        { currentState: state, lastEventVersion: finalVersion },
+      );
+    }
+
+    let snapshotCreated = false;
+    if (
+      options.snapshotThreshold &&
+      eventsProcessed >= options.snapshotThreshold
+    ) {
+      await this.snapshotRepository.save(
+        this.snapshotRepository.create({
+          aggregateId,
+          aggregateType,
+          version: finalVersion,
+          state,
+          eventCount: (snapshot?.eventCount ?? 0) + eventsProcessed,
+          description: 'replay',
+        }),
+      );
+      snapshotCreated = true;
+    }
+
+    const duration = Date.now() - startTime;
+    return {
+      aggregateId,
+      finalState: state,
+      fromSnapshotVersion,
+      finalVersion,
+      eventsProcessed,
+      duration,
+      eventsPerSecond: this.rate(eventsProcessed, duration),
+      snapshotCreated,
+    };
+  }
+
+  /**
+   * Rebuild many aggregates with bounded concurrency
+   */
+  async replayAggregates(
+    options: BulkReplayOptions = {},
+  ): Promise<BulkReplayResult> {
+    const startTime = Date.now();
+    const results: Record<string, AggregateReplayResult> = {};
+    const progress: BulkReplayProgress = {
+      aggregatesCompleted: 0,
+      aggregatesFailed: 0,
+      eventsProcessed: 0,
+      eventsPerSecond: 0,
+    };
+
+    const source = options.aggregateIds?.length
+      ? options.aggregateIds
+      : this.streamAggregateIds(options);
+
+    const failures = await runWorkPool(
+      source,
+      options.concurrency || DEFAULT_CONCURRENCY,
+      async (aggregateId) => {
+        try {
+          const result = await this.replayAggregate(aggregateId, options);
+          results[aggregateId] = result;
+          progress.aggregatesCompleted++;
+          progress.eventsProcessed += result.eventsProcessed;
+        } catch (error) {
+          progress.aggregatesFailed++;
+          throw error;
+        } finally {
+          progress.eventsPerSecond = this.rate(
+            progress.eventsProcessed,
+            Date.now() - startTime,
+          );
+          options.progressCallback?.({ ...progress });
+        }
+      },
+      { failFast: options.failFast },
+    );
+
+    const errors = failures.map(({ item, error }) => ({
+      aggregateId: item,
+      error: error.message,
+    }));
+
+    const duration = Date.now() - startTime;
+    this.logger.log(
+      `Replayed ${progress.aggregatesCompleted} aggregate(s), ${progress.eventsProcessed} event(s) in ${duration}ms (${progress.eventsPerSecond} events/sec, ${errors.length} error(s))`,
+    );
+
+    return {
+      ...progress,
+      eventsPerSecond: this.rate(progress.eventsProcessed, duration),
+      results,
+      errors,
+      duration,
+    };
+  }
+
+  /**
+   * Lazily page aggregate ids in id order; the next page is only fetched
+   * once the pool has consumed the current one
+   */
+  private async *streamAggregateIds(
+    options: BulkReplayOptions,
+  ): AsyncGenerator<string> {
+    const pageSize = options.pageSize || DEFAULT_PAGE_SIZE;
+    let lastId: string | undefined;
+
+    while (true) {
+      const queryBuilder = this.aggregateRepository
+        .createQueryBuilder('aggregate')
+        .select('aggregate.id', 'id')
+        .orderBy('aggregate.id', 'ASC')
+        .limit(pageSize);
+
+      if (lastId) {
+        queryBuilder.andWhere('aggregate.id > :lastId', { lastId });
+      }
+      if (options.aggregateType) {
+        queryBuilder.andWhere('aggregate.aggregateType = :aggregateType', {
+          aggregateType: options.aggregateType,
+        });
+      }
+      if (options.partnerId) {
+        queryBuilder.andWhere('aggregate.partnerId = :partnerId', {
+          partnerId: options.partnerId,
+        });
+      }
+
+      const rows = await queryBuilder.getRawMany<{ id: string }>();
+      for (const row of rows) {
+        yield row.id;
+      }
+
+      if (rows.length < pageSize) return;
+      lastId = rows[rows.length - 1].id;
+    }
+  }
+
+  private rate(events: number, durationMs: number): number {
+    return durationMs > 0 ? Math.round((events / durationMs) * 1000) : events;
+  }
+}
@@ -0,0 +1,69 @@
+import {
+  Column,
+  Entity,
+  Index,
+  PrimaryColumn,
+  PrimaryGeneratedColumn,
+} from 'typeorm';
+
+/**
+ * Amount/count totals of closed days per event type and partner
+ */
+@Entity('financial_event_daily_rollups')
+// Created NULLS NOT DISTINCT by the migration, so null partners share a bucket
+@Index(
+  'IDX_financial_event_daily_rollups_bucket',
+  ['day', 'eventType', 'partnerId'],
+  { unique: true },
+)
+@Index(['partnerId', 'day'])
+export class FinancialEventDailyRollupEntity {
+  @PrimaryGeneratedColumn('uuid')
+  id: string;
+
+  @Column({ name: 'day', type: 'date' })
+  day: string;
+
+  @Column({ name: 'event_type', type: 'varchar', length: 100 })
+  eventType: string;
+
+  @Column({ name: 'partner_id', type: 'uuid', nullable: true })
+  partnerId: string;
+
+  @Column({
+    name: 'amount',
+    type: 'decimal',
+    precision: 18,
+    scale: 2,
+    default: 0,
+  })
+  amount: number;
+
+  @Column({ name: 'event_count', type: 'int', default: 0 })
+  eventCount: number;
+}
+
+/**
+ * One row per day that has been rolled up, including days without events,
+ * so readers can tell a rolled-up empty day from a day not rolled up yet
+ */
+@Entity('financial_event_rollup_days')
+export class FinancialEventRollupDayEntity {
+  @PrimaryColumn({ name: 'day', type: 'date' })
+  day: string;
+
+  @Column({ name: 'event_count', type: 'int', default: 0 })
+  eventCount: number;
+
+  @Column({
+    name: 'total_amount',
+    type: 'decimal',
+    precision: 18,
+    scale: 2,
+    default: 0,
+  })
+  totalAmount: number;
+
+  @Column({ name: 'rolled_up_at', type: 'timestamp' })
+  rolledUpAt: Date;
+}
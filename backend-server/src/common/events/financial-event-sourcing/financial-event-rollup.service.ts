@@ -0,0 +1,238 @@
+import { Injectable, Logger } from '@nestjs/common';
+import { Cron, CronExpression } from '@nestjs/schedule';
+import { InjectRepository } from '@nestjs/typeorm';
+import { DataSource, Repository } from 'typeorm';
+
+import {
+  FinancialEventDailyRollupEntity,
+  FinancialEventRollupDayEntity,
+} from './financial-event-rollup.entity';
+import { FinancialEventType } from './financial-event.entity';
+
+export interface FinancialAnalyticsBucket {
+  day: string;
+  eventType: string;
+  amount: number;
+  count: number;
+}
+
+export interface FinancialRollupFilter {
+  partnerId?: string;
+  eventTypes?: FinancialEventType[];
+}
+
+const DAY_MS = 24 * 60 * 60 * 1000;
+const MAX_DAYS_PER_RUN = 31;
+
+/**
+ * Format a Date as its UTC calendar day (YYYY-MM-DD)
+ */
+export function toUtcDay(date: Date): string {
+  return date.toISOString().slice(0, 10);
+}
+
+/**
+ * Shift a YYYY-MM-DD day by a number of days
+ */
+export function addUtcDays(day: string, days: number): string {
+  const start = Date.parse(`${day}T00:00:00.000Z`);
+  return toUtcDay(new Date(start + days * DAY_MS));
+}
+
+/**
+ * Pre-aggregated daily totals for closed (past) days of the financial event
+ * store.
+ *
+ * Events are append-only and stamped with their insert time, so once a UTC
+ * day is over its totals never change. An hourly job rolls every closed day
+ * that has not been rolled up yet into per (day, event type, partner)
+ * buckets, which lets analytics read a quarter from a few hundred rows and
+ * scan only the still-open current day live.
+ */
+@Injectable()
+export class FinancialEventRollupService {
+  private readonly logger = new Logger(FinancialEventRollupService.name);
+  private rollupInProgress = false;
+
+  constructor(
+    @InjectRepository(FinancialEventRollupDayEntity)
+    private readonly rollupDayRepository: Repository<FinancialEventRollupDayEntity>,
+    @InjectRepository(FinancialEventDailyRollupEntity)
+    private readonly rollupRepository: Repository<FinancialEventDailyRollupEntity>,
+    private readonly dataSource: DataSource,
+  ) {}
+
+  /**
+   * Roll up one closed day; re-running it replaces the day's buckets.
+   *
+   * Every API instance runs the hourly job, so the day is locked for the
+   * transaction and buckets are upserted on their unique key. Events are
+   * append-only, so a closed day's set of buckets never shrinks.
+   */
+  async rollupDay(day: string): Promise<void> {
+    await this.dataSource.transaction(async (manager) => {
+      await manager.query('SELECT pg_advisory_xact_lock(hashtext($1))', [
+        `financial-event-rollup:${day}`,
+      ]);
+
+      await manager.query(
+        `INSERT INTO "financial_event_daily_rollups"
+           ("day", "event_type", "partner_id", "amount", "event_count")
+         SELECT $1::date, "event_type"::text, "partner_id",
+                COALESCE(SUM("amount"), 0), COUNT(*)
+         FROM "financial_events"
+         WHERE "amount" IS NOT NULL
+           AND "created_at" >= $1::date
+           AND "created_at" < $1::date + 1
+         GROUP BY "event_type", "partner_id"
+         ON CONFLICT ("day", "event_type", "partner_id") DO UPDATE SET
+           "amount" = EXCLUDED."amount",
+           "event_count" = EXCLUDED."event_count"`,
+        [day],
+      );
+
+      await manager.query(
+        `INSERT INTO "financial_event_rollup_days"
+           ("day", "event_count", "total_amount", "rolled_up_at")
+         SELECT $1::date, COALESCE(SUM("event_count"), 0),
+                COALESCE(SUM("amount"), 0), now()
+         FROM "financial_event_daily_rollups"
+         WHERE "day" = $1
+         ON CONFLICT ("day") DO UPDATE SET
+           "event_count" = EXCLUDED."event_count",
+           "total_amount" = EXCLUDED."total_amount",
+           "rolled_up_at" = EXCLUDED."rolled_up_at"`,
+        [day],
+      );
+    });
+  }
+
+  /**
+   * Roll up closed days after the last rolled-up day, oldest first
+   */
+  @Cron(CronExpression.EVERY_HOUR)
+  async rollupClosedDays(): Promise<number> {
+    if (this.rollupInProgress) return 0;
+    this.rollupInProgress = true;
+
+    try {
+      const yesterday = addUtcDays(toUtcDay(new Date()), -1);
+      let day = await this.getNextDayToRollUp();
+      let rolled = 0;
+
+      while (day && day <= yesterday && rolled < MAX_DAYS_PER_RUN) {
+        await this.rollupDay(day);
+        day = addUtcDays(day, 1);
+        rolled++;
+      }
+
+      if (rolled > 0) {
+        this.logger.log(
+          `Rolled up ${rolled} day(s) of financial events through ${addUtcDays(day, -1)}`,
+        );
+      }
+      return rolled;
+    } catch (error) {
+      this.logger.error(
+        `Failed to roll up financial events: ${error.message}`,
+        error.stack,
+      );
+      return 0;
+    } finally {
+      this.rollupInProgress = false;
+    }
+  }
+
+  /**
+   * Whether every day in [fromDay, toDay] has been rolled up
+   */
+  async isRangeRolledUp(fromDay: string, toDay: string): Promise<boolean> {
+    if (fromDay > toDay) return false;
+
+    const expectedDays =
+      Math.round(
+        (Date.parse(`${toDay}T00:00:00.000Z`) -
+          Date.parse(`${fromDay}T00:00:00.000Z`)) /
+          DAY_MS,
+      ) + 1;
+
+    const rolledDays = await this.rollupDayRepository
+      .createQueryBuilder('rollupDay')
+      .where('rollupDay.day BETWEEN :fromDay AND :toDay', { fromDay, toDay })
+      .getCount();
+
+    return rolledDays === expectedDays;
+  }
+
+  /**
+   * First day ever rolled up, or null when nothing has been rolled up yet
+   */
+  async getFirstRolledUpDay(): Promise<string | null> {
+    const row = await this.rollupDayRepository
+      .createQueryBuilder('rollupDay')
+      .select(`to_char(MIN(rollupDay.day), 'YYYY-MM-DD')`, 'day')
+      .getRawOne<{ day: string | null }>();
+
+    return row?.day ?? null;
+  }
+
+  /**
+   * Per day and event type totals from the rollup table
+   */
+  async getBuckets(
+    fromDay: string,
+    toDay: string,
+    filter: FinancialRollupFilter = {},
+  ): Promise<FinancialAnalyticsBucket[]> {
+    const queryBuilder = this.rollupRepository
+      .createQueryBuilder('rollup')
+      .select(`to_char(rollup.day, 'YYYY-MM-DD')`, 'day')
+      .addSelect('rollup.eventType', 'eventType')
+      .addSelect('COALESCE(SUM(rollup.amount), 0)', 'amount')
+      .addSelect('COALESCE(SUM(rollup.eventCount), 0)', 'count')
+      .where('rollup.day BETWEEN :fromDay AND :toDay', { fromDay, toDay })
+      .groupBy('rollup.day')
+      .addGroupBy('rollup.eventType');
+
+    if (filter.partnerId) {
+      queryBuilder.andWhere('rollup.partnerId = :partnerId', {
+        partnerId: filter.partnerId,
+      });
+    }
+
+    if (filter.eventTypes && filter.eventTypes.length > 0) {
+      queryBuilder.andWhere('rollup.eventType IN (:...eventTypes)', {
+        eventTypes: filter.eventTypes,
+      });
+    }
+
+    const rows = await queryBuilder.getRawMany<{
+      day: string;
+      eventType: string;
+      amount: string;
+      count: string;
+    }>();
+
+    return rows.map((row) => ({
+      day: row.day,
+      eventType: row.eventType,
+      amount: parseFloat(row.amount) || 0,
+      count: parseInt(row.count, 10) || 0,
+    }));
+  }
+
+  private async getNextDayToRollUp(): Promise<string | null> {
+    const lastRolled = await this.rollupDayRepository
+      .createQueryBuilder('rollupDay')
+      .select(`to_char(MAX(rollupDay.day), 'YYYY-MM-DD')`, 'day')
+      .getRawOne<{ day: string | null }>();
+
+    if (lastRolled?.day) return addUtcDays(lastRolled.day, 1);
+
+    const [firstEvent] = await this.dataSource.query(
+      `SELECT to_char(MIN("created_at"), 'YYYY-MM-DD') AS "day"
+       FROM "financial_events"`,
+    );
+    return firstEvent?.day ?? null;
+  }
+}
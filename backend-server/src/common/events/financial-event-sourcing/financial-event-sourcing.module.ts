@@ -3,16 +3,39 @@ import { EventEmitterModule } from '@nestjs/event-emitter';
 import { TypeOrmModule } from '@nestjs/typeorm';
 
 import { FinancialAggregateEntity } from './financial-aggregate.entity';
+import { FinancialEventReplayService } from './financial-event-replay.service';
+import {
+  FinancialEventDailyRollupEntity,
+  FinancialEventRollupDayEntity,
+} from './financial-event-rollup.entity';
+import { FinancialEventRollupService } from './financial-event-rollup.service';
 import { FinancialEventSourcingService } from './financial-event-sourcing.service';
 import { FinancialEventEntity } from './financial-event.entity';
 import { FinancialEventHandler } from './financial-event.handler';
+import { FinancialSnapshotEntity } from './financial-snapshot.entity';
 
 @Module({
   imports: [
-    TypeOrmModule.forFeature([FinancialEventEntity, FinancialAggregateEntity]),
+    TypeOrmModule.forFeature([
+      FinancialEventEntity,
+      FinancialAggregateEntity,
+      FinancialSnapshotEntity,
+      FinancialEventDailyRollupEntity,
+      FinancialEventRollupDayEntity,
+    ]),
     EventEmitterModule,
   ],
-  providers: [FinancialEventSourcingService, FinancialEventHandler],
-  exports: [FinancialEventSourcingService, TypeOrmModule],
+  providers: [
+    FinancialEventSourcingService,
+    FinancialEventReplayService,
+    FinancialEventRollupService,
+    FinancialEventHandler,
+  ],
+  exports: [
+    FinancialEventSourcingService,
+    FinancialEventReplayService,
+    FinancialEventRollupService,
+    TypeOrmModule,
+  ],
 })
 export class FinancialEventSourcingModule {}
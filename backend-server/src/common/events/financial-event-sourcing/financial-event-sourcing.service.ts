@@ -1,13 +1,22 @@
 import {
   BadRequestException,
+  Inject,
   Injectable,
   Logger,
   NotFoundException,
+  forwardRef,
 } from '@nestjs/common';
 import { EventEmitter2 } from '@nestjs/event-emitter';
 import { InjectRepository } from '@nestjs/typeorm';
-import { DataSource, QueryRunner, Repository } from 'typeorm';
-
+import {
+  Brackets,
+  DataSource,
+  LessThanOrEqual,
+  QueryRunner,
+  Repository,
+} from 'typeorm';
+
+import { runWorkPool } from '@/common/utils/concurrency.util';
 import {
   AggregateStatus,
   AggregateType,
@@ -18,6 +27,14 @@ import {
   FinancialEventStatus,
   FinancialEventType,
 } from './financial-event.entity';
+import {
+  addUtcDays,
+  FinancialAnalyticsBucket,
+  FinancialEventRollupService,
+  toUtcDay,
+} from './financial-event-rollup.service';
+import { FinancialEventReplayService } from './financial-event-replay.service';
+import { FinancialSnapshotEntity } from './financial-snapshot.entity';
 
 export interface FinancialEventData {
   aggregateId: string;
@@ -368,8 +385,13 @@ export class FinancialEventSourcingService {
     private readonly eventRepository: Repository<FinancialEventEntity>,
     @InjectRepository(FinancialAggregateEntity)
     private readonly aggregateRepository: Repository<FinancialAggregateEntity>,
+    @InjectRepository(FinancialSnapshotEntity)
+    private readonly snapshotRepository: Repository<FinancialSnapshotEntity>,
     private readonly dataSource: DataSource,
     private readonly eventEmitter: EventEmitter2,
+    private readonly rollupService: FinancialEventRollupService,
+    @Inject(forwardRef(() => FinancialEventReplayService))
+    private readonly replayService: FinancialEventReplayService,
   ) {}
 
   /**
@@ -715,7 +737,9 @@ export class FinancialEventSourcingService {
     };
   }> {
     const aggregate = await this.getAggregateState(aggregateId);
-    const events = await this.getEventsForAggregate(aggregateId);
+    const eventCount = await this.eventRepository.count({
+      where: { aggregateId },
+    });
 
     let projectionResults: Record<string, any> = {};
     if (options.includeProjections && options.projections) {
@@ -726,27 +750,55 @@ export class FinancialEventSourcingService {
       projectionResults = reconstructionResult.projections;
     }
 
-    const snapshotId = `snapshot_${aggregateId}_${aggregate.lastEventVersion}_${Date.now()}`;
+    const snapshot = await this.snapshotRepository.save(
+      this.snapshotRepository.create({
+        aggregateId,
+        aggregateType: aggregate.aggregateType,
+        version: aggregate.lastEventVersion,
+        state: aggregate.currentState,
+        projections: options.includeProjections ? projectionResults : null,
+        eventCount,
+        description: options.description,
+      }),
+    );
 
-    // Store snapshot (implementation would depend on your storage strategy)
     this.logger.log(
-      `Created snapshot ${snapshotId} for aggregate ${aggregateId}`,
+      `Created snapshot ${snapshot.id} for aggregate ${aggregateId}`,
     );
 
     return {
-      snapshotId,
+      snapshotId: snapshot.id,
       aggregateId,
-      version: aggregate.lastEventVersion,
-      state: aggregate.currentState,
+      version: snapshot.version,
+      state: snapshot.state,
       projections: options.includeProjections ? projectionResults : undefined,
       metadata: {
-        createdAt: new Date(),
-        eventCount: events.length,
+        createdAt: snapshot.createdAt,
+        eventCount,
         description: options.description,
       },
     };
   }
 
+  /**
+   * Latest persisted snapshot for an aggregate, optionally at or below a
+   * version
+   */
+  async getLatestSnapshot(
+    aggregateId: string,
+    maxVersion?: number,
+  ): Promise<FinancialSnapshotEntity | null> {
+    return this.snapshotRepository.findOne({
+      where: {
+        aggregateId,
+        ...(maxVersion !== undefined && {
+          version: LessThanOrEqual(maxVersion),
+        }),
+      },
+      order: { version: 'DESC' },
+    });
+  }
+
   /**
    * Validate state transition
    */
@@ -1966,8 +2018,35 @@ export class FinancialEventSourcingService {
       [];
 
     try {
-      const events = await this.getEventsForAggregate(aggregateId, options);
-      let state: Record<string, any> = {};
+      // Resume from the latest snapshot unless the replay needs the full
+      // history: explicit start versions, event type filters, projections
+      // and checkpoints all have to see every event from the beginning
+      const start = await this.replayService.getStartingPoint(aggregateId, {
+        useSnapshots:
+          options.includeSnapshots !== false &&
+          !options.fromVersion &&
+          !options.eventTypes?.length &&
+          !options.includeProjections &&
+          !options.checkpoints?.length,
+        toVersion: options.toVersion,
+      });
+      const afterVersion = options.fromVersion
+        ? options.fromVersion - 1
+        : start.version;
+      const streamOptions = {
+        toVersion: options.toVersion,
+        eventTypes: options.eventTypes,
+        pageSize: options.batchSize,
+      };
+      const total = options.progressCallback
+        ? await this.replayService.countEvents(
+            aggregateId,
+            afterVersion,
+            streamOptions,
+          )
+        : 0;
+
+      let state: Record<string, any> = start.state;
       let projectionResults: Record<string, any> = {};
 
       // Initialize projections
@@ -1980,138 +2059,146 @@ export class FinancialEventSourcingService {
       const eventProcessingTimes: number[] = [];
       let processedCount = 0;
 
-      for (const event of events) {
-        const eventStartTime = Date.now();
+      // Events are streamed in keyset pages, so memory stays bounded by the
+      // page size however long the aggregate's history is
+      replay: for await (const page of this.replayService.streamEvents(
+        aggregateId,
+        afterVersion,
+        streamOptions,
+      )) {
+        for (const event of page) {
+          const eventStartTime = Date.now();
 
-        try {
-          // Create checkpoint if requested
-          if (options.checkpoints?.includes(event.version)) {
-            checkpoints.push({
-              version: event.version,
-              state: JSON.parse(JSON.stringify(state)),
-              timestamp: new Date(),
-              eventId: event.id,
-              projections: options.includeProjections
-                ? JSON.parse(JSON.stringify(projectionResults))
-                : undefined,
-            });
-          }
+          try {
+            // Create checkpoint if requested
+            if (options.checkpoints?.includes(event.version)) {
+              checkpoints.push({
+                version: event.version,
+                state: JSON.parse(JSON.stringify(state)),
+                timestamp: new Date(),
+                eventId: event.id,
+                projections: options.includeProjections
+                  ? JSON.parse(JSON.stringify(projectionResults))
+                  : undefined,
+              });
+            }
 
-          // Apply custom validators if provided
-          if (options.customValidators) {
-            for (const validator of options.customValidators) {
-              try {
-                const isValid = validator.validate(state, event);
-                if (!isValid) {
+            // Apply custom validators if provided
+            if (options.customValidators) {
+              for (const validator of options.customValidators) {
+                try {
+                  const isValid = validator.validate(state, event);
+                  if (!isValid) {
+                    validationResults.businessRuleViolations.push({
+                      eventId: event.id,
+                      rule: validator.name,
+                      violation: validator.errorMessage,
+                    });
+
+                    if (options.stopOnError) {
+                      throw new Error(
+                        `Business rule violation: ${validator.errorMessage}`,
+                      );
+                    }
+                  }
+                } catch (validationError) {
                   validationResults.businessRuleViolations.push({
                     eventId: event.id,
                     rule: validator.name,
-                    violation: validator.errorMessage,
+                    violation: validationError.message,
                   });
-
-                  if (options.stopOnError) {
-                    throw new Error(
-                      `Business rule violation: ${validator.errorMessage}`,
-                    );
-                  }
                 }
-              } catch (validationError) {
-                validationResults.businessRuleViolations.push({
-                  eventId: event.id,
-                  rule: validator.name,
-                  violation: validationError.message,
-                });
               }
             }
-          }
 
-          // Apply event to state (skip if dry run)
-          if (!options.dryRun) {
-            const previousState = JSON.parse(JSON.stringify(state));
-            state = this.applyEventToState(state, event);
-
-            // Validate business rules if requested
-            if (options.validateBusinessRules) {
-              try {
-                await this.validateStateTransition(previousState, state, event);
-                validationResults.stateConsistencyChecks.passed++;
-                validationResults.stateConsistencyChecks.details.push({
-                  check: `state_transition_${event.eventType}`,
-                  result: true,
-                });
-              } catch (validationError) {
-                validationResults.stateConsistencyChecks.failed++;
-                validationResults.stateConsistencyChecks.details.push({
-                  check: `state_transition_${event.eventType}`,
-                  result: false,
-                  message: validationError.message,
-                });
+            // Apply event to state (skip if dry run)
+            if (!options.dryRun) {
+              const previousState = JSON.parse(JSON.stringify(state));
+              state = this.applyEventToState(state, event);
+
+              // Validate business rules if requested
+              if (options.validateBusinessRules) {
+                try {
+                  await this.validateStateTransition(previousState, state, event);
+                  validationResults.stateConsistencyChecks.passed++;
+                  validationResults.stateConsistencyChecks.details.push({
+                    check: `state_transition_${event.eventType}`,
+                    result: true,
+                  });
+                } catch (validationError) {
+                  validationResults.stateConsistencyChecks.failed++;
+                  validationResults.stateConsistencyChecks.details.push({
+                    check: `state_transition_${event.eventType}`,
+                    result: false,
+                    message: validationError.message,
+                  });
 
-                if (options.stopOnError) {
-                  throw validationError;
+                  if (options.stopOnError) {
+                    throw validationError;
+                  }
                 }
               }
-            }
 
-            // Apply projections
-            if (options.includeProjections && options.projections) {
-              for (const projection of options.projections) {
-                try {
-                  projectionResults[projection.name] = projection.apply(
-                    projectionResults[projection.name],
-                    event,
-                  );
-                } catch (projectionError) {
-                  this.logger.warn(
-                    `Failed to apply projection ${projection.name} for event ${event.id}`,
-                    projectionError,
-                  );
+              // Apply projections
+              if (options.includeProjections && options.projections) {
+                for (const projection of options.projections) {
+                  try {
+                    projectionResults[projection.name] = projection.apply(
+                      projectionResults[projection.name],
+                      event,
+                    );
+                  } catch (projectionError) {
+                    this.logger.warn(
+                      `Failed to apply projection ${projection.name} for event ${event.id}`,
+                      projectionError,
+                    );
+                  }
                 }
               }
             }
-          }
 
-          processedCount++;
-          const eventProcessingTime = Date.now() - eventStartTime;
-          eventProcessingTimes.push(eventProcessingTime);
+            processedCount++;
+            const eventProcessingTime = Date.now() - eventStartTime;
+            eventProcessingTimes.push(eventProcessingTime);
 
-          // Update performance metrics
-          performanceMetrics.memoryUsage = process.memoryUsage().heapUsed;
-          performanceMetrics.peakMemoryUsage = Math.max(
-            performanceMetrics.peakMemoryUsage,
-            performanceMetrics.memoryUsage,
-          );
+            // Update performance metrics
+            performanceMetrics.memoryUsage = process.memoryUsage().heapUsed;
+            performanceMetrics.peakMemoryUsage = Math.max(
+              performanceMetrics.peakMemoryUsage,
+              performanceMetrics.memoryUsage,
+            );
 
-          // Call progress callback if provided
-          if (options.progressCallback) {
-            options.progressCallback({
-              processed: processedCount,
-              total: events.length,
-              currentEvent: event,
-              currentState: state,
+            // Call progress callback if provided
+            if (options.progressCallback) {
+              options.progressCallback({
+                processed: processedCount,
+                total,
+                currentEvent: event,
+                currentState: state,
+              });
+            }
+          } catch (error) {
+            errors.push({
+              eventId: event.id,
+              error: error.message,
+              version: event.version,
             });
-          }
-        } catch (error) {
-          errors.push({
-            eventId: event.id,
-            error: error.message,
-            version: event.version,
-          });
 
-          if (options.rollbackOnError && checkpoints.length > 0) {
-            // Rollback to last checkpoint
-            const lastCheckpoint = checkpoints[checkpoints.length - 1];
-            state = lastCheckpoint.state;
-            if (options.includeProjections && lastCheckpoint.projections) {
-              projectionResults = lastCheckpoint.projections;
+            if (options.rollbackOnError && checkpoints.length > 0) {
+              // Rollback to last checkpoint
+              const lastCheckpoint = checkpoints[checkpoints.length - 1];
+              state = lastCheckpoint.state;
+              if (options.includeProjections && lastCheckpoint.projections) {
+                projectionResults = lastCheckpoint.projections;
+              }
+              this.logger.warn(
+                `Rolled back to checkpoint at version ${lastCheckpoint.version} due to error`,
+              );
             }
-            this.logger.warn(
-              `Rolled back to checkpoint at version ${lastCheckpoint.version} due to error`,
-            );
-          }
 
-          if (options.stopOnError) {
-            break;
+            if (options.stopOnError) {
+              break replay;
+            }
           }
         }
       }
@@ -2165,11 +2252,12 @@ export class FinancialEventSourcingService {
     const results: Record<string, ReplayResult> = {};
     const errors: Array<{ aggregateId: string; error: string }> = [];
 
-    // Process aggregates in batches
-    const batches = this.chunkArray(options.aggregateIds, maxConcurrency);
-
-    for (const batch of batches) {
-      const batchPromises = batch.map(async (aggregateId) => {
+    // Workers pull aggregates from a shared queue so one slow aggregate does
+    // not hold back the rest of its batch
+    await runWorkPool(
+      options.aggregateIds,
+      maxConcurrency,
+      async (aggregateId) => {
         try {
           const replayOptions: AdvancedReplayOptions = {
             includeProjections: !!options.sharedProjections,
@@ -2178,11 +2266,10 @@ export class FinancialEventSourcingService {
             validateBusinessRules: true,
           };
 
-          const result = await this.replayEventsWithCheckpoints(
+          results[aggregateId] = await this.replayEventsWithCheckpoints(
             aggregateId,
             replayOptions,
           );
-          results[aggregateId] = result;
         } catch (error) {
           errors.push({
             aggregateId,
@@ -2193,10 +2280,9 @@ export class FinancialEventSourcingService {
             throw error;
           }
         }
-      });
-
-      await Promise.all(batchPromises);
-    }
+      },
+      { failFast: options.failFast },
+    );
 
     if (errors.length > 0) {
       this.logger.warn(
@@ -2968,7 +3054,19 @@ export class FinancialEventSourcingService {
       {},
     );
 
-    // Store snapshot (implementation depends on your storage strategy)
+    if (events.length > 0) {
+      const lastEvent = events[events.length - 1];
+      await this.snapshotRepository.save(
+        this.snapshotRepository.create({
+          aggregateId: options.aggregateId,
+          aggregateType: lastEvent.aggregateType,
+          version: lastEvent.version,
+          state,
+          eventCount: events.length,
+        }),
+      );
+    }
+
     this.logger.log(
       `Created snapshot for aggregate ${options.aggregateId} with ${events.length} events`,
     );
@@ -3135,9 +3233,23 @@ export class FinancialEventSourcingService {
     eventCounts: Record<string, number>;
     dailyBreakdown: Array<{ date: string; amount: number; count: number }>;
   }> {
+    const rollupRange = await this.resolveRollupRange(
+      criteria.fromDate,
+      criteria.toDate,
+    );
+
     const queryBuilder = this.eventRepository
       .createQueryBuilder('event')
-      .where('event.amount IS NOT NULL');
+      .select(
+        `to_char(date_trunc('day', event.createdAt), 'YYYY-MM-DD')`,
+        'day',
+      )
+      .addSelect('event.eventType', 'eventType')
+      .addSelect('COALESCE(SUM(event.amount), 0)', 'amount')
+      .addSelect('COUNT(*)', 'count')
+      .where('event.amount IS NOT NULL')
+      .groupBy(`date_trunc('day', event.createdAt)`)
+      .addGroupBy('event.eventType');
 
     if (criteria.fromDate) {
       queryBuilder.andWhere('event.createdAt >= :fromDate', {
@@ -3151,6 +3263,19 @@ export class FinancialEventSourcingService {
       });
     }
 
+    // Closed days already in the rollup table are not scanned again
+    if (rollupRange) {
+      queryBuilder.andWhere(
+        new Brackets((qb) => {
+          qb.where('event.createdAt < :rollupStart', {
+            rollupStart: rollupRange.start,
+          }).orWhere('event.createdAt >= :rollupEnd', {
+            rollupEnd: rollupRange.end,
+          });
+        }),
+      );
+    }
+
     if (criteria.partnerId) {
       queryBuilder.andWhere('event.partnerId = :partnerId', {
         partnerId: criteria.partnerId,
@@ -3163,55 +3288,123 @@ export class FinancialEventSourcingService {
       });
     }
 
-    const events = await queryBuilder.getMany();
-
-    const totalAmount = events.reduce(
-      (sum, event) => sum + (event.amount || 0),
-      0,
-    );
-
-    const eventCounts = events.reduce(
-      (counts, event) => {
-        counts[event.eventType] = (counts[event.eventType] || 0) + 1;
-        return counts;
-      },
-      {} as Record<string, number>,
-    );
-
-    const dailyBreakdown = events.reduce(
-      (breakdown, event) => {
-        const date = event.createdAt.toISOString().split('T')[0];
-        const existing = breakdown.find((item) => item.date === date);
+    const [liveRows, rolledUpBuckets] = await Promise.all([
+      queryBuilder.getRawMany<{
+        day: string;
+        eventType: string;
+        amount: string;
+        count: string;
+      }>(),
+      rollupRange
+        ? this.rollupService.getBuckets(
+            rollupRange.fromDay,
+            rollupRange.toDay,
+            {
+              partnerId: criteria.partnerId,
+              eventTypes: criteria.eventTypes,
+            },
+          )
+        : Promise.resolve([] as FinancialAnalyticsBucket[]),
+    ]);
 
-        if (existing) {
-          existing.amount += event.amount || 0;
-          existing.count += 1;
-        } else {
-          breakdown.push({
-            date,
-            amount: event.amount || 0,
-            count: 1,
-          });
-        }
+    const buckets: FinancialAnalyticsBucket[] = [
+      ...rolledUpBuckets,
+      ...liveRows.map((row) => ({
+        day: row.day,
+        eventType: row.eventType,
+        amount: parseFloat(row.amount) || 0,
+        count: parseInt(row.count, 10) || 0,
+      })),
+    ];
 
-        return breakdown;
-      },
-      [] as Array<{ date: string; amount: number; count: number }>,
-    );
+    let totalAmount = 0;
+    const eventCounts: Record<string, number> = {};
+    const dailyBreakdown = new Map<
+      string,
+      { date: string; amount: number; count: number }
+    >();
+
+    for (const bucket of buckets) {
+      totalAmount += bucket.amount;
+      eventCounts[bucket.eventType] =
+        (eventCounts[bucket.eventType] || 0) + bucket.count;
+
+      const day = dailyBreakdown.get(bucket.day);
+      if (day) {
+        day.amount += bucket.amount;
+        day.count += bucket.count;
+      } else {
+        dailyBreakdown.set(bucket.day, {
+          date: bucket.day,
+          amount: bucket.amount,
+          count: bucket.count,
+        });
+      }
+    }
 
     return {
       totalAmount,
       eventCounts,
-      dailyBreakdown: dailyBreakdown.sort((a, b) =>
+      dailyBreakdown: Array.from(dailyBreakdown.values()).sort((a, b) =>
         a.date.localeCompare(b.date),
       ),
     };
   }
 
   /**
-   * Apply event to aggregate state
+   * Largest run of whole closed days inside [fromDate, toDate] that is fully
+   * covered by the daily rollup, or null when the range must be scanned live
+   */
+  private async resolveRollupRange(
+    fromDate?: Date,
+    toDate?: Date,
+  ): Promise<{
+    fromDay: string;
+    toDay: string;
+    start: Date;
+    end: Date;
+  } | null> {
+    let fromDay: string;
+    if (fromDate) {
+      fromDay = toUtcDay(fromDate);
+      if (fromDate.getTime() !== Date.parse(`${fromDay}T00:00:00.000Z`)) {
+        fromDay = addUtcDays(fromDay, 1);
+      }
+    } else {
+      fromDay = await this.rollupService.getFirstRolledUpDay();
+      if (!fromDay) return null;
+    }
+
+    // toDate is inclusive, so a day only counts once its last instant is in
+    let toDay = addUtcDays(toUtcDay(new Date()), -1);
+    if (toDate) {
+      const lastFullDay = addUtcDays(
+        toUtcDay(new Date(toDate.getTime() + 1)),
+        -1,
+      );
+      if (lastFullDay < toDay) toDay = lastFullDay;
+    }
+
+    if (fromDay > toDay) return null;
+    if (!(await this.rollupService.isRangeRolledUp(fromDay, toDay))) {
+      this.logger.debug(
+        `Financial rollup incomplete for ${fromDay}..${toDay}, scanning live`,
+      );
+      return null;
+    }
+
+    return {
+      fromDay,
+      toDay,
+      start: new Date(`${fromDay}T00:00:00.000Z`),
+      end: new Date(`${addUtcDays(toDay, 1)}T00:00:00.000Z`),
+    };
+  }
+
+  /**
+   * Fold a single event into an aggregate state
    */
-  private applyEventToState(
+  applyEventToState(
     currentState: Record<string, any>,
     event: FinancialEventEntity,
   ): Record<string, any> {
@@ -0,0 +1,38 @@
+import {
+  Column,
+  CreateDateColumn,
+  Entity,
+  Index,
+  PrimaryGeneratedColumn,
+} from 'typeorm';
+
+@Entity('financial_snapshots')
+@Index(['aggregateId', 'version'])
+export class FinancialSnapshotEntity {
+  @PrimaryGeneratedColumn('uuid')
+  id: string;
+
+  @Column({ name: 'aggregate_id', type: 'uuid' })
+  aggregateId: string;
+
+  @Column({ name: 'aggregate_type', type: 'varchar', length: 100 })
+  aggregateType: string;
+
+  @Column({ name: 'version', type: 'int' })
+  version: number;
+
+  @Column({ name: 'state', type: 'jsonb' })
+  state: Record<string, any>;
+
+  @Column({ name: 'projections', type: 'jsonb', nullable: true })
+  projections?: Record<string, any>;
+
+  @Column({ name: 'event_count', type: 'int', default: 0 })
+  eventCount: number;
+
+  @Column({ name: 'description', type: 'text', nullable: true })
+  description?: string;
+
+  @CreateDateColumn({ name: 'created_at' })
+  createdAt: Date;
+}
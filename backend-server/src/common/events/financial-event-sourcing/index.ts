@@ -1,5 +1,9 @@
 export * from './financial-aggregate.entity';
+export * from './financial-event-replay.service';
+export * from './financial-event-rollup.entity';
+export * from './financial-event-rollup.service';
 export * from './financial-event-sourcing.module';
 export * from './financial-event-sourcing.service';
 export * from './financial-event.entity';
 export * from './financial-event.handler';
+export * from './financial-snapshot.entity';
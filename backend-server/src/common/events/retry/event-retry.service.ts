@@ -104,6 +104,35 @@ export class EventRetryService {
     );
   }
 
+  /**
+   * Decide when a persisted event whose delivery failed should be retried.
+   *
+   * Used by the outbox poller for events in the event store: the retry
+   * state lives in the store rather than in memory, so this only applies
+   * the backoff policy and returns null (after dead-lettering the event)
+   * once the event should not be retried anymore.
+   */
+  async scheduleStoredEventRetry(
+    event: DomainEvent,
+    error: Error,
+    retryCount: number,
+    config?: Partial<RetryConfig>,
+  ): Promise<Date | null> {
+    const retryConfig = { ...this.defaultConfig, ...config };
+
+    if (
+      !this.isRetryableError(error, retryConfig) ||
+      retryCount >= retryConfig.maxRetries
+    ) {
+      await this.handleDeadLetter(event, event.eventType, 'outbox', error);
+      return null;
+    }
+
+    return new Date(
+      Date.now() + this.calculateDelay(retryCount + 1, retryConfig),
+    );
+  }
+
   /**
    * Check if an error is retryable based on configuration
    */
@@ -1,3 +1,4 @@
+import { RedisModule } from '@/shared/redis/redis.module';
 import { Module } from '@nestjs/common';
 import { EventEmitterModule } from '@nestjs/event-emitter';
 import { TypeOrmModule } from '@nestjs/typeorm';
@@ -26,6 +27,7 @@ import { RealTimeConfigService } from '../services/real-time-config.service';
     ]),
     EventEmitterModule,
     NotificationModule,
+    RedisModule,
   ],
   providers: [
     DynamicFinancialConfigService,
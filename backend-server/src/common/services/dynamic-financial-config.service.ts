@@ -10,16 +10,45 @@ import {
   ConfigurationValue,
   ConfigurationVersion,
 } from '@/common/types/financial-configuration.types';
+import { RedisService } from '@/shared/redis/redis.service';
 import { Injectable, Logger, OnModuleInit } from '@nestjs/common';
-import { EventEmitter2 } from '@nestjs/event-emitter';
+import { EventEmitter2, OnEvent } from '@nestjs/event-emitter';
 import { Cron, CronExpression } from '@nestjs/schedule';
 import { InjectRepository } from '@nestjs/typeorm';
+import { randomUUID } from 'crypto';
 import { Repository } from 'typeorm';
+import {
+  FinancialConfigEntry,
+  FinancialConfigSnapshot,
+} from './financial-config-snapshot';
+
+interface ConfigurationUpdateMessage {
+  origin: string;
+  type: ConfigurationType;
+  scope: ConfigurationScope;
+  scopeId?: string;
+  version: number;
+  config: Record<string, any>;
+  changedBy?: string;
+}
 
+const UPDATE_CHANNEL = 'financial-config:updates';
+
+/**
+ * Financial configuration (commission, tax, fee, ...) for every scope.
+ *
+ * All active configurations live in an in-memory FinancialConfigSnapshot,
+ * so reads never touch the database. Updates build a new snapshot and swap
+ * it in whole, then are broadcast over Redis pub/sub for other instances
+ * to apply. Entries only move forward by configuration version, and the
+ * snapshot is reloaded from the database every five minutes to pick up
+ * anything a broadcast missed.
+ */
 @Injectable()
 export class DynamicFinancialConfigService implements OnModuleInit {
   private readonly logger = new Logger(DynamicFinancialConfigService.name);
-  private readonly configCache = new Map<string, any>();
+  private readonly instanceId = randomUUID();
+  private snapshot = this.buildSnapshot([], 0);
   private readonly subscribers = new Map<string, Set<(config: any) => void>>();
   private readonly configVersions = new Map<string, ConfigurationVersion[]>();
 
@@ -31,38 +60,33 @@ export class DynamicFinancialConfigService implements OnModuleInit {
     @InjectRepository(FinancialConfigurationChangeEntity)
     private readonly changeRepository: Repository<FinancialConfigurationChangeEntity>,
     private readonly eventEmitter: EventEmitter2,
+    private readonly redisService: RedisService,
   ) {}
 
   async onModuleInit() {
     await this.loadAllConfigurations();
+    try {
+      await this.redisService.subscribe(UPDATE_CHANNEL, (message) =>
+        this.onUpdateMessage(message),
+      );
+    } catch (error) {
+      this.logger.warn(
+        `Updates from other instances apply after the next reload: ${error}`,
+      );
+    }
     this.logger.log('Dynamic Financial Configuration Service initialized');
   }
 
   /**
-   * Get configuration value with caching and real-time updates
+   * Get configuration value from the current snapshot. Scopes other than
+   * global return null when they have no configuration of their own.
    */
   async getConfiguration<T = any>(
     type: ConfigurationType,
     scope: ConfigurationScope = ConfigurationScope.GLOBAL,
     scopeId?: string,
   ): Promise<T | null> {
-    const cacheKey = this.buildCacheKey(type, scope, scopeId);
-
-    if (this.configCache.has(cacheKey)) {
-      return this.configCache.get(cacheKey);
-    }
-
-    // Load from database if not in cache
-    const config = await this.loadConfigurationFromDatabase(
-      type,
-      scope,
-      scopeId,
-    );
-    if (config) {
-      this.configCache.set(cacheKey, config);
-    }
-
-    return config;
+    return this.snapshot.get(type, scope, scopeId) as T | null;
   }
 
   /**
@@ -92,9 +116,21 @@ export class DynamicFinancialConfigService implements OnModuleInit {
       reason,
     );
 
-    // Update cache
-    const processedConfig = this.processConfiguration(configuration);
-    this.configCache.set(cacheKey, processedConfig);
+    // Swap in a snapshot with the new version and share it
+    const processedConfig = this.toSnapshotConfig(type, scope, configuration);
+    this.applyEntry(type, scope, scopeId, {
+      version: version.version,
+      config: processedConfig,
+    });
+    await this.publishUpdate({
+      origin: this.instanceId,
+      type,
+      scope,
+      scopeId,
+      version: version.version,
+      config: processedConfig,
+      changedBy: userId,
+    });
 
     // Record change
     await this.recordConfigurationChange({
@@ -245,47 +281,25 @@ export class DynamicFinancialConfigService implements OnModuleInit {
     region?: string,
     category?: string,
   ): Promise<T> {
-    // Start with global configuration
-    let config =
-      (await this.getConfiguration(type, ConfigurationScope.GLOBAL)) || {};
-
-    // Apply region-specific overrides
-    if (region) {
-      const regionConfig = await this.getConfiguration(
-        type,
-        ConfigurationScope.REGION,
-        region,
-      );
-      if (regionConfig) {
-        config = this.mergeConfigurations(config, regionConfig);
-      }
-    }
-
-    // Apply category-specific overrides
-    if (category) {
-      const categoryConfig = await this.getConfiguration(
-        type,
-        ConfigurationScope.CATEGORY,
-        category,
-      );
-      if (categoryConfig) {
-        config = this.mergeConfigurations(config, categoryConfig);
-      }
-    }
-
-    // Apply partner-specific overrides (highest priority)
-    if (partnerId) {
-      const partnerConfig = await this.getConfiguration(
-        type,
-        ConfigurationScope.PARTNER,
-        partnerId,
-      );
-      if (partnerConfig) {
-        config = this.mergeConfigurations(config, partnerConfig);
-      }
-    }
+    // Global, then region, category and partner overrides (highest priority)
+    return this.snapshot.resolve(type, { partnerId, region, category }) as T;
+  }
 
-    return config;
+  /**
+   * Apply updates made by another provider instance in this process.
+   */
+  @OnEvent('financial.config.updated')
+  handleConfigurationUpdated(event: {
+    type: ConfigurationType;
+    scope: ConfigurationScope;
+    scopeId?: string;
+    newConfig: Record<string, any>;
+    version: number;
+  }): void {
+    this.applyEntry(event.type, event.scope, event.scopeId, {
+      version: event.version,
+      config: event.newConfig,
+    });
   }
 
   /**
@@ -629,13 +643,6 @@ export class DynamicFinancialConfigService implements OnModuleInit {
     }
   }
 
-  /**
-   * Merge configurations with priority
-   */
-  private mergeConfigurations(base: any, override: any): any {
-    return { ...base, ...override };
-  }
-
   /**
    * Build cache key
    */
@@ -644,52 +651,143 @@ export class DynamicFinancialConfigService implements OnModuleInit {
     scope: ConfigurationScope,
     scopeId?: string,
   ): string {
-    return `${type}:${scope}${scopeId ? ':' + scopeId : ''}`;
+    return FinancialConfigSnapshot.key(type, scope, scopeId);
   }
 
   /**
-   * Load configuration from database
+   * Values as held in the snapshot; global configurations are laid over
+   * the built-in defaults.
    */
-  private async loadConfigurationFromDatabase(
+  private toSnapshotConfig(
     type: ConfigurationType,
     scope: ConfigurationScope,
-    scopeId?: string,
-  ): Promise<any> {
-    try {
-      const config = await this.configRepository.findOne({
-        where: {
-          type,
-          scope,
-          scopeId: scopeId || null,
-          isActive: true,
-        },
-        order: { version: 'DESC' },
+    configuration: Record<string, ConfigurationValue>,
+  ): Record<string, any> {
+    const processed = this.processConfiguration(configuration);
+    return scope === ConfigurationScope.GLOBAL
+      ? { ...this.getDefaultConfiguration(type), ...processed }
+      : processed;
+  }
+
+  /**
+   * Snapshot of the built-in defaults overlaid with the given rows.
+   */
+  private buildSnapshot(
+    rows: FinancialConfigurationEntity[],
+    version: number,
+  ): FinancialConfigSnapshot {
+    const entries = new Map<string, FinancialConfigEntry>();
+    for (const type of Object.values(ConfigurationType)) {
+      entries.set(this.buildCacheKey(type, ConfigurationScope.GLOBAL), {
+        version: 0,
+        config: this.getDefaultConfiguration(type),
       });
+    }
+    for (const row of rows) {
+      const key = this.buildCacheKey(row.type, row.scope, row.scopeId);
+      if ((entries.get(key)?.version ?? 0) > row.version) continue;
+      entries.set(key, {
+        version: row.version,
+        config: this.toSnapshotConfig(row.type, row.scope, row.configuration),
+      });
+    }
+    return new FinancialConfigSnapshot(version, entries);
+  }
 
-      if (!config) {
-        return this.getDefaultConfiguration(type);
-      }
+  /**
+   * Swap in a snapshot holding `entry`, unless the current one already has
+   * that configuration at the same or a later version.
+   */
+  private applyEntry(
+    type: ConfigurationType,
+    scope: ConfigurationScope,
+    scopeId: string | undefined,
+    entry: FinancialConfigEntry,
+  ): boolean {
+    const key = this.buildCacheKey(type, scope, scopeId);
+    const current = this.snapshot.entry(key);
+    if (current && current.version >= entry.version) return false;
+
+    this.snapshot = this.snapshot.with(key, entry);
+    return true;
+  }
 
-      return this.processConfiguration(config.configuration);
+  private async publishUpdate(
+    message: ConfigurationUpdateMessage,
+  ): Promise<void> {
+    try {
+      if (this.redisService.isReady()) {
+        await this.redisService.publish(
+          UPDATE_CHANNEL,
+          JSON.stringify(message),
+        );
+      }
     } catch (error) {
       this.logger.error(
-        `Failed to load configuration from database: ${error.message}`,
+        `Failed to broadcast configuration update: ${error.message}`,
         error.stack,
       );
-      return this.getDefaultConfiguration(type);
     }
   }
 
+  private async onUpdateMessage(raw: string): Promise<void> {
+    let message: ConfigurationUpdateMessage;
+    try {
+      message = JSON.parse(raw);
+    } catch (error) {
+      this.logger.warn(`Ignoring malformed configuration update: ${error}`);
+      return;
+    }
+    if (message.origin === this.instanceId) return;
+
+    const { type, scope, scopeId, version, config } = message;
+    const oldConfig = this.snapshot.get(type, scope, scopeId);
+    if (!this.applyEntry(type, scope, scopeId, { version, config })) return;
+
+    // Local subscribers and WebSocket clients of this instance
+    await this.notifyConfigurationChange(
+      type,
+      scope,
+      scopeId,
+      config,
+      oldConfig,
+    );
+    this.eventEmitter.emit('financial.config.updated', {
+      type,
+      scope,
+      scopeId,
+      oldConfig,
+      newConfig: config,
+      version,
+      changedBy: message.changedBy,
+    });
+  }
+
   /**
-   * Load all configurations on startup
+   * Load every active configuration into a fresh snapshot. Entries the
+   * current snapshot holds at a later version (updates that landed while
+   * loading) are kept.
    */
   private async loadAllConfigurations(): Promise<void> {
-    // Load all configuration types and scopes from database
-    // For now, load defaults
-    for (const type of Object.values(ConfigurationType)) {
-      const config = this.getDefaultConfiguration(type);
-      const cacheKey = this.buildCacheKey(type, ConfigurationScope.GLOBAL);
-      this.configCache.set(cacheKey, config);
+    try {
+      const rows = await this.configRepository.find({
+        where: { isActive: true },
+      });
+      const loaded = this.buildSnapshot(rows, this.snapshot.version + 1);
+
+      let snapshot = loaded;
+      for (const key of this.snapshot.keys()) {
+        const current = this.snapshot.entry(key);
+        if (current.version > (loaded.entry(key)?.version ?? 0)) {
+          snapshot = snapshot.with(key, current);
+        }
+      }
+      this.snapshot = snapshot;
+    } catch (error) {
+      this.logger.error(
+        `Failed to load configurations from database: ${error.message}`,
+        error.stack,
+      );
     }
   }
 
@@ -758,50 +856,41 @@ export class DynamicFinancialConfigService implements OnModuleInit {
   }
 
   /**
-   * Periodic cache refresh
+   * Periodic snapshot reload, covering updates whose broadcast was missed
    */
   @Cron(CronExpression.EVERY_5_MINUTES)
   async refreshConfigurationCache(): Promise<void> {
-    this.logger.debug('Refreshing configuration cache...');
-
-    // In a real implementation, this would check for database changes
-    // and update the cache accordingly
-
-    // For now, just log the refresh
+    await this.loadAllConfigurations();
     this.logger.debug(
-      `Configuration cache refreshed. ${this.configCache.size} configurations cached.`,
+      `Configuration snapshot ${this.snapshot.version} loaded with ${this.snapshot.size} configurations.`,
     );
   }
 
   /**
-   * Clear configuration cache
+   * Reload the configuration snapshot from the database
    */
   async clearCache(type?: ConfigurationType): Promise<void> {
-    if (type) {
-      // Clear specific configuration type
-      const keysToDelete = Array.from(this.configCache.keys()).filter((key) =>
-        key.startsWith(type),
-      );
-      keysToDelete.forEach((key) => this.configCache.delete(key));
-      this.logger.log(`Cleared cache for configuration type: ${type}`);
-    } else {
-      // Clear all cache
-      this.configCache.clear();
-      this.logger.log('Cleared all configuration cache');
-    }
+    await this.loadAllConfigurations();
+    this.logger.log(
+      type
+        ? `Reloaded configurations (requested for ${type})`
+        : 'Reloaded all configurations',
+    );
   }
 
   /**
    * Get cache statistics
    */
   getCacheStats(): {
+    snapshotVersion: number;
     totalConfigurations: number;
     totalVersions: number;
     totalSubscribers: number;
     cacheKeys: string[];
   } {
     return {
-      totalConfigurations: this.configCache.size,
+      snapshotVersion: this.snapshot.version,
+      totalConfigurations: this.snapshot.size,
       totalVersions: Array.from(this.configVersions.values()).reduce(
         (total, versions) => total + versions.length,
         0,
@@ -810,7 +899,7 @@ export class DynamicFinancialConfigService implements OnModuleInit {
         (total, subs) => total + subs.size,
         0,
       ),
-      cacheKeys: Array.from(this.configCache.keys()),
+      cacheKeys: this.snapshot.keys(),
     };
   }
 
@@ -0,0 +1,76 @@
+import {
+  ConfigurationScope,
+  ConfigurationType,
+} from '@/common/types/financial-configuration.types';
+import { FinancialConfigSnapshot } from './financial-config-snapshot';
+
+describe('FinancialConfigSnapshot', () => {
+  const type = ConfigurationType.COMMISSION_SETTINGS;
+  const key = (scope: ConfigurationScope, scopeId?: string) =>
+    FinancialConfigSnapshot.key(type, scope, scopeId);
+
+  const snapshot = new FinancialConfigSnapshot(
+    1,
+    new Map([
+      [
+        key(ConfigurationScope.GLOBAL),
+        {
+          version: 3,
+          config: { defaultCommissionPercentage: 10, paymentTermDays: 30 },
+        },
+      ],
+      [
+        key(ConfigurationScope.REGION, 'south'),
+        { version: 1, config: { paymentTermDays: 15 } },
+      ],
+      [
+        key(ConfigurationScope.PARTNER, 'partner-1'),
+        { version: 2, config: { defaultCommissionPercentage: 8 } },
+      ],
+    ]),
+  );
+
+  it('should return null for scopes without their own configuration', () => {
+    expect(
+      snapshot.get(type, ConfigurationScope.PARTNER, 'partner-2'),
+    ).toBeNull();
+    expect(
+      snapshot.get(type, ConfigurationScope.PARTNER, 'partner-1'),
+    ).toEqual({ defaultCommissionPercentage: 8 });
+  });
+
+  it('should layer region, category and partner over global', () => {
+    expect(
+      snapshot.resolve(type, { partnerId: 'partner-1', region: 'south' }),
+    ).toEqual({ defaultCommissionPercentage: 8, paymentTermDays: 15 });
+    expect(snapshot.resolve(type, { partnerId: 'partner-2' })).toEqual({
+      defaultCommissionPercentage: 10,
+      paymentTermDays: 30,
+    });
+  });
+
+  it('should memoize effective configurations', () => {
+    const first = snapshot.resolve(type, { partnerId: 'partner-1' });
+
+    expect(snapshot.resolve(type, { partnerId: 'partner-1' })).toBe(first);
+  });
+
+  it('should leave itself untouched when deriving a new snapshot', () => {
+    const before = snapshot.resolve(type, { partnerId: 'partner-1' });
+
+    const next = snapshot.with(key(ConfigurationScope.PARTNER, 'partner-1'), {
+      version: 3,
+      config: { defaultCommissionPercentage: 6 },
+    });
+
+    expect(next.version).toBe(2);
+    expect(next.resolve(type, { partnerId: 'partner-1' })).toEqual({
+      defaultCommissionPercentage: 6,
+      paymentTermDays: 30,
+    });
+    expect(snapshot.resolve(type, { partnerId: 'partner-1' })).toBe(before);
+    expect(
+      snapshot.entry(key(ConfigurationScope.PARTNER, 'partner-1')),
+    ).toEqual({ version: 2, config: { defaultCommissionPercentage: 8 } });
+  });
+});
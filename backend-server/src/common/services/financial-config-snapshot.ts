@@ -0,0 +1,105 @@
+import {
+  ConfigurationScope,
+  ConfigurationType,
+} from '@/common/types/financial-configuration.types';
+
+export interface FinancialConfigEntry {
+  /** Version of the stored configuration row; 0 for built-in defaults */
+  version: number;
+  config: Record<string, any>;
+}
+
+export interface FinancialConfigContext {
+  partnerId?: string;
+  region?: string;
+  category?: string;
+}
+
+/** Effective configurations memoized per snapshot before the memo resets */
+const EFFECTIVE_MEMO_MAX = 10000;
+
+/**
+ * Immutable view of every active financial configuration, keyed by
+ * `type:scope[:scopeId]`.
+ *
+ * Lookups are single map reads, and effective (merged) configurations are
+ * memoized on the snapshot itself, so swapping in a new snapshot drops them
+ * along with the old entries. Returned objects are shared; treat them as
+ * read-only.
+ */
+export class FinancialConfigSnapshot {
+  private readonly effective = new Map<string, Record<string, any>>();
+
+  constructor(
+    /** Increases by one with every snapshot built from its predecessor */
+    readonly version: number,
+    private readonly entries: ReadonlyMap<string, FinancialConfigEntry>,
+  ) {}
+
+  static key(
+    type: ConfigurationType,
+    scope: ConfigurationScope,
+    scopeId?: string,
+  ): string {
+    return `${type}:${scope}${scopeId ? ':' + scopeId : ''}`;
+  }
+
+  get size(): number {
+    return this.entries.size;
+  }
+
+  keys(): string[] {
+    return Array.from(this.entries.keys());
+  }
+
+  entry(key: string): FinancialConfigEntry | undefined {
+    return this.entries.get(key);
+  }
+
+  get(
+    type: ConfigurationType,
+    scope: ConfigurationScope,
+    scopeId?: string,
+  ): Record<string, any> | null {
+    return (
+      this.entries.get(FinancialConfigSnapshot.key(type, scope, scopeId))
+        ?.config ?? null
+    );
+  }
+
+  /**
+   * Global configuration overridden by region, then category, then partner.
+   */
+  resolve(
+    type: ConfigurationType,
+    { partnerId, region, category }: FinancialConfigContext = {},
+  ): Record<string, any> {
+    const memoKey = `${type}|${region ?? ''}|${category ?? ''}|${partnerId ?? ''}`;
+    const memoized = this.effective.get(memoKey);
+    if (memoized) return memoized;
+
+    let config = this.get(type, ConfigurationScope.GLOBAL) ?? {};
+    const overrides: Array<[ConfigurationScope, string | undefined]> = [
+      [ConfigurationScope.REGION, region],
+      [ConfigurationScope.CATEGORY, category],
+      [ConfigurationScope.PARTNER, partnerId],
+    ];
+    for (const [scope, scopeId] of overrides) {
+      const override = scopeId ? this.get(type, scope, scopeId) : null;
+      if (override) config = { ...config, ...override };
+    }
+
+    if (this.effective.size >= EFFECTIVE_MEMO_MAX) this.effective.clear();
+    this.effective.set(memoKey, config);
+    return config;
+  }
+
+  /**
+   * A new snapshot with `entry` stored under `key`; this one is unchanged.
+   */
+  with(key: string, entry: FinancialConfigEntry): FinancialConfigSnapshot {
+    const entries = new Map(this.entries);
+    entries.set(key, entry);
+    return new FinancialConfigSnapshot(this.version + 1, entries);
+  }
+}
@@ -0,0 +1,64 @@
+import { runWorkPool } from './concurrency.util';
+
+describe('runWorkPool', () => {
+  const delay = (ms: number) => new Promise((r) => setTimeout(r, ms));
+
+  it('should never exceed the concurrency limit', async () => {
+    let inFlight = 0;
+    let peak = 0;
+
+    await runWorkPool([1, 2, 3, 4, 5, 6, 7, 8], 3, async () => {
+      inFlight++;
+      peak = Math.max(peak, inFlight);
+      await delay(5);
+      inFlight--;
+    });
+
+    expect(peak).toBe(3);
+  });
+
+  it('should keep draining while a slow item holds its slot', async () => {
+    const completed: number[] = [];
+
+    await runWorkPool([1, 2, 3, 4], 2, async (item) => {
+      await delay(item === 1 ? 30 : 1);
+      completed.push(item);
+    });
+
+    expect(completed).toEqual([2, 3, 4, 1]);
+  });
+
+  it('should pull lazily from async sources', async () => {
+    let produced = 0;
+    async function* source() {
+      for (let i = 0; i < 10; i++) {
+        produced++;
+        yield i;
+      }
+    }
+
+    let maxAhead = 0;
+    let consumed = 0;
+    await runWorkPool(source(), 2, async () => {
+      maxAhead = Math.max(maxAhead, produced - consumed);
+      await delay(1);
+      consumed++;
+    });
+
+    expect(produced).toBe(10);
+    expect(maxAhead).toBeLessThanOrEqual(2);
+  });
+
+  it('should collect item errors unless failFast is set', async () => {
+    const worker = async (item: number) => {
+      if (item % 2 === 0) throw new Error(`bad ${item}`);
+    };
+
+    const errors = await runWorkPool([1, 2, 3, 4], 2, worker);
+    expect(errors.map((e) => e.item)).toEqual([2, 4]);
+
+    await expect(
+      runWorkPool([1, 2, 3, 4], 2, worker, { failFast: true }),
+    ).rejects.toThrow('bad 2');
+  });
+});
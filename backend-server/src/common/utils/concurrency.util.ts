@@ -0,0 +1,55 @@
+export interface WorkPoolOptions {
+  /**
+   * Stop pulling new work and reject as soon as one worker throws
+   */
+  failFast?: boolean;
+}
+
+/**
+ * Run `worker` over every item of `source` with at most `concurrency`
+ * items in flight.
+ *
+ * Workers pull from a single shared iterator, so a slow item only occupies
+ * its own slot while the remaining workers keep draining the source (work
+ * stealing rather than lockstep batches). Because items are pulled on
+ * demand, lazy async sources such as paged database cursors are only read
+ * as fast as the workers consume them (natural backpressure).
+ *
+ * @returns The errors raised by individual items when `failFast` is off
+ */
+export async function runWorkPool<T>(
+  source: Iterable<T> | AsyncIterable<T>,
+  concurrency: number,
+  worker: (item: T) => Promise<void>,
+  options: WorkPoolOptions = {},
+): Promise<Array<{ item: T; error: Error }>> {
+  const iterator: AsyncIterator<T> | Iterator<T> =
+    Symbol.asyncIterator in source
+      ? (source as AsyncIterable<T>)[Symbol.asyncIterator]()
+      : (source as Iterable<T>)[Symbol.iterator]();
+
+  const errors: Array<{ item: T; error: Error }> = [];
+  let stopped = false;
+
+  const runWorker = async () => {
+    while (!stopped) {
+      const next = await iterator.next();
+      if (next.done) return;
+
+      try {
+        await worker(next.value);
+      } catch (error) {
+        if (options.failFast) {
+          stopped = true;
+          throw error;
+        }
+        errors.push({ item: next.value, error });
+      }
+    }
+  };
+
+  const slots = Math.max(1, Math.floor(concurrency) || 1);
+  await Promise.all(Array.from({ length: slots }, () => runWorker()));
+
+  return errors;
+}
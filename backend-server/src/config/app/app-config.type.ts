@@ -4,6 +4,8 @@ export type AppConfig = {
   nodeEnv: `${Environment}`;
   isHttps: boolean;
   isWorker: boolean;
+  workerQueues: string[];
+  startupProfile: boolean;
   name: string;
   appPrefix: string;
   url: string;
@@ -16,4 +18,6 @@ export type AppConfig = {
   logService: string;
   corsOrigin: boolean | string[] | '*';
   localFileUpload: boolean;
+  exportDir: string;
+  auditSpillDir: string;
 };
@@ -14,6 +14,7 @@ import {
   Min,
 } from 'class-validator';
 import kebabCase from 'lodash/kebabCase';
+import path from 'node:path';
 import process from 'node:process';
 import { AppConfig } from './app-config.type';
 
@@ -30,6 +31,14 @@ class EnvironmentVariablesValidator {
   @IsOptional()
   IS_WORKER: boolean;
 
+  @IsString()
+  @IsOptional()
+  WORKER_QUEUES: string;
+
+  @IsBoolean()
+  @IsOptional()
+  APP_STARTUP_PROFILE: boolean;
+
   @IsString()
   @IsNotEmpty()
   APP_NAME: string;
@@ -81,6 +90,14 @@ class EnvironmentVariablesValidator {
   @IsBoolean()
   @IsOptional()
   APP_LOCAL_FILE_UPLOAD: boolean;
+
+  @IsString()
+  @IsOptional()
+  APP_EXPORT_DIR: string;
+
+  @IsString()
+  @IsOptional()
+  APP_AUDIT_SPILL_DIR: string;
 }
 
 export function getConfig(): AppConfig {
@@ -96,6 +113,8 @@ export function getConfig(): AppConfig {
     nodeEnv,
     isHttps: process.env.IS_HTTPS === 'true',
     isWorker: process.env.IS_WORKER === 'true',
+    workerQueues: getWorkerQueues(),
+    startupProfile: isStartupProfileEnabled(),
     name: process.env.APP_NAME,
     appPrefix: kebabCase(process.env.APP_NAME),
     url: process.env.APP_URL || `http://localhost:${port}`,
@@ -108,6 +127,11 @@ export function getConfig(): AppConfig {
     logService: process.env.APP_LOG_SERVICE || LogService.Console,
     corsOrigin: getCorsOrigin(),
     localFileUpload: process.env.APP_LOCAL_FILE_UPLOAD === 'true',
+    exportDir:
+      process.env.APP_EXPORT_DIR || path.join(process.cwd(), 'storage/exports'),
+    auditSpillDir:
+      process.env.APP_AUDIT_SPILL_DIR ||
+      path.join(process.cwd(), 'storage/audit-spill'),
   };
 }
 
@@ -118,6 +142,24 @@ export default registerAs<AppConfig>('app', () => {
   return getConfig();
 });
 
+/**
+ * Queues a worker consumes (WORKER_QUEUES); empty means every queue.
+ * Also read by main.ts, which picks the root module before config loads.
+ */
+export function getWorkerQueues(): string[] {
+  return (process.env.WORKER_QUEUES || '')
+    .split(',')
+    .map((queue) => queue.trim())
+    .filter(Boolean);
+}
+
+/**
+ * Whether startup phases are timed and reported (APP_STARTUP_PROFILE)
+ */
+export function isStartupProfileEnabled(): boolean {
+  return process.env.APP_STARTUP_PROFILE === 'true';
+}
+
 function getCorsOrigin() {
   const corsOrigin = process.env.APP_CORS_ORIGIN;
   if (corsOrigin === 'true') return true;
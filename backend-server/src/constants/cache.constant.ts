@@ -1,6 +1,8 @@
 export enum CacheKey {
   AccessToken = 'auth:token:%s:access', // %s: hash
   RefreshToken = 'auth:token:%s:refresh', // %s: token
+  RevokedAccessToken = 'auth:token:%s:revoked', // %s: hash
+  SubjectTokensRevokedAt = 'auth:subject:%s:tokens-revoked-at', // %s: token subject
   EmailVerificationToken = 'auth:token:%s:email-verification', // %s: userId
   UserSocketClients = 'socket:%s:clients', // %s: userId
   SignInMagicLinkMailLastSentAt = 'auth:signin-magic-link-mail:%s:last-sent-at', // %s: userId
@@ -11,4 +13,5 @@ export enum CacheKey {
   RevenueTrends = 'admin:analytics:revenue-trends:%s', // %s: query hash
   UserGrowth = 'admin:analytics:user-growth:%s', // %s: query hash
   SpaceUtilization = 'admin:analytics:space-utilization:%s', // %s: query hash
+  ListCount = 'pagination:count:%s', // %s: query hash
 }
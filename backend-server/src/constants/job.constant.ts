@@ -1,5 +1,7 @@
 export const Queue = {
   Email: 'email',
+  Export: 'export',
+  Billing: 'billing',
 } as const;
 
 export const Job = {
@@ -8,4 +10,15 @@ export const Job = {
     SignInMagicLink: 'signin-magic-link',
     ResetPassword: 'reset-password',
   },
+  Export: {
+    Inventory: 'inventory',
+    Commission: 'commission',
+    AdminUsers: 'admin-users',
+    AdminTransactions: 'admin-transactions',
+  },
+  Billing: {
+    RecurringRun: 'recurring-run',
+    RecurringChunk: 'recurring-chunk',
+    InvoicePdf: 'invoice-pdf',
+  },
 } as const satisfies Record<keyof typeof Queue, Record<string, string>>;
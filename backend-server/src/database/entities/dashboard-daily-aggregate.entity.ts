@@ -0,0 +1,47 @@
+import { Column, Entity, PrimaryColumn, UpdateDateColumn } from 'typeorm';
+
+/**
+ * Incrementally maintained per-day platform counters backing the admin
+ * dashboard. One row per calendar day (UTC); dashboard reads sum a handful of
+ * rows instead of scanning the user/partner/space/booking/payment tables.
+ */
+@Entity('dashboard_daily_aggregates')
+export class DashboardDailyAggregateEntity {
+  @PrimaryColumn({ type: 'date' })
+  day: string;
+
+  @Column({ type: 'int', default: 0 })
+  newUsers: number;
+
+  /** New users other than Admin and SuperAdmin */
+  @Column({ type: 'int', default: 0 })
+  newNonAdminUsers: number;
+
+  @Column({ type: 'int', default: 0 })
+  newPartners: number;
+
+  @Column({ type: 'int', default: 0 })
+  newSpaces: number;
+
+  /** New spaces currently in ACTIVE status */
+  @Column({ type: 'int', default: 0 })
+  newActiveSpaces: number;
+
+  @Column({ type: 'int', default: 0 })
+  newBookings: number;
+
+  @Column({ type: 'int', default: 0 })
+  completedBookings: number;
+
+  @Column({ type: 'int', default: 0 })
+  completedPayments: number;
+
+  @Column({ type: 'decimal', precision: 15, scale: 2, default: 0 })
+  completedRevenue: number;
+
+  @UpdateDateColumn({
+    type: 'timestamp',
+    default: () => 'CURRENT_TIMESTAMP',
+  })
+  updatedAt: Date;
+}
@@ -79,6 +79,13 @@ export class EventStoreEntity {
   @Column({ name: 'next_retry_at', type: 'timestamp', nullable: true })
   nextRetryAt?: Date;
 
+  /**
+   * Written by the batch publish path and therefore delivered by the
+   * outbox poller; single-event rows keep their own retry handling
+   */
+  @Column({ name: 'outbox', type: 'boolean', default: false })
+  outbox: boolean;
+
   @CreateDateColumn({ name: 'created_at' })
   createdAt: Date;
 
@@ -5,6 +5,7 @@ export { CityEntity } from './city.entity';
 export { ContentPageEntity } from './content-page.entity';
 export { ConversationEntity } from './conversation.entity';
 export { CouponEntity } from './coupon.entity';
+export { DashboardDailyAggregateEntity } from './dashboard-daily-aggregate.entity';
 export { DynamicPricingEntity } from './dynamic-pricing.entity';
 export { FinancialReportEntity } from './financial-report.entity';
 export { FraudAlertEntity } from './fraud-alert.entity';
@@ -0,0 +1,48 @@
+import { MigrationInterface, QueryRunner } from 'typeorm';
+
+export class CreateDashboardDailyAggregates1760000000000
+  implements MigrationInterface
+{
+  name = 'CreateDashboardDailyAggregates1760000000000';
+
+  public async up(queryRunner: QueryRunner): Promise<void> {
+    await queryRunner.query(`
+      CREATE TABLE IF NOT EXISTS "dashboard_daily_aggregates" (
+        "day" date NOT NULL,
+        "newUsers" integer NOT NULL DEFAULT 0,
+        "newNonAdminUsers" integer NOT NULL DEFAULT 0,
+        "newPartners" integer NOT NULL DEFAULT 0,
+        "newSpaces" integer NOT NULL DEFAULT 0,
+        "newActiveSpaces" integer NOT NULL DEFAULT 0,
+        "newBookings" integer NOT NULL DEFAULT 0,
+        "completedBookings" integer NOT NULL DEFAULT 0,
+        "completedPayments" integer NOT NULL DEFAULT 0,
+        "completedRevenue" decimal(15,2) NOT NULL DEFAULT 0,
+        "updatedAt" TIMESTAMP NOT NULL DEFAULT now(),
+        CONSTRAINT "PK_dashboard_daily_aggregates" PRIMARY KEY ("day")
+      )
+    `);
+
+    // Support the grouped reconciliation scans over the source tables
+    await queryRunner.query(`
+      CREATE INDEX IF NOT EXISTS "IDX_user_createdAt" ON "user" ("createdAt")
+    `);
+    await queryRunner.query(`
+      CREATE INDEX IF NOT EXISTS "IDX_partner_createdAt" ON "partner" ("createdAt")
+    `);
+    await queryRunner.query(`
+      CREATE INDEX IF NOT EXISTS "IDX_space_createdAt" ON "space" ("createdAt")
+    `);
+    await queryRunner.query(`
+      CREATE INDEX IF NOT EXISTS "IDX_booking_createdAt" ON "booking" ("createdAt")
+    `);
+  }
+
+  public async down(queryRunner: QueryRunner): Promise<void> {
+    await queryRunner.query(`DROP INDEX IF EXISTS "IDX_booking_createdAt"`);
+    await queryRunner.query(`DROP INDEX IF EXISTS "IDX_space_createdAt"`);
+    await queryRunner.query(`DROP INDEX IF EXISTS "IDX_partner_createdAt"`);
+    await queryRunner.query(`DROP INDEX IF EXISTS "IDX_user_createdAt"`);
+    await queryRunner.query(`DROP TABLE IF EXISTS "dashboard_daily_aggregates"`);
+  }
+}
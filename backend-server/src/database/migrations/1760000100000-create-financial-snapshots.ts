@@ -0,0 +1,37 @@
+import { MigrationInterface, QueryRunner } from 'typeorm';
+
+export class CreateFinancialSnapshots1760000100000
+  implements MigrationInterface
+{
+  name = 'CreateFinancialSnapshots1760000100000';
+
+  public async up(queryRunner: QueryRunner): Promise<void> {
+    await queryRunner.query(`
+      CREATE TABLE IF NOT EXISTS "financial_snapshots" (
+        "id" uuid NOT NULL DEFAULT uuid_generate_v4(),
+        "aggregate_id" uuid NOT NULL,
+        "aggregate_type" varchar(100) NOT NULL,
+        "version" integer NOT NULL,
+        "state" jsonb NOT NULL,
+        "projections" jsonb,
+        "event_count" integer NOT NULL DEFAULT 0,
+        "description" text,
+        "created_at" TIMESTAMP NOT NULL DEFAULT now(),
+        CONSTRAINT "PK_financial_snapshots" PRIMARY KEY ("id")
+      )
+    `);
+
+    // Latest-snapshot lookup: WHERE aggregate_id = $1 ORDER BY version DESC
+    await queryRunner.query(`
+      CREATE INDEX IF NOT EXISTS "IDX_financial_snapshots_aggregate_version"
+      ON "financial_snapshots" ("aggregate_id", "version" DESC)
+    `);
+  }
+
+  public async down(queryRunner: QueryRunner): Promise<void> {
+    await queryRunner.query(
+      `DROP INDEX IF EXISTS "IDX_financial_snapshots_aggregate_version"`,
+    );
+    await queryRunner.query(`DROP TABLE IF EXISTS "financial_snapshots"`);
+  }
+}
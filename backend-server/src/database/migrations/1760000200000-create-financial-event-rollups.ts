@@ -0,0 +1,58 @@
+import { MigrationInterface, QueryRunner } from 'typeorm';
+
+export class CreateFinancialEventRollups1760000200000
+  implements MigrationInterface
+{
+  name = 'CreateFinancialEventRollups1760000200000';
+
+  public async up(queryRunner: QueryRunner): Promise<void> {
+    await queryRunner.query(`
+      CREATE TABLE IF NOT EXISTS "financial_event_daily_rollups" (
+        "id" uuid NOT NULL DEFAULT uuid_generate_v4(),
+        "day" date NOT NULL,
+        "event_type" varchar(100) NOT NULL,
+        "partner_id" uuid,
+        "amount" decimal(18,2) NOT NULL DEFAULT 0,
+        "event_count" integer NOT NULL DEFAULT 0,
+        CONSTRAINT "PK_financial_event_daily_rollups" PRIMARY KEY ("id")
+      )
+    `);
+    // Bucket key the rollup job upserts on; a null partner is one bucket
+    await queryRunner.query(`
+      CREATE UNIQUE INDEX IF NOT EXISTS "IDX_financial_event_daily_rollups_bucket"
+      ON "financial_event_daily_rollups" ("day", "event_type", "partner_id")
+      NULLS NOT DISTINCT
+    `);
+    await queryRunner.query(`
+      CREATE INDEX IF NOT EXISTS "IDX_financial_event_daily_rollups_partner_day"
+      ON "financial_event_daily_rollups" ("partner_id", "day")
+    `);
+
+    await queryRunner.query(`
+      CREATE TABLE IF NOT EXISTS "financial_event_rollup_days" (
+        "day" date NOT NULL,
+        "event_count" integer NOT NULL DEFAULT 0,
+        "total_amount" decimal(18,2) NOT NULL DEFAULT 0,
+        "rolled_up_at" TIMESTAMP NOT NULL DEFAULT now(),
+        CONSTRAINT "PK_financial_event_rollup_days" PRIMARY KEY ("day")
+      )
+    `);
+
+    // Live analytics scans filter on created_at and group by event type
+    await queryRunner.query(`
+      CREATE INDEX IF NOT EXISTS "IDX_financial_events_created_at_type"
+      ON "financial_events" ("created_at", "event_type")
+      WHERE "amount" IS NOT NULL
+    `);
+  }
+
+  public async down(queryRunner: QueryRunner): Promise<void> {
+    await queryRunner.query(
+      `DROP INDEX IF EXISTS "IDX_financial_events_created_at_type"`,
+    );
+    await queryRunner.query(`DROP TABLE IF EXISTS "financial_event_rollup_days"`);
+    await queryRunner.query(
+      `DROP TABLE IF EXISTS "financial_event_daily_rollups"`,
+    );
+  }
+}
@@ -0,0 +1,27 @@
+import { MigrationInterface, QueryRunner } from 'typeorm';
+
+export class AddEventStoreOutboxIndex1760000300000 implements MigrationInterface {
+  name = 'AddEventStoreOutboxIndex1760000300000';
+
+  public async up(queryRunner: QueryRunner): Promise<void> {
+    // Rows written by the batch publish path; older rows stay out of the outbox
+    await queryRunner.query(`
+      ALTER TABLE "event_store"
+      ADD COLUMN IF NOT EXISTS "outbox" boolean NOT NULL DEFAULT false
+    `);
+
+    // Outbox poller: undelivered events due for (re)delivery in sequence order
+    await queryRunner.query(`
+      CREATE INDEX IF NOT EXISTS "IDX_event_store_outbox"
+      ON "event_store" ("next_retry_at", "sequence_number")
+      WHERE "outbox" AND "status" IN ('PENDING', 'FAILED')
+    `);
+  }
+
+  public async down(queryRunner: QueryRunner): Promise<void> {
+    await queryRunner.query(`DROP INDEX IF EXISTS "IDX_event_store_outbox"`);
+    await queryRunner.query(
+      `ALTER TABLE "event_store" DROP COLUMN IF EXISTS "outbox"`,
+    );
+  }
+}
@@ -0,0 +1,28 @@
+import { MigrationInterface, QueryRunner } from 'typeorm';
+
+export class AddBookingAvailabilityRangeIndex1760000400000
+  implements MigrationInterface
+{
+  name = 'AddBookingAvailabilityRangeIndex1760000400000';
+
+  public async up(queryRunner: QueryRunner): Promise<void> {
+    // btree_gist lets the varchar option id share one GiST index with the range
+    await queryRunner.query(`CREATE EXTENSION IF NOT EXISTS btree_gist`);
+
+    // Overlap lookups: "spaceOptionId" = $1 AND tsrange(start, end) && $range
+    await queryRunner.query(`
+      CREATE INDEX IF NOT EXISTS "IDX_booking_option_time_range"
+      ON "booking" USING gist (
+        "spaceOptionId",
+        tsrange("startDateTime", "endDateTime")
+      )
+      WHERE "status" <> 'cancelled' AND "deletedAt" IS NULL
+    `);
+  }
+
+  public async down(queryRunner: QueryRunner): Promise<void> {
+    await queryRunner.query(
+      `DROP INDEX IF EXISTS "IDX_booking_option_time_range"`,
+    );
+  }
+}
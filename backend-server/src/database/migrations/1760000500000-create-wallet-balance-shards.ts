@@ -0,0 +1,34 @@
+import { MigrationInterface, QueryRunner } from 'typeorm';
+
+export class CreateWalletBalanceShards1760000500000
+  implements MigrationInterface
+{
+  name = 'CreateWalletBalanceShards1760000500000';
+
+  public async up(queryRunner: QueryRunner): Promise<void> {
+    await queryRunner.query(`
+      ALTER TABLE "wallets"
+      ADD COLUMN IF NOT EXISTS "ledger_shards" smallint NOT NULL DEFAULT 0
+    `);
+
+    await queryRunner.query(`
+      CREATE TABLE IF NOT EXISTS "wallet_balance_shards" (
+        "wallet_id" uuid NOT NULL,
+        "shard" smallint NOT NULL,
+        "amount" decimal(15,2) NOT NULL DEFAULT 0,
+        "updated_at" TIMESTAMP NOT NULL DEFAULT now(),
+        CONSTRAINT "PK_wallet_balance_shards"
+          PRIMARY KEY ("wallet_id", "shard"),
+        CONSTRAINT "FK_wallet_balance_shards_wallet" FOREIGN KEY ("wallet_id")
+          REFERENCES "wallets" ("id") ON DELETE CASCADE
+      )
+    `);
+  }
+
+  public async down(queryRunner: QueryRunner): Promise<void> {
+    await queryRunner.query(`DROP TABLE IF EXISTS "wallet_balance_shards"`);
+    await queryRunner.query(
+      `ALTER TABLE "wallets" DROP COLUMN IF EXISTS "ledger_shards"`,
+    );
+  }
+}
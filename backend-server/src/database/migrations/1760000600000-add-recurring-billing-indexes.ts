@@ -0,0 +1,46 @@
+import { MigrationInterface, QueryRunner } from 'typeorm';
+
+export class AddRecurringBillingIndexes1760000600000
+  implements MigrationInterface
+{
+  name = 'AddRecurringBillingIndexes1760000600000';
+
+  public async up(queryRunner: QueryRunner): Promise<void> {
+    if (await queryRunner.hasTable('enhanced_invoices')) {
+      await queryRunner.query(`
+        ALTER TABLE "enhanced_invoices"
+        ADD COLUMN IF NOT EXISTS "recurringInvoiceId" uuid
+      `);
+
+      // Billing runs insert with ON CONFLICT DO NOTHING against this index
+      await queryRunner.query(`
+        CREATE UNIQUE INDEX IF NOT EXISTS "IDX_enhanced_invoices_recurring_issue"
+        ON "enhanced_invoices" ("recurringInvoiceId", "issueDate")
+        WHERE "recurringInvoiceId" IS NOT NULL
+      `);
+    }
+
+    if (await queryRunner.hasTable('recurring_invoices')) {
+      // Billing run planner: active schedules due by a date, in keyset order
+      await queryRunner.query(`
+        CREATE INDEX IF NOT EXISTS "IDX_recurring_invoices_due"
+        ON "recurring_invoices" ("nextGenerationDate", "id")
+        WHERE "isActive"
+      `);
+    }
+  }
+
+  public async down(queryRunner: QueryRunner): Promise<void> {
+    await queryRunner.query(
+      `DROP INDEX IF EXISTS "IDX_recurring_invoices_due"`,
+    );
+    await queryRunner.query(
+      `DROP INDEX IF EXISTS "IDX_enhanced_invoices_recurring_issue"`,
+    );
+    if (await queryRunner.hasTable('enhanced_invoices')) {
+      await queryRunner.query(
+        `ALTER TABLE "enhanced_invoices" DROP COLUMN IF EXISTS "recurringInvoiceId"`,
+      );
+    }
+  }
+}
@@ -0,0 +1,62 @@
+import { MigrationInterface, QueryRunner } from 'typeorm';
+
+export class CreateAnalyticsRollups1760000700000
+  implements MigrationInterface
+{
+  name = 'CreateAnalyticsRollups1760000700000';
+
+  public async up(queryRunner: QueryRunner): Promise<void> {
+    await queryRunner.query(`
+      CREATE TABLE IF NOT EXISTS "analytics_rollups" (
+        "resolution" varchar(10) NOT NULL,
+        "metric_name" varchar(100) NOT NULL,
+        "granularity" varchar(20) NOT NULL,
+        "bucket_start" timestamptz NOT NULL,
+        "sample_count" integer NOT NULL DEFAULT 0,
+        "value_sum" decimal(20,2) NOT NULL DEFAULT 0,
+        "value_min" decimal(15,2) NOT NULL,
+        "value_max" decimal(15,2) NOT NULL,
+        "last_value" decimal(15,2) NOT NULL,
+        "last_change_percentage" decimal(10,4),
+        "last_observed_at" timestamptz NOT NULL,
+        CONSTRAINT "PK_analytics_rollups" PRIMARY KEY (
+          "resolution", "metric_name", "granularity", "bucket_start"
+        )
+      )
+    `);
+
+    if (!(await queryRunner.hasTable('analytics'))) return;
+
+    // Backfill from existing records; new ones are rolled up as written
+    await queryRunner.query(`
+      INSERT INTO "analytics_rollups" (
+        "resolution", "metric_name", "granularity", "bucket_start",
+        "sample_count", "value_sum", "value_min", "value_max",
+        "last_value", "last_change_percentage", "last_observed_at"
+      )
+      SELECT res."resolution", o."metricName", o."granularity"::text,
+        date_trunc(res."resolution", o."observedAt") AT TIME ZONE 'UTC',
+        COUNT(*), SUM(o."value"), MIN(o."value"), MAX(o."value"),
+        (array_agg(o."value" ORDER BY o."observedAt" DESC, o."id" DESC))[1],
+        (array_agg(o."changePercentage"
+          ORDER BY o."observedAt" DESC, o."id" DESC))[1],
+        MAX(o."observedAt") AT TIME ZONE 'UTC'
+      FROM (
+        SELECT a.*, CASE
+          WHEN (a."collectedAt" AT TIME ZONE 'UTC')::date = a."date"
+          THEN a."collectedAt" AT TIME ZONE 'UTC'
+          ELSE a."date"::timestamp
+        END AS "observedAt"
+        FROM "analytics" a
+        WHERE a."isActive"
+      ) o
+      CROSS JOIN (VALUES ('minute'), ('hour'), ('day')) AS res("resolution")
+      GROUP BY 1, 2, 3, 4
+      ON CONFLICT DO NOTHING
+    `);
+  }
+
+  public async down(queryRunner: QueryRunner): Promise<void> {
+    await queryRunner.query(`DROP TABLE IF EXISTS "analytics_rollups"`);
+  }
+}
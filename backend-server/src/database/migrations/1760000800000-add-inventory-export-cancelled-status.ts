@@ -0,0 +1,20 @@
+import { MigrationInterface, QueryRunner } from 'typeorm';
+
+export class AddInventoryExportCancelledStatus1760000800000
+  implements MigrationInterface
+{
+  name = 'AddInventoryExportCancelledStatus1760000800000';
+
+  public async up(queryRunner: QueryRunner): Promise<void> {
+    if (await queryRunner.hasTable('inventory_exports')) {
+      await queryRunner.query(`
+        ALTER TYPE "inventory_exports_status_enum"
+        ADD VALUE IF NOT EXISTS 'cancelled'
+      `);
+    }
+  }
+
+  public async down(): Promise<void> {
+    // Postgres cannot drop a value from an enum type; rows may still use it
+  }
+}
@@ -20,6 +20,10 @@ import { setupGracefulShutdown } from 'nestjs-graceful-shutdown';
 import path from 'path';
 import { AppModule } from './app.module';
 import { GlobalExceptionFilter } from './common/filters/global-exception.filter';
+import {
+  getWorkerQueues,
+  isStartupProfileEnabled,
+} from './config/app/app.config';
 import { BULL_BOARD_PATH } from './config/bull/bull.config';
 import { type GlobalConfig } from './config/config.type';
 import { Environment } from './constants/app.constant';
@@ -27,6 +31,7 @@ import { SentryInterceptor } from './interceptors/sentry.interceptor';
 import { basicAuthMiddleware } from './middlewares/basic-auth.middleware';
 import { RedisIoAdapter } from './shared/socket/redis.adapter';
 import { consoleLoggingConfig } from './tools/logger/logger-factory';
+import { StartupProfiler } from './tools/startup/startup-profiler';
 import setupSwagger, { SWAGGER_PATH } from './tools/swagger/swagger.setup';
 
 async function bootstrap() {
@@ -39,9 +44,17 @@ async function bootstrap() {
   } as const;
 
   const isWorker = process.env.IS_WORKER === 'true';
+  const profiler = isStartupProfileEnabled()
+    ? new StartupProfiler()
+    : undefined;
+
+  const rootModule = isWorker
+    ? await AppModule.worker(getWorkerQueues())
+    : await AppModule.main();
+  profiler?.mark('Module graph loaded');
 
   const app = await NestFactory.create<NestFastifyApplication>(
-    isWorker ? AppModule.worker() : AppModule.main(),
+    rootModule,
     new FastifyAdapter({
       logger:
         process.env.APP_LOGGING === 'true'
@@ -52,9 +65,13 @@ async function bootstrap() {
       trustProxy: process.env.IS_HTTPS === 'true',
     }) as any,
     {
-      bufferLogs: true,
+      // The profiler times modules as Nest logs them, so it can't buffer
+      bufferLogs: !profiler,
+      logger: profiler,
     },
   );
+  profiler?.mark('Modules instantiated');
+  profiler?.instrument(app);
 
   const configService = app.get(ConfigService<GlobalConfig>);
 
@@ -200,6 +217,11 @@ async function bootstrap() {
     host: '0.0.0.0',
   });
 
+  if (profiler) {
+    profiler.mark('Configured, initialized and listening');
+    profiler.report();
+  }
+
   const httpUrl = await app.getUrl();
   // eslint-disable-next-line no-console
   console.info(
@@ -0,0 +1,95 @@
+import { GlobalConfig } from '@/config/config.type';
+import {
+  Injectable,
+  Logger,
+  OnModuleDestroy,
+  OnModuleInit,
+} from '@nestjs/common';
+import { ConfigService } from '@nestjs/config';
+import { Redis } from 'ioredis';
+
+type MessageHandler = (message: string) => void;
+
+/**
+ * Shared ioredis connections for services that keep their own state in
+ * Redis or talk to other instances over pub/sub.
+ *
+ * `client` fails fast while Redis is unreachable instead of queueing
+ * commands, so callers can fall back to in-process state. Subscriptions go
+ * through one subscriber connection and are re-issued whenever it becomes
+ * ready, so channels registered while Redis is down start delivering once
+ * it comes back.
+ */
+@Injectable()
+export class RedisService implements OnModuleInit, OnModuleDestroy {
+  private readonly logger = new Logger(RedisService.name);
+  readonly client: Redis;
+  private readonly subscriber: Redis;
+  private readonly handlers = new Map<string, Set<MessageHandler>>();
+
+  constructor(private readonly configService: ConfigService<GlobalConfig>) {
+    const redisConfig = this.configService.getOrThrow('redis', {
+      infer: true,
+    });
+    const options = {
+      ...redisConfig,
+      lazyConnect: true,
+      enableOfflineQueue: false,
+      maxRetriesPerRequest: 1,
+    };
+    this.client = new Redis(options);
+    this.subscriber = new Redis(options);
+    for (const connection of [this.client, this.subscriber]) {
+      connection.on('error', (error) =>
+        this.logger.warn(`Redis unavailable: ${error}`),
+      );
+    }
+    this.subscriber.on('ready', () => this.resubscribe());
+    this.subscriber.on('message', (channel, message) => {
+      for (const handler of this.handlers.get(channel) ?? []) {
+        handler(message);
+      }
+    });
+  }
+
+  async onModuleInit(): Promise<void> {
+    try {
+      await Promise.all([this.client.connect(), this.subscriber.connect()]);
+    } catch (error) {
+      this.logger.warn(`Redis not connected yet: ${error}`);
+    }
+  }
+
+  async onModuleDestroy(): Promise<void> {
+    this.client.disconnect();
+    this.subscriber.disconnect();
+  }
+
+  isReady(): boolean {
+    return this.client.status === 'ready';
+  }
+
+  async publish(channel: string, message: string): Promise<void> {
+    await this.client.publish(channel, message);
+  }
+
+  /**
+   * Deliver messages published on `channel` to `handler`. Rejects when
+   * Redis is down; the handler stays registered and is subscribed on
+   * reconnect.
+   */
+  async subscribe(channel: string, handler: MessageHandler): Promise<void> {
+    const handlers = this.handlers.get(channel) ?? new Set<MessageHandler>();
+    handlers.add(handler);
+    this.handlers.set(channel, handlers);
+    await this.subscriber.subscribe(channel);
+  }
+
+  private resubscribe(): void {
+    const channels = [...this.handlers.keys()];
+    if (channels.length === 0) return;
+    this.subscriber
+      .subscribe(...channels)
+      .catch((error) => this.logger.warn(`Redis resubscribe failed: ${error}`));
+  }
+}
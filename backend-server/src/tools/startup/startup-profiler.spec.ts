@@ -0,0 +1,72 @@
+import { Logger } from '@nestjs/common';
+import { ModulesContainer } from '@nestjs/core';
+import { StartupProfiler } from './startup-profiler';
+
+describe('StartupProfiler', () => {
+  let profiler: StartupProfiler;
+  let reportLog: jest.SpyInstance;
+
+  beforeEach(() => {
+    profiler = new StartupProfiler();
+    profiler.setLogLevels([]);
+    reportLog = jest
+      .spyOn(Logger.prototype, 'log')
+      .mockImplementation(() => undefined);
+  });
+
+  afterEach(() => {
+    reportLog.mockRestore();
+  });
+
+  const reportText = () => {
+    profiler.report();
+    return reportLog.mock.calls[0][0] as string;
+  };
+
+  it('should time modules from Nest instance loader messages', () => {
+    profiler.log('Starting Nest application...', 'NestFactory');
+    profiler.log('TypeOrmModule dependencies initialized', 'InstanceLoader');
+    profiler.log('AdminModule dependencies initialized', 'InstanceLoader');
+    profiler.log('Mapped {/api/users, GET} route', 'RouterExplorer');
+
+    const text = reportText();
+
+    expect(text).toContain('TypeOrmModule');
+    expect(text).toContain('AdminModule');
+    expect(text).not.toContain('RouterExplorer');
+  });
+
+  it('should time lifecycle hooks of static providers', async () => {
+    const service = { onModuleInit: jest.fn().mockResolvedValue(undefined) };
+    const original = service.onModuleInit;
+    const modules = new Map([
+      [
+        'AdminModule',
+        {
+          name: 'AdminModule',
+          providers: new Map([
+            [
+              'AdminService',
+              {
+                name: 'AdminService',
+                instance: service,
+                isDependencyTreeStatic: () => true,
+              },
+            ],
+          ]),
+          controllers: new Map(),
+        },
+      ],
+    ]);
+    const app = {
+      get: (token: unknown) =>
+        token === ModulesContainer ? modules : undefined,
+    };
+
+    profiler.instrument(app as any);
+    await service.onModuleInit('arg');
+
+    expect(original).toHaveBeenCalledWith('arg');
+    expect(reportText()).toMatch(/AdminModule/);
+  });
+});
@@ -0,0 +1,168 @@
+import { ConsoleLogger, INestApplication, Logger } from '@nestjs/common';
+import { ModulesContainer } from '@nestjs/core';
+import { performance } from 'node:perf_hooks';
+
+const LIFECYCLE_HOOKS = ['onModuleInit', 'onApplicationBootstrap'] as const;
+
+type LifecycleHook = (typeof LIFECYCLE_HOOKS)[number];
+
+interface ModuleTiming {
+  instantiateMs: number;
+  hooksMs: number;
+}
+
+interface HookTiming {
+  name: string;
+  ms: number;
+}
+
+const MODULE_INITIALIZED = /^(\w+) dependencies initialized/;
+
+/** Hooks faster than this are left out of the report */
+const MIN_REPORTED_HOOK_MS = 1;
+
+/**
+ * Measures where application startup time goes, enabled with
+ * APP_STARTUP_PROFILE=true.
+ *
+ * Used as the application logger, it times each module's instantiation from
+ * Nest's own "dependencies initialized" messages, which are logged as each
+ * module finishes. Once the app is created, `instrument` wraps every
+ * onModuleInit and onApplicationBootstrap hook so `report` can also show
+ * what ran at init.
+ */
+export class StartupProfiler extends ConsoleLogger {
+  private readonly startedAt = performance.now();
+  private readonly marks: HookTiming[] = [];
+  private readonly modules = new Map<string, ModuleTiming>();
+  private readonly hooks: HookTiming[] = [];
+  private lastMarkAt = this.startedAt;
+  private lastModuleAt?: number;
+
+  /** Record the time since the previous mark as a named startup phase */
+  mark(name: string): void {
+    const now = performance.now();
+    this.marks.push({ name, ms: now - this.lastMarkAt });
+    this.lastMarkAt = now;
+  }
+
+  log(message: any, context?: string): void;
+  log(message: any, ...optionalParams: any[]): void;
+  log(message: any, ...optionalParams: any[]): void {
+    this.capture(message, optionalParams.at(-1));
+    super.log(message, ...optionalParams);
+  }
+
+  /**
+   * Time the lifecycle hooks of every provider and controller. Call it
+   * after the app is created and before it is initialized.
+   */
+  instrument(app: INestApplication): void {
+    const wrapped = new WeakSet<object>();
+
+    for (const module of app.get(ModulesContainer).values()) {
+      const wrappers = [
+        ...module.providers.values(),
+        ...module.controllers.values(),
+      ];
+      for (const wrapper of wrappers) {
+        const instance = wrapper.instance;
+        if (
+          !instance ||
+          typeof instance !== 'object' ||
+          !wrapper.isDependencyTreeStatic() ||
+          wrapped.has(instance)
+        ) {
+          continue;
+        }
+        wrapped.add(instance);
+
+        for (const hook of LIFECYCLE_HOOKS) {
+          if (typeof instance[hook] === 'function') {
+            this.wrapHook(instance, hook, module.name, wrapper.name);
+          }
+        }
+      }
+    }
+  }
+
+  /** Log the startup breakdown, slowest first */
+  report(): void {
+    const logger = new Logger(StartupProfiler.name);
+    const totalMs = performance.now() - this.startedAt;
+    const { rss, heapUsed } = process.memoryUsage();
+    const toMb = (bytes: number) => (bytes / 1024 / 1024).toFixed(1);
+    const format = (ms: number) => ms.toFixed(1).padStart(9);
+
+    const lines = [
+      `Startup took ${totalMs.toFixed(0)}ms ` +
+        `(rss ${toMb(rss)}MB, heap ${toMb(heapUsed)}MB)`,
+      'Phases (ms):',
+      ...this.marks.map(({ name, ms }) => `${format(ms)}  ${name}`),
+      'Modules (ms)  instantiate     hooks',
+      ...[...this.modules.entries()]
+        .sort(
+          ([, a], [, b]) =>
+            b.instantiateMs + b.hooksMs - (a.instantiateMs + a.hooksMs),
+        )
+        .map(
+          ([name, { instantiateMs, hooksMs }]) =>
+            `${format(instantiateMs)} ${format(hooksMs)}  ${name}`,
+        ),
+      `Lifecycle hooks over ${MIN_REPORTED_HOOK_MS}ms:`,
+      ...this.hooks
+        .filter(({ ms }) => ms >= MIN_REPORTED_HOOK_MS)
+        .sort((a, b) => b.ms - a.ms)
+        .map(({ name, ms }) => `${format(ms)}  ${name}`),
+    ];
+
+    logger.log(lines.join('\n'));
+  }
+
+  private capture(message: unknown, context: unknown): void {
+    const now = performance.now();
+
+    if (context === 'NestFactory') {
+      // "Starting Nest application..." precedes module instantiation, so
+      // the first module's time also covers scanning the module graph
+      this.lastModuleAt = now;
+      return;
+    }
+    if (context !== 'InstanceLoader' || typeof message !== 'string') return;
+
+    const match = MODULE_INITIALIZED.exec(message);
+    if (!match || this.lastModuleAt === undefined) return;
+
+    this.moduleTiming(match[1]).instantiateMs += now - this.lastModuleAt;
+    this.lastModuleAt = now;
+  }
+
+  private wrapHook(
+    instance: Record<LifecycleHook, (...args: unknown[]) => unknown>,
+    hook: LifecycleHook,
+    moduleName: string,
+    providerName: string,
+  ): void {
+    const original = instance[hook];
+
+    instance[hook] = async (...args: unknown[]) => {
+      const start = performance.now();
+      try {
+        return await original.apply(instance, args);
+      } finally {
+        const ms = performance.now() - start;
+        this.moduleTiming(moduleName).hooksMs += ms;
+        this.hooks.push({ name: `${providerName}.${hook}`, ms });
+      }
+    };
+  }
+
+  private moduleTiming(name: string): ModuleTiming {
+    let timing = this.modules.get(name);
+    if (!timing) {
+      timing = { instantiateMs: 0, hooksMs: 0 };
+      this.modules.set(name, timing);
+    }
+    return timing;
+  }
+}
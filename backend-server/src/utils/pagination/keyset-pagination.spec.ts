@@ -0,0 +1,185 @@
+import { BadRequestException } from '@nestjs/common';
+import { keysetPaginate } from './keyset-pagination';
+
+describe('keysetPaginate', () => {
+  const rows = [
+    { id: 'c', createdAt: '2024-01-03 10:00:00.654321' },
+    { id: 'b', createdAt: '2024-01-02 10:00:00.123456' },
+    { id: 'a', createdAt: '2024-01-01 10:00:00' },
+  ];
+
+  const createBuilder = (pageRows = rows) => {
+    const qb: any = {
+      alias: 'user',
+      connection: {
+        query: jest
+          .fn()
+          .mockResolvedValue([
+            { 'QUERY PLAN': [{ Plan: { 'Plan Rows': 1000.4 } }] },
+          ]),
+      },
+      clone: jest.fn(() => qb),
+      addSelect: jest.fn().mockReturnThis(),
+      orderBy: jest.fn().mockReturnThis(),
+      addOrderBy: jest.fn().mockReturnThis(),
+      andWhere: jest.fn().mockReturnThis(),
+      limit: jest.fn().mockReturnThis(),
+      offset: jest.fn().mockReturnThis(),
+      getQueryAndParameters: jest.fn(() => ['SELECT "user"."id"', []]),
+      getCount: jest.fn().mockResolvedValue(42),
+      getRawAndEntities: jest.fn().mockResolvedValue({
+        entities: pageRows.map(({ id }) => ({ id })),
+        raw: pageRows.map(({ id, createdAt }) => ({
+          user_id: id,
+          keyset_cursor_value: createdAt,
+        })),
+      }),
+    };
+    return qb;
+  };
+
+  const options = {
+    sortKey: 'createdAt',
+    sortColumn: 'user.createdAt',
+    sortOrder: 'DESC' as const,
+    limit: 2,
+  };
+
+  it('should read one extra row to detect the next page', async () => {
+    const builder = createBuilder();
+
+    const page = await keysetPaginate(builder, options);
+
+    expect(builder.limit).toHaveBeenCalledWith(3);
+    expect(builder.orderBy).toHaveBeenCalledWith(
+      'user.createdAt',
+      'DESC',
+      undefined,
+    );
+    expect(builder.addOrderBy).toHaveBeenCalledWith('user.id', 'DESC');
+    expect(page.items).toEqual([{ id: 'c' }, { id: 'b' }]);
+    expect(page.hasNextPage).toBe(true);
+    expect(page.hasPreviousPage).toBe(false);
+    expect(page.previousCursor).toBeNull();
+    expect(page.totalRecords).toBe(1000);
+    expect(page.totalIsEstimate).toBe(true);
+    expect(builder.connection.query).toHaveBeenCalledWith(
+      'EXPLAIN (FORMAT JSON) SELECT "user"."id"',
+      [],
+    );
+  });
+
+  it('should seek past the cursor row with its exact sort value', async () => {
+    const first = await keysetPaginate(createBuilder(), options);
+    const builder = createBuilder(rows.slice(2));
+
+    const page = await keysetPaginate(builder, {
+      ...options,
+      afterCursor: first.nextCursor,
+    });
+
+    expect(builder.andWhere).toHaveBeenCalledWith(
+      '(user.createdAt, user.id) < (:keysetValue, :keysetId)',
+      { keysetValue: '2024-01-02 10:00:00.123456', keysetId: 'b' },
+    );
+    expect(builder.offset).not.toHaveBeenCalled();
+    expect(page.items).toEqual([{ id: 'a' }]);
+    expect(page.hasNextPage).toBe(false);
+    expect(page.hasPreviousPage).toBe(true);
+    expect(page.nextCursor).toBeNull();
+  });
+
+  it('should read backwards in reverse order and restore it', async () => {
+    const first = await keysetPaginate(createBuilder(), options);
+    const builder = createBuilder([rows[0]]);
+
+    const page = await keysetPaginate(builder, {
+      ...options,
+      beforeCursor: first.nextCursor,
+    });
+
+    expect(builder.orderBy).toHaveBeenCalledWith(
+      'user.createdAt',
+      'ASC',
+      undefined,
+    );
+    expect(builder.andWhere).toHaveBeenCalledWith(
+      '(user.createdAt, user.id) > (:keysetValue, :keysetId)',
+      expect.any(Object),
+    );
+    expect(page.items).toEqual([{ id: 'c' }]);
+    expect(page.hasNextPage).toBe(true);
+    expect(page.hasPreviousPage).toBe(false);
+  });
+
+  it('should keep NULLs last when the sort column is nullable', async () => {
+    const first = await keysetPaginate(createBuilder(), options);
+    const builder = createBuilder(rows.slice(2));
+
+    await keysetPaginate(builder, {
+      ...options,
+      nullable: true,
+      afterCursor: first.nextCursor,
+    });
+
+    expect(builder.orderBy).toHaveBeenCalledWith(
+      'user.createdAt',
+      'DESC',
+      'NULLS LAST',
+    );
+    expect(builder.andWhere).toHaveBeenCalledWith(
+      '(user.createdAt < :keysetValue OR (user.createdAt = :keysetValue AND user.id < :keysetId) OR user.createdAt IS NULL)',
+      expect.any(Object),
+    );
+  });
+
+  it('should reject a cursor issued for another sort', async () => {
+    const first = await keysetPaginate(createBuilder(), options);
+
+    await expect(
+      keysetPaginate(createBuilder(), {
+        ...options,
+        sortKey: 'email',
+        sortColumn: 'user.email',
+        afterCursor: first.nextCursor,
+      }),
+    ).rejects.toBeInstanceOf(BadRequestException);
+    await expect(
+      keysetPaginate(createBuilder(), { ...options, afterCursor: 'garbage' }),
+    ).rejects.toBeInstanceOf(BadRequestException);
+  });
+
+  it('should take the total from a final page reached by offset', async () => {
+    const builder = createBuilder(rows.slice(2));
+
+    const page = await keysetPaginate(builder, { ...options, page: 2 });
+
+    expect(builder.offset).toHaveBeenCalledWith(2);
+    expect(page.totalRecords).toBe(3);
+    expect(page.totalIsEstimate).toBe(false);
+    expect(page.hasPreviousPage).toBe(true);
+    expect(builder.connection.query).not.toHaveBeenCalled();
+  });
+
+  it('should cache exact counts when asked for them', async () => {
+    const cacheService: any = {
+      get: jest.fn().mockResolvedValue(undefined),
+      set: jest.fn(),
+    };
+    const builder = createBuilder();
+
+    const page = await keysetPaginate(builder, {
+      ...options,
+      exactCount: true,
+      cacheService,
+    });
+
+    expect(page.totalRecords).toBe(42);
+    expect(page.totalIsEstimate).toBe(false);
+    expect(cacheService.set).toHaveBeenCalledWith(
+      { key: 'ListCount', args: [expect.any(String)] },
+      42,
+      { ttl: 60000 },
+    );
+  });
+});
@@ -0,0 +1,258 @@
+import { CacheService } from '@/shared/cache/cache.service';
+import { BadRequestException } from '@nestjs/common';
+import { createHash } from 'crypto';
+import { ObjectLiteral, SelectQueryBuilder } from 'typeorm';
+
+type SortOrder = 'ASC' | 'DESC';
+
+/** A sortable column, as listed in an endpoint's sort map */
+export interface KeysetSortColumn {
+  /** Property path, e.g. `user.createdAt` */
+  column: string;
+  nullable?: boolean;
+}
+
+export interface KeysetPaginationOptions {
+  /**
+   * Public name of the sort field. Cursors carry it, so a cursor issued for
+   * one sort is rejected by another.
+   */
+  sortKey: string;
+  /** Property path to sort on, e.g. `user.createdAt` */
+  sortColumn: string;
+  sortOrder: SortOrder;
+  /** Set for nullable sort columns; NULLs sort last in either order */
+  nullable?: boolean;
+  limit: number;
+  afterCursor?: string;
+  beforeCursor?: string;
+  /** Legacy page number, applied as an offset when no cursor is given */
+  page?: number;
+  /** Count matching rows instead of using the planner's estimate */
+  exactCount?: boolean;
+  /** Caches exact counts for EXACT_COUNT_TTL_MS when provided */
+  cacheService?: CacheService;
+}
+
+export interface KeysetPage<T> {
+  items: T[];
+  totalRecords: number;
+  /** True when `totalRecords` is the planner's row estimate */
+  totalIsEstimate: boolean;
+  hasNextPage: boolean;
+  hasPreviousPage: boolean;
+  nextCursor: string | null;
+  previousCursor: string | null;
+}
+
+interface Cursor {
+  /** Sort key */
+  s: string;
+  /** Sort order */
+  o: SortOrder;
+  /** Sort column value as Postgres text, so timestamps keep microseconds */
+  v: string | null;
+  id: string;
+}
+
+const CURSOR_VALUE_ALIAS = 'keyset_cursor_value';
+const EXACT_COUNT_TTL_MS = 60 * 1000;
+
+/**
+ * Keyset ("seek") pagination over `(sortColumn, id)`.
+ *
+ * Pages are read with `WHERE (sortColumn, id) < (:value, :id) ... LIMIT n`,
+ * so every page costs the same index range scan however deep the client
+ * has paged, and rows inserted meanwhile don't shift later pages. Cursors
+ * are opaque base64url strings; `page` without a cursor still works as an
+ * offset for clients that haven't moved to cursors.
+ *
+ * Totals come from the planner's row estimate unless `exactCount` is set.
+ * The builder must only join to-one relations and must not be ordered or
+ * limited by the caller.
+ */
+export async function keysetPaginate<T extends ObjectLiteral>(
+  builder: SelectQueryBuilder<T>,
+  options: KeysetPaginationOptions,
+): Promise<KeysetPage<T>> {
+  const { sortColumn, sortOrder, nullable = false, limit } = options;
+  const idColumn = `${builder.alias}.id`;
+  const backwards = !options.afterCursor && !!options.beforeCursor;
+  const cursor = decodeCursor(
+    options.afterCursor ?? options.beforeCursor,
+    options,
+  );
+  const page = cursor ? 1 : Math.max(1, options.page ?? 1);
+
+  const order = backwards ? reverseOrder(sortOrder) : sortOrder;
+  const query = builder
+    .clone()
+    .addSelect(`CAST(${sortColumn} AS text)`, CURSOR_VALUE_ALIAS)
+    .orderBy(sortColumn, order, nullable ? nullsOrder(backwards) : undefined)
+    .addOrderBy(idColumn, order)
+    .limit(limit + 1);
+
+  if (cursor) {
+    query.andWhere(
+      seekCondition(sortColumn, idColumn, order, nullable, backwards, cursor),
+      { keysetValue: cursor.v, keysetId: cursor.id },
+    );
+  } else if (page > 1) {
+    query.offset((page - 1) * limit);
+  }
+
+  const { entities, raw } = await query.getRawAndEntities();
+  const valuesById = new Map<string, string | null>(
+    raw.map((row) => [
+      String(row[`${builder.alias}_id`]),
+      row[CURSOR_VALUE_ALIAS],
+    ]),
+  );
+
+  const hasMore = entities.length > limit;
+  const items = entities.slice(0, limit);
+  if (backwards) items.reverse();
+
+  const hasNextPage = backwards || hasMore;
+  const hasPreviousPage = backwards ? hasMore : !!cursor || page > 1;
+  const toCursor = (item: T) =>
+    encodeCursor({
+      s: options.sortKey,
+      o: sortOrder,
+      v: valuesById.get(String(item.id)) ?? null,
+      id: String(item.id),
+    });
+
+  const seen = (page - 1) * limit + items.length;
+  let totalRecords: number;
+  let totalIsEstimate = false;
+  if (!cursor && !hasMore) {
+    // The last page reached by offset tells us the total for free
+    totalRecords = seen;
+  } else if (options.exactCount) {
+    totalRecords = await countRows(builder, options.cacheService);
+  } else {
+    totalRecords = Math.max(await estimateRows(builder), seen);
+    totalIsEstimate = true;
+  }
+
+  return {
+    items,
+    totalRecords,
+    totalIsEstimate,
+    hasNextPage,
+    hasPreviousPage,
+    nextCursor:
+      hasNextPage && items.length ? toCursor(items[items.length - 1]) : null,
+    previousCursor:
+      hasPreviousPage && items.length ? toCursor(items[0]) : null,
+  };
+}
+
+/**
+ * Row count the planner expects the query to return, from
+ * `EXPLAIN (FORMAT JSON)`. Costs a plan, not a scan.
+ */
+export async function estimateRows(
+  builder: SelectQueryBuilder<ObjectLiteral>,
+): Promise<number> {
+  const [sql, parameters] = builder
+    .clone()
+    .orderBy()
+    .getQueryAndParameters();
+  const [row] = await builder.connection.query(
+    `EXPLAIN (FORMAT JSON) ${sql}`,
+    parameters,
+  );
+  const plan = row?.['QUERY PLAN']?.[0]?.Plan;
+  return Math.round(plan?.['Plan Rows'] ?? 0);
+}
+
+async function countRows(
+  builder: SelectQueryBuilder<ObjectLiteral>,
+  cacheService?: CacheService,
+): Promise<number> {
+  const countQuery = builder.clone().orderBy();
+  if (!cacheService) return countQuery.getCount();
+
+  const cacheKey = {
+    key: 'ListCount' as const,
+    args: [
+      createHash('sha256')
+        .update(JSON.stringify(countQuery.getQueryAndParameters()))
+        .digest('hex'),
+    ],
+  };
+  const cached = await cacheService.get<number>(cacheKey);
+  if (cached != null) return cached;
+
+  const count = await countQuery.getCount();
+  await cacheService.set(cacheKey, count, { ttl: EXACT_COUNT_TTL_MS });
+  return count;
+}
+
+/**
+ * Rows strictly after the cursor in the query's (possibly reversed) order.
+ * NULLs sort last in the requested order, so first when reading backwards.
+ */
+function seekCondition(
+  column: string,
+  idColumn: string,
+  order: SortOrder,
+  nullable: boolean,
+  backwards: boolean,
+  cursor: Cursor,
+): string {
+  const op = order === 'DESC' ? '<' : '>';
+  const afterId = `${idColumn} ${op} :keysetId`;
+
+  if (!nullable) {
+    // Row comparison lets Postgres seek a (column, id) index directly
+    return `(${column}, ${idColumn}) ${op} (:keysetValue, :keysetId)`;
+  }
+
+  const afterValue = `${column} ${op} :keysetValue OR (${column} = :keysetValue AND ${afterId})`;
+  if (backwards) {
+    return cursor.v === null
+      ? `(${column} IS NOT NULL OR ${afterId})`
+      : `(${afterValue})`;
+  }
+  return cursor.v === null
+    ? `(${column} IS NULL AND ${afterId})`
+    : `(${afterValue} OR ${column} IS NULL)`;
+}
+
+function encodeCursor(cursor: Cursor): string {
+  return Buffer.from(JSON.stringify(cursor)).toString('base64url');
+}
+
+function decodeCursor(
+  value: string | undefined,
+  { sortKey, sortOrder }: KeysetPaginationOptions,
+): Cursor | null {
+  if (!value) return null;
+
+  let cursor: Cursor;
+  try {
+    cursor = JSON.parse(Buffer.from(value, 'base64url').toString('utf8'));
+  } catch {
+    throw new BadRequestException('Invalid pagination cursor');
+  }
+  if (typeof cursor?.id !== 'string') {
+    throw new BadRequestException('Invalid pagination cursor');
+  }
+  if (cursor.s !== sortKey || cursor.o !== sortOrder) {
+    throw new BadRequestException(
+      'Pagination cursor does not match the requested sort',
+    );
+  }
+  return cursor;
+}
+
+function reverseOrder(order: SortOrder): SortOrder {
+  return order === 'ASC' ? 'DESC' : 'ASC';
+}
+
+function nullsOrder(backwards: boolean): 'NULLS FIRST' | 'NULLS LAST' {
+  return backwards ? 'NULLS FIRST' : 'NULLS LAST';
+}
@@ -0,0 +1,34 @@
+import { Queue } from '@/constants/job.constant';
+import { BullModule } from '@nestjs/bullmq';
+import { Module } from '@nestjs/common';
+import { BillingJobService } from './billing-job.service';
+
+@Module({
+  imports: [
+    BullModule.registerQueue({
+      name: Queue.Billing,
+      defaultJobOptions: {
+        attempts: 3,
+        backoff: {
+          type: 'exponential',
+          delay: 5000,
+        },
+        // Job ids deduplicate runs and chunks only while the job is kept
+        removeOnComplete: {
+          age: 7 * 24 * 60 * 60,
+        },
+        removeOnFail: {
+          age: 7 * 24 * 60 * 60,
+        },
+      },
+      streams: {
+        events: {
+          maxLen: 1000,
+        },
+      },
+    }),
+  ],
+  providers: [BillingJobService],
+  exports: [BillingJobService],
+})
+export class BillingJobModule {}
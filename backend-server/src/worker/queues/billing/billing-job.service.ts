@@ -0,0 +1,55 @@
+import { Job as AllJobs, Queue } from '@/constants/job.constant';
+import { InjectQueue } from '@nestjs/bullmq';
+import { Injectable, Logger } from '@nestjs/common';
+
+import { BillingQueue, RecurringRunJobData } from './billing.type';
+
+const BillingJob = AllJobs.Billing;
+
+export const toBillingDate = (date: Date): string =>
+  date.toISOString().slice(0, 10);
+
+/**
+ * Producer side of the billing queue. A recurring run is planned by a single
+ * job that splits the due schedules into chunk jobs; see BillingQueueService.
+ */
+@Injectable()
+export class BillingJobService {
+  private readonly logger = new Logger(BillingJobService.name);
+
+  constructor(
+    @InjectQueue(Queue.Billing)
+    private readonly billingQueue: BillingQueue,
+  ) {}
+
+  /**
+   * Queue a run that bills every active schedule due on or before
+   * `runDate`. The run id doubles as the job id, so queueing the same id
+   * twice while the first job is retained is a no-op. Overlapping runs are
+   * safe either way: each schedule is billed at most once per date.
+   */
+  async enqueueRecurringRun({
+    requestedBy,
+    runDate = toBillingDate(new Date()),
+    runId = `recurring-${runDate}-${Date.now()}`,
+  }: Partial<RecurringRunJobData> = {}): Promise<RecurringRunJobData> {
+    const data: RecurringRunJobData = { runId, runDate, requestedBy };
+    await this.billingQueue.add(BillingJob.RecurringRun, data, {
+      jobId: runId,
+    });
+    this.logger.log(`Queued recurring billing run ${runId}`);
+    return data;
+  }
+
+  async enqueueInvoicePdfs(invoiceIds: string[]): Promise<void> {
+    if (invoiceIds.length === 0) return;
+
+    await this.billingQueue.addBulk(
+      invoiceIds.map((invoiceId) => ({
+        name: BillingJob.InvoicePdf,
+        data: { invoiceId },
+        opts: { jobId: `pdf-${invoiceId}` },
+      })),
+    );
+  }
+}
@@ -0,0 +1,29 @@
+import {
+  EnhancedInvoiceEntity,
+  InvoiceAuditTrailEntity,
+  InvoiceSettingsEntity,
+  InvoiceTemplateEntity,
+  RecurringInvoiceEntity,
+} from '@/api/invoice/entities/enhanced-invoice.entity';
+import { Module } from '@nestjs/common';
+import { ScheduleModule } from '@nestjs/schedule';
+import { TypeOrmModule } from '@nestjs/typeorm';
+import { BillingJobModule } from './billing-job.module';
+import { BillingProcessor } from './billing.processor';
+import { BillingQueueService } from './billing.service';
+
+@Module({
+  imports: [
+    TypeOrmModule.forFeature([
+      EnhancedInvoiceEntity,
+      InvoiceAuditTrailEntity,
+      InvoiceSettingsEntity,
+      InvoiceTemplateEntity,
+      RecurringInvoiceEntity,
+    ]),
+    ScheduleModule.forRoot(),
+    BillingJobModule,
+  ],
+  providers: [BillingQueueService, BillingProcessor],
+})
+export class BillingQueueModule {}
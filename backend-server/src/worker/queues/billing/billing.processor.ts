@@ -0,0 +1,52 @@
+import { Job as AllJobs, Queue as QueueName } from '@/constants/job.constant';
+import { OnWorkerEvent, Processor, WorkerHost } from '@nestjs/bullmq';
+import { Logger } from '@nestjs/common';
+import { Job } from 'bullmq';
+import { BillingQueueService } from './billing.service';
+import { BillingJob } from './billing.type';
+
+const BillingJob = AllJobs.Billing;
+
+@Processor(QueueName.Billing, {
+  // Each chunk holds a transaction and row locks for its schedules; bound how
+  // many run at once per worker to keep connections free for the API
+  concurrency: 4,
+  stalledInterval: 60000,
+})
+export class BillingProcessor extends WorkerHost {
+  private readonly logger = new Logger(BillingProcessor.name);
+  constructor(private readonly billingQueueService: BillingQueueService) {
+    super();
+  }
+  async process(job: BillingJob, _token?: string) {
+    this.logger.debug(`Processing job ${job.id} of type ${job.name}.`);
+
+    switch (job.name) {
+      case BillingJob.RecurringRun:
+        return await this.billingQueueService.planRecurringRun(job);
+      case BillingJob.RecurringChunk:
+        return await this.billingQueueService.billRecurringChunk(job);
+      case BillingJob.InvoicePdf:
+        return await this.billingQueueService.renderInvoicePdf(job);
+      default:
+        throw new Error(`Unhandled job named: ${(job as any).name}`);
+    }
+  }
+
+  @OnWorkerEvent('completed')
+  async onCompleted(job: Job) {
+    this.logger.debug(`Job ${job.id} has been completed`);
+  }
+
+  @OnWorkerEvent('failed')
+  async onFailed(job: Job) {
+    this.logger.error(
+      `Job ${job.id} has failed with reason: ${job.failedReason}`,
+    );
+  }
+
+  @OnWorkerEvent('stalled')
+  async onStalled(job: Job) {
+    this.logger.error(`Job ${job.id} has been stalled`);
+  }
+}
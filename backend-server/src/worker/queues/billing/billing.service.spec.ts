@@ -0,0 +1,217 @@
+import {
+  EnhancedInvoiceEntity,
+  InvoiceAuditTrailEntity,
+  InvoiceSettingsEntity,
+  InvoiceTemplateEntity,
+  RecurringInvoiceEntity,
+} from '@/api/invoice/entities/enhanced-invoice.entity';
+import { RecurrenceFrequency } from '@/api/invoice/dto/enhanced-invoice.dto';
+import { Queue } from '@/constants/job.constant';
+import { getQueueToken } from '@nestjs/bullmq';
+import { Test, TestingModule } from '@nestjs/testing';
+import { getRepositoryToken } from '@nestjs/typeorm';
+import { DataSource } from 'typeorm';
+import { BillingJobService } from './billing-job.service';
+import { BillingQueueService } from './billing.service';
+
+describe('BillingQueueService', () => {
+  let service: BillingQueueService;
+
+  const insertBuilder = {
+    insert: jest.fn().mockReturnThis(),
+    into: jest.fn().mockReturnThis(),
+    values: jest.fn().mockReturnThis(),
+    onConflict: jest.fn().mockReturnThis(),
+    returning: jest.fn().mockReturnThis(),
+    updateEntity: jest.fn().mockReturnThis(),
+    execute: jest.fn(),
+  };
+  const manager = {
+    find: jest.fn(),
+    findOne: jest.fn(),
+    query: jest.fn(),
+    save: jest.fn(),
+    create: jest.fn((entity, data) => Object.assign(new entity(), data)),
+    createQueryBuilder: jest.fn(() => insertBuilder),
+  };
+  const dataSource = {
+    transaction: jest.fn((work) => work(manager)),
+  };
+  const selectBuilder = {
+    select: jest.fn().mockReturnThis(),
+    where: jest.fn().mockReturnThis(),
+    andWhere: jest.fn().mockReturnThis(),
+    orderBy: jest.fn().mockReturnThis(),
+    addOrderBy: jest.fn().mockReturnThis(),
+    limit: jest.fn().mockReturnThis(),
+    getMany: jest.fn(),
+  };
+  const recurringRepository = {
+    createQueryBuilder: jest.fn(() => selectBuilder),
+  };
+  const billingQueue = { add: jest.fn() };
+  const billingJobService = { enqueueInvoicePdfs: jest.fn() };
+
+  const createSchedule = (overrides: Partial<RecurringInvoiceEntity> = {}) =>
+    Object.assign(new RecurringInvoiceEntity(), {
+      id: 'schedule-1',
+      templateId: 'template-1',
+      customerId: 'customer-1',
+      createdBy: 'partner-1',
+      frequency: RecurrenceFrequency.MONTHLY,
+      nextGenerationDate: '2026-10-15',
+      currentOccurrences: 0,
+      isActive: true,
+      ...overrides,
+    });
+
+  beforeEach(async () => {
+    jest.clearAllMocks();
+
+    const module: TestingModule = await Test.createTestingModule({
+      providers: [
+        BillingQueueService,
+        { provide: DataSource, useValue: dataSource },
+        {
+          provide: getRepositoryToken(RecurringInvoiceEntity),
+          useValue: recurringRepository,
+        },
+        {
+          provide: getRepositoryToken(EnhancedInvoiceEntity),
+          useValue: { update: jest.fn() },
+        },
+        { provide: getQueueToken(Queue.Billing), useValue: billingQueue },
+        { provide: BillingJobService, useValue: billingJobService },
+      ],
+    }).compile();
+
+    service = module.get<BillingQueueService>(BillingQueueService);
+  });
+
+  describe('planRecurringRun', () => {
+    it('should queue one chunk per keyset page of due schedules', async () => {
+      const fullPage = Array.from({ length: 200 }, (_, i) =>
+        createSchedule({ id: `schedule-${1000 + i}` }),
+      );
+      selectBuilder.getMany
+        .mockResolvedValueOnce(fullPage)
+        .mockResolvedValueOnce([createSchedule({ id: 'schedule-2000' })]);
+      const job = {
+        data: { runId: 'run-1', runDate: '2026-10-15' },
+        updateProgress: jest.fn(),
+      };
+
+      await expect(service.planRecurringRun(job as any)).resolves.toEqual({
+        chunks: 2,
+        schedules: 201,
+      });
+
+      expect(billingQueue.add).toHaveBeenCalledTimes(2);
+      expect(billingQueue.add.mock.calls[0][2]).toEqual({
+        jobId: 'run-1-schedule-1000',
+      });
+      expect(billingQueue.add.mock.calls[1][1].scheduleIds).toEqual([
+        'schedule-2000',
+      ]);
+      expect(selectBuilder.andWhere).toHaveBeenLastCalledWith(
+        expect.stringContaining('(recurring.nextGenerationDate, recurring.id)'),
+        { lastDate: '2026-10-15', lastId: 'schedule-1199' },
+      );
+    });
+  });
+
+  describe('billRecurringChunk', () => {
+    it('should bill due schedules in bulk and retire ended ones', async () => {
+      const ended = createSchedule({
+        id: 'schedule-2',
+        maxOccurrences: 2,
+        currentOccurrences: 2,
+      });
+      manager.find
+        .mockResolvedValueOnce([createSchedule(), ended])
+        .mockResolvedValueOnce([
+          Object.assign(new InvoiceTemplateEntity(), {
+            id: 'template-1',
+            isActive: true,
+            templateData: { items: [] },
+          }),
+        ]);
+      manager.findOne.mockResolvedValue(
+        Object.assign(new InvoiceSettingsEntity(), {
+          id: 'settings-1',
+          numberPrefix: 'INV',
+          nextNumber: 1,
+          defaultPaymentTerms: 30,
+        }),
+      );
+      manager.query
+        .mockResolvedValueOnce([[{ nextNumber: 43 }], 1])
+        .mockResolvedValueOnce([[], 2]);
+      insertBuilder.execute.mockResolvedValue({
+        raw: [{ id: 'invoice-1', createdBy: 'partner-1' }],
+      });
+
+      const result = await service.billRecurringChunk({
+        data: {
+          runId: 'run-1',
+          runDate: '2026-10-15',
+          scheduleIds: ['schedule-1', 'schedule-2', 'schedule-3'],
+        },
+      } as any);
+
+      expect(result).toEqual({
+        generated: 1,
+        skipped: 1,
+        completed: 1,
+        failed: 0,
+      });
+      const [invoice] = insertBuilder.values.mock.calls[0][0];
+      expect(invoice).toMatchObject({
+        invoiceNumber: 'INV-0042',
+        recurringInvoiceId: 'schedule-1',
+        customerId: 'customer-1',
+        createdBy: 'partner-1',
+      });
+      expect(insertBuilder.into).toHaveBeenLastCalledWith(
+        InvoiceAuditTrailEntity,
+      );
+      expect(insertBuilder.values).toHaveBeenLastCalledWith([
+        {
+          invoiceId: 'invoice-1',
+          action: 'CREATED',
+          description: 'Invoice created',
+          performedBy: 'partner-1',
+        },
+      ]);
+      expect(manager.query.mock.calls[1][1]).toEqual([
+        'schedule-1',
+        '2026-11-15',
+        1,
+        true,
+        'schedule-2',
+        '2026-10-15',
+        2,
+        false,
+      ]);
+      expect(billingJobService.enqueueInvoicePdfs).toHaveBeenCalledWith([
+        'invoice-1',
+      ]);
+    });
+
+    it('should not write anything when no schedule is still due', async () => {
+      manager.find.mockResolvedValueOnce([]);
+
+      const result = await service.billRecurringChunk({
+        data: {
+          runId: 'run-1',
+          runDate: '2026-10-15',
+          scheduleIds: ['schedule-1'],
+        },
+      } as any);
+
+      expect(result.skipped).toBe(1);
+      expect(manager.query).not.toHaveBeenCalled();
+      expect(billingJobService.enqueueInvoicePdfs).toHaveBeenCalledWith([]);
+    });
+  });
+});
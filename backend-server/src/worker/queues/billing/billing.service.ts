@@ -0,0 +1,383 @@
+import {
+  EnhancedInvoiceEntity,
+  InvoiceAuditTrailEntity,
+  InvoiceSettingsEntity,
+  InvoiceTemplateEntity,
+  RecurringInvoiceEntity,
+} from '@/api/invoice/entities/enhanced-invoice.entity';
+import { Job as AllJobs, Queue } from '@/constants/job.constant';
+import { InjectQueue } from '@nestjs/bullmq';
+import { Injectable, Logger } from '@nestjs/common';
+import { Cron, CronExpression } from '@nestjs/schedule';
+import { InjectRepository } from '@nestjs/typeorm';
+import { Job } from 'bullmq';
+import { DataSource, EntityManager, In, Raw, Repository } from 'typeorm';
+
+import { BillingJobService, toBillingDate } from './billing-job.service';
+import {
+  BillingQueue,
+  InvoicePdfJobData,
+  InvoicePdfResult,
+  RecurringChunkJobData,
+  RecurringChunkResult,
+  RecurringRunJobData,
+  RecurringRunResult,
+} from './billing.type';
+
+const BillingJob = AllJobs.Billing;
+
+const CHUNK_SIZE = 200;
+
+interface DueSchedule {
+  schedule: RecurringInvoiceEntity;
+  template: InvoiceTemplateEntity;
+}
+
+/**
+ * Worker side of the billing queue.
+ *
+ * A recurring run pages through the due schedules in
+ * (nextGenerationDate, id) order and queues one chunk job per page. Each
+ * chunk bills its schedules in a single transaction: the schedules are
+ * locked (skipping any another job holds), their invoices and the invoices'
+ * audit entries are inserted with one statement each and the schedules
+ * advanced in another.
+ *
+ * Runs are idempotent and resumable. A chunk only bills schedules that are
+ * still due once locked, and invoices are unique per schedule and issue
+ * date, so retried, overlapping or restarted runs never bill a period twice;
+ * anything a failed run left behind is picked up by the next one.
+ */
+@Injectable()
+export class BillingQueueService {
+  private readonly logger = new Logger(BillingQueueService.name);
+
+  constructor(
+    private readonly dataSource: DataSource,
+    @InjectRepository(RecurringInvoiceEntity)
+    private readonly recurringRepository: Repository<RecurringInvoiceEntity>,
+    @InjectRepository(EnhancedInvoiceEntity)
+    private readonly invoiceRepository: Repository<EnhancedInvoiceEntity>,
+    @InjectQueue(Queue.Billing)
+    private readonly billingQueue: BillingQueue,
+    private readonly billingJobService: BillingJobService,
+  ) {}
+
+  /** One scheduled run per day; every worker queues it under the same id */
+  @Cron(CronExpression.EVERY_DAY_AT_1AM)
+  async scheduleRecurringRun(): Promise<void> {
+    const runDate = toBillingDate(new Date());
+    try {
+      await this.billingJobService.enqueueRecurringRun({
+        runDate,
+        runId: `recurring-${runDate}`,
+      });
+    } catch (error) {
+      this.logger.error(
+        `Failed to queue recurring billing run: ${error.message}`,
+        error.stack,
+      );
+    }
+  }
+
+  async planRecurringRun(
+    job: Job<RecurringRunJobData>,
+  ): Promise<RecurringRunResult> {
+    const { runId, runDate } = job.data;
+    const result: RecurringRunResult = { chunks: 0, schedules: 0 };
+    let page: RecurringInvoiceEntity[] = [];
+
+    do {
+      const query = this.recurringRepository
+        .createQueryBuilder('recurring')
+        .select(['recurring.id', 'recurring.nextGenerationDate'])
+        .where('recurring.isActive = true')
+        .andWhere('recurring.nextGenerationDate <= :runDate', { runDate })
+        .orderBy('recurring.nextGenerationDate', 'ASC')
+        .addOrderBy('recurring.id', 'ASC')
+        .limit(CHUNK_SIZE);
+      const last = page[page.length - 1];
+      if (last) {
+        query.andWhere(
+          '(recurring.nextGenerationDate, recurring.id) > (:lastDate, :lastId)',
+          { lastDate: last.nextGenerationDate, lastId: last.id },
+        );
+      }
+
+      page = await query.getMany();
+      if (page.length === 0) break;
+
+      // Keyed by the first schedule, so a restarted plan re-queues the same
+      // chunks as no-ops
+      const scheduleIds = page.map((schedule) => schedule.id);
+      await this.billingQueue.add(
+        BillingJob.RecurringChunk,
+        { ...job.data, scheduleIds },
+        { jobId: `${runId}-${scheduleIds[0]}` },
+      );
+
+      result.chunks++;
+      result.schedules += page.length;
+      await job.updateProgress(result.schedules);
+    } while (page.length === CHUNK_SIZE);
+
+    this.logger.log(
+      `Billing run ${runId} queued ${result.schedules} schedule(s) in ${result.chunks} chunk(s)`,
+    );
+    return result;
+  }
+
+  async billRecurringChunk(
+    job: Job<RecurringChunkJobData>,
+  ): Promise<RecurringChunkResult> {
+    const { runDate, scheduleIds, requestedBy } = job.data;
+    const result: RecurringChunkResult = {
+      generated: 0,
+      skipped: 0,
+      completed: 0,
+      failed: 0,
+    };
+
+    const invoiceIds = await this.dataSource.transaction(async (manager) => {
+      const schedules = await manager.find(RecurringInvoiceEntity, {
+        where: {
+          id: In(scheduleIds),
+          isActive: true,
+          nextGenerationDate: Raw((column) => `${column} <= :runDate`, {
+            runDate,
+          }),
+        },
+        order: { id: 'ASC' },
+        lock: { mode: 'pessimistic_write', onLocked: 'skip_locked' },
+      });
+      result.skipped = scheduleIds.length - schedules.length;
+      if (schedules.length === 0) return [];
+
+      const templateIds = Array.from(
+        new Set(schedules.map((schedule) => schedule.templateId)),
+      );
+      const templates = new Map(
+        (
+          await manager.find(InvoiceTemplateEntity, {
+            where: { id: In(templateIds) },
+          })
+        ).map((template) => [template.id, template]),
+      );
+
+      const due: DueSchedule[] = [];
+      const ended: RecurringInvoiceEntity[] = [];
+      for (const schedule of schedules) {
+        const template = templates.get(schedule.templateId);
+        if (this.hasEnded(schedule, schedule.nextGenerationDate)) {
+          ended.push(schedule);
+        } else if (
+          !template?.isActive ||
+          !Array.isArray(template.templateData?.items)
+        ) {
+          // Left due, so the next run retries once the template is fixed
+          result.failed++;
+          this.logger.warn(
+            `Recurring invoice ${schedule.id} has no usable template`,
+          );
+        } else {
+          due.push({ schedule, template });
+        }
+      }
+
+      const invoiceIds = await this.insertInvoices(manager, due, requestedBy);
+      result.generated = invoiceIds.length;
+      result.skipped += due.length - invoiceIds.length;
+      result.completed = await this.advanceSchedules(
+        manager,
+        due.map(({ schedule }) => schedule),
+        ended,
+      );
+      return invoiceIds;
+    });
+
+    await this.billingJobService.enqueueInvoicePdfs(invoiceIds);
+    return result;
+  }
+
+  /**
+   * Stands in for PDF rendering until an invoice renderer exists: records
+   * the URL the invoice PDF is served from.
+   */
+  async renderInvoicePdf(
+    job: Job<InvoicePdfJobData>,
+  ): Promise<InvoicePdfResult> {
+    const { invoiceId } = job.data;
+    const pdfUrl = `/api/invoice/${invoiceId}/pdf/download`;
+    await this.invoiceRepository.update(invoiceId, { pdfUrl });
+    return { pdfUrl };
+  }
+
+  /**
+   * Insert one invoice per schedule, dated on its billing date. Returns the
+   * ids of the invoices inserted; periods already invoiced are left alone.
+   */
+  private async insertInvoices(
+    manager: EntityManager,
+    due: DueSchedule[],
+    requestedBy?: string,
+  ): Promise<string[]> {
+    if (due.length === 0) return [];
+
+    const settings = await this.reserveInvoiceNumbers(
+      manager,
+      due.length,
+      requestedBy ?? due[0].schedule.createdBy,
+    );
+
+    const invoices = due.map(({ schedule, template }) => {
+      const issueDate = new Date(schedule.nextGenerationDate);
+      const dueDate = new Date(issueDate);
+      dueDate.setDate(dueDate.getDate() + settings.defaultPaymentTerms);
+      const invoiceNumber = settings.generateNextInvoiceNumber();
+      settings.incrementNextNumber();
+
+      return manager.create(EnhancedInvoiceEntity, {
+        discountAmount: 0,
+        shippingAmount: 0,
+        paidAmount: 0,
+        ...template.templateData,
+        invoiceNumber,
+        type: template.type,
+        customerId: schedule.customerId,
+        partnerId: schedule.createdBy,
+        recurringInvoiceId: schedule.id,
+        issueDate,
+        dueDate,
+        createdBy: requestedBy ?? schedule.createdBy,
+      });
+    });
+
+    const { raw } = await manager
+      .createQueryBuilder()
+      .insert()
+      .into(EnhancedInvoiceEntity)
+      .values(invoices)
+      // Only a period that's already invoiced is skipped; an invoice number
+      // clash still fails the chunk
+      .onConflict(
+        `("recurringInvoiceId", "issueDate") WHERE "recurringInvoiceId" IS NOT NULL DO NOTHING`,
+      )
+      .returning(['id', 'createdBy'])
+      .updateEntity(false)
+      .execute();
+
+    const inserted = raw as Array<{ id: string; createdBy: string }>;
+    if (inserted.length > 0) {
+      // Same 'CREATED' entry EnhancedInvoiceService.createInvoice records
+      await manager
+        .createQueryBuilder()
+        .insert()
+        .into(InvoiceAuditTrailEntity)
+        .values(
+          inserted.map((row) => ({
+            invoiceId: row.id,
+            action: 'CREATED',
+            description: 'Invoice created',
+            performedBy: row.createdBy,
+          })),
+        )
+        .updateEntity(false)
+        .execute();
+    }
+
+    return inserted.map((row) => row.id);
+  }
+
+  /**
+   * Reserve `count` consecutive invoice numbers. Returns the settings with
+   * `nextNumber` at the first reserved number. The settings row stays locked
+   * until the transaction ends, so numbers are reserved as late as possible;
+   * a chunk that rolls back releases its numbers.
+   */
+  private async reserveInvoiceNumbers(
+    manager: EntityManager,
+    count: number,
+    updatedBy: string,
+  ): Promise<InvoiceSettingsEntity> {
+    let settings = await manager.findOne(InvoiceSettingsEntity, { where: {} });
+    if (!settings) {
+      settings = await manager.save(
+        manager.create(InvoiceSettingsEntity, { updatedBy }),
+      );
+    }
+
+    // UPDATE statements come back from the driver as [rows, rowCount]
+    const [rows]: [Array<{ nextNumber: number }>, number] =
+      await manager.query(
+        `UPDATE "invoice_settings" SET "nextNumber" = "nextNumber" + $1
+         WHERE "id" = $2
+         RETURNING "nextNumber"`,
+        [count, settings.id],
+      );
+    settings.nextNumber = rows[0].nextNumber - count;
+    return settings;
+  }
+
+  /**
+   * Move billed schedules to their next date and deactivate the ones that
+   * ended, in one statement. Returns how many schedules were deactivated.
+   */
+  private async advanceSchedules(
+    manager: EntityManager,
+    billed: RecurringInvoiceEntity[],
+    ended: RecurringInvoiceEntity[],
+  ): Promise<number> {
+    const updates = [
+      ...billed.map((schedule) => {
+        const next = schedule.calculateNextGenerationDate();
+        const occurrences = schedule.currentOccurrences + 1;
+        const finished =
+          (!!schedule.maxOccurrences &&
+            occurrences >= schedule.maxOccurrences) ||
+          this.hasEnded(schedule, next);
+        return [schedule.id, toBillingDate(next), occurrences, !finished];
+      }),
+      ...ended.map((schedule) => [
+        schedule.id,
+        schedule.nextGenerationDate,
+        schedule.currentOccurrences,
+        false,
+      ]),
+    ];
+    if (updates.length === 0) return 0;
+
+    const params = updates.flat();
+    const values = updates.map((_, i) => {
+      const n = i * 4;
+      return `($${n + 1}::uuid, $${n + 2}::date, $${n + 3}::int, $${n + 4}::boolean)`;
+    });
+    await manager.query(
+      `UPDATE "recurring_invoices" r
+       SET "nextGenerationDate" = v."next",
+         "currentOccurrences" = v."occurrences",
+         "isActive" = v."active",
+         "updatedAt" = now()
+       FROM (VALUES ${values.join(', ')}) AS v("id", "next", "occurrences", "active")
+       WHERE r."id" = v."id"`,
+      params,
+    );
+
+    return updates.filter(([, , , active]) => !active).length;
+  }
+
+  private hasEnded(
+    schedule: RecurringInvoiceEntity,
+    billingDate: Date | string,
+  ): boolean {
+    if (
+      schedule.maxOccurrences &&
+      schedule.currentOccurrences >= schedule.maxOccurrences
+    ) {
+      return true;
+    }
+    return (
+      !!schedule.endDate &&
+      new Date(billingDate).getTime() > new Date(schedule.endDate).getTime()
+    );
+  }
+}
@@ -0,0 +1,64 @@
+import { Job as AllJobs } from '@/constants/job.constant';
+import { Job, Queue } from 'bullmq';
+
+const BillingJob = AllJobs.Billing;
+
+export type BillingJobName = (typeof BillingJob)[keyof typeof BillingJob];
+
+export interface RecurringRunJobData {
+  runId: string;
+  /** Billing date (YYYY-MM-DD); schedules due on or before it are billed */
+  runDate: string;
+  /** Admin who started the run; scheduled runs bill as the schedule owner */
+  requestedBy?: string;
+}
+
+export interface RecurringChunkJobData extends RecurringRunJobData {
+  scheduleIds: string[];
+}
+
+export interface InvoicePdfJobData {
+  invoiceId: string;
+}
+
+export interface RecurringRunResult {
+  chunks: number;
+  schedules: number;
+}
+
+export interface RecurringChunkResult {
+  generated: number;
+  /** Schedules already billed, deactivated or being billed by another job */
+  skipped: number;
+  /** Schedules deactivated because they reached their end date or limit */
+  completed: number;
+  failed: number;
+}
+
+export interface InvoicePdfResult {
+  pdfUrl: string;
+}
+
+export type BillingJobDataMap = {
+  [BillingJob.RecurringRun]: RecurringRunJobData;
+  [BillingJob.RecurringChunk]: RecurringChunkJobData;
+  [BillingJob.InvoicePdf]: InvoicePdfJobData;
+};
+
+type BillingJobData = BillingJobDataMap[keyof BillingJobDataMap];
+
+type BillingResult =
+  | RecurringRunResult
+  | RecurringChunkResult
+  | InvoicePdfResult;
+
+export type BillingQueue = Queue<BillingJobData, BillingResult, BillingJobName>;
+
+export type BillingJob =
+  | Job<RecurringRunJobData, RecurringRunResult, typeof BillingJob.RecurringRun>
+  | Job<
+      RecurringChunkJobData,
+      RecurringChunkResult,
+      typeof BillingJob.RecurringChunk
+    >
+  | Job<InvoicePdfJobData, InvoicePdfResult, typeof BillingJob.InvoicePdf>;
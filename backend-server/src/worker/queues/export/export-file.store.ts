@@ -0,0 +1,138 @@
+import { GlobalConfig } from '@/config/config.type';
+import { Injectable, Logger } from '@nestjs/common';
+import { ConfigService } from '@nestjs/config';
+import fs from 'node:fs';
+import { mkdir, readdir, rename, rm, stat } from 'node:fs/promises';
+import path from 'node:path';
+
+import { ExportFileFormat } from './export.type';
+
+const PARTIAL_SUFFIX = '.part';
+
+export const EXPORT_MIME_TYPES: Record<ExportFileFormat, string> = {
+  csv: 'text/csv; charset=utf-8',
+  xlsx: 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
+};
+
+export interface ExportFileHandle {
+  stream: fs.WriteStream;
+  /** Close the stream and publish the file, returning its size in bytes */
+  commit(): Promise<number>;
+  /** Close the stream and delete the partial file */
+  discard(): Promise<void>;
+}
+
+/**
+ * Local file store for generated exports.
+ *
+ * Files are written under a `.part` name and renamed once complete, so a
+ * download never sees a half-written export. API and worker processes must
+ * share `app.exportDir` (same host or a mounted volume); docker-compose.yml
+ * mounts the `exports` volume there in both services.
+ */
+@Injectable()
+export class ExportFileStore {
+  private readonly logger = new Logger(ExportFileStore.name);
+  private readonly root: string;
+
+  constructor(private readonly configService: ConfigService<GlobalConfig>) {
+    this.root = path.resolve(
+      this.configService.get('app.exportDir', { infer: true }),
+    );
+  }
+
+  fileName(prefix: string, exportId: string, format: ExportFileFormat): string {
+    return `${prefix}-${exportId}.${format}`;
+  }
+
+  async open(fileName: string): Promise<ExportFileHandle> {
+    await mkdir(this.root, { recursive: true });
+
+    const finalPath = this.resolve(fileName);
+    const partialPath = `${finalPath}${PARTIAL_SUFFIX}`;
+    const stream = fs.createWriteStream(partialPath);
+
+    const close = () =>
+      new Promise<void>((resolve, reject) => {
+        if (stream.closed) return resolve();
+        stream.once('error', reject);
+        stream.end(() => resolve());
+      });
+
+    return {
+      stream,
+      commit: async () => {
+        await close();
+        await rename(partialPath, finalPath);
+        return (await stat(finalPath)).size;
+      },
+      discard: async () => {
+        stream.destroy();
+        await rm(partialPath, { force: true });
+      },
+    };
+  }
+
+  async exists(fileName: string): Promise<boolean> {
+    try {
+      return (await stat(this.resolve(fileName))).isFile();
+    } catch {
+      return false;
+    }
+  }
+
+  createReadStream(fileName: string): fs.ReadStream {
+    return fs.createReadStream(this.resolve(fileName));
+  }
+
+  async remove(fileName: string): Promise<void> {
+    await rm(this.resolve(fileName), { force: true });
+  }
+
+  /**
+   * Delete files whose retention has elapsed. `retentionFor` returns the
+   * retention in milliseconds for a file name, or null to keep the file.
+   * Partial files are treated as abandoned after `partialRetentionMs`.
+   */
+  async sweep(
+    retentionFor: (fileName: string) => number | null,
+    partialRetentionMs: number,
+  ): Promise<number> {
+    let entries: string[];
+    try {
+      entries = await readdir(this.root);
+    } catch (error) {
+      if (error.code === 'ENOENT') return 0;
+      throw error;
+    }
+
+    const now = Date.now();
+    let removed = 0;
+
+    for (const entry of entries) {
+      const retention = entry.endsWith(PARTIAL_SUFFIX)
+        ? partialRetentionMs
+        : retentionFor(entry);
+      if (retention === null) continue;
+
+      const filePath = path.join(this.root, entry);
+      try {
+        const { mtimeMs } = await stat(filePath);
+        if (mtimeMs + retention > now) continue;
+        await rm(filePath, { force: true });
+        removed++;
+      } catch (error) {
+        this.logger.warn(`Failed to sweep export ${entry}: ${error.message}`);
+      }
+    }
+
+    return removed;
+  }
+
+  private resolve(fileName: string): string {
+    if (path.basename(fileName) !== fileName) {
+      throw new Error(`Invalid export file name: ${fileName}`);
+    }
+    return path.join(this.root, fileName);
+  }
+}
@@ -0,0 +1,36 @@
+import { Queue } from '@/constants/job.constant';
+import { BullModule } from '@nestjs/bullmq';
+import { Module } from '@nestjs/common';
+import { ExportFileStore } from './export-file.store';
+import { ExportJobService } from './export-job.service';
+
+@Module({
+  imports: [
+    BullModule.registerQueue({
+      name: Queue.Export,
+      defaultJobOptions: {
+        attempts: 2,
+        backoff: {
+          type: 'exponential',
+          delay: 5000,
+        },
+        // Finished jobs carry the export result; keep them for the
+        // longest retention window
+        removeOnComplete: {
+          age: 7 * 24 * 60 * 60,
+        },
+        removeOnFail: {
+          age: 7 * 24 * 60 * 60,
+        },
+      },
+      streams: {
+        events: {
+          maxLen: 1000,
+        },
+      },
+    }),
+  ],
+  providers: [ExportJobService, ExportFileStore],
+  exports: [ExportJobService, ExportFileStore],
+})
+export class ExportJobModule {}
@@ -0,0 +1,137 @@
+import { Job as AllJobs, Queue } from '@/constants/job.constant';
+import { InjectQueue } from '@nestjs/bullmq';
+import { Injectable, Logger } from '@nestjs/common';
+import { JobState } from 'bullmq';
+import { ReadStream } from 'node:fs';
+
+import { EXPORT_MIME_TYPES, ExportFileStore } from './export-file.store';
+import {
+  ExportJobDataMap,
+  ExportJobName,
+  ExportQueue,
+  ExportResult,
+} from './export.type';
+
+const ExportJob = AllJobs.Export;
+
+export type ExportJobState = JobState | 'cancelled' | 'unknown';
+
+export interface ExportJobStatus {
+  exportId: string;
+  type: ExportJobName;
+  state: ExportJobState;
+  progress: number;
+  result?: ExportResult;
+  errorMessage?: string;
+  createdAt: Date;
+}
+
+export interface ExportDownload {
+  stream: ReadStream;
+  fileName: string;
+  contentType: string;
+  fileSize: number;
+}
+
+const HOUR_MS = 60 * 60 * 1000;
+
+export const EXPORT_CANCELLED_MESSAGE = 'Export cancelled';
+
+export const COMMISSION_EXPORT_TYPES = ['calculations', 'payments'];
+
+/** How long a finished export stays downloadable, per export type */
+export const EXPORT_RETENTION_MS: Record<ExportJobName, number> = {
+  [ExportJob.Inventory]: 7 * 24 * HOUR_MS,
+  [ExportJob.Commission]: 24 * HOUR_MS,
+  [ExportJob.AdminUsers]: 24 * HOUR_MS,
+  [ExportJob.AdminTransactions]: 24 * HOUR_MS,
+};
+
+/**
+ * Producer side of the export queue: enqueues exports, reports their
+ * progress and serves finished files. The export id doubles as the job id.
+ */
+@Injectable()
+export class ExportJobService {
+  private readonly logger = new Logger(ExportJobService.name);
+
+  constructor(
+    @InjectQueue(Queue.Export)
+    private readonly exportQueue: ExportQueue,
+    private readonly fileStore: ExportFileStore,
+  ) {}
+
+  async enqueue<N extends keyof ExportJobDataMap>(
+    name: N,
+    data: ExportJobDataMap[N],
+  ): Promise<void> {
+    await this.exportQueue.add(name, data, { jobId: data.exportId });
+    this.logger.log(`Queued ${name} export ${data.exportId}`);
+  }
+
+  async getStatus(exportId: string): Promise<ExportJobStatus | null> {
+    const job = await this.exportQueue.getJob(exportId);
+    if (!job) return null;
+
+    const state = await job.getState();
+    const cancelled =
+      job.data.cancelRequested &&
+      state !== 'completed' &&
+      job.failedReason === EXPORT_CANCELLED_MESSAGE;
+
+    return {
+      exportId,
+      type: job.name as ExportJobName,
+      state: cancelled ? 'cancelled' : state,
+      progress: typeof job.progress === 'number' ? job.progress : 0,
+      result: job.returnvalue || undefined,
+      errorMessage: cancelled ? undefined : job.failedReason,
+      createdAt: new Date(job.timestamp),
+    };
+  }
+
+  /**
+   * Cancel an export. Queued jobs are removed outright; a running job is
+   * flagged and stops at its next page boundary, discarding its partial file.
+   */
+  async cancel(exportId: string): Promise<boolean> {
+    const job = await this.exportQueue.getJob(exportId);
+    if (!job) return false;
+
+    const state = await job.getState();
+    if (state === 'waiting' || state === 'delayed' || state === 'prioritized') {
+      await job.remove();
+      return true;
+    }
+
+    if (state === 'active') {
+      await job.updateData({ ...job.data, cancelRequested: true });
+      return true;
+    }
+
+    return false;
+  }
+
+  async isCancelRequested(exportId: string): Promise<boolean> {
+    const job = await this.exportQueue.getJob(exportId);
+    return !job || !!job.data.cancelRequested;
+  }
+
+  /**
+   * Open a finished export for download, or null when it is not (or no
+   * longer) available
+   */
+  async openDownload(exportId: string): Promise<ExportDownload | null> {
+    const job = await this.exportQueue.getJob(exportId);
+    const result = job?.returnvalue;
+    if (!result || new Date(result.expiresAt) <= new Date()) return null;
+    if (!(await this.fileStore.exists(result.fileName))) return null;
+
+    return {
+      stream: this.fileStore.createReadStream(result.fileName),
+      fileName: result.fileName,
+      contentType: EXPORT_MIME_TYPES[job.data.format],
+      fileSize: result.fileSize,
+    };
+  }
+}
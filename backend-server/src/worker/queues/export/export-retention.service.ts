@@ -0,0 +1,68 @@
+import { CommissionExportEntity } from '@/api/commission/entities/commission.entity';
+import { ExportStatus } from '@/api/space-inventory/dto/space-inventory.dto';
+import { InventoryExportEntity } from '@/api/space-inventory/entities/space-inventory.entity';
+import { Injectable, Logger } from '@nestjs/common';
+import { Cron, CronExpression } from '@nestjs/schedule';
+import { InjectRepository } from '@nestjs/typeorm';
+import { LessThan, Repository } from 'typeorm';
+
+import { ExportFileStore } from './export-file.store';
+import { EXPORT_RETENTION_MS } from './export-job.service';
+import { ExportJobName } from './export.type';
+
+const PARTIAL_FILE_RETENTION_MS = 24 * 60 * 60 * 1000;
+
+/**
+ * Deletes export files once their retention elapses and marks the matching
+ * export records as expired
+ */
+@Injectable()
+export class ExportRetentionService {
+  private readonly logger = new Logger(ExportRetentionService.name);
+
+  constructor(
+    @InjectRepository(InventoryExportEntity)
+    private readonly inventoryExportRepository: Repository<InventoryExportEntity>,
+    @InjectRepository(CommissionExportEntity)
+    private readonly commissionExportRepository: Repository<CommissionExportEntity>,
+    private readonly fileStore: ExportFileStore,
+  ) {}
+
+  @Cron(CronExpression.EVERY_HOUR)
+  async purgeExpiredExports(): Promise<number> {
+    try {
+      const removed = await this.fileStore.sweep(
+        (fileName) => this.retentionFor(fileName),
+        PARTIAL_FILE_RETENTION_MS,
+      );
+
+      const now = new Date();
+      await this.inventoryExportRepository.update(
+        { status: ExportStatus.COMPLETED, expiresAt: LessThan(now) },
+        { status: ExportStatus.EXPIRED, downloadUrl: null },
+      );
+      await this.commissionExportRepository.update(
+        { status: 'completed', expiresAt: LessThan(now) },
+        { status: 'expired' },
+      );
+
+      if (removed > 0) {
+        this.logger.log(`Removed ${removed} expired export file(s)`);
+      }
+      return removed;
+    } catch (error) {
+      this.logger.error(
+        `Failed to purge expired exports: ${error.message}`,
+        error.stack,
+      );
+      return 0;
+    }
+  }
+
+  private retentionFor(fileName: string): number | null {
+    const prefix = Object.keys(EXPORT_RETENTION_MS).find((name) =>
+      fileName.startsWith(`${name}-`),
+    );
+    return prefix ? EXPORT_RETENTION_MS[prefix as ExportJobName] : null;
+  }
+}
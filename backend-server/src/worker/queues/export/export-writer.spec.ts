@@ -0,0 +1,53 @@
+import ExcelJS from 'exceljs';
+import { PassThrough } from 'node:stream';
+import { ExportColumn, createExportWriter } from './export-writer';
+
+describe('createExportWriter', () => {
+  const columns: ExportColumn[] = [
+    { key: 'id', header: 'ID' },
+    { key: 'name', header: 'Name' },
+    { key: 'amount', header: 'Amount', type: 'number' },
+  ];
+
+  const capture = () => {
+    const output = new PassThrough();
+    const chunks: Buffer[] = [];
+    output.on('data', (chunk: Buffer) => chunks.push(chunk));
+    return { output, contents: () => Buffer.concat(chunks) };
+  };
+
+  it('should write RFC 4180 escaped CSV', async () => {
+    const { output, contents } = capture();
+    const writer = createExportWriter('csv', output, columns);
+
+    await writer.start();
+    await writer.writeRows([
+      { id: '1', name: 'Desk, "A"', amount: 10.5 },
+      { id: '2', name: 'Line\nbreak', amount: null },
+    ]);
+    await writer.finish();
+
+    expect(contents().toString('utf8')).toBe(
+      '\ufeffID,Name,Amount\r\n' +
+        '1,"Desk, ""A""",10.5\r\n' +
+        '2,"Line\nbreak",\r\n',
+    );
+  });
+
+  it('should write a readable XLSX workbook', async () => {
+    const { output, contents } = capture();
+    const writer = createExportWriter('xlsx', output, columns);
+
+    await writer.start();
+    await writer.writeRows([{ id: '1', name: 'Desk <A>', amount: 10.5 }]);
+    await writer.finish();
+
+    const workbook = new ExcelJS.Workbook();
+    await workbook.xlsx.load(contents());
+    const sheet = workbook.getWorksheet('Export');
+
+    expect(sheet.getRow(1).values).toEqual([undefined, 'ID', 'Name', 'Amount']);
+    expect(sheet.getRow(2).getCell(2).value).toBe('Desk <A>');
+    expect(sheet.getRow(2).getCell(3).value).toBe(10.5);
+  });
+});
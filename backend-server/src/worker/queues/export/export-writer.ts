@@ -0,0 +1,158 @@
+import { createObjectCsvStringifier } from 'csv-writer';
+import ExcelJS from 'exceljs';
+import { once } from 'node:events';
+import { Writable } from 'node:stream';
+
+import { ExportFileFormat } from './export.type';
+
+export type ExportRow = Record<string, unknown>;
+
+export interface ExportColumn {
+  key: string;
+  header: string;
+  type?: 'string' | 'number' | 'boolean' | 'date';
+}
+
+export interface ExportFileWriter {
+  start(): Promise<void>;
+  writeRows(rows: ExportRow[]): Promise<void>;
+  finish(): Promise<void>;
+}
+
+/** Excel's sheet limit, minus the header row */
+export const XLSX_MAX_ROWS = 1048575;
+
+async function write(stream: Writable, chunk: string): Promise<void> {
+  if (!stream.write(chunk)) {
+    await once(stream, 'drain');
+  }
+}
+
+function formatValue(value: unknown): string {
+  if (value === null || value === undefined) return '';
+  if (value instanceof Date) return value.toISOString();
+  if (typeof value === 'object') return JSON.stringify(value);
+  return String(value);
+}
+
+export function createExportWriter(
+  format: ExportFileFormat,
+  output: Writable,
+  columns: ExportColumn[],
+): ExportFileWriter {
+  return format === 'xlsx'
+    ? new XlsxExportWriter(output, columns)
+    : new CsvExportWriter(output, columns);
+}
+
+/**
+ * RFC 4180 CSV, prefixed with a UTF-8 BOM so Excel detects the encoding
+ */
+export class CsvExportWriter implements ExportFileWriter {
+  private readonly stringifier: ReturnType<typeof createObjectCsvStringifier>;
+
+  constructor(
+    private readonly output: Writable,
+    private readonly columns: ExportColumn[],
+  ) {
+    this.stringifier = createObjectCsvStringifier({
+      header: columns.map((column) => ({
+        id: column.key,
+        title: column.header,
+      })),
+      recordDelimiter: '\r\n',
+    });
+  }
+
+  async start(): Promise<void> {
+    await write(
+      this.output,
+      '\ufeff' + this.stringifier.getHeaderString(),
+    );
+  }
+
+  async writeRows(rows: ExportRow[]): Promise<void> {
+    if (rows.length === 0) return;
+
+    const records = rows.map((row) =>
+      Object.fromEntries(
+        this.columns.map((column) => [
+          column.key,
+          formatValue(row[column.key]),
+        ]),
+      ),
+    );
+    await write(this.output, this.stringifier.stringifyRecords(records));
+  }
+
+  async finish(): Promise<void> {
+    // Nothing to close; the file store ends the underlying stream
+  }
+}
+
+/**
+ * Single-sheet XLSX through exceljs' streaming workbook writer; rows are
+ * committed as they arrive, so memory stays flat regardless of row count.
+ * Committing the workbook ends the output stream.
+ */
+export class XlsxExportWriter implements ExportFileWriter {
+  private readonly workbook: ExcelJS.stream.xlsx.WorkbookWriter;
+  private readonly sheet: ExcelJS.Worksheet;
+  private rowCount = 0;
+
+  constructor(
+    output: Writable,
+    private readonly columns: ExportColumn[],
+  ) {
+    this.workbook = new ExcelJS.stream.xlsx.WorkbookWriter({
+      stream: output,
+      useStyles: false,
+      useSharedStrings: false,
+    });
+    this.sheet = this.workbook.addWorksheet('Export');
+  }
+
+  async start(): Promise<void> {
+    this.sheet.columns = this.columns.map((column) => ({
+      key: column.key,
+      header: column.header,
+    }));
+  }
+
+  async writeRows(rows: ExportRow[]): Promise<void> {
+    if (rows.length === 0) return;
+
+    this.rowCount += rows.length;
+    if (this.rowCount > XLSX_MAX_ROWS) {
+      throw new Error(
+        `XLSX exports are limited to ${XLSX_MAX_ROWS} rows; use CSV instead`,
+      );
+    }
+
+    for (const row of rows) {
+      this.sheet
+        .addRow(
+          this.columns.map((column) => this.cell(row[column.key], column)),
+        )
+        .commit();
+    }
+  }
+
+  async finish(): Promise<void> {
+    this.sheet.commit();
+    await this.workbook.commit();
+  }
+
+  private cell(value: unknown, column: ExportColumn): ExcelJS.CellValue {
+    if (value === null || value === undefined || value === '') return null;
+
+    if (column.type === 'number') {
+      const numeric = typeof value === 'number' ? value : Number(value);
+      if (Number.isFinite(numeric)) return numeric;
+    }
+    if (column.type === 'boolean' && typeof value === 'boolean') {
+      return value;
+    }
+    return formatValue(value);
+  }
+}
@@ -0,0 +1,36 @@
+import { UserEntity } from '@/auth/entities/user.entity';
+import {
+  CommissionCalculationEntity,
+  CommissionExportEntity,
+  CommissionPaymentEntity,
+} from '@/api/commission/entities/commission.entity';
+import {
+  InventoryEntity,
+  InventoryExportEntity,
+} from '@/api/space-inventory/entities/space-inventory.entity';
+import { PaymentEntity } from '@/database/entities/payment.entity';
+import { Module } from '@nestjs/common';
+import { ScheduleModule } from '@nestjs/schedule';
+import { TypeOrmModule } from '@nestjs/typeorm';
+import { ExportJobModule } from './export-job.module';
+import { ExportRetentionService } from './export-retention.service';
+import { ExportProcessor } from './export.processor';
+import { ExportQueueService } from './export.service';
+
+@Module({
+  imports: [
+    TypeOrmModule.forFeature([
+      InventoryEntity,
+      InventoryExportEntity,
+      CommissionCalculationEntity,
+      CommissionPaymentEntity,
+      CommissionExportEntity,
+      UserEntity,
+      PaymentEntity,
+    ]),
+    ScheduleModule.forRoot(),
+    ExportJobModule,
+  ],
+  providers: [ExportQueueService, ExportProcessor, ExportRetentionService],
+})
+export class ExportQueueModule {}
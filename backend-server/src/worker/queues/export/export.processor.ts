@@ -0,0 +1,54 @@
+import { Job as AllJobs, Queue as QueueName } from '@/constants/job.constant';
+import { OnWorkerEvent, Processor, WorkerHost } from '@nestjs/bullmq';
+import { Logger } from '@nestjs/common';
+import { Job } from 'bullmq';
+import { ExportQueueService } from './export.service';
+import { ExportJob, ExportResult } from './export.type';
+
+const ExportJob = AllJobs.Export;
+
+@Processor(QueueName.Export, {
+  // Each export holds an open file and streams pages; cap how many run at
+  // once per worker so concurrent admin exports cannot starve the pool
+  concurrency: 2,
+  stalledInterval: 60000,
+})
+export class ExportProcessor extends WorkerHost {
+  private readonly logger = new Logger(ExportProcessor.name);
+  constructor(private readonly exportQueueService: ExportQueueService) {
+    super();
+  }
+  async process(job: ExportJob, _token?: string): Promise<ExportResult> {
+    this.logger.debug(`Processing job ${job.id} of type ${job.name}.`);
+
+    switch (job.name) {
+      case ExportJob.Inventory:
+        return await this.exportQueueService.exportInventory(job);
+      case ExportJob.Commission:
+        return await this.exportQueueService.exportCommissions(job);
+      case ExportJob.AdminUsers:
+        return await this.exportQueueService.exportUsers(job);
+      case ExportJob.AdminTransactions:
+        return await this.exportQueueService.exportTransactions(job);
+      default:
+        throw new Error(`Unhandled job named: ${(job as any).name}`);
+    }
+  }
+
+  @OnWorkerEvent('completed')
+  async onCompleted(job: Job) {
+    this.logger.debug(`Job ${job.id} has been completed`);
+  }
+
+  @OnWorkerEvent('failed')
+  async onFailed(job: Job) {
+    this.logger.error(
+      `Job ${job.id} has failed with reason: ${job.failedReason}`,
+    );
+  }
+
+  @OnWorkerEvent('stalled')
+  async onStalled(job: Job) {
+    this.logger.error(`Job ${job.id} has been stalled`);
+  }
+}
@@ -0,0 +1,650 @@
+import { UserEntity } from '@/auth/entities/user.entity';
+import {
+  CommissionCalculationEntity,
+  CommissionExportEntity,
+  CommissionPaymentEntity,
+} from '@/api/commission/entities/commission.entity';
+import { ExportStatus } from '@/api/space-inventory/dto/space-inventory.dto';
+import {
+  InventoryEntity,
+  InventoryExportEntity,
+} from '@/api/space-inventory/entities/space-inventory.entity';
+import { PaymentEntity } from '@/database/entities/payment.entity';
+import { Injectable, Logger } from '@nestjs/common';
+import { InjectRepository } from '@nestjs/typeorm';
+import { Job, UnrecoverableError } from 'bullmq';
+import { Repository, SelectQueryBuilder } from 'typeorm';
+
+import { ExportFileStore } from './export-file.store';
+import {
+  COMMISSION_EXPORT_TYPES,
+  EXPORT_CANCELLED_MESSAGE,
+  EXPORT_RETENTION_MS,
+  ExportJobService,
+} from './export-job.service';
+import { ExportColumn, ExportRow, createExportWriter } from './export-writer';
+import {
+  AdminTransactionsExportJob,
+  AdminUsersExportJob,
+  CommissionExportJob,
+  ExportJobBase,
+  ExportJobName,
+  ExportResult,
+  InventoryExportJob,
+} from './export.type';
+
+const EXPORT_PAGE_SIZE = 1000;
+
+type ExportSourceColumn = ExportColumn & { select: string };
+
+interface ExportSource {
+  alias: string;
+  query: SelectQueryBuilder<any>;
+  columns: ExportSourceColumn[];
+}
+
+type ExportQueueJob<T extends { data: unknown }> = Job<
+  T['data'],
+  ExportResult,
+  ExportJobName
+>;
+
+/**
+ * Worker side of the export queue.
+ *
+ * Rows are read in keyset pages ordered by (createdAt, id), so each page is
+ * a short index-backed query and no connection or snapshot is held for the
+ * length of the export. Pages are encoded straight into the output file
+ * stream, which keeps memory flat regardless of export size.
+ */
+@Injectable()
+export class ExportQueueService {
+  private readonly logger = new Logger(ExportQueueService.name);
+
+  constructor(
+    @InjectRepository(InventoryEntity)
+    private readonly inventoryRepository: Repository<InventoryEntity>,
+    @InjectRepository(InventoryExportEntity)
+    private readonly inventoryExportRepository: Repository<InventoryExportEntity>,
+    @InjectRepository(CommissionCalculationEntity)
+    private readonly calculationRepository: Repository<CommissionCalculationEntity>,
+    @InjectRepository(CommissionPaymentEntity)
+    private readonly commissionPaymentRepository: Repository<CommissionPaymentEntity>,
+    @InjectRepository(CommissionExportEntity)
+    private readonly commissionExportRepository: Repository<CommissionExportEntity>,
+    @InjectRepository(UserEntity)
+    private readonly userRepository: Repository<UserEntity>,
+    @InjectRepository(PaymentEntity)
+    private readonly paymentRepository: Repository<PaymentEntity>,
+    private readonly exportJobService: ExportJobService,
+    private readonly fileStore: ExportFileStore,
+  ) {}
+
+  async exportInventory(
+    job: ExportQueueJob<InventoryExportJob>,
+  ): Promise<ExportResult> {
+    const { exportId, filters = {}, fields } = job.data;
+
+    const query = this.inventoryRepository.createQueryBuilder('inventory');
+    let columns: ExportSourceColumn[] = [
+      { key: 'id', header: 'Inventory ID', select: 'inventory.id' },
+      {
+        key: 'spacePackageId',
+        header: 'Space Package ID',
+        select: 'inventory.spacePackageId',
+      },
+      { key: 'status', header: 'Status', select: 'inventory.status' },
+      {
+        key: 'totalQuantity',
+        header: 'Total Quantity',
+        type: 'number',
+        select: 'inventory.totalQuantity',
+      },
+      {
+        key: 'availableQuantity',
+        header: 'Available Quantity',
+        type: 'number',
+        select: 'inventory.availableQuantity',
+      },
+      {
+        key: 'reservedQuantity',
+        header: 'Reserved Quantity',
+        type: 'number',
+        select: 'inventory.reservedQuantity',
+      },
+      {
+        key: 'lowStockThreshold',
+        header: 'Low Stock Threshold',
+        type: 'number',
+        select: 'inventory.lowStockThreshold',
+      },
+      {
+        key: 'reorderPoint',
+        header: 'Reorder Point',
+        type: 'number',
+        select: 'inventory.reorderPoint',
+      },
+      {
+        key: 'maxStockLevel',
+        header: 'Max Stock Level',
+        type: 'number',
+        select: 'inventory.maxStockLevel',
+      },
+      {
+        key: 'locationDetails',
+        header: 'Location',
+        select: 'inventory.locationDetails',
+      },
+      { key: 'notes', header: 'Notes', select: 'inventory.notes' },
+      {
+        key: 'createdAt',
+        header: 'Created At',
+        type: 'date',
+        select: 'inventory.createdAt',
+      },
+      {
+        key: 'updatedAt',
+        header: 'Updated At',
+        type: 'date',
+        select: 'inventory.updatedAt',
+      },
+    ];
+
+    if (job.data.includeRelated) {
+      query.leftJoin('inventory.spacePackage', 'spacePackage');
+      columns.splice(2, 0, {
+        key: 'spacePackageName',
+        header: 'Space Package',
+        select: 'spacePackage.name',
+      });
+    }
+
+    if (fields && fields.length > 0) {
+      columns = columns.filter((column) => fields.includes(column.key));
+    }
+
+    if (filters.status) {
+      query.andWhere('inventory.status = :status', { status: filters.status });
+    }
+    if (filters.spacePackageId) {
+      query.andWhere('inventory.spacePackageId = :spacePackageId', {
+        spacePackageId: filters.spacePackageId,
+      });
+    }
+    if (filters.lowStockOnly) {
+      query.andWhere(
+        'inventory.availableQuantity <= inventory.lowStockThreshold',
+      );
+    }
+
+    await this.inventoryExportRepository.update(exportId, {
+      status: ExportStatus.PROCESSING,
+      errorMessage: null,
+    });
+
+    try {
+      const result = await this.writeExport(job, {
+        alias: 'inventory',
+        query,
+        columns,
+      });
+
+      await this.inventoryExportRepository.update(exportId, {
+        status: ExportStatus.COMPLETED,
+        downloadUrl: `/api/v1/space-inventory/exports/${exportId}/download`,
+        fileSize: result.fileSize,
+        recordCount: result.recordCount,
+        completedAt: new Date(result.completedAt),
+        expiresAt: new Date(result.expiresAt),
+      });
+      return result;
+    } catch (error) {
+      await this.inventoryExportRepository.update(exportId, {
+        status: this.isCancellation(error)
+          ? ExportStatus.CANCELLED
+          : ExportStatus.FAILED,
+        errorMessage: error.message,
+      });
+      throw error;
+    }
+  }
+
+  async exportCommissions(
+    job: ExportQueueJob<CommissionExportJob>,
+  ): Promise<ExportResult> {
+    const { exportId, exportType, partnerIds, dateFrom, dateTo } = job.data;
+    const filters = job.data.filters || {};
+
+    if (!COMMISSION_EXPORT_TYPES.includes(exportType)) {
+      throw new UnrecoverableError(
+        `Unsupported commission export type: ${exportType}`,
+      );
+    }
+
+    const source: ExportSource =
+      exportType === 'payments'
+        ? this.commissionPaymentSource()
+        : this.commissionCalculationSource();
+    const { alias, query } = source;
+    const amountColumn =
+      exportType === 'payments' ? 'totalAmount' : 'totalCommission';
+
+    if (partnerIds && partnerIds.length > 0) {
+      query.andWhere(`${alias}.partnerId IN (:...partnerIds)`, { partnerIds });
+    }
+    if (dateFrom) {
+      query.andWhere(`${alias}.createdAt >= :dateFrom`, { dateFrom });
+    }
+    if (dateTo) {
+      query.andWhere(`${alias}.createdAt <= :dateTo`, { dateTo });
+    }
+    if (filters.status) {
+      query.andWhere(`${alias}.status = :status`, { status: filters.status });
+    }
+    if (filters.minAmount !== undefined) {
+      query.andWhere(`${alias}.${amountColumn} >= :minAmount`, {
+        minAmount: filters.minAmount,
+      });
+    }
+    if (filters.maxAmount !== undefined) {
+      query.andWhere(`${alias}.${amountColumn} <= :maxAmount`, {
+        maxAmount: filters.maxAmount,
+      });
+    }
+
+    await this.commissionExportRepository.update(exportId, {
+      status: 'processing',
+      errorMessage: null,
+    });
+
+    try {
+      const result = await this.writeExport(job, source);
+
+      await this.commissionExportRepository.update(exportId, {
+        status: 'completed',
+        filePath: `/api/v1/commission/export/${exportId}/download`,
+        fileName: result.fileName,
+        recordCount: result.recordCount,
+        completedAt: new Date(result.completedAt),
+        expiresAt: new Date(result.expiresAt),
+      });
+      return result;
+    } catch (error) {
+      await this.commissionExportRepository.update(exportId, {
+        status: this.isCancellation(error) ? 'cancelled' : 'failed',
+        errorMessage: error.message,
+      });
+      throw error;
+    }
+  }
+
+  async exportUsers(
+    job: ExportQueueJob<AdminUsersExportJob>,
+  ): Promise<ExportResult> {
+    const filters = job.data.filters || {};
+    const query = this.userRepository.createQueryBuilder('user');
+
+    if (filters.query) {
+      query.andWhere(
+        '(user.firstName ILIKE :query OR user.lastName ILIKE :query OR user.email ILIKE :query OR user.username ILIKE :query)',
+        { query: `%${filters.query}%` },
+      );
+    }
+    if (filters.status) {
+      query.andWhere('user.status = :status', { status: filters.status });
+    }
+    if (filters.role) {
+      query.andWhere('user.role = :role', { role: filters.role });
+    }
+    if (filters.emailVerified !== undefined) {
+      query.andWhere('user.isEmailVerified = :emailVerified', {
+        emailVerified: filters.emailVerified,
+      });
+    }
+    if (filters.createdAfter) {
+      query.andWhere('user.createdAt >= :createdAfter', {
+        createdAfter: filters.createdAfter,
+      });
+    }
+    if (filters.createdBefore) {
+      query.andWhere('user.createdAt <= :createdBefore', {
+        createdBefore: filters.createdBefore,
+      });
+    }
+    if (filters.lastLoginAfter) {
+      query.andWhere('user.lastLoginAt >= :lastLoginAfter', {
+        lastLoginAfter: filters.lastLoginAfter,
+      });
+    }
+
+    return this.writeExport(job, {
+      alias: 'user',
+      query,
+      columns: [
+        { key: 'id', header: 'User ID', select: 'user.id' },
+        { key: 'username', header: 'Username', select: 'user.username' },
+        { key: 'email', header: 'Email', select: 'user.email' },
+        { key: 'firstName', header: 'First Name', select: 'user.firstName' },
+        { key: 'lastName', header: 'Last Name', select: 'user.lastName' },
+        { key: 'role', header: 'Role', select: 'user.role' },
+        { key: 'status', header: 'Status', select: 'user.status' },
+        {
+          key: 'isEmailVerified',
+          header: 'Email Verified',
+          type: 'boolean',
+          select: 'user.isEmailVerified',
+        },
+        {
+          key: 'kycVerified',
+          header: 'KYC Verified',
+          type: 'boolean',
+          select: 'user.kycVerified',
+        },
+        {
+          key: 'lastLoginAt',
+          header: 'Last Login At',
+          type: 'date',
+          select: 'user.lastLoginAt',
+        },
+        {
+          key: 'createdAt',
+          header: 'Created At',
+          type: 'date',
+          select: 'user.createdAt',
+        },
+      ],
+    });
+  }
+
+  async exportTransactions(
+    job: ExportQueueJob<AdminTransactionsExportJob>,
+  ): Promise<ExportResult> {
+    const filters = job.data.filters || {};
+    const query = this.paymentRepository
+      .createQueryBuilder('payment')
+      .leftJoin('payment.user', 'user')
+      .leftJoin('payment.booking', 'booking')
+      .leftJoin('booking.spaceOption', 'spaceOption');
+
+    if (filters.status) {
+      query.andWhere('payment.status = :status', { status: filters.status });
+    }
+    if (filters.startDate) {
+      query.andWhere('payment.createdAt >= :startDate', {
+        startDate: filters.startDate,
+      });
+    }
+    if (filters.endDate) {
+      query.andWhere('payment.createdAt <= :endDate', {
+        endDate: filters.endDate,
+      });
+    }
+    if (filters.userId) {
+      query.andWhere('payment.userId = :userId', { userId: filters.userId });
+    }
+    if (filters.minAmount) {
+      query.andWhere('payment.amount >= :minAmount', {
+        minAmount: filters.minAmount,
+      });
+    }
+    if (filters.maxAmount) {
+      query.andWhere('payment.amount <= :maxAmount', {
+        maxAmount: filters.maxAmount,
+      });
+    }
+
+    return this.writeExport(job, {
+      alias: 'payment',
+      query,
+      columns: [
+        {
+          key: 'transactionId',
+          header: 'Transaction ID',
+          select: 'COALESCE(payment.gatewayPaymentId, payment.id)',
+        },
+        { key: 'userId', header: 'User ID', select: 'user.id' },
+        { key: 'userName', header: 'User Name', select: 'user.username' },
+        { key: 'userEmail', header: 'User Email', select: 'user.email' },
+        { key: 'bookingId', header: 'Booking ID', select: 'booking.id' },
+        { key: 'spaceName', header: 'Space Name', select: 'spaceOption.name' },
+        {
+          key: 'amount',
+          header: 'Amount',
+          type: 'number',
+          select: 'payment.amount',
+        },
+        { key: 'currency', header: 'Currency', select: 'payment.currency' },
+        { key: 'status', header: 'Status', select: 'payment.status' },
+        { key: 'method', header: 'Payment Method', select: 'payment.method' },
+        {
+          key: 'failureReason',
+          header: 'Description',
+          select: 'payment.failureReason',
+        },
+        {
+          key: 'createdAt',
+          header: 'Created At',
+          type: 'date',
+          select: 'payment.createdAt',
+        },
+        {
+          key: 'updatedAt',
+          header: 'Updated At',
+          type: 'date',
+          select: 'payment.updatedAt',
+        },
+      ],
+    });
+  }
+
+  private commissionCalculationSource(): ExportSource {
+    const amount = (key: string, header: string): ExportSourceColumn => ({
+      key,
+      header,
+      type: 'number',
+      select: `calculation.${key}`,
+    });
+
+    return {
+      alias: 'calculation',
+      query: this.calculationRepository.createQueryBuilder('calculation'),
+      columns: [
+        { key: 'id', header: 'Calculation ID', select: 'calculation.id' },
+        {
+          key: 'bookingId',
+          header: 'Booking ID',
+          select: 'calculation.bookingId',
+        },
+        {
+          key: 'partnerId',
+          header: 'Partner ID',
+          select: 'calculation.partnerId',
+        },
+        { key: 'ruleId', header: 'Rule ID', select: 'calculation.ruleId' },
+        amount('bookingAmount', 'Booking Amount'),
+        amount('commissionRate', 'Commission Rate'),
+        amount('commissionAmount', 'Commission Amount'),
+        amount('bonusAmount', 'Bonus Amount'),
+        amount('totalCommission', 'Total Commission'),
+        { key: 'status', header: 'Status', select: 'calculation.status' },
+        {
+          key: 'calculatedAt',
+          header: 'Calculated At',
+          type: 'date',
+          select: 'calculation.calculatedAt',
+        },
+        {
+          key: 'approvedAt',
+          header: 'Approved At',
+          type: 'date',
+          select: 'calculation.approvedAt',
+        },
+        {
+          key: 'createdAt',
+          header: 'Created At',
+          type: 'date',
+          select: 'calculation.createdAt',
+        },
+      ],
+    };
+  }
+
+  private commissionPaymentSource(): ExportSource {
+    return {
+      alias: 'commissionPayment',
+      query:
+        this.commissionPaymentRepository.createQueryBuilder(
+          'commissionPayment',
+        ),
+      columns: [
+        { key: 'id', header: 'Payment ID', select: 'commissionPayment.id' },
+        {
+          key: 'partnerId',
+          header: 'Partner ID',
+          select: 'commissionPayment.partnerId',
+        },
+        {
+          key: 'totalAmount',
+          header: 'Total Amount',
+          type: 'number',
+          select: 'commissionPayment.totalAmount',
+        },
+        { key: 'status', header: 'Status', select: 'commissionPayment.status' },
+        {
+          key: 'paymentMethod',
+          header: 'Payment Method',
+          select: 'commissionPayment.paymentMethod',
+        },
+        {
+          key: 'paymentReference',
+          header: 'Payment Reference',
+          select: 'commissionPayment.paymentReference',
+        },
+        {
+          key: 'transactionReference',
+          header: 'Transaction Reference',
+          select: 'commissionPayment.transactionReference',
+        },
+        {
+          key: 'scheduledDate',
+          header: 'Scheduled Date',
+          type: 'date',
+          select: 'commissionPayment.scheduledDate',
+        },
+        {
+          key: 'processedDate',
+          header: 'Processed Date',
+          type: 'date',
+          select: 'commissionPayment.processedDate',
+        },
+        {
+          key: 'createdAt',
+          header: 'Created At',
+          type: 'date',
+          select: 'commissionPayment.createdAt',
+        },
+      ],
+    };
+  }
+
+  /**
+   * Stream a source into the file store, reporting progress per page and
+   * stopping at the next page boundary once cancellation is requested
+   */
+  private async writeExport(
+    job: Job<ExportJobBase, ExportResult, ExportJobName>,
+    source: ExportSource,
+  ): Promise<ExportResult> {
+    const { exportId, format } = job.data;
+    const total = await source.query.clone().getCount();
+
+    const fileName = this.fileStore.fileName(job.name, exportId, format);
+    const file = await this.fileStore.open(fileName);
+    const writer = createExportWriter(format, file.stream, source.columns);
+    let recordCount = 0;
+
+    try {
+      await writer.start();
+
+      for await (const rows of this.readPages(source)) {
+        if (await this.exportJobService.isCancelRequested(exportId)) {
+          throw new UnrecoverableError(EXPORT_CANCELLED_MESSAGE);
+        }
+
+        await writer.writeRows(rows);
+        recordCount += rows.length;
+        await job.updateProgress(
+          total > 0 ? Math.min(99, Math.floor((recordCount / total) * 100)) : 99,
+        );
+      }
+
+      await writer.finish();
+      const fileSize = await file.commit();
+      await job.updateProgress(100);
+
+      const completedAt = new Date();
+      this.logger.log(
+        `Export ${exportId} wrote ${recordCount} row(s), ${fileSize} bytes`,
+      );
+
+      return {
+        fileName,
+        fileSize,
+        recordCount,
+        completedAt: completedAt.toISOString(),
+        expiresAt: new Date(
+          completedAt.getTime() + EXPORT_RETENTION_MS[job.name],
+        ).toISOString(),
+      };
+    } catch (error) {
+      await file.discard();
+      throw error;
+    }
+  }
+
+  private async *readPages(
+    source: ExportSource,
+  ): AsyncGenerator<ExportRow[]> {
+    const { alias } = source;
+    let cursor: { cursorAt: string; cursorId: string } | undefined;
+
+    while (true) {
+      const query = source.query.clone().select([]);
+      for (const column of source.columns) {
+        query.addSelect(column.select, column.key);
+      }
+      query
+        .addSelect(`CAST(${alias}.createdAt AS text)`, '__cursorAt')
+        .addSelect(`${alias}.id`, '__cursorId')
+        .orderBy(`${alias}.createdAt`, 'ASC')
+        .addOrderBy(`${alias}.id`, 'ASC')
+        .limit(EXPORT_PAGE_SIZE);
+
+      if (cursor) {
+        query.andWhere(
+          `(${alias}.createdAt, ${alias}.id) > (:cursorAt, :cursorId)`,
+          cursor,
+        );
+      }
+
+      const rows = await query.getRawMany<ExportRow>();
+      if (rows.length === 0) return;
+
+      yield rows;
+
+      if (rows.length < EXPORT_PAGE_SIZE) return;
+      const last = rows[rows.length - 1];
+      cursor = {
+        cursorAt: last.__cursorAt as string,
+        cursorId: last.__cursorId as string,
+      };
+    }
+  }
+
+  private isCancellation(error: Error): boolean {
+    return (
+      error instanceof UnrecoverableError &&
+      error.message === EXPORT_CANCELLED_MESSAGE
+    );
+  }
+}
@@ -0,0 +1,113 @@
+import { Job as AllJobs } from '@/constants/job.constant';
+import { Job, JobsOptions, Queue } from 'bullmq';
+
+const ExportJob = AllJobs.Export;
+
+export type ExportFileFormat = 'csv' | 'xlsx';
+
+export type ExportJobName = (typeof ExportJob)[keyof typeof ExportJob];
+
+export interface ExportJobBase {
+  exportId: string;
+  format: ExportFileFormat;
+  requestedBy?: string;
+  cancelRequested?: boolean;
+}
+
+export interface InventoryExportJob {
+  name: typeof ExportJob.Inventory;
+  data: ExportJobBase & {
+    filters?: {
+      status?: string;
+      spacePackageId?: string;
+      lowStockOnly?: boolean;
+    };
+    fields?: string[];
+  };
+}
+
+export interface CommissionExportJob {
+  name: typeof ExportJob.Commission;
+  data: ExportJobBase & {
+    exportType: string;
+    partnerIds?: string[];
+    dateFrom?: string;
+    dateTo?: string;
+    filters?: {
+      status?: string;
+      minAmount?: number;
+      maxAmount?: number;
+    };
+  };
+}
+
+export interface AdminUsersExportJob {
+  name: typeof ExportJob.AdminUsers;
+  data: ExportJobBase & {
+    filters: {
+      query?: string;
+      status?: string;
+      role?: string;
+      emailVerified?: boolean;
+      createdAfter?: string;
+      createdBefore?: string;
+      lastLoginAfter?: string;
+    };
+  };
+}
+
+export interface AdminTransactionsExportJob {
+  name: typeof ExportJob.AdminTransactions;
+  data: ExportJobBase & {
+    filters: {
+      status?: string;
+      startDate?: string;
+      endDate?: string;
+      userId?: string;
+      minAmount?: number;
+      maxAmount?: number;
+    };
+  };
+}
+
+export interface ExportResult {
+  fileName: string;
+  fileSize: number;
+  recordCount: number;
+  completedAt: string;
+  expiresAt: string;
+}
+
+export type ExportJobDataMap = {
+  [ExportJob.Inventory]: InventoryExportJob['data'];
+  [ExportJob.Commission]: CommissionExportJob['data'];
+  [ExportJob.AdminUsers]: AdminUsersExportJob['data'];
+  [ExportJob.AdminTransactions]: AdminTransactionsExportJob['data'];
+};
+
+type ExportJobData = ExportJobDataMap[keyof ExportJobDataMap];
+
+export type ExportQueue = Omit<
+  Queue<ExportJobData, ExportResult, ExportJobName>,
+  'add'
+> & {
+  add<N extends keyof ExportJobDataMap>(
+    name: N,
+    data: ExportJobDataMap[N],
+    options?: JobsOptions,
+  ): Promise<Job<ExportJobDataMap[N], ExportResult, N>>;
+};
+
+export type ExportJob =
+  | Job<InventoryExportJob['data'], ExportResult, typeof ExportJob.Inventory>
+  | Job<CommissionExportJob['data'], ExportResult, typeof ExportJob.Commission>
+  | Job<
+      AdminUsersExportJob['data'],
+      ExportResult,
+      typeof ExportJob.AdminUsers
+    >
+  | Job<
+      AdminTransactionsExportJob['data'],
+      ExportResult,
+      typeof ExportJob.AdminTransactions
+    >;
@@ -1,7 +1,40 @@
-import { Module } from '@nestjs/common';
-import { EmailQueueModule } from './queues/email/email.module';
+import { Queue } from '@/constants/job.constant';
+import { DynamicModule, Module, Type } from '@nestjs/common';
 
-@Module({
-  imports: [EmailQueueModule],
-})
-export class WorkerModule {}
+type QueueName = (typeof Queue)[keyof typeof Queue];
+
+/**
+ * Queue modules are required on demand, so a worker scoped to some queues
+ * never loads the code (or schedules the crons) of the others
+ */
+const QUEUE_MODULES: Record<QueueName, () => Promise<Type>> = {
+  [Queue.Email]: () =>
+    import('./queues/email/email.module').then((m) => m.EmailQueueModule),
+  [Queue.Export]: () =>
+    import('./queues/export/export.module').then((m) => m.ExportQueueModule),
+  [Queue.Billing]: () =>
+    import('./queues/billing/billing.module').then(
+      (m) => m.BillingQueueModule,
+    ),
+};
+
+@Module({})
+export class WorkerModule {
+  /**
+   * Worker consuming the given queues, or every queue when none are given
+   */
+  static async register(queues: string[] = []): Promise<DynamicModule> {
+    const names = queues.length > 0 ? queues : Object.keys(QUEUE_MODULES);
+    const unknown = names.filter((name) => !(name in QUEUE_MODULES));
+    if (unknown.length > 0) {
+      throw new Error(`Unknown worker queues: ${unknown.join(', ')}`);
+    }
+
+    return {
+      module: WorkerModule,
+      imports: await Promise.all(
+        names.map((name) => QUEUE_MODULES[name as QueueName]()),
+      ),
+    };
+  }
+}
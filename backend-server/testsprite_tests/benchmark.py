@@ -0,0 +1,393 @@
+"""
+Load and latency benchmark for the admin hot paths covered by TC001-TC010.
+
+Unlike the TC scripts, which log in on every run and fire a single request,
+this harness logs in once, reuses the bearer token, keeps pooled keep-alive
+connections open and drives every scenario at a configurable concurrency
+through asyncio. Results (p50/p95/p99 latency, throughput, error count) can be
+saved as a JSON baseline and later runs compared against it.
+
+Run against the offline mock backend:
+
+    node mock-server.js &
+    python testsprite_tests/benchmark.py --email admin@test.com \
+        --password admin123 --save-baseline testsprite_tests/baseline.json
+
+and then, after a change:
+
+    python testsprite_tests/benchmark.py --email admin@test.com \
+        --password admin123 --baseline testsprite_tests/baseline.json
+
+partner_me is benchmarked as a partner and only runs when
+--partner-email and --partner-password are given.
+
+The process exits with status 1 when any scenario regresses past the
+configured tolerance, so it can gate CI.
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
+
+import requests
+from requests.adapters import HTTPAdapter
+
+BASE_URL = os.environ.get("BENCH_BASE_URL", "http://localhost:5001")
+TIMEOUT = 30
+HEADERS = {
+    "Content-Type": "application/json",
+    "Accept": "application/json",
+}
+
+DEFAULT_SCENARIOS = ("login", "users", "user_by_id", "partners")
+# Need a partner login (--partner-email/--partner-password)
+PARTNER_SCENARIOS = ("partner_me",)
+
+
+@dataclass
+class Scenario:
+    name: str
+    method: str
+    path: str
+    body: dict = None
+    authenticated: bool = True
+    # Bearer token for this scenario instead of the client's admin token
+    token: str = None
+
+
+@dataclass
+class ScenarioResult:
+    name: str
+    requests: int
+    errors: int
+    concurrency: int
+    duration_s: float
+    throughput_rps: float
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+    mean_ms: float
+    max_ms: float
+    status_codes: dict = field(default_factory=dict)
+
+
+def percentile(sorted_values, pct):
+    """Nearest-rank percentile over an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(pct / 100.0 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+def summarize(name, latencies_ms, status_codes, errors, concurrency, duration_s):
+    ordered = sorted(latencies_ms)
+    count = len(ordered)
+    return ScenarioResult(
+        name=name,
+        requests=count,
+        errors=errors,
+        concurrency=concurrency,
+        duration_s=round(duration_s, 3),
+        throughput_rps=round(count / duration_s, 2) if duration_s > 0 else 0.0,
+        p50_ms=round(percentile(ordered, 50), 2),
+        p95_ms=round(percentile(ordered, 95), 2),
+        p99_ms=round(percentile(ordered, 99), 2),
+        mean_ms=round(sum(ordered) / count, 2) if count else 0.0,
+        max_ms=round(ordered[-1], 2) if count else 0.0,
+        status_codes=dict(sorted(status_codes.items())),
+    )
+
+
+class BenchmarkClient:
+    """
+    Thread-safe HTTP client with one pooled keep-alive session per worker
+    thread, sharing a single bearer token obtained at startup.
+    """
+
+    def __init__(self, base_url, concurrency, timeout=TIMEOUT):
+        self.base_url = base_url.rstrip("/")
+        self.timeout = timeout
+        self.pool_size = concurrency
+        self.token = None
+        self._local = threading.local()
+        self._sessions = []
+        self._lock = threading.Lock()
+
+    def _session(self):
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(
+                pool_connections=1, pool_maxsize=self.pool_size, max_retries=0
+            )
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            session.headers.update(HEADERS)
+            self._local.session = session
+            with self._lock:
+                self._sessions.append(session)
+        return session
+
+    def request(self, scenario):
+        headers = {}
+        token = scenario.token or self.token
+        if scenario.authenticated and token:
+            headers["Authorization"] = f"Bearer {token}"
+        started = time.perf_counter()
+        response = self._session().request(
+            scenario.method,
+            f"{self.base_url}{scenario.path}",
+            json=scenario.body,
+            headers=headers,
+            timeout=self.timeout,
+        )
+        # Drain the body so the connection is returned to the pool.
+        response.content
+        return response, (time.perf_counter() - started) * 1000.0
+
+    def login(self, email, password):
+        """Log in and use the token for every scenario by default."""
+        self.token = self.fetch_token(email, password)
+
+    def fetch_token(self, email, password):
+        scenario = Scenario(
+            "login",
+            "POST",
+            "/api/v1/auth/login",
+            {"email": email, "password": password},
+            authenticated=False,
+        )
+        response, _ = self.request(scenario)
+        if response.status_code not in (200, 201):
+            raise RuntimeError(
+                f"Login failed with status {response.status_code}: {response.text[:200]}"
+            )
+        data = unwrap(response.json())
+        token = data.get("accessToken") or data.get("access_token") or data.get("token")
+        if not token:
+            raise RuntimeError("No token found in login response")
+        return token
+
+    def close(self):
+        with self._lock:
+            for session in self._sessions:
+                session.close()
+            self._sessions.clear()
+
+
+def unwrap(payload):
+    """The real API and the mock wrap results in `{ success, data }`."""
+    if isinstance(payload, dict) and "data" in payload and "success" in payload:
+        return payload["data"] if payload["data"] is not None else payload
+    return payload
+
+
+def first_id(payload):
+    data = unwrap(payload)
+    if isinstance(data, dict):
+        data = data.get("data") or data.get("items") or data.get("users") or []
+    if isinstance(data, list) and data:
+        return data[0].get("id")
+    return None
+
+
+def build_scenarios(client, args):
+    users_path = "/api/v1/admin/users?page=1&limit=20"
+    user_id = args.user_id
+    if user_id is None:
+        response, _ = client.request(Scenario("discover", "GET", users_path))
+        user_id = first_id(response.json()) if response.ok else None
+
+    scenarios = {
+        "login": Scenario(
+            "login",
+            "POST",
+            "/api/v1/auth/login",
+            {"email": args.email, "password": args.password},
+            authenticated=False,
+        ),
+        "users": Scenario("users", "GET", users_path),
+        "partners": Scenario("partners", "GET", "/api/v1/admin/partners?page=1&limit=10"),
+    }
+    if args.partner_email and args.partner_password:
+        # /partner/me resolves the partner from the caller, so an admin token
+        # would only exercise the not-found path
+        partner_token = client.fetch_token(args.partner_email, args.partner_password)
+        scenarios["partner_me"] = Scenario(
+            "partner_me", "GET", "/api/v1/partner/me", token=partner_token
+        )
+    if user_id:
+        scenarios["user_by_id"] = Scenario("user_by_id", "GET", f"/api/v1/admin/users/{user_id}")
+    return scenarios
+
+
+async def run_scenario(client, executor, scenario, total_requests, concurrency, warmup):
+    loop = asyncio.get_running_loop()
+
+    for _ in range(warmup):
+        await loop.run_in_executor(executor, client.request, scenario)
+
+    latencies = []
+    status_codes = {}
+    errors = 0
+    remaining = total_requests
+    counter_lock = asyncio.Lock()
+
+    async def worker():
+        nonlocal remaining, errors
+        while True:
+            async with counter_lock:
+                if remaining <= 0:
+                    return
+                remaining -= 1
+            try:
+                response, elapsed_ms = await loop.run_in_executor(
+                    executor, client.request, scenario
+                )
+            except requests.RequestException as e:
+                errors += 1
+                key = type(e).__name__
+                status_codes[key] = status_codes.get(key, 0) + 1
+                continue
+            latencies.append(elapsed_ms)
+            key = str(response.status_code)
+            status_codes[key] = status_codes.get(key, 0) + 1
+            if response.status_code >= 400:
+                errors += 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    duration = time.perf_counter() - started
+    return summarize(scenario.name, latencies, status_codes, errors, concurrency, duration)
+
+
+def compare(results, baseline, tolerance, metrics=("p50_ms", "p95_ms", "p99_ms")):
+    """
+    Return a list of human readable regressions. A latency metric regresses
+    when it grows by more than `tolerance` (a fraction) over the baseline;
+    throughput regresses when it drops by more than `tolerance`.
+    """
+    regressions = []
+    previous = {item["name"]: item for item in baseline.get("results", [])}
+    for result in results:
+        before = previous.get(result.name)
+        if not before:
+            continue
+        for metric in metrics:
+            old, new = before.get(metric) or 0.0, getattr(result, metric)
+            if old > 0 and new > old * (1 + tolerance):
+                regressions.append(
+                    f"{result.name}: {metric} {old:.2f} -> {new:.2f} (+{(new / old - 1) * 100:.1f}%)"
+                )
+        old_rps = before.get("throughput_rps") or 0.0
+        if old_rps > 0 and result.throughput_rps < old_rps * (1 - tolerance):
+            regressions.append(
+                f"{result.name}: throughput_rps {old_rps:.2f} -> {result.throughput_rps:.2f} "
+                f"({(result.throughput_rps / old_rps - 1) * 100:.1f}%)"
+            )
+        if result.errors > (before.get("errors") or 0):
+            regressions.append(
+                f"{result.name}: errors {before.get('errors', 0)} -> {result.errors}"
+            )
+    return regressions
+
+
+def print_table(results):
+    header = f"{'scenario':<12} {'reqs':>6} {'err':>5} {'rps':>9} {'p50':>8} {'p95':>8} {'p99':>8} {'max':>8}"
+    print(header)
+    print("-" * len(header))
+    for r in results:
+        print(
+            f"{r.name:<12} {r.requests:>6} {r.errors:>5} {r.throughput_rps:>9.2f} "
+            f"{r.p50_ms:>8.2f} {r.p95_ms:>8.2f} {r.p99_ms:>8.2f} {r.max_ms:>8.2f}"
+        )
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--base-url", default=BASE_URL)
+    parser.add_argument("--email", default=os.environ.get("BENCH_EMAIL", "admin@test.com"))
+    parser.add_argument("--password", default=os.environ.get("BENCH_PASSWORD", "admin123"))
+    parser.add_argument("--partner-email", default=os.environ.get("BENCH_PARTNER_EMAIL"),
+                        help="Partner login for partner_me (skipped if omitted)")
+    parser.add_argument("--partner-password", default=os.environ.get("BENCH_PARTNER_PASSWORD"))
+    parser.add_argument("--scenarios", default=None,
+                        help="Comma separated subset of: "
+                        + ", ".join(DEFAULT_SCENARIOS + PARTNER_SCENARIOS)
+                        + " (partner_me runs by default when partner credentials are given)")
+    parser.add_argument("--concurrency", type=int, default=10)
+    parser.add_argument("--requests", type=int, default=200, help="Requests per scenario")
+    parser.add_argument("--warmup", type=int, default=5, help="Warmup requests per scenario")
+    parser.add_argument("--user-id", default=None, help="User id for user_by_id (discovered if omitted)")
+    parser.add_argument("--save-baseline", default=None, help="Write results to this JSON file")
+    parser.add_argument("--baseline", default=None, help="Compare against this JSON baseline")
+    parser.add_argument("--tolerance", type=float, default=0.2,
+                        help="Allowed relative regression before failing (default 0.2 = 20%%)")
+    args = parser.parse_args(argv)
+    if args.scenarios is None:
+        defaults = DEFAULT_SCENARIOS
+        if args.partner_email and args.partner_password:
+            defaults += PARTNER_SCENARIOS
+        args.scenarios = ",".join(defaults)
+    return args
+
+
+async def main(argv=None):
+    args = parse_args(argv)
+    client = BenchmarkClient(args.base_url, args.concurrency)
+    executor = ThreadPoolExecutor(max_workers=args.concurrency)
+    try:
+        client.login(args.email, args.password)
+        scenarios = build_scenarios(client, args)
+
+        results = []
+        for name in [s.strip() for s in args.scenarios.split(",") if s.strip()]:
+            scenario = scenarios.get(name)
+            if scenario is None:
+                print(f"Skipping unknown or unavailable scenario '{name}'", file=sys.stderr)
+                continue
+            results.append(
+                await run_scenario(
+                    client, executor, scenario, args.requests, args.concurrency, args.warmup
+                )
+            )
+    finally:
+        executor.shutdown(wait=True)
+        client.close()
+
+    print_table(results)
+
+    report = {
+        "base_url": args.base_url,
+        "concurrency": args.concurrency,
+        "requests_per_scenario": args.requests,
+        "recorded_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        "results": [asdict(r) for r in results],
+    }
+    if args.save_baseline:
+        with open(args.save_baseline, "w") as fh:
+            json.dump(report, fh, indent=2)
+        print(f"\nBaseline written to {args.save_baseline}")
+
+    if args.baseline:
+        with open(args.baseline) as fh:
+            baseline = json.load(fh)
+        regressions = compare(results, baseline, args.tolerance)
+        if regressions:
+            print("\nRegressions against baseline:")
+            for line in regressions:
+                print(f"  - {line}")
+            return 1
+        print(f"\nNo regressions against {args.baseline} (tolerance {args.tolerance:.0%})")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))